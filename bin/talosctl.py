@@ -195,6 +195,35 @@ def cmd_parameters(args: argparse.Namespace) -> Any:
     raise RuntimeError(f"Unknown params action: {args.action}")
 
 
+def cmd_discover(args: argparse.Namespace) -> Any:
+    base = _normalize_base_url(args.base_url)
+
+    if args.action == "scan":
+        target: dict[str, Any] = {
+            "transport": args.transport,
+            "slave_id_start": args.start,
+            "slave_id_end": args.end,
+            "register_type": args.register_type,
+            "probe_offset": args.offset,
+            "max_devices": args.max_devices,
+            "stop_on_first_baudrate": not args.all_baudrates,
+            "fingerprint": args.fingerprint,
+        }
+        if args.transport == "serial":
+            target["port"] = args.port
+        else:
+            target["host"] = args.port
+            target["tcp_port"] = args.tcp_port
+        if args.baudrates:
+            target["baudrates"] = args.baudrates
+
+        body = {"targets": [target], "probe_timeout_sec": args.probe_timeout}
+        # A full scan takes far longer than a normal API call: never below the scan budget
+        return _request("POST", f"{base}/api/discovery/scan", json_body=body, timeout=max(args.timeout, 600.0))
+
+    raise RuntimeError(f"Unknown discover action: {args.action}")
+
+
 # -------------------------
 # CLI parser
 # -------------------------
@@ -266,6 +295,24 @@ def build_parser() -> argparse.ArgumentParser:
     con_get = con_sub.add_parser("get", help="GET /api/constraints/{device_id}")
     con_get.add_argument("device_id")
 
+    # discover
+    dis = sub.add_parser("discover", help="Device discovery (commissioning)")
+    dis_sub = dis.add_subparsers(dest="action", required=True)
+
+    dis_scan = dis_sub.add_parser("scan", help="POST /api/discovery/scan")
+    dis_scan.add_argument("port", help="Serial port path, or host for tcp / rtu_over_tcp")
+    dis_scan.add_argument("--transport", choices=["serial", "tcp", "rtu_over_tcp"], default="serial")
+    dis_scan.add_argument("--tcp-port", type=int, default=502, help="Gateway TCP port (default: 502)")
+    dis_scan.add_argument("--baudrates", type=int, nargs="+", help="Candidate baud rates (default: server list)")
+    dis_scan.add_argument("--start", type=int, default=1, help="First slave ID (default: 1)")
+    dis_scan.add_argument("--end", type=int, default=247, help="Last slave ID (default: 247)")
+    dis_scan.add_argument("--register-type", choices=["holding", "input"], default="holding")
+    dis_scan.add_argument("--offset", type=int, default=0, help="Probe register offset (default: 0)")
+    dis_scan.add_argument("--max-devices", type=int, help="Stop after N slaves answered")
+    dis_scan.add_argument("--all-baudrates", action="store_true", help="Keep scanning after a baud rate had hits")
+    dis_scan.add_argument("--fingerprint", action="store_true", help="Match hits against driver signatures")
+    dis_scan.add_argument("--probe-timeout", type=float, default=0.1, help="Initial probe timeout seconds")
+
     return p
 
 
@@ -282,6 +329,8 @@ def main() -> int:
             result = cmd_parameters(args)
         elif args.cmd == "constraints":
             result = cmd_constraints(args)
+        elif args.cmd == "discover":
+            result = cmd_discover(args)
         else:
             raise RuntimeError(f"Unknown command: {args.cmd}")
 
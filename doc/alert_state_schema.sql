@@ -1,4 +1,4 @@
--- Future SQLite schema for alert state persistence
+-- SQLite schema for alert state persistence (repository/alert_state_store.py)
 
 CREATE TABLE alert_states (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -36,6 +36,8 @@ from api.router import (
     config_io,
     constraint,
     device,
+    diagnostics,
+    discovery,
     drvier_config,
     health,
     instance_config,
@@ -117,6 +119,8 @@ def create_application() -> FastAPI:
     app.include_router(monitoring.router, prefix="/api/monitoring", tags=["Monitoring"])
     app.include_router(snapshot.router, prefix="/api/snapshots", tags=["Snapshots"])
     app.include_router(provision.router, prefix="/api/provision", tags=["Provisioning"])
+    app.include_router(discovery.router, prefix="/api/discovery", tags=["Discovery"])
+    app.include_router(diagnostics.router, prefix="/api/diagnostics", tags=["Diagnostics"])
     app.include_router(modbus_config.router, prefix="/api/config/modbus", tags=["Modbus Configuration"])
     app.include_router(drvier_config.router, prefix="/api/config/modbus_drivers", tags=["Modbus Driver Configuration"])
     app.include_router(system_config.router, prefix="/api/config/system", tags=["System Configuration"])
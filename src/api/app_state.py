@@ -76,6 +76,12 @@ class TalosAppState(BaseModel):
     heartbeat_path: str | None = None
     heartbeat_max_age_sec: float = 60.0
 
+    # Startup probing (StartupOrchestrator, unified mode): probe progress + time-to-first-snapshot
+    startup: object | None = Field(default=None, description="Startup orchestrator (probe progress and metrics)")
+
+    # Event loop profiler (unified mode): slow callbacks, per-subscriber CPU, sampling profiles
+    loop_profiler: object | None = Field(default=None, description="LoopProfiler installed on the core event loop")
+
     @model_validator(mode="after")
     def validate_unified_mode_requirements(self) -> "TalosAppState":
         """Validate that unified mode has all required components."""
@@ -11,6 +11,7 @@ from fastapi import Depends, Header, Request
 from api.repository.config_repository import ConfigRepository
 from api.service.constraint_service import ConstraintService
 from api.service.device_service import DeviceService
+from api.service.discovery_service import DiscoveryService
 from api.service.instance_config_service import InstanceConfigService
 from api.service.modbus_config_service import ModbusConfigService
 from api.service.parameter_service import ParameterService
@@ -70,6 +71,11 @@ def get_health_manager(request: Request) -> DeviceHealthManager:
     return request.app.state.talos.get_health_manager()
 
 
+def get_discovery_service(request: Request) -> DiscoveryService:
+    """Provide DiscoveryService; the device manager (busy ports) is optional in standalone mode."""
+    return DiscoveryService(device_manager=request.app.state.talos.async_device_manager)
+
+
 def get_device_service(
     device_manager: AsyncDeviceManager = Depends(get_async_device_manager),
     config_repo: ConfigRepository = Depends(get_config_repository),
@@ -0,0 +1,71 @@
+from typing import Literal
+
+from pydantic import BaseModel, Field, model_validator
+
+from api.model.enums import ResponseStatus
+from api.model.responses import BaseResponse
+from core.device.modbus.discovery_scanner import DEFAULT_BAUDRATES
+from core.model.enum.modbus_transport_enum import ModbusTransport
+
+
+class DiscoveryTargetRequest(BaseModel):
+    """One port (or TCP gateway) to scan"""
+
+    transport: ModbusTransport = Field(default=ModbusTransport.SERIAL, description="serial | tcp | rtu_over_tcp")
+    port: str | None = Field(default=None, description="Serial port path (transport=serial)")
+    host: str | None = Field(default=None, description="Gateway / device host (TCP transports)")
+    tcp_port: int = Field(default=502, ge=1, le=65535, description="Gateway / device TCP port")
+
+    baudrates: list[int] = Field(
+        default_factory=lambda: list(DEFAULT_BAUDRATES), min_length=1, description="Candidate baud rates (serial)"
+    )
+    slave_id_start: int = Field(default=1, ge=1, le=247, description="First slave ID to probe")
+    slave_id_end: int = Field(default=247, ge=1, le=247, description="Last slave ID to probe")
+
+    register_type: Literal["holding", "input"] = Field(default="holding", description="Probe function (FC03/FC04)")
+    probe_offset: int = Field(default=0, ge=0, le=65535, description="Register read by each probe")
+
+    max_devices: int | None = Field(default=None, ge=1, description="Stop this port after N slaves answered")
+    stop_on_first_baudrate: bool = Field(default=True, description="Skip remaining baud rates once one has hits")
+    fingerprint: bool = Field(default=False, description="Match hits against driver register signatures")
+
+    @model_validator(mode="after")
+    def _check_target(self) -> "DiscoveryTargetRequest":
+        if self.transport == ModbusTransport.SERIAL and not self.port:
+            raise ValueError("serial target requires 'port'")
+        if self.transport != ModbusTransport.SERIAL and not self.host:
+            raise ValueError(f"{self.transport} target requires 'host'")
+        if self.slave_id_start > self.slave_id_end:
+            raise ValueError("slave_id_start must be <= slave_id_end")
+        return self
+
+
+class DiscoveryScanRequest(BaseModel):
+    """Scan request: targets are scanned in parallel"""
+
+    targets: list[DiscoveryTargetRequest] = Field(..., min_length=1, description="Ports / gateways to scan")
+    probe_timeout_sec: float = Field(default=0.1, gt=0, le=1.0, description="Probe timeout until the first reply")
+    min_timeout_sec: float = Field(default=0.03, gt=0, le=1.0, description="Floor of the adaptive probe timeout")
+
+
+class DiscoveryHitInfo(BaseModel):
+    slave_id: int
+    baudrate: int | None = None
+    latency_ms: float
+    exception_code: int | None = Field(default=None, description="Set when the slave answered with an exception")
+    models: list[str] = Field(default_factory=list, description="Fingerprint candidates, best first")
+
+
+class PortScanInfo(BaseModel):
+    endpoint: str
+    hits: list[DiscoveryHitInfo] = Field(default_factory=list)
+    baudrates_tried: list[int | None] = Field(default_factory=list)
+    probes: int = 0
+    elapsed_sec: float = 0.0
+    errors: list[str] = Field(default_factory=list)
+
+
+class DiscoveryScanResponse(BaseResponse):
+    status: ResponseStatus = ResponseStatus.SUCCESS
+    results: list[PortScanInfo] = Field(default_factory=list)
+    total_found: int = 0
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 
 from api.model.common import MetadataInfo
 from api.model.responses import BaseResponse
+from core.model.enum.modbus_transport_enum import ModbusTransport
 
 # ============================================================================
 # Request Models
@@ -29,9 +30,13 @@ class ModbusDeviceCreateRequest(BaseModel):
 class ModbusBusCreateRequest(BaseModel):
     """Request model for creating/updating a modbus bus"""
 
-    port: str = Field(..., description="Serial port path")
+    transport: ModbusTransport = Field(default=ModbusTransport.SERIAL, description="serial | tcp | rtu_over_tcp")
+    port: str | None = Field(default=None, description="Serial port path (transport=serial)")
     baudrate: int = Field(default=9600, description="Baud rate")
     timeout: float = Field(default=1.0, gt=0, le=2.0, description="Modbus timeout in seconds")
+    host: str | None = Field(default=None, description="Gateway / device host (TCP transports)")
+    tcp_port: int = Field(default=502, ge=1, le=65535, description="Gateway / device TCP port")
+    pool_size: int = Field(default=2, ge=1, le=8, description="Pooled connections (transport=tcp)")
 
 
 # ============================================================================
@@ -57,9 +62,13 @@ class ModbusBusInfo(BaseModel):
     """Modbus bus information"""
 
     name: str
-    port: str
+    transport: ModbusTransport = ModbusTransport.SERIAL
+    port: str | None = None
     baudrate: int
     timeout: float
+    host: str | None = None
+    tcp_port: int = 502
+    pool_size: int = 2
 
 
 # ============================================================================
@@ -0,0 +1,66 @@
+"""
+Diagnostics Router
+
+Event loop stalls, per-subscriber CPU and on-demand sampling profiles of the running service.
+"""
+
+import logging
+
+from fastapi import APIRouter, HTTPException, Query, Request, status
+from fastapi.responses import PlainTextResponse
+
+from core.util.loop_profiler import LoopProfiler
+
+logger = logging.getLogger("DiagnosticsRouter")
+
+router = APIRouter()
+
+
+def _get_profiler(request: Request) -> LoopProfiler:
+    profiler = request.app.state.talos.loop_profiler
+    if profiler is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Loop profiler is not enabled (unified mode with LOOP_PROFILER.ENABLED only)",
+        )
+    return profiler
+
+
+@router.get(
+    "/loop",
+    summary="Event loop stalls and CPU per owner",
+    description="Recent slow callbacks with the stack captured while they ran, and loop CPU/wall time per "
+    "subscriber (or named task) since start or the last reset",
+)
+async def loop_summary(request: Request, reset: bool = Query(False, description="Clear counters after reading")):
+    profiler = _get_profiler(request)
+    summary = profiler.summary()
+    if reset:
+        profiler.reset()
+    return summary
+
+
+@router.get(
+    "/profile",
+    response_class=PlainTextResponse,
+    summary="Sampling profile of the event loop thread",
+    description="Sample the loop thread for N seconds; returns collapsed stacks (`frame;frame;... count`) "
+    "for flamegraph.pl or speedscope",
+)
+async def loop_profile(
+    request: Request,
+    seconds: float = Query(10.0, gt=0, description="Sampling duration"),
+    interval_ms: float = Query(5.0, ge=1, le=1000, description="Sampling interval"),
+) -> PlainTextResponse:
+    profiler = _get_profiler(request)
+    if profiler.profiling:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A profile is already running")
+
+    try:
+        collapsed = await profiler.profile(seconds, interval_sec=interval_ms / 1000)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+    except RuntimeError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    return PlainTextResponse(collapsed)
@@ -0,0 +1,38 @@
+"""
+Device Discovery Router
+
+Scans ports for Modbus slaves during commissioning.
+"""
+
+import logging
+
+from fastapi import APIRouter, Depends, HTTPException, status
+
+from api.dependency import get_discovery_service
+from api.model.discovery import DiscoveryScanRequest, DiscoveryScanResponse
+from api.service.discovery_service import DiscoveryService
+from exception import PortInUseError
+
+logger = logging.getLogger("DiscoveryRouter")
+
+router = APIRouter()
+
+
+@router.post(
+    "/scan",
+    response_model=DiscoveryScanResponse,
+    summary="Scan ports for Modbus slaves",
+    description="Probe slave IDs x baud rates on each target (targets in parallel); optionally fingerprint models",
+)
+async def scan(
+    request: DiscoveryScanRequest, service: DiscoveryService = Depends(get_discovery_service)
+) -> DiscoveryScanResponse:
+    try:
+        return await service.scan(request)
+
+    except PortInUseError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e)) from e
+
+    except Exception as e:
+        logger.error(f"Discovery scan failed: {e}", exc_info=True)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e)) from e
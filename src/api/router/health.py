@@ -66,6 +66,8 @@ async def health_check(request: Request):
             or (heartbeat_info["age_sec"] > hb_max_age)
         )
 
+    startup = talos.startup.summary() if talos.startup is not None else {"enabled": False}
+
     return {
         "status": "unhealthy" if unhealthy else "healthy",
         "timestamp": datetime.now(tz=TIMEZONE_INFO).isoformat(),
@@ -74,6 +76,7 @@ async def health_check(request: Request):
         "python_version": platform.python_version(),
         "platform": platform.system(),
         "heartbeat": heartbeat_info,
+        "startup": startup,
         "thresholds": {"heartbeat_max_age_sec": hb_max_age},
     }
 
@@ -0,0 +1,41 @@
+import logging
+
+from api.model.discovery import DiscoveryScanRequest, DiscoveryScanResponse, PortScanInfo
+from core.device.modbus.discovery_scanner import DiscoveryTarget, ModbusDiscoveryScanner
+from device_manager import AsyncDeviceManager
+from exception import PortInUseError
+
+logger = logging.getLogger("DiscoveryService")
+
+
+class DiscoveryService:
+    """
+    Commissioning scans (slave IDs x baud rates) on ports not owned by configured devices.
+
+    Endpoints already opened by the device manager are refused: probing them at other baud
+    rates would corrupt the running monitor's traffic.
+    """
+
+    def __init__(self, device_manager: AsyncDeviceManager | None = None, driver_dir: str = "./res/driver"):
+        self.device_manager = device_manager
+        self.driver_dir = driver_dir
+
+    async def scan(self, request: DiscoveryScanRequest) -> DiscoveryScanResponse:
+        targets: list[DiscoveryTarget] = [DiscoveryTarget(**target.model_dump()) for target in request.targets]
+
+        busy: set[str] = set(self.device_manager.client_dict) if self.device_manager else set()
+        for target in targets:
+            if target.endpoint in busy:
+                raise PortInUseError(f"{target.endpoint} is in use by configured devices")
+
+        scanner = ModbusDiscoveryScanner(
+            driver_dir=self.driver_dir,
+            probe_timeout_sec=request.probe_timeout_sec,
+            min_timeout_sec=request.min_timeout_sec,
+        )
+        results = await scanner.scan(targets)
+
+        return DiscoveryScanResponse(
+            results=[PortScanInfo(**result.to_dict()) for result in results],
+            total_found=sum(len(result.hits) for result in results),
+        )
@@ -83,7 +83,16 @@ class ModbusConfigService:
             )
 
             buses = {
-                name: ModbusBusInfo(name=name, port=bus.port, baudrate=bus.baudrate, timeout=bus.timeout)
+                name: ModbusBusInfo(
+                    name=name,
+                    transport=bus.transport,
+                    port=bus.port,
+                    baudrate=bus.baudrate,
+                    timeout=bus.timeout,
+                    host=bus.host,
+                    tcp_port=bus.tcp_port,
+                    pool_size=bus.pool_size,
+                )
                 for name, bus in config.bus_dict.items()
             }
 
@@ -125,9 +134,7 @@ class ModbusConfigService:
         try:
             config = self._yaml_manager.read_config("modbus_device")
 
-            config.bus_dict[bus_name] = ModbusBusConfig(
-                port=bus_request.port, baudrate=bus_request.baudrate, timeout=bus_request.timeout
-            )
+            config.bus_dict[bus_name] = ModbusBusConfig(**bus_request.model_dump())
 
             self._yaml_manager.update_config("modbus_device", config, config_source=ConfigSource.EDGE, modified_by=user)
 
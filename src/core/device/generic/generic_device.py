@@ -1,4 +1,6 @@
 import asyncio
+from collections.abc import Collection
+from datetime import datetime
 from typing import Any
 
 from pymodbus.client import AsyncModbusSerialClient
@@ -8,12 +10,16 @@ from core.device.generic.computed_field_processor import ComputedFieldProcessor
 from core.device.generic.constraints_policy import ConstraintPolicy
 from core.device.generic.hooks import HookManager
 from core.device.generic.modbus_bus import ModbusBus
-from core.device.generic.scales import ScaleService
+from core.device.generic.scales import ScaleService, index_pins_for
 from core.device.modbus.bulk_reader import BulkRange, ModbusBulkReader
 from core.device.modbus.device_helper import ModbusDeviceHelper
 from core.device.modbus.register_handler import ModbusRegisterHandler
 from core.model.device_constant import DEFAULT_MISSING_VALUE, REG_RW_ON_OFF
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.model.enum.poll_class_enum import PollClass
 from core.model.enum.register_type_enum import RegisterType
+from core.util.latency_histogram import DeviceLatencyTracker
+from core.util.time_util import TIMEZONE_INFO
 from core.util.value_decoder import ValueDecoder
 
 
@@ -25,6 +31,11 @@ class AsyncGenericModbusDevice(BaseDevice):
     - ModbusBulkReader: Bulk read optimization
     - ModbusRegisterHandler: Low-level register operations
     - ModbusDeviceHelpers: Utility functions
+
+    Multi-rate polling: every readable pin belongs to a poll class (pin `poll_class`, else the
+    instance/driver default, else normal). read_all(poll_classes) reads only those classes and
+    merges them over the last values of the others; value_timestamps records when each value
+    was last read.
     """
 
     def __init__(
@@ -43,6 +54,9 @@ class AsyncGenericModbusDevice(BaseDevice):
         mode_dict: dict | None = None,
         write_hooks: list | dict | None = None,
         port_lock: asyncio.Lock | None = None,
+        transport: str = ModbusTransport.SERIAL,
+        request_timeout_sec: float | None = None,
+        poll_class: str | None = None,
     ):
         # Initialize base class
         super().__init__(model, slave_id, device_type, register_map)
@@ -52,12 +66,21 @@ class AsyncGenericModbusDevice(BaseDevice):
         self.register_type = register_type
         self.port = str(port)
         self._port_lock = port_lock
+        self.transport = ModbusTransport(transport)
+        self.request_timeout_sec = request_timeout_sec
+        self._latency_tracker: DeviceLatencyTracker | None = None
 
         # Create default ModbusBus
         bus_slave_id = (
             int(self.slave_id) if isinstance(self.slave_id, str) and self.slave_id.isdigit() else int(self.slave_id)
         )
-        self.bus = ModbusBus(client=client, slave_id=bus_slave_id, register_type=register_type, lock=self._port_lock)
+        self.bus = ModbusBus(
+            client=client,
+            slave_id=bus_slave_id,
+            register_type=register_type,
+            lock=self._port_lock,
+            transport=self.transport,
+        )
         self._bus_cache: dict[str, ModbusBus] = {register_type: self.bus}
 
         self.logger.debug(f"[{self.model}_{self.slave_id}] Initialized with default register_type='{register_type}'")
@@ -83,10 +106,41 @@ class AsyncGenericModbusDevice(BaseDevice):
         # Initialize specialized handlers
         self.bulk_reader = ModbusBulkReader(register_map, register_type, self.logger)
         self.register_handler = ModbusRegisterHandler(model, register_map, self.bus, self.logger)
-        self.helpers = ModbusDeviceHelper(model, slave_id, register_map, self.scales, client, port_lock, self.logger)
+        self.helpers = ModbusDeviceHelper(
+            model, slave_id, register_map, self.scales, client, port_lock, self.logger, transport=self.transport
+        )
+        self.helpers.request_timeout_sec = request_timeout_sec
 
         self._model_config = model_config
 
+        # Multi-rate polling (computed fields are not polled: they follow their inputs)
+        self.default_poll_class = PollClass(
+            poll_class or (model_config or {}).get("poll_class") or PollClass.NORMAL.value
+        )
+        self.pin_poll_classes: dict[str, PollClass] = {
+            name: PollClass(cfg.get("poll_class") or self.default_poll_class)
+            for name, cfg in register_map.items()
+            if cfg.get("readable") and cfg.get("type") != "computed"
+        }
+        self._class_readers: dict[frozenset[str], ModbusBulkReader] = {}
+        self._last_values: dict[str, Any] = {}
+        # Pins actually read by the latest read_all() (without values merged from other poll classes)
+        self.last_read_values: dict[str, Any] = {}
+        self.value_timestamps: dict[str, datetime] = {}
+
+    @property
+    def poll_classes(self) -> frozenset[str]:
+        """Poll classes used by this device's readable pins."""
+        return frozenset(self.pin_poll_classes.values())
+
+    def attach_latency_tracker(self, tracker: DeviceLatencyTracker) -> None:
+        """Enable adaptive request deadlines on every bus of this device (existing and future)."""
+        self._latency_tracker = tracker
+        self.helpers.latency_tracker = tracker
+        for bus in self._bus_cache.values():
+            bus.latency = tracker
+            bus.request_timeout_sec = self.request_timeout_sec
+
     # ==================== Override base class methods ====================
 
     def supports_on_off(self) -> bool:
@@ -107,24 +161,35 @@ class AsyncGenericModbusDevice(BaseDevice):
         return None
 
     # ==================== Public read/write methods ====================
-    async def read_all(self) -> dict[str, Any]:
+    async def read_all(self, poll_classes: Collection[str] | None = None) -> dict[str, Any]:
+        """
+        Read all readable pins, or only the pins of `poll_classes` merged over the last values
+        of the other classes. Selecting every class of the device is a full read.
+        """
+        selected: frozenset[str] = self.poll_classes if poll_classes is None else self.poll_classes & set(poll_classes)
+        bulk_reader: ModbusBulkReader = (
+            self.bulk_reader if selected == self.poll_classes else self._bulk_reader_for(selected)
+        )
+
         if not await self.bus.ensure_connected():
             self.logger.warning("[OFFLINE] default bus not connected; return default -1 snapshot")
-            return self.helpers.default_offline_snapshot()
+            return self._offline_snapshot()
 
         result: dict[str, Any] = {}
 
         try:
-            bulk_ranges: list[BulkRange] = self.bulk_reader.build_bulk_ranges(max_regs_per_req=120)
+            bulk_ranges: list[BulkRange] = bulk_reader.build_bulk_ranges(max_regs_per_req=120)
         except Exception as exc:
             self.logger.error(
                 f"[{self.model}:{self.slave_id}] build_bulk_ranges failed: {exc}; treat as offline",
                 exc_info=True,
             )
-            return self.helpers.default_offline_snapshot()
+            return self._offline_snapshot()
 
         any_bulk_attempted = len(bulk_ranges) > 0
         any_bulk_success = False
+        range_results: list[tuple[BulkRange, list[int]]] = []
+        words: dict[tuple[str, int], int] = {}
 
         for bulk_range in bulk_ranges:
             bus = await self._get_or_create_bus(bulk_range.register_type)
@@ -138,24 +203,32 @@ class AsyncGenericModbusDevice(BaseDevice):
                     f"[{self.model}:{self.slave_id}] Bulk read failed "
                     f"rt={bulk_range.register_type} start={bulk_range.start} count={bulk_range.count}: {exc}"
                 )
-                for pin_name, _ in bulk_range.items:
-                    result[pin_name] = DEFAULT_MISSING_VALUE
+                for pin_name, pin_cfg in bulk_range.items:
+                    if pin_cfg.get("readable"):
+                        result[pin_name] = DEFAULT_MISSING_VALUE
                 continue
 
-            bulk_results = self.bulk_reader.process_bulk_range_result(
-                bulk_range, registers, self.register_handler.is_invalid_raw
-            )
-            result.update(bulk_results)
+            range_results.append((bulk_range, registers))
+            words.update(bulk_reader.collect_words(bulk_range, registers))
 
         # Only treat as offline if we attempted bulk but none succeeded
         if any_bulk_attempted and not any_bulk_success:
             self.logger.warning(
                 f"[{self.model}:{self.slave_id}] All bulk reads failed; treat device as offline, skip per-pin fallback"
             )
-            return self.helpers.default_offline_snapshot()
+            return self._offline_snapshot()
+
+        # Dynamic scales and composed values come from the same buffer (no extra requests)
+        scale_factors: dict[str, float] = await self._resolve_bulk_scale_factors(words, bulk_reader)
+        for bulk_range, registers in range_results:
+            bulk_results = bulk_reader.process_bulk_range_result(
+                bulk_range, registers, self.register_handler.is_invalid_raw, scale_factors
+            )
+            result.update(bulk_results)
+        result.update(bulk_reader.compose_from_words(words, scale_factors))
 
         # Fallback for non-bulk pins
-        for pin_name, pin_cfg in self.register_map.items():
+        for pin_name, pin_cfg in bulk_reader.register_map.items():
             if not pin_cfg.get("readable"):
                 continue
             if pin_name in result:
@@ -167,8 +240,7 @@ class AsyncGenericModbusDevice(BaseDevice):
                 self.logger.warning(f"[{self.model}:{self.slave_id}] Fallback read failed: {pin_name}: {exc}; set -1")
                 result[pin_name] = DEFAULT_MISSING_VALUE
 
-        result = self.computed_processor.compute(result)
-        return result
+        return self._merge_read_values(result)
 
     async def read_value(self, name: str) -> float | int:
         """Read a single parameter value."""
@@ -236,6 +308,43 @@ class AsyncGenericModbusDevice(BaseDevice):
         self.hooks.on_write(name, pin_config)
         self.logger.info(f"[{self.model}] Write {raw} to {name} (offset={pin_config['offset']})")
 
+    async def write_values(self, writes: list[tuple[str, int | float]]) -> list[bool]:
+        """
+        Write several parameters with as few Modbus requests as possible.
+
+        - Holding registers listed in ascending adjacent order are merged into one FC 16 request
+        - Bit pins sharing a word are folded into a single read-modify-write
+        - Coils are written individually (FC 05)
+
+        Requests go out in the order of *writes*, e.g. a frequency listed before run/stop
+        is written first even if its offset is higher. A name repeated in *writes* starts
+        a new request group, so later values still land after earlier ones.
+
+        Returns:
+            One success flag per entry of *writes*; values rejected by constraints are False
+
+        Raises:
+            ValueError: If a pin is not writable (nothing is written), as write_value() does
+        """
+        not_writable: list[str] = [name for name, _ in writes if not self.helpers.require_writable(name)]
+        if not_writable:
+            raise ValueError(f"Pins {not_writable} are not writable in register_map")
+
+        results: list[bool] = [False] * len(writes)
+        group: list[int] = []
+        group_names: set[str] = set()
+
+        for index, (name, _) in enumerate(writes):
+            if name in group_names:
+                await self._write_group(writes, group, results)
+                group, group_names = [], set()
+            group.append(index)
+            group_names.add(name)
+
+        if group:
+            await self._write_group(writes, group, results)
+        return results
+
     async def write_on_off(self, value: int) -> None:
         """
         Legacy method for writing on/off state.
@@ -263,10 +372,74 @@ class AsyncGenericModbusDevice(BaseDevice):
             slave_id=bus_slave_id,
             register_type=register_type,
             lock=self._port_lock,
+            transport=self.transport,
+            latency=self._latency_tracker,
+            request_timeout_sec=self.request_timeout_sec,
         )
         self._bus_cache[register_type] = new_bus
         return new_bus
 
+    def _bulk_reader_for(self, poll_classes: frozenset[str]) -> ModbusBulkReader:
+        """Bulk reader over the pins of some poll classes plus the registers they are computed from (cached)."""
+        reader = self._class_readers.get(poll_classes)
+        if reader is not None:
+            return reader
+
+        names: set[str] = {name for name, poll_class in self.pin_poll_classes.items() if poll_class in poll_classes}
+        for name in list(names):
+            pin_cfg = self.register_map[name]
+            if isinstance(pin_cfg.get("composed_of"), (list, tuple)):
+                names.update(pin_cfg["composed_of"])
+            if pin_cfg.get("scale_from"):
+                names.update(index_pins_for(pin_cfg["scale_from"]))
+
+        sub_map = {name: cfg for name, cfg in self.register_map.items() if name in names}
+        reader = self._class_readers[poll_classes] = ModbusBulkReader(sub_map, self.register_type, self.logger)
+        return reader
+
+    def _merge_read_values(self, values: dict[str, Any]) -> dict[str, Any]:
+        """Merge freshly read values over the last known ones, stamp them, then compute computed fields."""
+        now = datetime.now(tz=TIMEZONE_INFO)
+        self.last_read_values = values
+        self._last_values.update(values)
+
+        result = self.computed_processor.compute(dict(self._last_values))
+        for name in (*values, *self.computed_processor.computed_fields):
+            self.value_timestamps[name] = now
+        return result
+
+    def _offline_snapshot(self) -> dict[str, Any]:
+        """All -1 snapshot; merged values and their timestamps are dropped as well."""
+        snapshot = self.helpers.default_offline_snapshot()
+        self._last_values = dict(snapshot)
+        self.last_read_values = dict(snapshot)
+        self.value_timestamps.clear()
+        return snapshot
+
+    async def _resolve_bulk_scale_factors(
+        self, words: dict[tuple[str, int], int], bulk_reader: ModbusBulkReader | None = None
+    ) -> dict[str, float]:
+        """
+        Resolve the factor of every readable scale_from kind, using index registers from the bulk buffer.
+        The scale cache is refreshed from the buffered indices (only changed indices invalidate it).
+        """
+        bulk_reader = bulk_reader or self.bulk_reader
+        scale_from_set: set[str] = {
+            cfg["scale_from"]
+            for cfg in bulk_reader.register_map.values()
+            if cfg.get("readable") and cfg.get("scale_from")
+        }
+        if not scale_from_set:
+            return {}
+
+        index_words: dict[str, int] = bulk_reader.pin_words(bulk_reader.scale_index_pins(), words)
+        self.scales.refresh_indices(index_words)
+
+        factors: dict[str, float] = {}
+        for scale_from in scale_from_set:
+            factors[scale_from] = await self.helpers.resolve_dynamic_scale(scale_from, self.bus, index_words)
+        return factors
+
     async def _read_coil(self, name: str, bus: ModbusBus, offset: int) -> int:
         """Read coil value (FC 01)."""
         try:
@@ -311,6 +484,79 @@ class AsyncGenericModbusDevice(BaseDevice):
             self.logger.error(f"[{self.model}_{self.slave_id}] Failed to write coil {name}: {e}")
             raise
 
+    async def _write_group(self, writes: list[tuple[str, int | float]], indices: list[int], results: list[bool]):
+        """
+        Write one group of distinct pins in action order.
+
+        Word and bit pins share the coalesced register writes; a coil is written after the
+        registers planned before it, so "set frequency, then run" is never reordered.
+        """
+        segment: list[int] = []
+
+        for index in indices:
+            name, value = writes[index]
+            pin_config: dict = self.helpers.require_writable(name)
+            if not self.constraints.allow(name, float(value)):
+                self.logger.warning(f"[{self.model}] Write to {name}={value} rejected by constraints")
+                continue
+
+            if pin_config.get("register_type", self.register_type) != RegisterType.COIL.value:
+                segment.append(index)
+                continue
+
+            if segment:
+                await self._write_register_segment(writes, segment, results)
+                segment = []
+
+            bus: ModbusBus = self.helpers.get_bus_for_pin(name, self.register_type, self._bus_cache)
+            try:
+                await self._write_coil(name, bus, pin_config, value)
+                results[index] = True
+            except Exception:
+                pass  # Already logged by _write_coil
+
+        if segment:
+            await self._write_register_segment(writes, segment, results)
+
+    async def _write_register_segment(
+        self, writes: list[tuple[str, int | float]], indices: list[int], results: list[bool]
+    ):
+        """Write word and bit pins as coalesced register writes, in the order their offsets first appear."""
+        words: dict[int, int | None] = {}  # None: bit pins only, filled in by merge_bits
+        bits: dict[int, dict[int, int]] = {}
+        pins_by_offset: dict[int, list[tuple[int, str, dict]]] = {}
+
+        for index in indices:
+            name, value = writes[index]
+            pin_config: dict = self.helpers.require_writable(name)
+            offset = int(pin_config["offset"])
+            bit_index = pin_config.get("bit")
+            if bit_index is not None:
+                words.setdefault(offset, None)
+                bits.setdefault(offset, {})[int(bit_index)] = 1 if int(value) else 0
+            else:
+                words[offset] = self.helpers.scaled_raw_value(pin_config, value)
+            pins_by_offset.setdefault(offset, []).append((index, name, pin_config))
+
+        for offset, bit_values in bits.items():
+            new_word = await self.register_handler.merge_bits(offset, bit_values, base_word=words[offset])
+            if new_word is None:
+                words.pop(offset)
+                continue
+            words[offset] = new_word
+
+        written: dict[int, bool] = await self.register_handler.write_words(words) if words else {}
+
+        for offset, pins in pins_by_offset.items():
+            ok = written.get(offset, False)
+            for index, name, pin_config in pins:
+                if not ok:
+                    self.logger.warning(f"[{self.model}] Write to {name} failed (offset={offset})")
+                    continue
+                results[index] = True
+                self.hooks.on_write(name, pin_config)
+                self.logger.info(f"[{self.model}] Write {words[offset]} to {name} (offset={offset})")
+
     async def _write_bit_operation(self, name: str, pin_cfg: dict, bit_index: int, bit_value: int):
         """Perform bit-level write using read-modify-write."""
         new_word = await self.register_handler.write_bit(pin_cfg["offset"], bit_index, bit_value)
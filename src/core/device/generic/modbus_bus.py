@@ -1,12 +1,15 @@
 import asyncio
 import logging
-from typing import Any, Coroutine
+from typing import Any, Awaitable, Coroutine
 
 from pymodbus.client import AsyncModbusSerialClient
 from pymodbus.pdu.pdu import ModbusPDU
 
+from core.device.modbus.tcp_client_pool import ModbusTcpClientPool
 from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.model.enum.modbus_transport_enum import ModbusTransport
 from core.model.enum.register_type_enum import RegisterType
+from core.util.latency_histogram import DeviceLatencyTracker
 
 logger = logging.getLogger("ModbusBus")
 
@@ -21,6 +24,11 @@ class ModbusBus:
     - Reduced log verbosity for common errors
 
     Critical for preventing "expected id X but got Y" errors in multi-device RS-485 environments.
+
+    Transport semantics:
+    - serial: RX buffer clearing + 10ms settle delay before each request
+    - rtu_over_tcp: no local serial buffer, but keeps the settle delay (the gateway still drives RS-485)
+    - tcp: native Modbus TCP, requests are sent immediately (callers may run them concurrently)
     """
 
     # Modbus exception codes (for error classification)
@@ -40,16 +48,27 @@ class ModbusBus:
         slave_id: int,
         register_type: str,
         lock: asyncio.Lock | None = None,
+        transport: str = ModbusTransport.SERIAL,
+        latency: DeviceLatencyTracker | None = None,
+        request_timeout_sec: float | None = None,
     ):
         self.client = client
         self.slave_id = int(slave_id)
         self.register_type = register_type
         self.lock = lock
+        self.transport = ModbusTransport(transport)
+
+        # Adaptive request deadline (p99 x margin of this device's history, capped at the bus timeout)
+        self.latency = latency
+        self.request_timeout_sec = request_timeout_sec
 
         # Track consecutive errors for adaptive behavior
         self._consecutive_errors = 0
         self._max_errors_before_reset = 3
 
+        # Exception code of the last failed write_regs() response (None if it succeeded or raised)
+        self.last_write_regs_exception_code: int | None = None
+
     # ==================== Public API ====================
 
     async def read_u16(self, offset: int) -> int:
@@ -71,11 +90,7 @@ class ModbusBus:
                 return [DEFAULT_MISSING_VALUE] * count
 
             # CRITICAL: Clear buffer BEFORE request
-            buffer_cleared = self._try_clear_receive_buffer()
-            logger.debug(f"[DEBUG][Bus][Slave {self.slave_id}] Buffer clear result: {buffer_cleared}")
-
-            # Small delay to let buffer clear propagate
-            await asyncio.sleep(0.01)  # 10ms
+            await self._prepare_request()
 
             try:
                 logger.debug(
@@ -84,28 +99,44 @@ class ModbusBus:
                 )
 
                 if self.register_type in (RegisterType.HOLDING, "holding"):
-                    resp: ModbusPDU = await self.client.read_holding_registers(
-                        address=int(offset),
-                        count=int(count),
-                        slave=int(self.slave_id),
+                    resp: ModbusPDU = await self._timed_request(
+                        "read",
+                        int(count),
+                        self.client.read_holding_registers(
+                            address=int(offset),
+                            count=int(count),
+                            slave=int(self.slave_id),
+                        ),
                     )
                 elif self.register_type in (RegisterType.INPUT, "input"):
-                    resp: ModbusPDU = await self.client.read_input_registers(
-                        address=int(offset),
-                        count=int(count),
-                        slave=int(self.slave_id),
+                    resp: ModbusPDU = await self._timed_request(
+                        "read",
+                        int(count),
+                        self.client.read_input_registers(
+                            address=int(offset),
+                            count=int(count),
+                            slave=int(self.slave_id),
+                        ),
                     )
                 elif self.register_type in (RegisterType.COIL, "coil"):
-                    resp: ModbusPDU = await self.client.read_coils(
-                        address=int(offset),
-                        count=int(count),
-                        slave=int(self.slave_id),
+                    resp: ModbusPDU = await self._timed_request(
+                        "read_bits",
+                        int(count),
+                        self.client.read_coils(
+                            address=int(offset),
+                            count=int(count),
+                            slave=int(self.slave_id),
+                        ),
                     )
                 elif self.register_type in (RegisterType.DISCRETE_INPUT, "discrete_input"):
-                    resp: ModbusPDU = await self.client.read_discrete_inputs(
-                        address=int(offset),
-                        count=int(count),
-                        slave=int(self.slave_id),
+                    resp: ModbusPDU = await self._timed_request(
+                        "read_bits",
+                        int(count),
+                        self.client.read_discrete_inputs(
+                            address=int(offset),
+                            count=int(count),
+                            slave=int(self.slave_id),
+                        ),
                     )
                 else:
                     logger.error(f"[Bus] Unsupported register type for read_regs: {self.register_type}")
@@ -187,14 +218,17 @@ class ModbusBus:
                 return False
 
             # Clear buffer before write
-            self._try_clear_receive_buffer()
-            await asyncio.sleep(0.01)
+            await self._prepare_request()
 
             try:
-                resp: ModbusPDU = await self.client.write_register(
-                    address=int(offset),
-                    value=int(value),
-                    slave=int(self.slave_id),
+                resp: ModbusPDU = await self._timed_request(
+                    "write",
+                    1,
+                    self.client.write_register(
+                        address=int(offset),
+                        value=int(value),
+                        slave=int(self.slave_id),
+                    ),
                 )
 
                 if resp.isError():
@@ -230,6 +264,57 @@ class ModbusBus:
                 await self._reset_connection_locked(reason="write_exception", force_close=True)
                 return False
 
+    async def write_regs(self, offset: int, values: list[int]) -> bool:
+        """Write contiguous 16-bit registers in one request (FC 16) with PRE-REQUEST buffer clearing."""
+        async with self._lock_context():
+            self.last_write_regs_exception_code = None
+            if not await self._ensure_connected_locked():
+                logger.error(f"[Bus] connect failed (slave={self.slave_id})")
+                return False
+
+            # Clear buffer before write
+            await self._prepare_request()
+
+            try:
+                resp: ModbusPDU = await self._timed_request(
+                    "write",
+                    len(values),
+                    self.client.write_registers(
+                        address=int(offset),
+                        values=[int(value) for value in values],
+                        slave=int(self.slave_id),
+                    ),
+                )
+
+                if resp.isError():
+                    try:
+                        exc_code = resp.exception_code
+                    except AttributeError:
+                        exc_code = 0
+                    self.last_write_regs_exception_code = exc_code
+
+                    if exc_code in {self.ILLEGAL_DATA_ADDRESS, self.ILLEGAL_DATA_VALUE, self.ILLEGAL_FUNCTION}:
+                        logger.debug(f"[Bus] Write-multiple config error (slave={self.slave_id}, code={exc_code})")
+                        await self._reset_connection_locked(reason=f"write_regs_error_{exc_code}", force_close=False)
+                    else:
+                        logger.warning(f"[Bus] Write-multiple error (slave={self.slave_id}, code={exc_code})")
+                        await self._reset_connection_locked(reason=f"write_regs_error_{exc_code}", force_close=True)
+
+                    return False
+
+                self._consecutive_errors = 0
+                return True
+
+            except asyncio.CancelledError:
+                logger.warning(f"[Bus] CancelledError during write_regs (slave={self.slave_id}, offset={offset})")
+                await self._reset_connection_locked(reason="cancelled", force_close=True)
+                raise
+
+            except Exception as exc:
+                logger.warning(f"[Bus] Exception during write_regs (slave={self.slave_id}): {exc}")
+                await self._reset_connection_locked(reason="write_regs_exception", force_close=True)
+                return False
+
     async def read_coil(self, offset: int) -> int:
         coils = await self.read_coils(offset, 1)
         return coils[0] if coils else DEFAULT_MISSING_VALUE
@@ -242,14 +327,17 @@ class ModbusBus:
                 return [DEFAULT_MISSING_VALUE] * count
 
             # Clear buffer before request
-            self._try_clear_receive_buffer()
-            await asyncio.sleep(0.01)
+            await self._prepare_request()
 
             try:
-                resp: ModbusPDU = await self.client.read_coils(
-                    address=int(offset),
-                    count=int(count),
-                    slave=int(self.slave_id),
+                resp: ModbusPDU = await self._timed_request(
+                    "read_bits",
+                    int(count),
+                    self.client.read_coils(
+                        address=int(offset),
+                        count=int(count),
+                        slave=int(self.slave_id),
+                    ),
                 )
 
                 if resp.isError():
@@ -303,14 +391,17 @@ class ModbusBus:
                 return False
 
             # Clear buffer before write
-            self._try_clear_receive_buffer()
-            await asyncio.sleep(0.01)
+            await self._prepare_request()
 
             try:
-                resp: ModbusPDU = await self.client.write_coil(
-                    address=int(offset),
-                    value=bool(value),
-                    slave=int(self.slave_id),
+                resp: ModbusPDU = await self._timed_request(
+                    "write",
+                    1,
+                    self.client.write_coil(
+                        address=int(offset),
+                        value=bool(value),
+                        slave=int(self.slave_id),
+                    ),
                 )
 
                 if resp.isError():
@@ -342,14 +433,17 @@ class ModbusBus:
                 return False
 
             # Clear buffer before write
-            self._try_clear_receive_buffer()
-            await asyncio.sleep(0.01)
+            await self._prepare_request()
 
             try:
-                resp: ModbusPDU = await self.client.write_coils(
-                    address=int(offset),
-                    values=list(values),
-                    slave=int(self.slave_id),
+                resp: ModbusPDU = await self._timed_request(
+                    "write",
+                    len(values),
+                    self.client.write_coils(
+                        address=int(offset),
+                        values=list(values),
+                        slave=int(self.slave_id),
+                    ),
                 )
 
                 if resp.isError():
@@ -385,14 +479,17 @@ class ModbusBus:
                 return [DEFAULT_MISSING_VALUE] * count
 
             # Clear buffer before request
-            self._try_clear_receive_buffer()
-            await asyncio.sleep(0.01)
+            await self._prepare_request()
 
             try:
-                resp: ModbusPDU = await self.client.read_discrete_inputs(
-                    address=int(offset),
-                    count=int(count),
-                    slave=int(self.slave_id),
+                resp: ModbusPDU = await self._timed_request(
+                    "read_bits",
+                    int(count),
+                    self.client.read_discrete_inputs(
+                        address=int(offset),
+                        count=int(count),
+                        slave=int(self.slave_id),
+                    ),
                 )
 
                 if resp.isError():
@@ -511,6 +608,43 @@ class ModbusBus:
         await self._reset_connection_locked(reason=f"modbus_error_{exc_code}", force_close=True)
         return [DEFAULT_MISSING_VALUE] * count
 
+    async def _timed_request(self, kind: str, count: int, request: Awaitable[ModbusPDU]) -> ModbusPDU:
+        """
+        Await a client request under the device's adaptive deadline and record its latency.
+
+        A dead slave times out after ~p99 x margin instead of the full client timeout (+ retries).
+        Without history (or tracker) the client's own timeout applies unchanged; after a
+        timeout the next request does too, so a slower slave can re-learn its deadline.
+        """
+        if self.latency is None or self.request_timeout_sec is None:
+            return await request
+
+        key = self.latency.size_key(kind, count)
+        deadline = self.latency.deadline(key, self.request_timeout_sec)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        try:
+            resp: ModbusPDU = await (request if deadline is None else asyncio.wait_for(request, timeout=deadline))
+        except asyncio.TimeoutError:
+            self.latency.record_timeout(key)
+            raise
+        if not resp.isError():
+            self.latency.record(key, loop.time() - start)
+        return resp
+
+    async def _prepare_request(self) -> None:
+        """Pre-request line hygiene, depending on transport (must be called under port lock)."""
+        if self.transport == ModbusTransport.TCP:
+            return
+
+        if self.transport == ModbusTransport.SERIAL:
+            buffer_cleared = self._try_clear_receive_buffer()
+            logger.debug(f"[DEBUG][Bus][Slave {self.slave_id}] Buffer clear result: {buffer_cleared}")
+
+        # Small delay to let buffer clear propagate / keep RS-485 inter-frame gap behind gateways
+        await asyncio.sleep(0.01)  # 10ms
+
     async def _ensure_connected_locked(self) -> bool:
         """Must be called under port lock."""
         if self.client.connected:
@@ -564,7 +698,11 @@ class ModbusBus:
         Clear serial RX buffer via ctx.transport.sync_serial.
 
         Critical for RS-485: Prevents stale frames from causing slave ID confusion.
+        No-op for TCP transports (no local serial port to clear).
         """
+        if self.transport != ModbusTransport.SERIAL:
+            return False
+
         # Direct path for pymodbus 3.x: ctx.transport.sync_serial
         try:
             ctx = self.client.ctx
@@ -606,7 +744,14 @@ class ModbusBus:
     async def _safe_close_client(self, reason: str) -> None:
         """
         Best-effort close supporting both sync and async implementations.
+
+        A pooled TCP client is left open: the pool already closed the member whose request
+        failed, and closing the pool would also drop requests other devices have in flight.
         """
+        if isinstance(self.client, ModbusTcpClientPool):
+            logger.debug(f"[Bus] Pooled connection kept (slave={self.slave_id}, reason={reason})")
+            return
+
         try:
             close_ret = self.client.close()
             if asyncio.iscoroutine(close_ret) or isinstance(close_ret, Coroutine):
@@ -3,6 +3,28 @@ from typing import Awaitable, Callable
 
 from core.model.enum.scale_table_enum import ScaleTable
 
+# Pin attribute `scale_from` -> scale kind
+SCALE_FROM_KIND: dict[str, str] = {
+    "current_index": "current",
+    "voltage_index": "voltage",
+    "energy_index": "energy_auto",
+    "kwh_scale": "kwh",
+}
+
+# Scale kind -> index register (pin name) it is looked up with
+INDEX_PIN_BY_KIND: dict[str, str] = {
+    "current": "SCALE_CurrentIndex",
+    "voltage": "SCALE_VoltageIndex",
+    "energy_auto": "SCALE_EnergyIndex",
+    "kwh": "SCALE_EnergyIndex",
+}
+
+
+def index_pins_for(scale_from: str) -> list[str]:
+    """Index register names a scale_from pin depends on (empty for unknown kinds)."""
+    kind = SCALE_FROM_KIND.get(scale_from)
+    return [INDEX_PIN_BY_KIND[kind]] if kind in INDEX_PIN_BY_KIND else []
+
 
 class ScaleService:
     """Responsible for all scale_from and tables/modes, including cache and invalidation."""
@@ -12,6 +34,7 @@ class ScaleService:
         self.mode_dict = mode_dict or {}
         self.logger = logger
         self.cache: dict[str, float] = {}
+        self._index_values: dict[str, int] = {}
 
     async def get_factor(self, kind: str, index_reader: Callable[[str], Awaitable[int]]) -> float:
         # kind: "current" | "voltage" | "energy_auto" | "kwh"
@@ -20,15 +43,15 @@ class ScaleService:
 
         match kind:
             case "current":
-                idx = await index_reader("SCALE_CurrentIndex")
+                idx = await index_reader(INDEX_PIN_BY_KIND["current"])
                 val = self._lookup_factor(table_name=ScaleTable.CURRENT, idx=idx, default=0.01)
 
             case "voltage":
-                idx = await index_reader("SCALE_VoltageIndex")
+                idx = await index_reader(INDEX_PIN_BY_KIND["voltage"])
                 val = self._lookup_factor(table_name=ScaleTable.VOLTAGE, idx=idx, default=1.0)
 
             case "energy_auto":
-                idx = await index_reader("SCALE_EnergyIndex")
+                idx = await index_reader(INDEX_PIN_BY_KIND["energy_auto"])
                 base = self._lookup_factor(table_name=ScaleTable.ENERGY, idx=idx, default=1.0)
                 post = float(self.table_dict.get("energy_post_multiplier", 0.001))
                 val = base * post
@@ -48,6 +71,17 @@ class ScaleService:
         self.cache[kind] = val
         return val
 
+    def refresh_indices(self, index_values: dict[str, int]) -> None:
+        """
+        Feed index register values read elsewhere (e.g. a bulk poll).
+        Cached factors are dropped only for kinds whose index actually changed.
+        """
+        for index_pin, value in index_values.items():
+            if self._index_values.get(index_pin) == value:
+                continue
+            self._index_values[index_pin] = value
+            self.invalidate([kind for kind, pin in INDEX_PIN_BY_KIND.items() if pin == index_pin])
+
     def invalidate(self, keys: list[str] | None = None):
         if keys:
             for k in keys:
@@ -2,12 +2,16 @@ import logging
 from dataclasses import dataclass
 from typing import Any
 
-from core.device.modbus.device_helper import required_word_count
+from core.device.generic.scales import index_pins_for
+from core.device.modbus.device_helper import compose_words, required_word_count
 from core.model.device_constant import DEFAULT_MISSING_VALUE, INVALID_U16_SENTINEL
 from core.model.enum.register_type_enum import RegisterType
 from core.util.data_decoder import DecodeFormat
 from core.util.value_decoder import ValueDecoder
 
+# Bit-addressed tables: read with FC01/FC02, one item per coil / input
+BIT_REGISTER_TYPES: frozenset[str] = frozenset({RegisterType.COIL.value, RegisterType.DISCRETE_INPUT.value})
+
 
 @dataclass(frozen=True)
 class BulkRange:
@@ -23,6 +27,13 @@ class ModbusBulkReader:
     """
     Handles bulk reading optimization for Modbus devices.
     Groups contiguous registers into single read operations.
+
+    Word tables (holding/input) are merged up to max_regs_per_req words per request;
+    bit tables (coil/discrete_input) up to max_bits_per_req bits per FC01/FC02 request.
+
+    composed_of sub-registers and scale index registers are planned as dependencies (even when
+    not readable themselves), so composed values and dynamic scales are resolved from the bulk
+    buffer without per-pin reads.
     """
 
     def __init__(self, register_map: dict, default_register_type: str, logger: logging.Logger):
@@ -31,13 +42,12 @@ class ModbusBulkReader:
         self.logger = logger
         self.decoder = ValueDecoder()
 
-    def build_bulk_ranges(self, max_regs_per_req: int = 120) -> list[BulkRange]:
+    def build_bulk_ranges(self, max_regs_per_req: int = 120, max_bits_per_req: int = 2000) -> list[BulkRange]:
         """Build list of contiguous register ranges for bulk reading."""
         bulk_candidates: list[tuple[str, dict, int, int, str]] = []
 
-        for pin_name, pin_cfg in self.register_map.items():
-            if not self._is_bulk_eligible(pin_cfg):
-                continue
+        for pin_name in self._planned_pin_names():
+            pin_cfg = self.register_map[pin_name]
 
             register_type = pin_cfg.get("register_type") or self.default_register_type
 
@@ -52,21 +62,41 @@ class ModbusBulkReader:
                 self.logger.error(f"[BulkReader] pin '{pin_name}' invalid offset={offset}, skip bulk. cfg={pin_cfg}")
                 continue
 
-            decode_format = pin_cfg.get("format", DecodeFormat.U16)
-            word_count = required_word_count(decode_format)
+            if register_type in BIT_REGISTER_TYPES:
+                word_count = 1
+            else:
+                word_count = required_word_count(pin_cfg.get("format", DecodeFormat.U16))
 
             bulk_candidates.append((pin_name, pin_cfg, start_offset, word_count, register_type))
 
         bulk_candidates.sort(key=lambda c: (c[4], c[2]))
-        return self._merge_candidates_into_ranges(bulk_candidates, max_regs_per_req)
+        return self._merge_candidates_into_ranges(bulk_candidates, max_regs_per_req, max_bits_per_req)
 
     def process_bulk_range_result(
-        self, bulk_range: BulkRange, registers: list[int], is_invalid_raw_func: callable
+        self,
+        bulk_range: BulkRange,
+        registers: list[int],
+        is_invalid_raw_func: callable,
+        scale_factors: dict[str, float] | None = None,
     ) -> dict[str, Any]:
-        """Process bulk read results and map back to pins."""
+        """
+        Process bulk read results and map back to pins.
+
+        Dependency-only (non-readable) registers are not reported. scale_from pins are reported
+        only when their factor is in scale_factors (otherwise left to the per-pin fallback).
+        """
+        if bulk_range.register_type in BIT_REGISTER_TYPES:
+            return self._process_bit_range_result(bulk_range, registers)
+
         result: dict[str, Any] = {}
+        scale_factors = scale_factors or {}
 
         for pin_name, pin_cfg in bulk_range.items:
+            if not pin_cfg.get("readable"):
+                continue
+            if pin_cfg.get("scale_from") and pin_cfg["scale_from"] not in scale_factors:
+                continue
+
             offset = pin_cfg.get("offset")
             if offset is None:
                 result[pin_name] = DEFAULT_MISSING_VALUE
@@ -97,26 +127,121 @@ class ModbusBulkReader:
                 continue
 
             decoded_value = self.decoder.decode_registers(decode_format, register_words)
-            final_value = self._apply_post_process(pin_cfg, decoded_value)
+            final_value = self._apply_post_process(pin_cfg, decoded_value, scale_factors)
             result[pin_name] = final_value
 
         return result
 
+    def collect_words(self, bulk_range: BulkRange, registers: list[int]) -> dict[tuple[str, int], int]:
+        """Raw 16-bit words of a word-table range, keyed by (register_type, offset)."""
+        if bulk_range.register_type in BIT_REGISTER_TYPES:
+            return {}
+        return {
+            (bulk_range.register_type, bulk_range.start + i): int(word) & INVALID_U16_SENTINEL
+            for i, word in enumerate(registers[: bulk_range.count])
+        }
+
+    def pin_words(self, pin_names: list[str], words: dict[tuple[str, int], int]) -> dict[str, int]:
+        """Buffered word of each named single-register pin (pins not in the buffer are omitted)."""
+        out: dict[str, int] = {}
+        for pin_name in pin_names:
+            key = self._word_key(pin_name)
+            if key is not None and key in words:
+                out[pin_name] = words[key]
+        return out
+
+    def scale_index_pins(self) -> list[str]:
+        """Index registers needed by readable scale_from pins."""
+        names: dict[str, None] = {}
+        for pin_cfg in self.register_map.values():
+            if pin_cfg.get("readable") and pin_cfg.get("scale_from"):
+                names.update(dict.fromkeys(index_pins_for(pin_cfg["scale_from"])))
+        return list(names)
+
+    def compose_from_words(
+        self, words: dict[tuple[str, int], int], scale_factors: dict[str, float] | None = None
+    ) -> dict[str, Any]:
+        """
+        Assemble readable composed_of pins whose sub-registers are all in the bulk buffer.
+        Pins that cannot be assembled (missing words, or scale factor not resolved) are omitted.
+        """
+        result: dict[str, Any] = {}
+        scale_factors = scale_factors or {}
+
+        for pin_name, pin_cfg in self.register_map.items():
+            sub_keys = pin_cfg.get("composed_of")
+            if not pin_cfg.get("readable") or not isinstance(sub_keys, (list, tuple)) or len(sub_keys) not in (2, 3):
+                continue
+            if pin_cfg.get("scale_from") and pin_cfg["scale_from"] not in scale_factors:
+                continue
+
+            sub_words = self.pin_words(list(sub_keys), words)
+            if len(sub_words) != len(sub_keys):
+                continue
+
+            value = compose_words([sub_words[key] for key in sub_keys])
+            if value == DEFAULT_MISSING_VALUE:
+                result[pin_name] = DEFAULT_MISSING_VALUE
+                continue
+            result[pin_name] = self._apply_post_process(pin_cfg, value, scale_factors)
+
+        return result
+
+    def _process_bit_range_result(self, bulk_range: BulkRange, bits: list[int]) -> dict[str, Any]:
+        """Map FC01/FC02 bits back to pins (0/1, same as the per-pin coil/discrete_input reads)."""
+        result: dict[str, Any] = {}
+
+        for pin_name, pin_cfg in bulk_range.items:
+            relative_index = int(pin_cfg["offset"]) - bulk_range.start
+            if relative_index < 0 or relative_index >= len(bits):
+                result[pin_name] = DEFAULT_MISSING_VALUE
+                continue
+
+            bit = bits[relative_index]
+            result[pin_name] = DEFAULT_MISSING_VALUE if bit == DEFAULT_MISSING_VALUE else (1 if bit else 0)
+
+        return result
+
+    def _planned_pin_names(self) -> list[str]:
+        """Bulk-eligible pins plus the registers composed/scaled pins depend on."""
+        names: dict[str, None] = {}
+        for pin_name, pin_cfg in self.register_map.items():
+            if self._is_bulk_eligible(pin_cfg):
+                names[pin_name] = None
+            elif pin_cfg.get("readable") and isinstance(pin_cfg.get("composed_of"), (list, tuple)):
+                names.update(dict.fromkeys(k for k in pin_cfg["composed_of"] if self._is_dependency(k)))
+
+        for index_pin in self.scale_index_pins():
+            if self._is_dependency(index_pin):
+                names[index_pin] = None
+        return list(names)
+
+    def _is_dependency(self, pin_name: str) -> bool:
+        """A word register another pin's value is computed from (readable or not)."""
+        pin_cfg = self.register_map.get(pin_name)
+        if not isinstance(pin_cfg, dict) or pin_cfg.get("offset") is None or pin_cfg.get("composed_of"):
+            return False
+        register_type = pin_cfg.get("register_type") or self.default_register_type
+        return register_type in {RegisterType.HOLDING.value, RegisterType.INPUT.value}
+
+    def _word_key(self, pin_name: str) -> tuple[str, int] | None:
+        pin_cfg = self.register_map.get(pin_name) or {}
+        try:
+            return (pin_cfg.get("register_type") or self.default_register_type, int(pin_cfg["offset"]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
     def _is_bulk_eligible(self, config_raw: dict) -> bool:
         """Check if a pin configuration is eligible for bulk reading."""
         if not config_raw.get("readable"):
             return False
-        if config_raw.get("register_type") in {RegisterType.COIL.value, RegisterType.DISCRETE_INPUT.value}:
-            return False
         if config_raw.get("composed_of"):
             return False
-        if config_raw.get("scale_from"):
-            return False
         pin_rt = config_raw.get("register_type", self.default_register_type)
-        return pin_rt in {RegisterType.HOLDING.value, RegisterType.INPUT.value, self.default_register_type}
+        return pin_rt in {RegisterType.HOLDING.value, RegisterType.INPUT.value, *BIT_REGISTER_TYPES}
 
     def _merge_candidates_into_ranges(
-        self, candidates: list[tuple[str, dict, int, int, str]], max_regs: int
+        self, candidates: list[tuple[str, dict, int, int, str]], max_regs: int, max_bits: int = 2000
     ) -> list[BulkRange]:
         """Merge bulk candidates into contiguous ranges."""
         bulk_ranges: list[BulkRange] = []
@@ -138,10 +263,11 @@ class ModbusBulkReader:
                 continue
 
             max_gap = 0
+            max_span = max_bits if current_register_type in BIT_REGISTER_TYPES else max_regs
             should_split = (
                 register_type != current_register_type
                 or next_range_start > current_range_end + max_gap
-                or (next_range_end - current_range_start) > max_regs
+                or (next_range_end - current_range_start) > max_span
             )
 
             if should_split:
@@ -174,8 +300,10 @@ class ModbusBulkReader:
 
         return bulk_ranges
 
-    def _apply_post_process(self, config: dict, value: int | float) -> int | float:
-        """Apply post-processing steps to decoded value."""
+    def _apply_post_process(
+        self, config: dict, value: int | float, scale_factors: dict[str, float] | None = None
+    ) -> int | float:
+        """Apply post-processing steps to decoded value (same order as the per-pin read path)."""
         if config.get("bit") is not None:
             value = self.decoder.extract_bit(value, config["bit"])
 
@@ -184,6 +312,10 @@ class ModbusBulkReader:
 
         value = self.decoder.apply_scale(value, config.get("scale", 1.0))
 
+        scale_from = config.get("scale_from")
+        if scale_from is not None and scale_factors:
+            value = self.decoder.apply_scale(value, scale_factors[scale_from])
+
         precision = config.get("precision")
         if precision is not None:
             value = round(value, int(precision))
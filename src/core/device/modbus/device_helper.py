@@ -3,9 +3,11 @@ import logging
 from typing import Any
 
 from core.device.generic.modbus_bus import ModbusBus
-from core.device.generic.scales import ScaleService
-from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.device.generic.scales import SCALE_FROM_KIND, ScaleService
+from core.model.device_constant import DEFAULT_MISSING_VALUE, HI_SHIFT, INVALID_U16_SENTINEL, MD_SHIFT
+from core.model.enum.modbus_transport_enum import ModbusTransport
 from core.util.data_decoder import DecodeFormat
+from core.util.latency_histogram import DeviceLatencyTracker
 
 # ==================== Module-level utility functions ====================
 
@@ -41,6 +43,25 @@ def required_word_count(fmt: str | DecodeFormat) -> int:
             return 1
 
 
+def compose_words(words: list[int]) -> int:
+    """
+    Combine 2 (HI, LO) or 3 (HI, MD, LO) 16-bit words of a composed_of pin.
+
+    Returns:
+        The 32/48-bit value, or DEFAULT_MISSING_VALUE when every word is the 0xFFFF sentinel
+    """
+    words = [int(w) & INVALID_U16_SENTINEL for w in words]
+    if all(w == INVALID_U16_SENTINEL for w in words):
+        return DEFAULT_MISSING_VALUE
+
+    if len(words) == 2:
+        hi, lo = words
+        return (hi << MD_SHIFT) | lo
+
+    hi, md, lo = words
+    return (hi << HI_SHIFT) | (md << MD_SHIFT) | lo
+
+
 class ModbusDeviceHelper:
     """Helper utilities for Modbus device operations."""
 
@@ -53,6 +74,7 @@ class ModbusDeviceHelper:
         client: Any,
         port_lock: asyncio.Lock,
         logger: logging.Logger,
+        transport: str = ModbusTransport.SERIAL,
     ):
         self.model = model
         self.slave_id = slave_id
@@ -61,6 +83,9 @@ class ModbusDeviceHelper:
         self.client = client
         self.port_lock = port_lock
         self.logger = logger
+        self.transport = transport
+        self.latency_tracker: DeviceLatencyTracker | None = None
+        self.request_timeout_sec: float | None = None
 
     def require_readable(self, name: str) -> dict:
         """Get readable pin config or empty dict."""
@@ -117,6 +142,9 @@ class ModbusDeviceHelper:
             slave_id=bus_slave_id,
             register_type=pin_register_type,
             lock=self.port_lock,
+            transport=self.transport,
+            latency=self.latency_tracker,
+            request_timeout_sec=self.request_timeout_sec,
         )
         bus_cache[pin_register_type] = new_bus
 
@@ -127,10 +155,18 @@ class ModbusDeviceHelper:
 
         return new_bus
 
-    async def resolve_dynamic_scale(self, scale_from: str, bus: ModbusBus) -> float:
-        """Resolve dynamic scale factor from device registers."""
+    async def resolve_dynamic_scale(
+        self, scale_from: str, bus: ModbusBus, index_words: dict[str, int] | None = None
+    ) -> float:
+        """
+        Resolve dynamic scale factor from device registers.
+
+        index_words: index register values already read (bulk buffer); only missing ones hit the bus.
+        """
 
         async def index_reader(index_name: str) -> int:
+            if index_words and index_name in index_words:
+                return index_words[index_name]
             pin = self.register_map.get(index_name)
             if not pin:
                 self.logger.warning(f"[{self.model}] index '{index_name}' not defined; fallback -1")
@@ -141,13 +177,7 @@ class ModbusDeviceHelper:
                 self.logger.warning(f"[{self.model}] read index '{index_name}' failed: {e}")
                 return DEFAULT_MISSING_VALUE
 
-        mapping = {
-            "current_index": "current",
-            "voltage_index": "voltage",
-            "energy_index": "energy_auto",
-            "kwh_scale": "kwh",
-        }
-        kind = mapping.get(scale_from)
+        kind = SCALE_FROM_KIND.get(scale_from)
         if not kind:
             self.logger.warning(f"[{self.model}] Unknown scale_from '{scale_from}'")
             return 1.0
@@ -0,0 +1,290 @@
+import asyncio
+import logging
+import os
+from dataclasses import asdict, dataclass, field
+from glob import glob
+from typing import Any, Callable
+
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusException
+from pymodbus.framer import FramerType
+
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.model.enum.register_type_enum import RegisterType
+from core.util.config_manager import ConfigManager
+from core.util.latency_histogram import DeviceLatencyTracker
+
+logger = logging.getLogger("ModbusDiscoveryScanner")
+
+DEFAULT_BAUDRATES: tuple[int, ...] = (9600, 19200, 38400, 115200, 4800)
+
+# Exception codes a gateway answers with on behalf of a silent slave: not a hit
+GATEWAY_EXCEPTION_CODES: frozenset[int] = frozenset({0x0A, 0x0B})
+
+PROBE_LATENCY_KEY = "probe"
+
+ProbeClientFactory = Callable[["DiscoveryTarget", int | None, float], Any]
+
+
+@dataclass
+class DiscoveryTarget:
+    """One port (or TCP gateway) to scan."""
+
+    port: str | None = None
+    transport: ModbusTransport = ModbusTransport.SERIAL
+    host: str | None = None
+    tcp_port: int = 502
+
+    baudrates: list[int] = field(default_factory=lambda: list(DEFAULT_BAUDRATES))
+    slave_id_start: int = 1
+    slave_id_end: int = 247
+
+    register_type: str = RegisterType.HOLDING.value
+    probe_offset: int = 0
+
+    max_devices: int | None = None  # stop the port once this many slaves answered
+    stop_on_first_baudrate: bool = True  # skip remaining baud rates once one has hits
+    fingerprint: bool = False
+
+    @property
+    def endpoint(self) -> str:
+        if self.transport == ModbusTransport.SERIAL:
+            return str(self.port)
+        return f"{self.transport}://{self.host}:{self.tcp_port}"
+
+
+@dataclass
+class DiscoveryHit:
+    slave_id: int
+    baudrate: int | None
+    latency_ms: float
+    exception_code: int | None = None  # answered with a Modbus exception (still present)
+    models: list[str] = field(default_factory=list)  # fingerprint candidates, best first
+
+
+@dataclass
+class PortScanResult:
+    endpoint: str
+    hits: list[DiscoveryHit] = field(default_factory=list)
+    baudrates_tried: list[int | None] = field(default_factory=list)
+    probes: int = 0
+    elapsed_sec: float = 0.0
+    errors: list[str] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+@dataclass(frozen=True)
+class DriverSignature:
+    """Offsets a driver's model answers on; a slave that answers all of them matches."""
+
+    model: str
+    register_type: str
+    offsets: tuple[int, ...]
+
+
+class ModbusDiscoveryScanner:
+    """
+    Scans ports for Modbus slaves (slave ID x baud rate) with minimal probe reads.
+
+    - One FC03/FC04 read of a single register per (baud rate, slave ID). Any reply counts as a
+      hit, including Modbus exception responses (except gateway 0x0A/0x0B).
+    - Aggressive adaptive timeout: probe_timeout_sec until the first reply, then p99 x margin
+      of the replies seen on that port (never below min_timeout_sec).
+    - Ports are scanned in parallel; slave IDs on one port are probed sequentially.
+    - Stops early: max_devices per port, and remaining baud rates once one baud rate had hits.
+    - Optional fingerprint: match each hit against `res/driver/*.yml` register signatures
+      (first / middle / last readable offset of the driver's register table).
+    """
+
+    def __init__(
+        self,
+        *,
+        driver_dir: str = "./res/driver",
+        probe_timeout_sec: float = 0.1,
+        min_timeout_sec: float = 0.03,
+        timeout_margin: float = 3.0,
+        inter_probe_delay_sec: float = 0.0,
+        client_factory: ProbeClientFactory | None = None,
+    ):
+        self.driver_dir = driver_dir
+        self.probe_timeout_sec = float(probe_timeout_sec)
+        self.min_timeout_sec = float(min_timeout_sec)
+        self.timeout_margin = float(timeout_margin)
+        self.inter_probe_delay_sec = float(inter_probe_delay_sec)
+        self._client_factory: ProbeClientFactory = client_factory or _build_probe_client
+        self._signatures: list[DriverSignature] | None = None
+
+    async def scan(self, targets: list[DiscoveryTarget]) -> list[PortScanResult]:
+        """Scan every target; different ports run in parallel."""
+        return list(await asyncio.gather(*(self.scan_port(target) for target in targets)))
+
+    async def scan_port(self, target: DiscoveryTarget) -> PortScanResult:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = PortScanResult(endpoint=target.endpoint)
+
+        baudrates: list[int | None] = (
+            list(target.baudrates) if target.transport == ModbusTransport.SERIAL else [None]
+        ) or list(DEFAULT_BAUDRATES)
+
+        for baudrate in baudrates:
+            result.baudrates_tried.append(baudrate)
+            hits_before = len(result.hits)
+
+            await self._scan_baudrate(target, baudrate, result)
+
+            if self._port_done(target, result):
+                break
+            if target.stop_on_first_baudrate and len(result.hits) > hits_before:
+                break
+
+        result.elapsed_sec = loop.time() - start
+        logger.info(
+            f"[Discovery] {result.endpoint}: {len(result.hits)} slaves in {result.elapsed_sec:.2f}s "
+            f"({result.probes} probes, baudrates={result.baudrates_tried})"
+        )
+        return result
+
+    # ==================== Internal helpers ====================
+
+    async def _scan_baudrate(self, target: DiscoveryTarget, baudrate: int | None, result: PortScanResult) -> None:
+        client = self._client_factory(target, baudrate, self.probe_timeout_sec)
+        try:
+            if not await client.connect():
+                result.errors.append(f"connect failed (baudrate={baudrate})")
+                return
+
+            tracker = DeviceLatencyTracker(
+                margin=self.timeout_margin, min_deadline_sec=self.min_timeout_sec, min_samples=1
+            )
+
+            for slave_id in range(int(target.slave_id_start), int(target.slave_id_end) + 1):
+                if self._port_done(target, result):
+                    return
+
+                timeout = tracker.deadline(PROBE_LATENCY_KEY, self.probe_timeout_sec) or self.probe_timeout_sec
+                reply = await self._probe(client, target.register_type, target.probe_offset, slave_id, timeout)
+                result.probes += 1
+
+                if reply is not None:
+                    elapsed, exception_code = reply
+                    tracker.record(PROBE_LATENCY_KEY, elapsed)
+                    hit = DiscoveryHit(slave_id, baudrate, round(elapsed * 1000, 1), exception_code)
+                    if target.fingerprint:
+                        hit.models = await self._fingerprint(client, slave_id, timeout)
+                    result.hits.append(hit)
+                    logger.info(f"[Discovery] {target.endpoint}: slave {slave_id} @ {baudrate} ({hit.latency_ms}ms)")
+
+                if self.inter_probe_delay_sec:
+                    await asyncio.sleep(self.inter_probe_delay_sec)
+        finally:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug(f"[Discovery] {target.endpoint}: close failed: {e}")
+
+    @staticmethod
+    def _port_done(target: DiscoveryTarget, result: PortScanResult) -> bool:
+        return target.max_devices is not None and len(result.hits) >= target.max_devices
+
+    @staticmethod
+    async def _probe(
+        client, register_type: str, offset: int, slave_id: int, timeout: float
+    ) -> tuple[float, int | None] | None:
+        """(elapsed_sec, exception_code) if the slave answered, None on silence / garbage."""
+        read = (
+            client.read_input_registers if register_type == RegisterType.INPUT.value else client.read_holding_registers
+        )
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
+        try:
+            response = await asyncio.wait_for(read(int(offset), count=1, slave=slave_id), timeout=timeout)
+        except (asyncio.TimeoutError, ModbusException, ConnectionError, OSError):
+            return None
+
+        elapsed = loop.time() - start
+        if response is None:
+            return None
+        if not response.isError():
+            return elapsed, None
+
+        exception_code = getattr(response, "exception_code", None)
+        if not exception_code or exception_code in GATEWAY_EXCEPTION_CODES:
+            return None
+        return elapsed, int(exception_code)
+
+    async def _fingerprint(self, client, slave_id: int, timeout: float) -> list[str]:
+        """Driver models whose every signature offset answers without an exception (most specific first)."""
+        answers: dict[tuple[str, int], bool] = {}
+        matches: list[DriverSignature] = []
+
+        for signature in self.signatures():
+            matched = True
+            for offset in signature.offsets:
+                key = (signature.register_type, offset)
+                if key not in answers:
+                    reply = await self._probe(client, signature.register_type, offset, slave_id, timeout)
+                    answers[key] = reply is not None and reply[1] is None
+                if not answers[key]:
+                    matched = False
+                    break
+            if matched:
+                matches.append(signature)
+
+        matches.sort(key=lambda s: (-max(s.offsets), -len(s.offsets), s.model))
+        return [signature.model for signature in matches]
+
+    def signatures(self) -> list[DriverSignature]:
+        """Register signatures of every driver under driver_dir (loaded once)."""
+        if self._signatures is None:
+            self._signatures = load_driver_signatures(self.driver_dir)
+        return self._signatures
+
+
+def load_driver_signatures(driver_dir: str) -> list[DriverSignature]:
+    signatures: list[DriverSignature] = []
+
+    for path in sorted(glob(os.path.join(driver_dir, "*.yml"))):
+        try:
+            driver: dict = ConfigManager.load_yaml_file(path) or {}
+        except Exception as e:
+            logger.warning(f"[Discovery] skip driver {path}: {e}")
+            continue
+
+        register_type: str = driver.get("register_type") or RegisterType.HOLDING.value
+        if register_type not in (RegisterType.HOLDING.value, RegisterType.INPUT.value):
+            continue
+
+        offsets: list[int] = sorted(
+            {
+                int(cfg["offset"])
+                for cfg in (driver.get("register_map") or {}).values()
+                if isinstance(cfg, dict)
+                and cfg.get("offset") is not None
+                and cfg.get("readable", True)
+                and (cfg.get("register_type") or register_type) == register_type
+            }
+        )
+        if not offsets or not driver.get("model"):
+            continue
+
+        picked = tuple(sorted({offsets[0], offsets[len(offsets) // 2], offsets[-1]}))
+        signatures.append(DriverSignature(model=str(driver["model"]), register_type=register_type, offsets=picked))
+
+    return signatures
+
+
+def _build_probe_client(target: DiscoveryTarget, baudrate: int | None, timeout: float):
+    """Probe client without retries (a silent slave must cost exactly one timeout)."""
+    if target.transport == ModbusTransport.TCP:
+        return AsyncModbusTcpClient(target.host, port=target.tcp_port, timeout=timeout, retries=0)
+
+    if target.transport == ModbusTransport.RTU_OVER_TCP:
+        return AsyncModbusTcpClient(
+            target.host, port=target.tcp_port, framer=FramerType.RTU, timeout=timeout, retries=0
+        )
+
+    return AsyncModbusSerialClient(port=target.port, baudrate=int(baudrate or 9600), timeout=timeout, retries=0)
@@ -1,8 +1,8 @@
 import logging
 
 from core.device.generic.modbus_bus import ModbusBus
-from core.device.modbus.device_helper import required_word_count
-from core.model.device_constant import DEFAULT_MISSING_VALUE, HI_SHIFT, INVALID_U16_SENTINEL, MD_SHIFT
+from core.device.modbus.device_helper import compose_words, required_word_count
+from core.model.device_constant import DEFAULT_MISSING_VALUE, INVALID_U16_SENTINEL
 from core.util.data_decoder import DecodeFormat
 from core.util.value_decoder import ValueDecoder
 
@@ -13,12 +13,15 @@ class ModbusRegisterHandler:
     Supports multi-word formats, bit operations, and invalid value detection.
     """
 
+    MAX_WRITE_REGS_PER_REQ = 123  # Modbus FC 16 limit
+
     def __init__(self, model: str, register_map: dict, bus: ModbusBus, logger: logging.Logger):
         self.model = model
         self.register_map = register_map
         self.bus = bus
         self.logger = logger
         self.decoder = ValueDecoder()
+        self.write_multiple_supported = True
 
     async def read_raw(self, reg_config: dict) -> float | int:
         """Read raw value(s) from Modbus according to register configuration."""
@@ -52,6 +55,65 @@ class ModbusRegisterHandler:
         """Write a 16-bit word to a register."""
         await self.bus.write_u16(offset, int(raw_value))
 
+    async def write_words(self, words: dict[int, int]) -> dict[int, bool]:
+        """
+        Write several 16-bit words in the dict's insertion order.
+
+        Offsets that follow each other in that order (offset + 1) are merged into FC 16
+        requests; any other offset starts a new request, so the write order is kept.
+        A failed multi-register write is retried one register at a time (FC 06); if the
+        device answered ILLEGAL_FUNCTION, later calls use single writes only.
+
+        Returns:
+            Success flag per offset
+        """
+        results: dict[int, bool] = {}
+        for start, values in self._contiguous_runs(words):
+            if len(values) > 1 and self.write_multiple_supported:
+                if await self.bus.write_regs(start, values):
+                    results.update({start + i: True for i in range(len(values))})
+                    continue
+
+                if self.bus.last_write_regs_exception_code == ModbusBus.ILLEGAL_FUNCTION:
+                    self.write_multiple_supported = False
+                    self.logger.warning(
+                        f"[{self.model}] Write-multiple (FC 16) not supported (offset={start}); "
+                        f"falling back to single-register writes"
+                    )
+
+            for i, value in enumerate(values):
+                results[start + i] = await self.bus.write_u16(start + i, value)
+        return results
+
+    async def merge_bits(self, offset: int, bit_values: dict[int, int], base_word: int | None = None) -> int | None:
+        """
+        Apply several bit updates to one word with at most one read.
+
+        Args:
+            offset: Register offset
+            bit_values: bit_index -> 0/1
+            base_word: Known word value (skips the read), e.g. a full-word write in the same batch
+
+        Returns:
+            The updated word, or None if the current word could not be read
+        """
+        if base_word is None:
+            try:
+                current = await self.bus.read_u16(offset)
+            except Exception as e:
+                self.logger.warning(f"[{self.model}] Read before bit-write failed (offset={offset}): {e}")
+                return None
+
+            if current is None or int(current) < 0:
+                self.logger.warning(f"[{self.model}] Read before bit-write returned no data (offset={offset})")
+                return None
+            base_word = int(current)
+
+        new_word = int(base_word)
+        for bit_index, bit_value in bit_values.items():
+            new_word = self._apply_bit(new_word, bit_index, bit_value)
+        return new_word
+
     async def write_bit(self, offset: int, bit_index: int, bit_value: int) -> int | None:
         """Write a single bit using read-modify-write."""
         try:
@@ -60,11 +122,7 @@ class ModbusRegisterHandler:
             self.logger.warning(f"[{self.model}] Read before bit-write failed (offset={offset}): {e}")
             return None
 
-        new_word = int(current)
-        if bit_value:
-            new_word |= 1 << bit_index
-        else:
-            new_word &= ~(1 << bit_index)
+        new_word = self._apply_bit(int(current), bit_index, bit_value)
 
         try:
             await self.bus.write_u16(offset, new_word)
@@ -101,6 +159,25 @@ class ModbusRegisterHandler:
 
         return False
 
+    @staticmethod
+    def _apply_bit(word: int, bit_index: int, bit_value: int) -> int:
+        if bit_value:
+            return word | (1 << bit_index)
+        return word & ~(1 << bit_index)
+
+    @classmethod
+    def _contiguous_runs(cls, words: dict[int, int]) -> list[tuple[int, list[int]]]:
+        """Group offset->word pairs into (start, values) runs of ascending adjacent offsets, keeping dict order."""
+        runs: list[tuple[int, list[int]]] = []
+        for offset in words:
+            if runs:
+                start, values = runs[-1]
+                if offset == start + len(values) and len(values) < cls.MAX_WRITE_REGS_PER_REQ:
+                    values.append(words[offset])
+                    continue
+            runs.append((offset, [words[offset]]))
+        return runs
+
     async def _read_composed(self, reg_config: dict) -> int:
         """Read composed value from multiple 16-bit registers (supports 32-bit and 48-bit)."""
         sub_registers = reg_config["composed_of"]
@@ -115,15 +192,6 @@ class ModbusRegisterHandler:
                 self.logger.error(f"[{self.model}] composed_of sub key '{sub_key}' missing 'offset'")
                 return DEFAULT_MISSING_VALUE
             word = await self.bus.read_u16(pin_cfg["offset"])
-            register_value_list.append(int(word) & INVALID_U16_SENTINEL)
+            register_value_list.append(int(word))
 
-        if len(register_value_list) == 2:
-            hi, lo = register_value_list
-            if hi == INVALID_U16_SENTINEL and lo == INVALID_U16_SENTINEL:
-                return DEFAULT_MISSING_VALUE
-            return (hi << MD_SHIFT) | lo
-        else:
-            hi, md, lo = register_value_list
-            if hi == INVALID_U16_SENTINEL and md == INVALID_U16_SENTINEL and lo == INVALID_U16_SENTINEL:
-                return DEFAULT_MISSING_VALUE
-            return (hi << HI_SHIFT) | (md << MD_SHIFT) | lo
+        return compose_words(register_value_list)
@@ -0,0 +1,134 @@
+import asyncio
+import logging
+from typing import Any, Callable
+
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.framer import FramerType
+from pymodbus.pdu.pdu import ModbusPDU
+
+TcpClientFactory = Callable[[], AsyncModbusTcpClient]
+
+
+class ModbusTcpClientPool:
+    """
+    Pool of AsyncModbusTcpClient connections to one gateway / meter (host:port).
+
+    Exposes the subset of the pymodbus client API used by ModbusBus, so a pool can stand in
+    for a single client everywhere a device expects one.
+
+    - pymodbus serializes requests on a single client (one outstanding transaction per
+      connection). Spreading requests over `size` connections lets up to `size` MBAP
+      transactions be in flight against the same endpoint at once, each connection with
+      its own transaction-ID sequence.
+    - Each request goes to the connected member with the fewest requests in flight;
+      disconnected members are reconnected lazily when picked.
+    - A member whose request fails (exception, timeout, cancellation) is closed on its own;
+      the other members and their in-flight requests are left alone.
+    - close() drops every connection; the next request reconnects.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 502,
+        *,
+        size: int = 2,
+        timeout: float = 1.0,
+        framer: FramerType = FramerType.SOCKET,
+        client_factory: TcpClientFactory | None = None,
+    ):
+        self.logger = logging.getLogger("ModbusTcpClientPool")
+        self.host = host
+        self.port = int(port)
+        self.endpoint = f"{host}:{self.port}"
+
+        factory: TcpClientFactory = client_factory or (
+            lambda: AsyncModbusTcpClient(host, port=int(port), framer=framer, timeout=timeout, retries=1)
+        )
+        self._clients: list[AsyncModbusTcpClient] = [factory() for _ in range(max(1, int(size)))]
+        self._in_flight: list[int] = [0] * len(self._clients)
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    @property
+    def connected(self) -> bool:
+        return any(client.connected for client in self._clients)
+
+    @property
+    def in_flight(self) -> int:
+        return sum(self._in_flight)
+
+    async def connect(self) -> bool:
+        results = await asyncio.gather(*(self._connect_one(client) for client in self._clients))
+        ok_count = sum(results)
+        if ok_count < len(self._clients):
+            self.logger.warning(f"[TCP] {self.endpoint}: {ok_count}/{len(self._clients)} connections up")
+        return ok_count > 0
+
+    def close(self) -> None:
+        for index in range(len(self._clients)):
+            self._close_member(index)
+
+    # ==================== Client API ====================
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("read_holding_registers", address, count=count, slave=slave)
+
+    async def read_input_registers(self, address: int, *, count: int = 1, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("read_input_registers", address, count=count, slave=slave)
+
+    async def read_coils(self, address: int, *, count: int = 1, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("read_coils", address, count=count, slave=slave)
+
+    async def read_discrete_inputs(self, address: int, *, count: int = 1, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("read_discrete_inputs", address, count=count, slave=slave)
+
+    async def write_register(self, address: int, value: int, *, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("write_register", address, value, slave=slave)
+
+    async def write_registers(self, address: int, values: list[int], *, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("write_registers", address, values, slave=slave)
+
+    async def write_coil(self, address: int, value: bool, *, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("write_coil", address, value, slave=slave)
+
+    async def write_coils(self, address: int, values: list[bool], *, slave: int = 1) -> ModbusPDU:
+        return await self._dispatch("write_coils", address, values, slave=slave)
+
+    # ==================== Internal helpers ====================
+
+    async def _dispatch(self, method: str, *args: Any, **kwargs: Any) -> ModbusPDU:
+        index = self._pick()
+        client = self._clients[index]
+        self._in_flight[index] += 1
+        try:
+            if not client.connected and not await self._connect_one(client):
+                raise ConnectionError(f"connection to {self.endpoint} unavailable")
+            return await getattr(client, method)(*args, **kwargs)
+        except BaseException as e:
+            # The transaction state of this connection is unknown now; drop only this member
+            self.logger.debug(f"[TCP] {self.endpoint}: closing member {index} after {type(e).__name__}")
+            self._close_member(index)
+            raise
+        finally:
+            self._in_flight[index] -= 1
+
+    def _pick(self) -> int:
+        # Prefer live connections; fall back to reconnecting the least busy member
+        candidates = [i for i, client in enumerate(self._clients) if client.connected] or range(len(self._clients))
+        return min(candidates, key=lambda i: self._in_flight[i])
+
+    async def _connect_one(self, client: AsyncModbusTcpClient) -> bool:
+        try:
+            return bool(await client.connect())
+        except Exception as e:
+            self.logger.warning(f"[TCP] {self.endpoint}: connect failed: {e}")
+            return False
+
+    def _close_member(self, index: int) -> None:
+        try:
+            self._clients[index].close()
+        except Exception as e:
+            self.logger.debug(f"[TCP] {self.endpoint}: close failed: {e}")
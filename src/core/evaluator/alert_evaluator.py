@@ -1,6 +1,8 @@
 import logging
 from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime
+from typing import Callable
 
 from core.evaluator.alert_state_manager import AlertStateManager
 from core.evaluator.time_evalutor import TimeControlEvaluator
@@ -19,6 +21,29 @@ from core.util.time_util import TIMEZONE_INFO
 
 logger = logging.getLogger("AlertEvaluator")
 
+_MISSING = object()
+
+AlertEvaluateFn = Callable[[AlertConditionModel, dict[str, float], str], "tuple[bool, float] | None"]
+
+
+@dataclass(frozen=True)
+class CompiledAlert:
+    """
+    Alert config resolved once at startup.
+
+    - evaluate: evaluation routine for the alert type (no isinstance routing per snapshot)
+    - sources: pins the alert depends on, in config order
+    - time_dependent: result also depends on wall clock (schedule alerts), never skipped
+    """
+
+    alert: AlertConditionModel
+    evaluate: AlertEvaluateFn
+    sources: tuple[str, ...]
+    time_dependent: bool
+
+    def input_key(self, snapshot: dict[str, float]) -> tuple:
+        return tuple(snapshot.get(source, _MISSING) for source in self.sources)
+
 
 class AlertEvaluator:
     def __init__(
@@ -26,9 +51,14 @@ class AlertEvaluator:
         alert_config: AlertConfig,
         valid_device_ids: set[str],
         time_control_evaluator: TimeControlEvaluator | None = None,
+        state_manager: AlertStateManager | None = None,
     ):
-        # Nest struct: { model: { slave_id: [AlertConditionModel] } }
-        self.device_alert_dict: dict[str, dict[str, list[AlertConditionModel]]] = {}
+        # Flat index: { device_id: [CompiledAlert] }
+        self.alerts_by_device: dict[str, list[CompiledAlert]] = {}
+
+        # Inputs of the last non-triggered evaluation: (device_id, alert_code) -> input key
+        self._last_normal_inputs: dict[tuple[str, str], tuple] = {}
+        self.skipped_evaluations = 0
 
         total_alerts = 0
         total_devices = 0
@@ -38,7 +68,6 @@ class AlertEvaluator:
         model_alert_counts = {}  # { model: { slave_id: count } }
 
         for model, model_config in alert_config.root.items():
-            self.device_alert_dict[model] = {}
             model_alert_counts[model] = {}
 
             for slave_id in model_config.instances:
@@ -51,7 +80,8 @@ class AlertEvaluator:
 
                 alerts = alert_config.get_instance_alerts(model, slave_id)
                 if alerts:
-                    self.device_alert_dict[model][slave_id] = alerts
+                    compiled = [c for c in (self._compile_alert(device_id, alert) for alert in alerts) if c]
+                    self.alerts_by_device[device_id] = compiled
                     total_devices += 1
                     total_alerts += len(alerts)
                     model_alert_counts[model][slave_id] = len(alerts)
@@ -64,7 +94,7 @@ class AlertEvaluator:
                 else:
                     logger.debug(f"[{device_id}] No alert configured. Skipped.")
 
-        self.state_manager = AlertStateManager()
+        self.state_manager = state_manager or AlertStateManager()
         self.time_control_evaluator = time_control_evaluator
 
         logger.info("=" * 60)
@@ -77,6 +107,7 @@ class AlertEvaluator:
         logger.info(f"Total Devices: {total_devices}")
         logger.info(f"Total Alerts: {total_alerts}")
         logger.info(f"Skipped Devices: {skipped_devices}")
+        logger.info(f"Alert State Persistence: {'Enabled' if self.state_manager.is_persistent else 'Disabled'}")
 
     def evaluate(self, device_id: str, snapshot: dict[str, float]) -> list[AlertEvaluationResult]:
         """
@@ -87,35 +118,33 @@ class AlertEvaluator:
         """
         result_list: list[AlertEvaluationResult] = []
 
-        try:
-            model, slave_id = device_id.rsplit("_", 1)
-        except ValueError:
-            logger.warning(f"[SKIP] Invalid device_id format: {device_id}")
-            return result_list
-
-        model_alerts: dict[str, list[AlertConditionModel]] = self.device_alert_dict.get(model, {})
-        alert_list: list[AlertConditionModel] | None = model_alerts.get(slave_id)
-        if not alert_list:
+        compiled_list: list[CompiledAlert] | None = self.alerts_by_device.get(device_id)
+        if not compiled_list:
             logger.debug(f"No alert config for device_id: {device_id}")
             return result_list
 
-        for alert in alert_list:
-            # Route to different evaluation logic based on alert type
-            if isinstance(alert, ScheduleExpectedStateAlertConfig):
-                # Time-based expected state evaluation
-                evaluation_result: tuple[bool, float] | None = self._evaluate_schedule_expected_state(
-                    alert, snapshot, device_id
-                )
-            elif isinstance(alert, ScheduleThresholdAlertConfig):
-                evaluation_result = self._evaluate_schedule_threshold(alert, snapshot, device_id)
-            elif isinstance(alert, (ThresholdAlertConfig, AggregateAlertConfig)):
-                # Traditional threshold/aggregate evaluation
-                evaluation_result: tuple[bool, float] | None = self._evaluate_threshold_or_aggregate(
-                    alert, snapshot, device_id
-                )
-            else:
-                logger.warning(f"[{device_id}] Unknown alert type: {type(alert)}")
-                continue
+        for compiled in compiled_list:
+            alert = compiled.alert
+            state_key = (device_id, alert.code)
+
+            input_key: tuple | None = None
+            if not compiled.time_dependent:
+                input_key = compiled.input_key(snapshot)
+                # Unchanged inputs on a NORMAL alert re-produce the same non-triggered result
+                if (
+                    self._last_normal_inputs.get(state_key) == input_key
+                    and self.state_manager.get_state(device_id, alert.code) == AlertState.NORMAL
+                ):
+                    self.skipped_evaluations += 1
+                    continue
+
+            evaluation_result: tuple[bool, float] | None = compiled.evaluate(alert, snapshot, device_id)
+
+            if input_key is not None:
+                if evaluation_result is not None and evaluation_result[0]:
+                    self._last_normal_inputs.pop(state_key, None)
+                else:
+                    self._last_normal_inputs[state_key] = input_key
 
             if evaluation_result is None:
                 continue
@@ -163,6 +192,24 @@ class AlertEvaluator:
 
         return result_list
 
+    def _compile_alert(self, device_id: str, alert: AlertConditionModel) -> CompiledAlert | None:
+        """Resolve the evaluation route of an alert config once, at startup."""
+        if isinstance(alert, ScheduleExpectedStateAlertConfig):
+            # Time-based expected state evaluation
+            evaluate, time_dependent = self._evaluate_schedule_expected_state, True
+        elif isinstance(alert, ScheduleThresholdAlertConfig):
+            evaluate, time_dependent = self._evaluate_schedule_threshold, True
+        elif isinstance(alert, (ThresholdAlertConfig, AggregateAlertConfig)):
+            # Traditional threshold/aggregate evaluation
+            evaluate, time_dependent = self._evaluate_threshold_or_aggregate, False
+        else:
+            logger.warning(f"[{device_id}] Unknown alert type: {type(alert)}")
+            return None
+
+        return CompiledAlert(
+            alert=alert, evaluate=evaluate, sources=tuple(alert.sources), time_dependent=time_dependent
+        )
+
     def _calculate_alert_value(
         self, alert: AlertConditionModel, snapshot: dict[str, float], device_id: str
     ) -> float | None:
@@ -1,10 +1,18 @@
+from __future__ import annotations
+
+import asyncio
 import logging
+import time
 from datetime import datetime
+from typing import TYPE_CHECKING
 
 from core.model.enum.alert_state_enum import AlertState
 from core.schema.alert_schema import AlertSeverity
 from core.util.time_util import TIMEZONE_INFO
 
+if TYPE_CHECKING:
+    from repository.alert_state_store import AlertStateStore
+
 
 class AlertStateRecord:
     """Single alert state record"""
@@ -27,6 +35,17 @@ class AlertStateRecord:
         self.resolved_at = resolved_at
         self.last_value = last_value
 
+    def copy(self) -> AlertStateRecord:
+        return AlertStateRecord(
+            device_id=self.device_id,
+            alert_code=self.alert_code,
+            state=self.state,
+            severity=self.severity,
+            triggered_at=self.triggered_at,
+            resolved_at=self.resolved_at,
+            last_value=self.last_value,
+        )
+
 
 class AlertStateManager:
     """
@@ -38,21 +57,30 @@ class AlertStateManager:
     - ACTIVE → RESOLVED: Recovered (notify)
     - RESOLVED → NORMAL: Cleanup (no notify)
 
-    Current: Memory-based storage (dict)
-    Future: SQLite persistence (see docs/alert_state_schema.sql)
-
-    Migration path:
-    1. Add SQLite backend option
-    2. Load existing states on startup
-    3. Persist state changes to DB
-    4. Keep memory dict as cache
+    Storage: memory dict on the hot path, optionally backed by an AlertStateStore
+    (SQLite, see doc/alert_state_schema.sql):
+    1. Existing states are loaded once on startup, so active alarms are not re-notified
+    2. Changed keys are marked dirty and written behind in batched transactions (flush)
+    3. RESOLVED → NORMAL cleanups delete their rows; compaction removes leftovers
     """
 
-    def __init__(self):
+    def __init__(self, store: AlertStateStore | None = None):
         # Key: (device_id, alert_code), Value: AlertStateRecord
         self.states: dict[tuple[str, str], AlertStateRecord] = {}
         self.logger = logging.getLogger(__class__.__name__)
 
+        self._store = store
+        self._dirty: set[tuple[str, str]] = set()
+
+        if store is not None:
+            for record in store.load_all():
+                self.states[(record.device_id, record.alert_code)] = record
+            self.logger.info(f"[STATE] Restored {len(self.states)} alert states from store")
+
+    @property
+    def is_persistent(self) -> bool:
+        return self._store is not None
+
     def get_state(self, device_id: str, alert_code: str) -> AlertState:
         """Get current state for an alert"""
         key = (device_id, alert_code)
@@ -143,6 +171,7 @@ class AlertStateManager:
 
     def clear_all(self):
         """Clear all states (for testing or reset)"""
+        self._mark_dirty(*self.states.keys())
         self.states.clear()
         self.logger.info("[STATE] All states cleared")
 
@@ -179,16 +208,18 @@ class AlertStateManager:
             resolved_at=resolved_at,
             last_value=current_value,
         )
+        self._mark_dirty(key)
 
         self.logger.info(
             f"[STATE] [{device_id}] {alert_code}: {old_state} → {new_state} " f"(value={current_value:.2f})"
         )
 
     def _update_value(self, device_id: str, alert_code: str, current_value: float):
-        """Update last value without changing state"""
-        key = (device_id, alert_code)
-        if key in self.states:
-            self.states[key].last_value = current_value
+        """Update last value without changing state (the row is rewritten only if the value differs)"""
+        record = self.states.get((device_id, alert_code))
+        if record is not None and record.last_value != current_value:
+            record.last_value = current_value
+            self._mark_dirty((device_id, alert_code))
 
     def _remove_state(self, device_id: str, alert_code: str):
         """Remove state record (cleanup after RESOLVED → NORMAL)"""
@@ -196,3 +227,54 @@ class AlertStateManager:
         if key in self.states:
             self.logger.info(f"[STATE] [{device_id}] {alert_code}: Cleared")
             del self.states[key]
+            self._mark_dirty(key)
+
+    # ---------- Write-behind persistence ----------
+
+    def _mark_dirty(self, *keys: tuple[str, str]) -> None:
+        if self._store is not None:
+            self._dirty.update(keys)
+
+    def collect_changes(self) -> tuple[list[AlertStateRecord], list[tuple[str, str]]]:
+        """Take the pending changes as (upserts, deletes) and reset the dirty set."""
+        upserts: list[AlertStateRecord] = []
+        deletes: list[tuple[str, str]] = []
+        for key in self._dirty:
+            record = self.states.get(key)
+            if record is None:
+                deletes.append(key)
+            else:
+                upserts.append(record.copy())
+        self._dirty.clear()
+        return upserts, deletes
+
+    async def flush(self) -> None:
+        """Write pending changes to the store in one transaction (off the event loop)."""
+        if self._store is None or not self._dirty:
+            return
+
+        upserts, deletes = self.collect_changes()
+        try:
+            await asyncio.to_thread(self._store.apply_changes, upserts, deletes)
+        except Exception as e:
+            # Keep the changes for the next flush
+            self._dirty.update((r.device_id, r.alert_code) for r in upserts)
+            self._dirty.update(deletes)
+            self.logger.error(f"[STATE] Failed to persist alert states: {e}")
+
+    async def run_persistence_loop(self, flush_interval_sec: float = 5.0, compact_interval_sec: float = 3600.0):
+        """Periodically flush dirty states and compact the store; flushes once more on cancel."""
+        if self._store is None:
+            return
+
+        last_compact = time.monotonic()
+        try:
+            while True:
+                await asyncio.sleep(flush_interval_sec)
+                await self.flush()
+
+                if time.monotonic() - last_compact >= compact_interval_sec:
+                    last_compact = time.monotonic()
+                    await asyncio.to_thread(self._store.compact)
+        finally:
+            await self.flush()
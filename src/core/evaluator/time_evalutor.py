@@ -1,5 +1,7 @@
 import logging
-from datetime import datetime, time
+import time as _time
+from dataclasses import dataclass
+from datetime import datetime, time, timedelta
 from zoneinfo import ZoneInfo
 
 from core.schema.control_condition_schema import ControlActionType
@@ -8,6 +10,23 @@ from core.util.time_util import TIMEZONE_INFO
 
 logger = logging.getLogger("TimeControlEvaluator")
 
+# How far ahead to look for the next allowed ↔ blocked transition.
+# One full week (plus a day of slack) covers every weekday/interval combination.
+TIMELINE_HORIZON_DAYS = 8
+
+# Interval ends are inclusive, so the first blocked instant is one tick after `end`.
+_END_EPSILON = timedelta(microseconds=1)
+
+
+@dataclass
+class _DeviceTimeline:
+    """Cached allowed state of a device, valid for [computed_at, valid_until)."""
+
+    allowed: bool
+    computed_at: float
+    valid_until: float
+    next_transition: float | None
+
 
 class TimeControlEvaluator:
     """
@@ -19,6 +38,10 @@ class TimeControlEvaluator:
       - allow(device_id): only checks "is it currently allowed?"
       - evaluate_action(device_id): on the first call returns the current state's
         action; afterward only returns an action when the state changes
+      - next_transition(device_id): the next instant at which allow() flips
+
+    Per device, the current state is cached together with the next transition
+    instant, so repeated calls between transitions cost one timestamp comparison.
     """
 
     def __init__(self, config: TimeControlConfig):
@@ -26,24 +49,14 @@ class TimeControlEvaluator:
         self._default_tz: ZoneInfo = ZoneInfo(config.timezone) if config.timezone else TIMEZONE_INFO
         self._last_allowed_by_device: dict[str, bool] = {}
 
+        self._schedule_cache: dict[str, tuple[DeviceSchedule | None, ZoneInfo]] = {}
+        self._timeline_by_device: dict[str, _DeviceTimeline] = {}
+
     # ---------- Public API ----------
 
     def allow(self, device_id: str, now: datetime | None = None) -> bool:
         """Return whether the current time (with timezone) is within allowed intervals."""
-        schedule, tz = self._resolve_schedule_and_tz(device_id)
-        if schedule is None:
-            logger.debug(f"[TimeControlEvaluator] No config for {device_id}, no working time limit.")
-            return True
-
-        local_now = (now or datetime.now(self._default_tz)).astimezone(tz)
-        if schedule.weekdays and local_now.isoweekday() not in schedule.weekdays:
-            self._debug(device_id, local_now, schedule, allowed=False)
-            return False
-
-        now_t = local_now.time()
-        allowed = any(self._in_interval(now_t, itv.start, itv.end) for itv in schedule.intervals)
-        self._debug(device_id, local_now, schedule, allowed=allowed)
-        return allowed
+        return self._get_timeline(device_id, self._to_timestamp(now)).allowed
 
     def evaluate_action(self, device_id: str, now: datetime | None = None) -> ControlActionType | None:
         """
@@ -67,17 +80,103 @@ class TimeControlEvaluator:
         self._last_allowed_by_device[device_id] = allowed_now
         return action
 
+    def next_transition(self, device_id: str, now: datetime | None = None) -> datetime | None:
+        """
+        Return the next instant at which the allowed state of the device flips,
+        or None if the state does not change within the lookahead horizon
+        (including devices without any schedule).
+        """
+        timeline = self._get_timeline(device_id, self._to_timestamp(now))
+        if timeline.next_transition is None:
+            return None
+        return datetime.fromtimestamp(timeline.next_transition, tz=self._default_tz)
+
     # ---------- Private helpers ----------
 
+    @staticmethod
+    def _to_timestamp(now: datetime | None) -> float:
+        return now.timestamp() if now is not None else _time.time()
+
+    def _get_timeline(self, device_id: str, ts: float) -> _DeviceTimeline:
+        timeline = self._timeline_by_device.get(device_id)
+        if timeline is not None and timeline.computed_at <= ts < timeline.valid_until:
+            return timeline
+
+        timeline = self._build_timeline(device_id, ts)
+        self._timeline_by_device[device_id] = timeline
+        return timeline
+
+    def _build_timeline(self, device_id: str, ts: float) -> _DeviceTimeline:
+        """Evaluate the state at `ts` and search forward for the next transition."""
+        schedule, tz = self._resolve_schedule_and_tz(device_id)
+        if schedule is None:
+            logger.debug(f"[TimeControlEvaluator] No config for {device_id}, no working time limit.")
+            return _DeviceTimeline(allowed=True, computed_at=ts, valid_until=float("inf"), next_transition=None)
+
+        local_now = datetime.fromtimestamp(ts, tz=tz)
+        allowed = self._is_allowed_at(schedule, local_now)
+
+        next_transition: float | None = None
+        for candidate in self._candidate_boundaries(schedule, local_now):
+            if self._is_allowed_at(schedule, candidate) != allowed:
+                next_transition = candidate.timestamp()
+                break
+
+        if next_transition is not None:
+            valid_until = next_transition
+        else:
+            # Constant for a whole weekly cycle; re-check after the horizon anyway
+            valid_until = ts + timedelta(days=TIMELINE_HORIZON_DAYS - 1).total_seconds()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            self._debug(device_id, local_now, schedule, allowed, next_transition)
+
+        return _DeviceTimeline(
+            allowed=allowed, computed_at=ts, valid_until=valid_until, next_transition=next_transition
+        )
+
+    @classmethod
+    def _is_allowed_at(cls, schedule: DeviceSchedule, local_dt: datetime) -> bool:
+        if schedule.weekdays and local_dt.isoweekday() not in schedule.weekdays:
+            return False
+        now_t = local_dt.time()
+        return any(cls._in_interval(now_t, itv.start, itv.end) for itv in schedule.intervals)
+
+    @staticmethod
+    def _candidate_boundaries(schedule: DeviceSchedule, local_now: datetime) -> list[datetime]:
+        """
+        All instants after `local_now` at which the allowed state may change:
+        local midnights (weekday change), interval starts, and just past interval ends.
+        """
+        tz = local_now.tzinfo
+        today = local_now.date()
+        candidates: list[datetime] = []
+        for offset in range(TIMELINE_HORIZON_DAYS):
+            day = today + timedelta(days=offset)
+            candidates.append(datetime.combine(day, time.min, tzinfo=tz))
+            for itv in schedule.intervals:
+                candidates.append(datetime.combine(day, itv.start, tzinfo=tz))
+                candidates.append(datetime.combine(day, itv.end, tzinfo=tz) + _END_EPSILON)
+
+        now_ts = local_now.timestamp()
+        return sorted((c for c in candidates if c.timestamp() > now_ts), key=lambda c: c.timestamp())
+
     def _resolve_schedule_and_tz(self, device_id: str) -> tuple[DeviceSchedule | None, ZoneInfo]:
         """Return (DeviceSchedule, timezone); if not found, return (None, default_tz)."""
+        cached = self._schedule_cache.get(device_id)
+        if cached is not None:
+            return cached
+
         work_hours: dict[str, DeviceSchedule] = self._config.work_hours
         schedule: DeviceSchedule | None = work_hours.get(device_id) or work_hours.get("default")
         if schedule is None:
-            return None, self._default_tz
+            resolved = (None, self._default_tz)
+        else:
+            tz = ZoneInfo(schedule.timezone) if schedule.timezone else self._default_tz
+            resolved = (schedule, tz)
 
-        tz = ZoneInfo(schedule.timezone) if schedule.timezone else self._default_tz
-        return schedule, tz
+        self._schedule_cache[device_id] = resolved
+        return resolved
 
     @staticmethod
     def _in_interval(current: time, start_t: time, end_t: time) -> bool:
@@ -91,13 +190,25 @@ class TimeControlEvaluator:
     def _fmt_intervals(schedule: DeviceSchedule) -> str:
         return str([(i.start.isoformat(), i.end.isoformat()) for i in schedule.intervals])
 
-    def _debug(self, device_id: str, local_now: datetime, schedule: DeviceSchedule, allowed: bool) -> None:
+    def _debug(
+        self,
+        device_id: str,
+        local_now: datetime,
+        schedule: DeviceSchedule,
+        allowed: bool,
+        next_transition: float | None,
+    ) -> None:
         try:
             tz_key = local_now.tzinfo.key  # type: ignore[attr-defined]
         except Exception:
             tz_key = str(local_now.tzinfo)
+        next_str = (
+            datetime.fromtimestamp(next_transition, tz=local_now.tzinfo).strftime("%Y-%m-%d %H:%M:%S")
+            if next_transition is not None
+            else "none"
+        )
         logger.debug(
             f"[TimeControl] {device_id} now={local_now.strftime('%Y-%m-%d %H:%M:%S')} "
             f"tz={tz_key} wd={local_now.isoweekday()} "
-            f"intervals={self._fmt_intervals(schedule)} → allowed={allowed}"
+            f"intervals={self._fmt_intervals(schedule)} → allowed={allowed} next_transition={next_str}"
         )
@@ -1,13 +1,19 @@
 import asyncio
 import logging
 import re
+import time
 from collections import defaultdict
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal
 
 from core.device.generic.generic_device import AsyncGenericModbusDevice
 from core.model.control_execution import WrittenTarget
-from core.model.device_constant import DEFAULT_TARGET_BY_ACTION, REG_RW_ON_OFF, VALUE_TOLERANCE
+from core.model.device_constant import (
+    DEFAULT_MISSING_VALUE,
+    DEFAULT_TARGET_BY_ACTION,
+    REG_RW_ON_OFF,
+    VALUE_TOLERANCE,
+)
 from core.model.enum.condition_enum import SwitchMode
 from core.schema.control_condition_schema import ControlActionSchema, ControlActionType
 from core.util.device_health_manager import DeviceHealthManager
@@ -15,6 +21,8 @@ from device_manager import AsyncDeviceManager
 
 logger = logging.getLogger(__name__)
 
+SNAPSHOT_MAX_AGE_SEC = 30.0
+
 
 @dataclass(slots=True)
 class ExecutionStats:
@@ -37,6 +45,36 @@ class ExecutionStats:
         )
 
 
+@dataclass(slots=True)
+class PlannedWrite:
+    target: str
+    value: float | int
+    log_message: str
+    action: ControlActionSchema  # recorded in written_targets once the write succeeded
+    on_off: bool = False
+
+
+@dataclass(slots=True)
+class DeviceWriteBatch:
+    """Writes planned for one device during one execute() call, sent together on flush."""
+
+    device_id: str
+    device: AsyncGenericModbusDevice
+    writes: list[PlannedWrite] = field(default_factory=list)
+    # Actions held back by a higher-priority write planned here; re-run after the flush
+    deferred: list[ControlActionSchema] = field(default_factory=list)
+
+    def planned_write(self, target: str) -> PlannedWrite | None:
+        for planned in reversed(self.writes):
+            if planned.target == target:
+                return planned
+        return None
+
+    def planned_value(self, target: str) -> float | int | None:
+        planned = self.planned_write(target)
+        return planned.value if planned is not None else None
+
+
 class ControlExecutor:
     """
     Executes control actions with priority protection.
@@ -50,12 +88,18 @@ class ControlExecutor:
 
     Features:
     - Priority-based execution (lower number = higher priority)
-    - Redundant write prevention
+    - Redundant write prevention (cached snapshot values first, live read as fallback)
+    - Per-device write batching (contiguous registers / shared bit words coalesced)
     - Device health checking
     - Comprehensive logging
     """
 
-    def __init__(self, device_manager: AsyncDeviceManager, health_manager: DeviceHealthManager | None = None):
+    def __init__(
+        self,
+        device_manager: AsyncDeviceManager,
+        health_manager: DeviceHealthManager | None = None,
+        snapshot_max_age_sec: float = SNAPSHOT_MAX_AGE_SEC,
+    ):
         self.device_manager = device_manager
         self.health_manager = health_manager
         self.logger = logging.getLogger(__class__.__name__)
@@ -63,12 +107,23 @@ class ControlExecutor:
         self._execution_stats = ExecutionStats()
         self._pulse_locks: dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
 
+        # device_id -> (monotonic timestamp, last known values)
+        self._snapshot_cache: dict[str, tuple[float, dict[str, float]]] = {}
+        self._snapshot_max_age_sec = snapshot_max_age_sec
+
+    def update_snapshot(self, device_id: str, snapshot: dict[str, float]) -> None:
+        """Cache the latest polled values of a device for redundant-write checks."""
+        self._snapshot_cache[device_id] = (time.monotonic(), dict(snapshot))
+
     async def execute(self, action_list: list[ControlActionSchema]):
         """
         Execute a list of control actions with priority protection.
 
         Actions are processed in order, with priority protection preventing
-        lower priority actions from overwriting higher priority writes.
+        lower priority actions from overwriting higher priority writes. Writes are
+        planned per device and flushed together once every action has been processed.
+        A target only counts as written once its write succeeded: actions held back by a
+        planned write are re-run after the flush, so a failed write does not block them.
 
         Args:
             action_list: List of actions to execute (should be pre-sorted by priority)
@@ -86,6 +141,20 @@ class ControlExecutor:
         written_targets: dict[str, WrittenTarget] = {}
         self._execution_stats.reset(total_actions=len(action_list))
 
+        pending: list[ControlActionSchema] = list(action_list)
+        while pending:
+            batches = await self._plan_actions(pending, written_targets)
+            if batches:
+                await asyncio.gather(*(self._flush_writes(batch, written_targets) for batch in batches.values()))
+            pending = [action for batch in batches.values() for action in batch.deferred]
+
+        self.logger.info(f"[EXEC] Summary: {self._execution_stats.summary_str()}")
+
+    async def _plan_actions(
+        self, action_list: list[ControlActionSchema], written_targets: dict[str, WrittenTarget]
+    ) -> dict[str, DeviceWriteBatch]:
+        """Plan the writes of one round of actions into per-device batches."""
+        batches: dict[str, DeviceWriteBatch] = {}
         for action in action_list:
             # Pre-flight checks
             if not self._is_device_healthy(action):
@@ -102,40 +171,49 @@ class ControlExecutor:
                 self.logger.warning(f"[EXEC] [SKIP] Device {action.model}_{action.slave_id} not found")
                 continue
 
+            device_id = f"{action.model}_{action.slave_id}"
+            batch = batches.get(device_id)
+            if batch is None:
+                batch = batches[device_id] = DeviceWriteBatch(device_id=device_id, device=device)
+
             # Execute action by type
             try:
-                await self._execute_action(action=action, device=device, written_targets=written_targets)
+                await self._execute_action(action=action, device=device, written_targets=written_targets, batch=batch)
             except Exception as e:
                 self.logger.warning(f"[EXEC] [FAIL] {action.model}_{action.slave_id}: {e}")
 
-        self.logger.info(f"[EXEC] Summary: {self._execution_stats.summary_str()}")
+        return batches
 
     # ============================================================================
     # Main Action Router
     # ============================================================================
 
     async def _execute_action(
-        self, action: ControlActionSchema, device: AsyncGenericModbusDevice, written_targets: dict[str, WrittenTarget]
+        self,
+        action: ControlActionSchema,
+        device: AsyncGenericModbusDevice,
+        written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch,
     ):
         """Route action to appropriate handler based on type"""
         match action.type:
             case ControlActionType.TURN_ON | ControlActionType.TURN_OFF:
-                await self._execute_turn_on_off(action, device, written_targets)
+                await self._execute_turn_on_off(action, device, written_targets, batch)
 
             case ControlActionType.ADJUST_FREQUENCY:
-                await self._execute_adjust_frequency(action, device, written_targets)
+                await self._execute_adjust_frequency(action, device, written_targets, batch)
 
             case ControlActionType.SET_FREQUENCY:
-                await self._execute_set_value(action, device, written_targets)
+                await self._execute_set_value(action, device, written_targets, batch)
 
             case ControlActionType.WRITE_DO:
                 if action.switch_mode == SwitchMode.PULSE:
-                    await self._execute_pulse_do(action, device, written_targets)
+                    await self._execute_pulse_do(action, device, written_targets, batch)
                 else:
-                    await self._execute_set_value(action, device, written_targets)
+                    await self._execute_set_value(action, device, written_targets, batch)
 
             case ControlActionType.RESET:
-                await self._execute_set_value(action, device, written_targets)
+                await self._execute_set_value(action, device, written_targets, batch)
 
             case _:
                 self.logger.warning(f"[EXEC] [SKIP] Unknown action type: {action.type}")
@@ -145,7 +223,11 @@ class ControlExecutor:
     # ============================================================================
 
     async def _execute_turn_on_off(
-        self, action: ControlActionSchema, device: AsyncGenericModbusDevice, written_targets: dict[str, WrittenTarget]
+        self,
+        action: ControlActionSchema,
+        device: AsyncGenericModbusDevice,
+        written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch,
     ):
         """Handle TURN_ON/TURN_OFF actions"""
         # Capability check
@@ -158,26 +240,33 @@ class ControlExecutor:
         target_key: str = self._make_target_key(device, target)
 
         # Priority protection
-        if self._is_protected(target_key, desired_state, action, written_targets):
+        if self._is_protected(target_key, desired_state, action, written_targets, batch):
             return
 
         # Read current state to avoid redundant writes
-        current_state: int | None = await self._read_on_off_state(device, target)
+        current_state: int | None = await self._read_on_off_state(device, target, batch)
         if current_state is not None and current_state == desired_state:
             self._execution_stats.skipped_redundant += 1
             self.logger.info(f"[EXEC] [SKIP] {device.model} {target} already {desired_state}")
             return
 
-        # Write new state
-        await device.write_on_off(desired_state)
-        self.logger.info(f"[EXEC] [WRITE] {device.model} {target} => {desired_state}")
-        self._execution_stats.successful_writes += 1
-
-        # Record written target
-        self._record_write(target_key, desired_state, action, written_targets)
+        # Plan new state
+        batch.writes.append(
+            PlannedWrite(
+                target=target,
+                value=desired_state,
+                log_message=f"[EXEC] [WRITE] {device.model} {target} => {desired_state}",
+                action=action,
+                on_off=True,
+            )
+        )
 
     async def _execute_adjust_frequency(
-        self, action: ControlActionSchema, device: AsyncGenericModbusDevice, written_targets: dict[str, WrittenTarget]
+        self,
+        action: ControlActionSchema,
+        device: AsyncGenericModbusDevice,
+        written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch,
     ):
         """Handle ADJUST_FREQUENCY action (incremental change)"""
         # Validate target
@@ -201,8 +290,10 @@ class ControlExecutor:
             self.logger.info(f"[EXEC] [SKIP] {device.model} adjustment too small: {action.value}")
             return
 
-        # Read current frequency
-        current_freq = await self._read_value(device, target)
+        # Read current frequency (a value planned earlier in this batch takes precedence)
+        current_freq = batch.planned_value(target)
+        if current_freq is None:
+            current_freq = await self._read_value(device, target)
         if current_freq is None:
             self.logger.warning(f"[EXEC] [SKIP] {device.model} {target} returned None value")
             return
@@ -211,25 +302,25 @@ class ControlExecutor:
         new_freq = float(current_freq) + float(action.value)
 
         # Priority protection
-        if self._is_protected(target_key, new_freq, action, written_targets):
+        if self._is_protected(target_key, new_freq, action, written_targets, batch):
             return
 
-        # Write new frequency
-        try:
-            await device.write_value(target, new_freq)
-            self._execution_stats.successful_writes += 1
-            self.logger.info(
-                f"[EXEC] [ADJUST] {device.model} {target}: " f"{current_freq} + {action.value} = {new_freq}"
+        # Plan new frequency
+        batch.writes.append(
+            PlannedWrite(
+                target=target,
+                value=new_freq,
+                log_message=f"[EXEC] [ADJUST] {device.model} {target}: {current_freq} + {action.value} = {new_freq}",
+                action=action,
             )
-
-            # Record written target
-            self._record_write(target_key, new_freq, action, written_targets)
-
-        except Exception as write_error:
-            self.logger.warning(f"[EXEC] [FAIL] {device.model} cannot write {target} to {new_freq}: " f"{write_error}")
+        )
 
     async def _execute_set_value(
-        self, action: ControlActionSchema, device: AsyncGenericModbusDevice, written_targets: dict[str, WrittenTarget]
+        self,
+        action: ControlActionSchema,
+        device: AsyncGenericModbusDevice,
+        written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch,
     ):
         """Handle SET_FREQUENCY, WRITE_DO, RESET actions (absolute value)"""
         # Determine target register
@@ -250,11 +341,11 @@ class ControlExecutor:
             return
 
         # Priority protection
-        if self._is_protected(target_key, action.value, action, written_targets):
+        if self._is_protected(target_key, action.value, action, written_targets, batch):
             return
 
         # Check redundancy
-        current_value: float | None = await self._read_value(device, target)
+        current_value: float | None = await self._current_value(device, target, batch)
         if current_value is not None and self._is_redundant_write(current_value, action.value):
             self._execution_stats.skipped_redundant += 1
             self.logger.debug(
@@ -265,24 +356,40 @@ class ControlExecutor:
             )
             return
 
-        # Write value
-        await device.write_value(target, action.value)
-        self._execution_stats.successful_writes += 1
-        self.logger.info(f"[EXEC] [WRITE] {device.model} {target} => {action.value}")
-
-        # Record written target
-        self._record_write(target_key, action.value, action, written_targets)
+        # Plan value
+        batch.writes.append(
+            PlannedWrite(
+                target=target,
+                value=action.value,
+                log_message=f"[EXEC] [WRITE] {device.model} {target} => {action.value}",
+                action=action,
+            )
+        )
 
     async def _execute_pulse_do(
-        self, action: ControlActionSchema, device: AsyncGenericModbusDevice, written_targets: dict[str, WrittenTarget]
+        self,
+        action: ControlActionSchema,
+        device: AsyncGenericModbusDevice,
+        written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch | None = None,
     ):
-        """Handle pulse-mode WRITE_DO actions (write → sleep → write)"""
+        """
+        Handle pulse-mode WRITE_DO actions (write → sleep → write).
+
+        Pulses are timing-sensitive, so they bypass batching: writes already planned
+        for the device are flushed first to keep their order.
+        """
         if action.pulse is None:
             self.logger.warning(
                 f"[EXEC] [PULSE] {device.model} switch_mode=pulse but pulse config is None; "
                 f"falling back to normal write"
             )
-            await self._execute_set_value(action, device, written_targets)
+            standalone = batch is None
+            if standalone:
+                batch = DeviceWriteBatch(device_id=f"{action.model}_{action.slave_id}", device=device)
+            await self._execute_set_value(action, device, written_targets, batch)
+            if standalone:
+                await self._flush_writes(batch, written_targets)
             return
 
         # Determine target register
@@ -302,6 +409,10 @@ class ControlExecutor:
         end_value = pulse.end_value
         duration_ms = pulse.duration_ms
 
+        # Flush first so writes planned earlier in this round are recorded before the priority check
+        if batch is not None:
+            await self._flush_writes(batch, written_targets)
+
         # Priority protection — check start_value (the first write)
         if self._is_protected(target_key, start_value, action, written_targets):
             return
@@ -319,6 +430,66 @@ class ControlExecutor:
         self._execution_stats.successful_writes += 1
         self._record_write(target_key, end_value, action, written_targets)
 
+    # ============================================================================
+    # Write Batching
+    # ============================================================================
+
+    async def _flush_writes(self, batch: DeviceWriteBatch, written_targets: dict[str, WrittenTarget]) -> None:
+        """
+        Send the writes planned for one device.
+
+        Generic Modbus devices receive them as one write_values() call, which merges
+        contiguous registers (FC 16) and bit pins sharing a word; other devices get
+        one write per target in planning order. Only successful writes are recorded
+        in written_targets for priority protection.
+        """
+        writes, batch.writes = batch.writes, []
+        if not writes:
+            return
+
+        device = batch.device
+        if isinstance(device, AsyncGenericModbusDevice):
+            try:
+                outcomes: list[bool] = await device.write_values([(w.target, w.value) for w in writes])
+            except Exception as e:
+                self.logger.warning(f"[EXEC] [FAIL] {batch.device_id} batched write failed: {e}")
+                return
+        else:
+            outcomes = []
+            for planned in writes:
+                try:
+                    if planned.on_off:
+                        await device.write_on_off(planned.value)
+                    else:
+                        await device.write_value(planned.target, planned.value)
+                    outcomes.append(True)
+                except Exception as e:
+                    self.logger.warning(
+                        f"[EXEC] [FAIL] {device.model} cannot write {planned.target} to {planned.value}: {e}"
+                    )
+                    outcomes.append(False)
+
+        for planned, ok in zip(writes, outcomes):
+            if not ok:
+                if isinstance(device, AsyncGenericModbusDevice):
+                    self.logger.warning(
+                        f"[EXEC] [FAIL] {device.model} cannot write {planned.target} to {planned.value}"
+                    )
+                continue
+
+            self._execution_stats.successful_writes += 1
+            self.logger.info(planned.log_message)
+            try:
+                self._record_write(
+                    self._make_target_key(device, planned.target), planned.value, planned.action, written_targets
+                )
+            except ValueError as e:
+                self.logger.warning(f"[EXEC] cannot record write of {planned.target}={planned.value}: {e}")
+
+            cached = self._snapshot_cache.get(batch.device_id)
+            if cached is not None:
+                cached[1][planned.target] = planned.value
+
     # ============================================================================
     # Helper Methods - Device Operations
     # ============================================================================
@@ -364,19 +535,56 @@ class ControlExecutor:
             self.logger.warning(f"[EXEC] read {target} failed on {device.model}: {e}. " f"Will try to write anyway.")
             return None
 
-    async def _read_on_off_state(self, device: AsyncGenericModbusDevice, target: str) -> int | None:
+    async def _current_value(
+        self, device: AsyncGenericModbusDevice, target: str, batch: DeviceWriteBatch
+    ) -> float | None:
         """
-        Read current ON/OFF state from device.
+        Resolve the value a target holds before this write, for redundancy checks.
+
+        Order: a write already planned in this batch, then a fresh cached snapshot value,
+        then a live device read.
+        """
+        planned = batch.planned_value(target)
+        if planned is not None:
+            return planned
+
+        cached = self._cached_value(batch.device_id, target)
+        if cached is not None:
+            return cached
+
+        return await self._read_value(device, target)
+
+    def _cached_value(self, device_id: str, target: str) -> float | None:
+        """Return the cached snapshot value of a target, or None if missing or stale."""
+        cached = self._snapshot_cache.get(device_id)
+        if cached is None:
+            return None
+
+        updated_at, values = cached
+        if time.monotonic() - updated_at > self._snapshot_max_age_sec:
+            return None
+
+        value = values.get(target)
+        if value is None or value == DEFAULT_MISSING_VALUE:
+            return None
+        return value
+
+    async def _read_on_off_state(
+        self, device: AsyncGenericModbusDevice, target: str, batch: DeviceWriteBatch
+    ) -> int | None:
+        """
+        Read current ON/OFF state (planned value, cached snapshot, or live read).
 
         Args:
             device: Device to read from
             target: Register name to read (typically RW_ON_OFF)
+            batch: Write batch of the current execution
 
         Returns:
             0 (OFF) or 1 (ON), or None if read failed
         """
         try:
-            raw_value = await device.read_value(target)
+            raw_value = await self._current_value(device, target, batch)
             if raw_value is None:
                 return None
             return int(float(raw_value))
@@ -394,24 +602,45 @@ class ControlExecutor:
         new_value: float | int,
         action: ControlActionSchema,
         written_targets: dict[str, WrittenTarget],
+        batch: DeviceWriteBatch | None = None,
     ) -> bool:
         """
         Check if target is protected by a higher priority action.
 
+        A higher-priority write that is only planned (not yet sent) defers the action
+        to the next round instead: it runs after the flush, when the planned write has
+        either succeeded (and protects the target) or failed (and does not).
+
         Args:
             target_key: Unique key for device+target combination
             new_value: Value to be written
             action: Current action being processed
-            written_targets: Dictionary of already written targets
+            written_targets: Dictionary of successfully written targets
+            batch: Write batch of the current round, if any
 
         Returns:
-            True if write should be skipped (protected), False otherwise
+            True if write should be skipped (protected or deferred), False otherwise
         """
+        action_priority: int = action.priority if action.priority is not None else 999
+
+        if batch is not None:
+            planned = next(
+                (w for w in reversed(batch.writes) if self._make_target_key(batch.device, w.target) == target_key),
+                None,
+            )
+            planned_priority = planned.action.priority if planned and planned.action.priority is not None else 999
+            if planned is not None and planned_priority < action_priority:
+                batch.deferred.append(action)
+                self.logger.debug(
+                    f"[EXEC] [DEFER] {target_key}: {planned.value} planned by higher priority rule "
+                    f"{self._extract_rule_code(planned.action.reason)} (p={planned_priority}), retry after flush"
+                )
+                return True
+
         if target_key not in written_targets:
             return False
 
         written_target: WrittenTarget = written_targets[target_key]
-        action_priority: int = action.priority if action.priority is not None else 999
 
         # If previous priority is higher (smaller number), protect it
         if written_target.has_higher_priority_than(action_priority):
@@ -1,4 +1,7 @@
+import asyncio
 import logging
+import time
+from datetime import datetime
 
 from core.evaluator.time_evalutor import TimeControlEvaluator
 from core.executor.time_control_executor import TimeControlExecutor
@@ -6,9 +9,13 @@ from core.model.device_constant import INVERTER, IO_MODULE
 from core.schema.control_condition_schema import ControlActionType
 from core.util.pubsub.base import PubSub
 from core.util.pubsub.pubsub_topic import PubSubTopic
+from core.util.time_util import TIMEZONE_INFO
 
 logger = logging.getLogger("TimeControlHandler")
 
+# Upper bound for one scheduler sleep, so wall-clock adjustments are picked up
+MAX_SCHEDULER_SLEEP_SEC = 60.0
+
 
 class TimeControlHandler:
 
@@ -39,6 +46,11 @@ class TimeControlHandler:
         self._last_online: dict[str, bool] = {}
         self._non_switchable_devices: set[str] = set()
 
+        # Transition scheduler: device_id -> (model, slave_id) and next transition timestamp
+        self._scheduled_targets: dict[str, tuple[str, int]] = {}
+        self._next_transition_ts: dict[str, float | None] = {}
+        self._schedule_changed = asyncio.Event()
+
     async def handle_snapshot(self, snapshot: dict):
         device_id: str = snapshot.get("device_id")
         if not device_id:
@@ -72,7 +84,70 @@ class TimeControlHandler:
                 await self.pubsub.publish(PubSubTopic.SNAPSHOT_ALLOWED, snapshot)
                 return
 
+        if device_id not in self._scheduled_targets and self._supports_switch(device_id, snapshot):
+            self._register_schedule_target(device_id, model, slave_id)
+
         # Process action based on evaluation
+        await self._dispatch_action(device_id, model, slave_id, action_type, is_online)
+        if action_type == ControlActionType.TURN_OFF and self.send_turn_off_on_change:
+            return
+
+        # Transmit the snapshot if the device is allowed
+        if self.evaluator.allow(device_id):
+            await self.pubsub.publish(PubSubTopic.SNAPSHOT_ALLOWED, snapshot)
+
+    async def run_transition_scheduler(self) -> None:
+        """
+        Emit TURN_ON / TURN_OFF exactly at each device's schedule transition,
+        instead of waiting for the next snapshot of that device.
+
+        Devices are picked up once their first snapshot has been handled (model,
+        slave_id and switch support are only known from snapshots).
+        """
+        while True:
+            self._schedule_changed.clear()
+            due_ts = min((ts for ts in self._next_transition_ts.values() if ts is not None), default=None)
+            timeout = MAX_SCHEDULER_SLEEP_SEC if due_ts is None else max(0.0, due_ts - time.time())
+
+            try:
+                await asyncio.wait_for(self._schedule_changed.wait(), timeout=min(timeout, MAX_SCHEDULER_SLEEP_SEC))
+                continue
+            except asyncio.TimeoutError:
+                pass
+
+            await self._fire_due_transitions()
+
+    async def _fire_due_transitions(self) -> None:
+        now_ts = time.time()
+        for device_id, (model, slave_id) in list(self._scheduled_targets.items()):
+            due_ts = self._next_transition_ts.get(device_id)
+            if due_ts is None or due_ts > now_ts:
+                continue
+
+            # The loop may wake a hair early relative to wall clock; evaluate at the transition instant
+            at = datetime.fromtimestamp(max(now_ts, due_ts), tz=TIMEZONE_INFO)
+            action_type = self.evaluator.evaluate_action(device_id, at)
+            self._next_transition_ts[device_id] = self._next_transition_timestamp(device_id, at)
+
+            if action_type is None:
+                # Already handled by the snapshot path
+                continue
+
+            logger.info(
+                f"[TimeControl] {device_id} schedule transition at {at.strftime('%H:%M:%S')} → {action_type.name}"
+            )
+            await self._dispatch_action(
+                device_id, model, slave_id, action_type, self._last_online.get(device_id, False)
+            )
+
+    async def _dispatch_action(
+        self,
+        device_id: str,
+        model: str,
+        slave_id: int,
+        action_type: ControlActionType | None,
+        is_online: bool,
+    ) -> None:
         if action_type == ControlActionType.TURN_OFF and self.send_turn_off_on_change:
             logger.info(f"[{__class__.__name__}] {device_id} off_timezone → skip alerts & controls.")
             if is_online:
@@ -87,9 +162,14 @@ class TimeControlHandler:
             else:
                 await self.executor.defer_control(device_id, model, slave_id, action_type, "On timezone auto startup")
 
-        # Transmit the snapshot if the device is allowed
-        if self.evaluator.allow(device_id):
-            await self.pubsub.publish(PubSubTopic.SNAPSHOT_ALLOWED, snapshot)
+    def _register_schedule_target(self, device_id: str, model: str, slave_id: int) -> None:
+        self._scheduled_targets[device_id] = (model, slave_id)
+        self._next_transition_ts[device_id] = self._next_transition_timestamp(device_id)
+        self._schedule_changed.set()
+
+    def _next_transition_timestamp(self, device_id: str, now: datetime | None = None) -> float | None:
+        next_transition = self.evaluator.next_transition(device_id, now)
+        return next_transition.timestamp() if next_transition is not None else None
 
     def _try_log_startup_summary(self):
         if self._startup_summary_logged:
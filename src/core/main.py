@@ -14,7 +14,7 @@ from core.util.device_id_policy import get_policy, load_device_id_policy
 from core.util.factory.alert_factory import build_alert_subscriber
 from core.util.factory.constraint_factory import build_constraint_subscriber
 from core.util.factory.control_factory import build_control_subscriber
-from core.util.factory.notifier_factory import build_notifiers_and_routing
+from core.util.factory.notifier_factory import build_notifiers_and_routing, close_notifiers
 from core.util.factory.sender_factory import build_sender_subscriber, init_sender
 from core.util.factory.snapshot_factory import build_snapshot_subscriber
 from core.util.factory.time_factory import build_time_control_subscriber
@@ -115,6 +115,7 @@ async def main(
         device_timeout_sec=system_config.MONITOR_DEVICE_TIMEOUT_SEC,
         read_concurrency=system_config.MONITOR_READ_CONCURRENCY,
         log_each_device=system_config.MONITOR_LOG_EACH_DEVICE,
+        poll_intervals=system_config.MONITOR_POLL_INTERVALS.as_class_intervals(),
     )
     logger.info("Monitor initialized")
 
@@ -154,6 +155,7 @@ async def main(
         monitor_interval=poll_interval,
         alert_interval=alert_interval,
         outlier_log_path=outlier_log_path,
+        alert_state_db_path=system_config.PATHS.ALERT_STATE_DB_PATH,
     )
 
     control_subscriber: ControlSubscriber = build_control_subscriber(
@@ -239,6 +241,7 @@ async def main(
         logger.info("Shutting down...")
 
         await subscriber_registry.stop_all()
+        await close_notifiers(notifier_list)
 
         # Stop cleanup task
         if cleanup_task_handle:
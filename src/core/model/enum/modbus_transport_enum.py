@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class ModbusTransport(StrEnum):
+    SERIAL = "serial"
+    TCP = "tcp"
+    RTU_OVER_TCP = "rtu_over_tcp"
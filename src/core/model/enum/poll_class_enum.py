@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class PollClass(StrEnum):
+    FAST = "fast"
+    NORMAL = "normal"
+    SLOW = "slow"
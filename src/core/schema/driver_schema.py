@@ -7,6 +7,8 @@ from typing import Literal, Union
 
 from pydantic import BaseModel, Field
 
+from core.model.enum.poll_class_enum import PollClass
+
 
 class PhysicalPinDefinition(BaseModel):
     """Physical register definition (actual hardware register)"""
@@ -31,6 +33,9 @@ class PhysicalPinDefinition(BaseModel):
     bit: int | None = Field(
         default=None, ge=0, le=15, description="Bit index within the register word (0-15) for bit-level DI/DO mapping"
     )
+    poll_class: PollClass | None = Field(
+        default=None, description="Polling rate class (fast/normal/slow); inherits the driver poll_class if unset"
+    )
 
 
 class ComputedPinDefinition(BaseModel):
@@ -68,6 +73,7 @@ class ComposedPinDefinition(BaseModel):
     type: str | None = None
     unit: str | None = None
     precision: int | None = None
+    poll_class: PollClass | None = Field(default=None, description="Polling rate class (fast/normal/slow)")
 
 
 class DriverConfig(BaseModel):
@@ -77,6 +83,7 @@ class DriverConfig(BaseModel):
     register_type: str = Field(..., description="Register type (holding, input, coil, discrete_input)")
     type: str = Field(..., description="Device type (ai_module, vfd, inverter, etc.)")
     description: str | None = Field(None, description="Driver description")
+    poll_class: PollClass | None = Field(None, description="Default polling rate class for every pin of this driver")
 
     register_map: dict[str, Union[PhysicalPinDefinition, ComputedPinDefinition, ComposedPinDefinition]] = Field(
         ..., description="Pin definition mapping"
@@ -3,8 +3,10 @@ from __future__ import annotations
 import logging
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.model.enum.poll_class_enum import PollClass
 from core.schema.config_metadata import ConfigMetadata
 
 logger = logging.getLogger(__name__)
@@ -12,15 +14,32 @@ logger = logging.getLogger(__name__)
 
 class ModbusBusConfig(BaseModel):
     """
-    One RTU bus (serial port settings).
+    One Modbus bus.
+
+    - transport=serial (default): local RS-485 port, `port` required
+    - transport=tcp: native Modbus TCP device/gateway, `host` required, pooled connections
+    - transport=rtu_over_tcp: RTU frames tunneled through an Ethernet-to-RS485 gateway, `host` required
     """
 
     model_config = ConfigDict(extra="allow", str_strip_whitespace=True)
 
-    port: str = Field(..., description="Serial port path (e.g., /dev/ttyUSB0)")
+    transport: ModbusTransport = Field(default=ModbusTransport.SERIAL, description="serial | tcp | rtu_over_tcp")
+    port: str | None = Field(default=None, description="Serial port path (e.g., /dev/ttyUSB0)")
     baudrate: int = Field(default=9600, description="Baud rate")
     timeout: float = Field(default=1.0, gt=0, le=2.0, description="Modbus client timeout for this bus (seconds)")
 
+    host: str | None = Field(default=None, description="Gateway / device IP or hostname (TCP transports)")
+    tcp_port: int = Field(default=502, ge=1, le=65535, description="Gateway / device TCP port")
+    pool_size: int = Field(default=2, ge=1, le=8, description="Pooled connections per host:port (transport=tcp)")
+
+    @model_validator(mode="after")
+    def _check_endpoint(self) -> "ModbusBusConfig":
+        if self.transport == ModbusTransport.SERIAL and not self.port:
+            raise ValueError("serial bus requires 'port'")
+        if self.transport != ModbusTransport.SERIAL and not self.host:
+            raise ValueError(f"{self.transport} bus requires 'host'")
+        return self
+
     @field_validator("baudrate", mode="before")
     @classmethod
     def _to_int_baudrate(cls, v: Any) -> int:
@@ -59,14 +78,34 @@ class ModbusDeviceConfig(BaseModel):
     slave_id: int
 
     # Either provided by YAML merge, or resolved from buses via `bus`
+    transport: ModbusTransport = ModbusTransport.SERIAL
     port: str | None = None
     baudrate: int | None = None
     timeout: float | None = None
 
+    host: str | None = None
+    tcp_port: int = 502
+    pool_size: int = 2
+
     modes: dict[str, Any] = Field(default_factory=dict)
 
+    # Instance-level default polling class (pin-level poll_class still wins)
+    poll_class: PollClass | None = None
+
     bus: str | None = None
 
+    @property
+    def endpoint(self) -> str | None:
+        """
+        Key identifying the physical link the device sits on (shared client + lock).
+        Serial: the port path. TCP transports: "<transport>://host:tcp_port".
+        """
+        if self.transport == ModbusTransport.SERIAL:
+            return self.port
+        if not self.host:
+            return None
+        return f"{self.transport}://{self.host}:{self.tcp_port}"
+
     @field_validator("slave_id", mode="before")
     @classmethod
     def _to_int_slave_id(cls, v: Any) -> int:
@@ -124,7 +163,7 @@ class ModbusDeviceFileConfig(BaseModel):
 
     def resolve_device_bus_settings(self) -> list[ModbusDeviceConfig]:
         """
-        Ensure each device has (port, baudrate, timeout).
+        Ensure each device has (port | host, baudrate, timeout).
         Priority:
           1) device explicit fields (after YAML merge)
           2) device.bus reference -> buses[bus]
@@ -132,8 +171,8 @@ class ModbusDeviceFileConfig(BaseModel):
         """
         resolved: list[ModbusDeviceConfig] = []
         for device in self.device_list:
-            # Already has port from YAML merge
-            if device.port:
+            # Already has port/host from YAML merge
+            if device.port or device.host:
                 if device.baudrate is None:
                     device.baudrate = 9600
                 if device.timeout is None:
@@ -150,14 +189,18 @@ class ModbusDeviceFileConfig(BaseModel):
                     )
                     resolved.append(device)
                     continue
+                device.transport = bus.transport
                 device.port = bus.port
+                device.host = bus.host
+                device.tcp_port = bus.tcp_port
+                device.pool_size = bus.pool_size
                 device.baudrate = int(device.baudrate or bus.baudrate)
                 device.timeout = float(device.timeout or bus.timeout)
                 resolved.append(device)
                 continue
 
-            # No port and no bus reference
-            logger.warning(f"[modbus_device] device missing port/bus: {device.model}_{device.slave_id}")
+            # No port/host and no bus reference
+            logger.warning(f"[modbus_device] device missing port/host/bus: {device.model}_{device.slave_id}")
             resolved.append(device)
 
         return resolved
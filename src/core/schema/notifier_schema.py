@@ -10,6 +10,8 @@ class SmsNotifierConfig(BaseModel):
     enabled: bool = Field(default=False, description="Enable SMS notifications")
     priority: int = Field(default=1, ge=1, le=10, description="Notifier priority (1=highest)")
     phone_numbers: list[str] = Field(default_factory=list, description="List of phone numbers")
+    rate_per_min: float = Field(default=6.0, gt=0, description="Max messages per minute (token bucket rate)")
+    burst: int = Field(default=2, ge=1, description="Messages allowed back-to-back before throttling")
 
     @field_validator("phone_numbers")
     def validate_phone_numbers(cls, v):
@@ -31,6 +33,8 @@ class TelegramNotifierConfig(BaseModel):
     chat_id: str = Field(default="", description="Telegram chat/group ID")
     timeout_sec: float = Field(default=5.0, gt=0)
     parse_mode: str = Field(default="HTML", description="Message parse mode (HTML/Markdown)")
+    rate_per_min: float = Field(default=20.0, gt=0, description="Max messages per minute (Telegram group limit)")
+    burst: int = Field(default=5, ge=1, description="Messages allowed back-to-back before throttling")
 
     @field_validator("parse_mode")
     def validate_parse_mode(cls, v):
@@ -52,6 +56,17 @@ class EmailNotifierConfig(BaseModel):
     enabled: bool = Field(default=True, description="Email is always enabled as fallback")
     priority: int = Field(default=3, ge=1, le=10)
     config_path: str = Field(default="./res/mail_config.yml", description="Path to email config")
+    rate_per_min: float = Field(default=10.0, gt=0, description="Max messages per minute (token bucket rate)")
+    burst: int = Field(default=3, ge=1, description="Messages allowed back-to-back before throttling")
+
+
+class HttpPoolConfigSchema(BaseModel):
+    """Shared HTTP connection pool for webhook-based notifiers (Telegram, ...)"""
+
+    max_connections: int = Field(default=10, ge=1, description="Max concurrent connections per endpoint")
+    max_keepalive_connections: int = Field(default=5, ge=0, description="Idle connections kept alive per endpoint")
+    keepalive_expiry_sec: float = Field(default=60.0, gt=0, description="Idle connection lifetime")
+    http2: bool = Field(default=True, description="Use HTTP/2 when the 'h2' package is installed")
 
 
 class NotifierConfigSchema(BaseModel):
@@ -60,6 +75,7 @@ class NotifierConfigSchema(BaseModel):
     sms: SmsNotifierConfig | None = None
     telegram: TelegramNotifierConfig | None = None
     email: EmailNotifierConfig = Field(default_factory=EmailNotifierConfig)
+    http_pool: HttpPoolConfigSchema = Field(default_factory=HttpPoolConfigSchema)
 
 
 class RoutingRule(BaseModel):
@@ -102,6 +118,21 @@ class NotificationStrategySchema(BaseModel):
         return v
 
 
+class DigestConfigSchema(BaseModel):
+    """Per-channel alert coalescing (digest) settings"""
+
+    enabled: bool = Field(
+        default=False,
+        description="Coalesce alerts per notifier into digest messages (off: every alert is sent on its own)",
+    )
+    window_sec: float = Field(default=10.0, ge=0, description="Collect alerts for this long before sending")
+    max_batch: int = Field(default=50, ge=1, description="Flush early once this many alerts are pending")
+    bypass_severities: list[AlertSeverity] = Field(
+        default_factory=lambda: [AlertSeverity.CRITICAL],
+        description="Severities sent immediately, bypassing the digest window and rate limit",
+    )
+
+
 class RetryConfigSchema(BaseModel):
     """Retry configuration"""
 
@@ -122,3 +153,4 @@ class NotificationConfigSchema(BaseModel):
     strategy: NotificationStrategySchema = Field(default_factory=NotificationStrategySchema)
     notifiers: NotifierConfigSchema = Field(default_factory=NotifierConfigSchema)
     retry: RetryConfigSchema = Field(default_factory=RetryConfigSchema)
+    digest: DigestConfigSchema = Field(default_factory=DigestConfigSchema)
@@ -5,6 +5,7 @@ Defines application-layer pin mapping configuration schema
 
 from pydantic import BaseModel, Field
 
+from core.model.enum.poll_class_enum import PollClass
 from core.schema.config_metadata import ConfigMetadata
 
 
@@ -19,6 +20,7 @@ class PinMapping(BaseModel):
     unit: str | None = Field(None, description="Display unit (e.g., '°C', 'bar', 'V')")
     precision: int | None = Field(None, ge=0, description="Display precision (number of decimal places)")
     remark: str | None = Field(None, description="Additional notes or semantic label")
+    poll_class: PollClass | None = Field(None, description="Polling rate class (fast/normal/slow)")
 
 
 class PinMappingConfig(BaseModel):
@@ -1,6 +1,6 @@
 import os
 import pathlib
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 
@@ -86,6 +86,67 @@ class SenderSchema(BaseModel):
         ),
     )
 
+    # --- Prebuilt frames (live send) ---
+    prebuild_frames: bool = Field(
+        True,
+        description=(
+            "Convert snapshots to legacy items in the background as they arrive, so a tick only "
+            "stamps timestamps and sends"
+        ),
+    )
+    prebuild_debounce_sec: float = Field(
+        2.0, ge=0, description="Coalesce snapshot updates for this long before (re)building a device's frame"
+    )
+
+    # --- Backlog drain (resend worker) ---
+    resend_drain_enabled: bool = Field(
+        True,
+        description=(
+            "Adaptive backlog drain: AIMD-sized batches (starting at fail_resend_batch) "
+            "uploaded with bounded concurrency, back to back while the cloud keeps accepting"
+        ),
+    )
+    resend_max_batch: int = Field(200, ge=1, description="Upper bound of the adaptive resend batch size")
+    resend_concurrency: int = Field(2, ge=1, description="Max concurrent backlog uploads")
+    resend_slow_latency_sec: float = Field(
+        5.0, gt=0, description="Uploads slower than this shrink the resend batch size"
+    )
+    resend_merge_max_kb: int = Field(
+        0,
+        ge=0,
+        description="Merge several stored payloads into one upload up to N KB (0 = one upload per payload)",
+    )
+
+    # --- Outbox backend ---
+    outbox_backend: Literal["segment", "file"] = Field(
+        "segment",
+        description="Outbox storage: 'segment' (append-only segment log + SQLite index) or 'file' (one file per payload)",
+    )
+    outbox_segment_max_mb: float = Field(4.0, gt=0, description="Max size of one outbox segment file in MB")
+    outbox_compression: Literal["none", "gzip"] = Field(
+        "gzip", description="At-rest compression of outbox entries (segment backend only)"
+    )
+
+    # --- Upload encoding ---
+    upload_compression: Literal["off", "gzip", "auto"] = Field(
+        "off",
+        description=(
+            "Content-Encoding for cloud uploads: 'off' (plain JSON), 'gzip' (always), "
+            "'auto' (gzip, falling back to plain JSON if the endpoint rejects it)"
+        ),
+    )
+    upload_gzip_min_bytes: int = Field(1024, ge=0, description="Only gzip request bodies of at least N bytes")
+    payload_encoding: Literal["v6", "compact", "auto"] = Field(
+        "v6",
+        description=(
+            "Live upload format: 'v6' (full v6.0 payload), 'compact' (v7.0 dictionary + delta rows), "
+            "'auto' (compact, falling back to v6 for the rest of the process if the endpoint rejects it)"
+        ),
+    )
+    compact_full_every: int = Field(
+        60, ge=1, description="Send a self-contained compact payload after N deltas (bounds receiver drift)"
+    )
+
     # --- Preserve existing block ---
     sender: SenderFlag = Field(default_factory=SenderFlag)
 
@@ -130,6 +191,14 @@ class SenderSchema(BaseModel):
             )
         return self
 
+    # ---------- YAML 1.1 reads bare off/on as booleans ----------
+    @field_validator("upload_compression", mode="before")
+    @classmethod
+    def _coerce_upload_compression(cls, v: Any) -> Any:
+        if isinstance(v, bool):
+            return "gzip" if v else "off"
+        return v
+
     # ---------- Boundary validations ----------
     @field_validator("anchor_offset_sec")
     @classmethod
@@ -11,6 +11,7 @@ class PathsConfig(BaseModel):
     STATE_DIR: str = Field(default="logs/state", description="State data directory")
     LOG_DIR: str = Field(default="logs", description="Log directory")
     OUTLIER_LOG_PATH: str = Field(default="logs/outlier.log", description="Outlier log file path")
+    ALERT_STATE_DB_PATH: str = Field(default="logs/state/alert_state.db", description="Alert state SQLite file path")
 
 
 class DeviceIdPolicyConfig(BaseModel):
@@ -23,6 +24,18 @@ class DeviceIdPolicyConfig(BaseModel):
     PREFIX: str = Field(default="", description="Prefix")
 
 
+class PollIntervalsConfig(BaseModel):
+    """Per poll-class intervals (seconds); unset classes poll at MONITOR_INTERVAL_SECONDS"""
+
+    FAST: float | None = Field(default=None, gt=0, description="Interval for poll_class=fast pins")
+    NORMAL: float | None = Field(default=None, gt=0, description="Interval for poll_class=normal pins")
+    SLOW: float | None = Field(default=None, gt=0, description="Interval for poll_class=slow pins")
+
+    def as_class_intervals(self) -> dict[str, float | None]:
+        """Intervals keyed by PollClass value (fast/normal/slow)."""
+        return {key.lower(): value for key, value in self.model_dump().items()}
+
+
 class SubscribersConfig(BaseModel):
     """Subscribers configuration"""
 
@@ -56,6 +69,15 @@ class SubscribersConfig(BaseModel):
         return iter(self.model_dump())
 
 
+class LoopProfilerSettings(BaseModel):
+    """Event loop profiler (slow-callback detector, per-subscriber CPU, sampling profiler)"""
+
+    ENABLED: bool = Field(default=True, description="Time every loop callback and capture stalls")
+    SLOW_CALLBACK_MS: float = Field(default=100.0, gt=0, description="Callbacks running longer are recorded as stalls")
+    MAX_STALLS: int = Field(default=50, ge=1, le=1000, description="Recent stalls kept in memory")
+    MAX_PROFILE_SEC: float = Field(default=60.0, gt=0, le=600, description="Longest on-demand sampling profile")
+
+
 class ReverseSshConfig(BaseModel):
     PORT_SOURCE: Literal["config", "mqtt"] = Field(
         default="config", description="Reverse SSH port source: config | mqtt"
@@ -86,9 +108,11 @@ class SystemConfig(BaseModel):
     )
     MONITOR_DEVICE_TIMEOUT_SEC: float = Field(default=3.0, gt=0, le=60, description="Per-device read timeout seconds.")
     MONITOR_LOG_EACH_DEVICE: bool = Field(default=False, description="Log per-device online status (debug)")
+    MONITOR_POLL_INTERVALS: PollIntervalsConfig = Field(default_factory=PollIntervalsConfig)
     PATHS: PathsConfig = Field(default_factory=PathsConfig)
     DEVICE_ID_POLICY: DeviceIdPolicyConfig = Field(default_factory=DeviceIdPolicyConfig)
     SUBSCRIBERS: SubscribersConfig = Field(default_factory=SubscribersConfig)
+    LOOP_PROFILER: LoopProfilerSettings = Field(default_factory=LoopProfilerSettings)
 
     REMOTE_ACCESS: RemoteAccessConfig = Field(default_factory=RemoteAccessConfig)
 
@@ -124,9 +148,11 @@ class SystemConfigFileSchema(BaseModel):
     MONITOR_READ_CONCURRENCY: int = Field(default=50, ge=1, le=500)
     MONITOR_DEVICE_TIMEOUT_SEC: float = Field(default=3.0, gt=0, le=60)
     MONITOR_LOG_EACH_DEVICE: bool = Field(default=False)
+    MONITOR_POLL_INTERVALS: PollIntervalsConfig = Field(default_factory=PollIntervalsConfig)
     PATHS: PathsConfig = Field(default_factory=PathsConfig)
     DEVICE_ID_POLICY: DeviceIdPolicyConfig = Field(default_factory=DeviceIdPolicyConfig)
     SUBSCRIBERS: SubscribersConfig = Field(default_factory=SubscribersConfig)
+    LOOP_PROFILER: LoopProfilerSettings = Field(default_factory=LoopProfilerSettings)
     REMOTE_ACCESS: RemoteAccessConfig = Field(default_factory=RemoteAccessConfig)
 
     @model_validator(mode="after")
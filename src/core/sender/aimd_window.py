@@ -0,0 +1,66 @@
+import logging
+
+logger = logging.getLogger("AimdWindow")
+
+
+class AimdWindow:
+    """
+    Additive-increase / multiplicative-decrease batch window for the resend drain.
+
+    Uploads of one resend round are reported via observe(); end_round() then adjusts the
+    window once per round:
+      - every upload succeeded and none was slower than slow_latency_sec → size += increase
+      - any failure or slow upload                                      → size *= decrease_factor
+
+    The window therefore grows while the link keeps up and shrinks as soon as the cloud
+    errors out or latency shows the link is saturated.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        *,
+        minimum: int = 1,
+        maximum: int = 200,
+        increase: int | None = None,
+        decrease_factor: float = 0.5,
+        slow_latency_sec: float = 5.0,
+    ):
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.increase = max(1, int(increase if increase is not None else initial))
+        self.decrease_factor = float(decrease_factor)
+        self.slow_latency_sec = float(slow_latency_sec)
+        self._size = min(max(int(initial), self.minimum), self.maximum)
+
+        self._round_ok = 0
+        self._round_failed = 0
+        self._round_slow = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def observe(self, ok: bool, latency_sec: float) -> None:
+        if not ok:
+            self._round_failed += 1
+        elif latency_sec > self.slow_latency_sec:
+            self._round_slow += 1
+        else:
+            self._round_ok += 1
+
+    def end_round(self) -> int:
+        """Apply the round's outcome and return the new window size."""
+        previous = self._size
+        if self._round_failed or self._round_slow:
+            self._size = max(self.minimum, int(self._size * self.decrease_factor))
+        elif self._round_ok:
+            self._size = min(self.maximum, self._size + self.increase)
+
+        if self._size != previous:
+            logger.debug(
+                f"[AIMD] window {previous} → {self._size} "
+                f"(ok={self._round_ok}, slow={self._round_slow}, failed={self._round_failed})"
+            )
+        self._round_ok = self._round_failed = self._round_slow = 0
+        return self._size
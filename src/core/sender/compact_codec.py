@@ -0,0 +1,160 @@
+from collections import Counter
+from typing import Any
+
+FULL_VERSION = "6.0"
+COMPACT_VERSION = "7.0"
+COMPACT_ENCODING = "dict-delta"
+
+
+class CompactBaseMismatch(ValueError):
+    """The receiver does not hold the base payload a delta refers to."""
+
+
+class CompactPayloadEncoder:
+    """
+    Encode v6.0 PushIMAData payloads into the compact v7.0 form.
+
+    v7.0 layout:
+        {
+          "FUNC": "PushIMAData", "version": "7.0", "Encoding": "dict-delta",
+          "GatewayID": ..., "Timestamp": ...,
+          "DictId": 3,
+          "Dict": ["HZ", "KW", ...],          # only while the receiver may not know DictId yet
+          "Base": "20250101120000" | None,    # Timestamp of the acknowledged payload deltas refer to
+          "Rows": [
+            ["<DeviceID>", [key indices], [values]],     # changed fields only (delta vs Base)
+            ["<DeviceID>", [key indices], [values], 1],  # full row: replaces the device's state
+          ]
+        }
+
+    - Field names live once in a per-gateway dictionary (append-only; DictId = its length).
+    - Rows carry values only, addressed by dictionary index.
+    - A device's row omits fields whose value equals the last *acknowledged* payload. Only
+      ack() advances the base, so an unacknowledged send never corrupts later deltas.
+    - Every full_every-th payload (and the first one after reset()) is sent with Base=None and
+      full rows, bounding how long a receiver can drift.
+    """
+
+    def __init__(self, full_every: int = 60):
+        self.full_every = max(1, int(full_every))
+        self._keys: list[str] = []
+        self._key_index: dict[str, int] = {}
+        self._acked_dict_id = 0
+        self._base_ts: str | None = None
+        self._base_rows: dict[str, dict[str, Any]] = {}
+        self._deltas_since_full = 0
+        self._last_encoded_full = True
+
+    @property
+    def dict_id(self) -> int:
+        return len(self._keys)
+
+    def reset(self) -> None:
+        """Forget the acknowledged base and dictionary; the next payload is fully self-contained."""
+        self._acked_dict_id = 0
+        self._base_ts = None
+        self._base_rows = {}
+        self._deltas_since_full = 0
+
+    def encode(self, payload: dict) -> dict:
+        use_base = self._base_ts is not None and self._deltas_since_full < self.full_every
+        self._last_encoded_full = not use_base
+        items = payload.get("Data") or []
+        # A DeviceID repeated within one payload has no unambiguous base: always send it full
+        duplicated = {dev for dev, n in Counter(it.get("DeviceID") for it in items).items() if n > 1}
+
+        rows: list[list] = []
+        for item in items:
+            device_id = item.get("DeviceID")
+            data: dict = item.get("Data") or {}
+            base = self._base_rows.get(device_id) if use_base and device_id not in duplicated else None
+
+            if base is not None and base.keys() <= data.keys():
+                changed = [(k, v) for k, v in data.items() if k not in base or base[k] != v]
+                rows.append([device_id, [self._index_of(k) for k, _ in changed], [v for _, v in changed]])
+            else:
+                row = [device_id, [self._index_of(k) for k in data], list(data.values())]
+                if use_base:
+                    row.append(1)  # new device or dropped fields: replace state instead of merging
+                rows.append(row)
+
+        encoded = {
+            "FUNC": payload.get("FUNC", "PushIMAData"),
+            "version": COMPACT_VERSION,
+            "Encoding": COMPACT_ENCODING,
+            "GatewayID": payload.get("GatewayID"),
+            "Timestamp": payload.get("Timestamp"),
+            "DictId": self.dict_id,
+            "Base": self._base_ts if use_base else None,
+            "Rows": rows,
+        }
+        if self._acked_dict_id != self.dict_id or not use_base:
+            encoded["Dict"] = list(self._keys)
+        return encoded
+
+    def ack(self, payload: dict) -> None:
+        """The receiver accepted the last encode() of payload: it becomes the base for later deltas."""
+        rows: dict[str, dict[str, Any]] = {}
+        for item in payload.get("Data") or []:
+            rows[item.get("DeviceID")] = dict(item.get("Data") or {})
+
+        self._deltas_since_full = 0 if self._last_encoded_full else self._deltas_since_full + 1
+        self._base_rows = rows
+        self._base_ts = payload.get("Timestamp")
+        self._acked_dict_id = self.dict_id
+
+    def _index_of(self, key: str) -> int:
+        idx = self._key_index.get(key)
+        if idx is None:
+            idx = len(self._keys)
+            self._keys.append(key)
+            self._key_index[key] = idx
+        return idx
+
+
+class CompactPayloadDecoder:
+    """
+    Reference receiver for the v7.0 encoding: rebuilds the equivalent v6.0 payload.
+
+    Keeps the dictionary and the last applied payload per gateway, exactly the state a
+    cloud endpoint needs to accept compact uploads.
+    """
+
+    def __init__(self):
+        self._keys: list[str] = []
+        self._last_ts: str | None = None
+        self._last_rows: dict[str, dict[str, Any]] = {}
+
+    def decode(self, encoded: dict) -> dict:
+        if encoded.get("version") != COMPACT_VERSION:
+            return encoded
+
+        if "Dict" in encoded:
+            self._keys = list(encoded["Dict"])
+        if int(encoded.get("DictId", 0)) > len(self._keys):
+            raise CompactBaseMismatch(f"unknown dictionary id {encoded.get('DictId')}")
+
+        base_ts = encoded.get("Base")
+        if base_ts is not None and base_ts != self._last_ts:
+            raise CompactBaseMismatch(f"base {base_ts} not held (last applied: {self._last_ts})")
+        base_rows = self._last_rows if base_ts is not None else {}
+
+        items: list[dict] = []
+        rows: dict[str, dict[str, Any]] = {}
+        for row in encoded.get("Rows") or []:
+            device_id, indices, values = row[0], row[1], row[2]
+            is_full = base_ts is None or (len(row) > 3 and row[3])
+            data = {} if is_full else dict(base_rows.get(device_id) or {})
+            data.update((self._keys[i], v) for i, v in zip(indices, values))
+            rows[device_id] = data
+            items.append({"DeviceID": device_id, "Data": data})
+
+        self._last_ts = encoded.get("Timestamp")
+        self._last_rows = rows
+        return {
+            "FUNC": encoded.get("FUNC", "PushIMAData"),
+            "version": FULL_VERSION,
+            "GatewayID": encoded.get("GatewayID"),
+            "Timestamp": encoded.get("Timestamp"),
+            "Data": items,
+        }
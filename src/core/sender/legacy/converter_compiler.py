@@ -0,0 +1,64 @@
+import logging
+from typing import Any, Callable
+
+from core.sender.legacy.converter_registry import CONVERTER_PLAN_BUILDERS
+from core.sender.legacy.snapshot_converters import LegacyConversionPlan
+from core.util import device_id_policy
+from device_manager import AsyncDeviceManager
+
+logger = logging.getLogger("LegacyConverterCompiler")
+
+
+class LegacyConverterCompiler:
+    """
+    Cache of precompiled legacy converters.
+
+    A plan is compiled once per (converter, gateway, model, slave_id, key set, DeviceID policy,
+    device manager):
+    routing, pin discovery (regex), DeviceID generation and field lookup happen at compile time,
+    leaving conversion itself a fixed loop over precomputed (source key, output key) pairs.
+    The key set is the snapshot's key tuple, which is stable for a device between polls.
+    """
+
+    MAX_PLANS = 512
+
+    def __init__(self):
+        self._plans: dict[tuple, LegacyConversionPlan] = {}
+
+    def plan_for(
+        self,
+        converter_fn: Callable,
+        *,
+        gateway_id: str,
+        model: str | None,
+        slave_id: str | int,
+        values: dict[str, Any],
+        device_manager: AsyncDeviceManager,
+    ) -> LegacyConversionPlan | None:
+        """Return the compiled plan for this snapshot shape, or None if the converter has no compiler."""
+        builder = CONVERTER_PLAN_BUILDERS.get(converter_fn)
+        if builder is None:
+            return None
+
+        key = (converter_fn, gateway_id, model, str(slave_id), tuple(values), device_id_policy.POLICY, device_manager)
+        plan = self._plans.get(key)
+        if plan is not None:
+            return plan
+
+        def resolve_pin_type_map() -> dict[str, str] | None:
+            device = device_manager.get_device_by_model_and_slave_id(model, str(slave_id))
+            return device.pin_type_map if device else None
+
+        plan = builder(gateway_id, slave_id, model, key[4], resolve_pin_type_map)
+        if plan is None:
+            return None
+
+        if len(self._plans) >= self.MAX_PLANS:
+            logger.info(f"[LegacyFormat] converter plan cache full ({self.MAX_PLANS}), clearing")
+            self._plans.clear()
+        self._plans[key] = plan
+        logger.debug(f"[LegacyFormat] compiled {builder.__name__} for {model}_{slave_id} ({len(key[4])} keys)")
+        return plan
+
+    def clear(self) -> None:
+        self._plans.clear()
@@ -1,6 +1,10 @@
 # FIXME Need to Refactor
 
 from core.sender.legacy.snapshot_converters import (
+    compile_ai_module_converter,
+    compile_di_module_converter,
+    compile_inverter_converter,
+    compile_power_meter_converter,
     convert_ai_module_snapshot,
     convert_di_module_snapshot,
     convert_inverter_snapshot,
@@ -17,3 +21,12 @@ CONVERTER_MAP = {
     "sensor": convert_sensor_snapshot,
     "panel_meter": convert_panel_meter_snapshot,
 }
+
+# Converter function → plan compiler producing identical output.
+# Keyed by function so a replaced CONVERTER_MAP entry is never shadowed by a stale plan.
+CONVERTER_PLAN_BUILDERS = {
+    convert_di_module_snapshot: compile_di_module_converter,
+    convert_ai_module_snapshot: compile_ai_module_converter,
+    convert_inverter_snapshot: compile_inverter_converter,
+    convert_power_meter_snapshot: compile_power_meter_converter,
+}
@@ -3,11 +3,14 @@ import logging
 from typing import Any
 
 from core.model.device_constant import DEFAULT_MISSING_VALUE, INVERTER_OFFLINE_PROBE_KEYS, INVERTER_STATUS_OFFLINE_CODE
+from core.sender.legacy.converter_compiler import LegacyConverterCompiler
 from core.sender.legacy.converter_registry import CONVERTER_MAP
 from device_manager import AsyncDeviceManager
 
 logger = logging.getLogger("LegacyFormatAdapter")
 
+_converter_compiler = LegacyConverterCompiler()
+
 
 def is_default_missing_value(value: Any) -> bool:
     """Return True if value equals the system default missing sentinel (-1)."""
@@ -57,7 +60,7 @@ def convert_snapshot_to_legacy_payload(
     - For inverter:
         * If inferred offline → set invstatus=9
         * Coerce ERROR/ALERT/RW_ON_OFF to non-negative ints
-    - Delegate to converter functions by device_type.
+    - Delegate to converter functions by device_type (precompiled per key set when available).
     """
     try:
         device_type: str | None = snapshot.get("type")
@@ -85,6 +88,18 @@ def convert_snapshot_to_legacy_payload(
             logger.debug(f"[LegacyFormat] Skip unsupported type: {device_type}")
             return []
 
+        # Fast path: precompiled plan for this device's key set
+        plan = _converter_compiler.plan_for(
+            converter_fn,
+            gateway_id=gateway_id,
+            model=model,
+            slave_id=slave_id,
+            values=values,
+            device_manager=device_manager,
+        )
+        if plan is not None:
+            return plan(values)
+
         # Dispatch by type
         match device_type:
             case "ai_module":
@@ -4,18 +4,19 @@ import logging
 import os
 import re
 import socket
-from collections import defaultdict
+import time
 from datetime import datetime, timedelta
-from zoneinfo import ZoneInfo
 
-import aiofiles
 import httpx
 
 from core.model.enum.equipment_enum import EquipmentType
 from core.schema.sender_schema import SenderSchema
 from core.schema.system_config_schema import RemoteAccessConfig, ReverseSshConfig, SystemConfig
+from core.sender.aimd_window import AimdWindow
+from core.sender.compact_codec import CompactPayloadEncoder
 from core.sender.legacy.legacy_format_adapter import convert_snapshot_to_legacy_payload
-from core.sender.outbox_store import OutboxStore
+from core.sender.outbox_store import OutboxEntry, OutboxStore
+from core.sender.segment_outbox_store import SegmentOutboxStore
 from core.sender.transport import ResendTransport
 from core.util.system_info.system_info_collector import SystemInfoCollector
 from core.util.time_util import TIMEZONE_INFO
@@ -51,15 +52,44 @@ class LegacySenderAdapter:
         self.last_post_ok_within_sec = float(self.sender_config_model.last_post_ok_within_sec)
         self.resend_start_delay_sec = int(self.sender_config_model.resend_start_delay_sec)
 
+        # ---- Backlog drain: AIMD batch size, bounded concurrency, optional merging ----
+        # With drain disabled the window is pinned to fail_resend_batch and uploads are sequential.
+        self.resend_drain_enabled = bool(self.sender_config_model.resend_drain_enabled)
+        if self.resend_drain_enabled:
+            self.resend_concurrency = int(self.sender_config_model.resend_concurrency)
+            self.resend_merge_max_bytes = int(self.sender_config_model.resend_merge_max_kb) * 1024
+            self._resend_window = AimdWindow(
+                self.fail_resend_batch,
+                maximum=max(self.fail_resend_batch, int(self.sender_config_model.resend_max_batch)),
+                slow_latency_sec=float(self.sender_config_model.resend_slow_latency_sec),
+            )
+        else:
+            self.resend_concurrency = 1
+            self.resend_merge_max_bytes = 0
+            self._resend_window = AimdWindow(
+                self.fail_resend_batch, minimum=self.fail_resend_batch, maximum=self.fail_resend_batch
+            )
+
         self.device_manager = device_manager
         os.makedirs(self.resend_dir, exist_ok=True)
 
         self.__attempt_count = int(self.sender_config_model.attempt_count)
         self.__max_retry = int(self.sender_config_model.max_retry)
 
-        # window → { device_id → snapshot }; in-memory cache only
-        self._latest_per_window: dict[datetime, dict[str, dict]] = defaultdict(dict)
-        self._lock = asyncio.Lock()
+        # device_id → latest snapshot (reference, not a copy); one slot per device keeps memory
+        # bounded however late the scheduler runs. Ingest and tick scans never await mid-update,
+        # so no lock is needed on the event loop.
+        self._latest_by_device: dict[str, dict] = {}
+
+        # ---- Prebuilt frames: device_id → (snapshot it was built from, converted legacy items) ----
+        # Built in the background as snapshots arrive; a tick only stamps timestamps onto them.
+        self.prebuild_frames = bool(self.sender_config_model.prebuild_frames)
+        self.prebuild_debounce_sec = float(self.sender_config_model.prebuild_debounce_sec)
+        self._frames_by_device: dict[str, tuple[dict, list[dict]]] = {}
+        self._frames_dirty: set[str] = set()
+        self._frames_wakeup = asyncio.Event()
+        self._frame_builder_task: asyncio.Task | None = None
+
         self._epoch = datetime(1970, 1, 1, tzinfo=TIMEZONE_INFO)
 
         # ---- Warm-up state ----
@@ -79,19 +109,28 @@ class LegacySenderAdapter:
         self._transport: ResendTransport | None = None
         self.last_post_ok_at: datetime | None = None
 
+        # ---- Live payload encoding (v7.0 compact is negotiated; outbox keeps self-contained v6.0) ----
+        self.payload_encoding = self.sender_config_model.payload_encoding
+        self._compact: CompactPayloadEncoder | None = None
+        if self.payload_encoding != "v6":
+            self._compact = CompactPayloadEncoder(full_every=self.sender_config_model.compact_full_every)
+
         # ---- Background worker state ----
         self._resend_task: asyncio.Task | None = None
         self._resend_wakeup: asyncio.Event = asyncio.Event()
         self._stopping: bool = False
 
+        # ---- Live sends take priority: backlog uploads wait while one is in flight ----
+        self._live_sends_inflight = 0
+        self._live_idle = asyncio.Event()
+        self._live_idle.set()
+
         # ---- Main tasks handles (IMPORTANT) ----
         self._warmup_task: asyncio.Task | None = None
         self._scheduler_task: asyncio.Task | None = None
 
         # ---- Outbox store ----
-        self._store = OutboxStore(
-            dirpath=self.resend_dir,
-            tz=TIMEZONE_INFO,
+        store_kwargs = dict(
             gateway_id=self.gateway_id,
             resend_quota_mb=self.resend_quota_mb,
             fs_free_min_mb=self.fs_free_min_mb,
@@ -99,6 +138,16 @@ class LegacySenderAdapter:
             cleanup_batch=self.sender_config_model.resend_cleanup_batch,
             cleanup_enabled=self.sender_config_model.resend_cleanup_enabled,
         )
+        if self.sender_config_model.outbox_backend == "segment":
+            self._store: OutboxStore = SegmentOutboxStore(
+                self.resend_dir,
+                TIMEZONE_INFO,
+                segment_max_bytes=int(self.sender_config_model.outbox_segment_max_mb * 1024 * 1024),
+                compression=self.sender_config_model.outbox_compression,
+                **store_kwargs,
+            )
+        else:
+            self._store = OutboxStore(self.resend_dir, TIMEZONE_INFO, **store_kwargs)
 
         self.series_number = series_number
         self.resend_anchor_offset_sec = int(sender_config_schema.resend_anchor_offset_sec)
@@ -118,9 +167,8 @@ class LegacySenderAdapter:
     # -------------------------
     async def handle_snapshot(self, snapshot_map: dict) -> None:
         """
-        On receiving a snapshot, place it into the bucket of its window
-        (within the same window keep only the last one per device),
-        and trigger warm-up once the first snapshot arrives.
+        On receiving a snapshot, keep it as the device's latest slot (unless an
+        even newer one is already held), and trigger warm-up once the first snapshot arrives.
         """
         device_id = snapshot_map.get("device_id")
         sampling_datetime: datetime | None = snapshot_map.get("sampling_datetime")
@@ -135,9 +183,16 @@ class LegacySenderAdapter:
         else:
             sampling_datetime = sampling_datetime.astimezone(TIMEZONE_INFO)
 
-        wstart = LegacySenderAdapter._window_start(sampling_datetime, int(self.send_interval_sec), tz=TIMEZONE_INFO)
-        async with self._lock:
-            self._latest_per_window[wstart][device_id] = {**snapshot_map, "sampling_datetime": sampling_datetime}
+        # Copy only when normalization changed the timestamp (astimezone to the same tz returns self)
+        if sampling_datetime is not snapshot_map["sampling_datetime"]:
+            snapshot_map = {**snapshot_map, "sampling_datetime": sampling_datetime}
+
+        prev = self._latest_by_device.get(device_id)
+        if prev is None or sampling_datetime >= prev["sampling_datetime"]:
+            self._latest_by_device[device_id] = snapshot_map
+            if self.prebuild_frames:
+                self._frames_dirty.add(device_id)
+                self._frames_wakeup.set()
 
         if not self._first_snapshot_event.is_set():
             self._first_snapshot_event.set()
@@ -149,6 +204,7 @@ class LegacySenderAdapter:
           - _warmup_send_once(): wait first snapshot → send immediately
           - _scheduler_loop(): aligned periodic sending
           - _resend_worker_loop(): background resend
+          - _frame_builder_loop(): convert snapshots ahead of the tick (if prebuild_frames)
         """
         if self._client is None:
             timeout = httpx.Timeout(
@@ -161,7 +217,14 @@ class LegacySenderAdapter:
             logger.info("[Sender] Shared HTTP client created (connect=5.0s, read=10.0s, write=5.0s, pool=5.0s)")
 
         if self._transport is None:
-            self._transport = ResendTransport(self.ima_url, self._client, self._is_ok)
+            self._transport = self._make_transport(self._client)
+
+        # One-shot import of a legacy one-file-per-payload outbox
+        if isinstance(self._store, SegmentOutboxStore):
+            try:
+                await asyncio.to_thread(self._store.import_legacy_files)
+            except Exception as e:
+                logger.warning(f"[Sender] legacy outbox import failed: {e}")
 
         # Keep task handles so stop() can cancel/await them.
         if self._warmup_task is None or self._warmup_task.done():
@@ -170,6 +233,9 @@ class LegacySenderAdapter:
         if self._scheduler_task is None or self._scheduler_task.done():
             self._scheduler_task = asyncio.create_task(self._scheduler_loop())
 
+        if self.prebuild_frames and (self._frame_builder_task is None or self._frame_builder_task.done()):
+            self._frame_builder_task = asyncio.create_task(self._frame_builder_loop())
+
         # Start background resend worker (optional by config)
         if self.fail_resend_enabled:
             asyncio.create_task(self._delayed_resend_start())
@@ -184,7 +250,11 @@ class LegacySenderAdapter:
         self._stopping = True
 
         # 1) stop scheduler / warmup
-        for tname, task in [("scheduler", self._scheduler_task), ("warmup", self._warmup_task)]:
+        for tname, task in [
+            ("scheduler", self._scheduler_task),
+            ("warmup", self._warmup_task),
+            ("frame builder", self._frame_builder_task),
+        ]:
             if task is not None and not task.done():
                 task.cancel()
                 try:
@@ -216,6 +286,9 @@ class LegacySenderAdapter:
         except Exception as e:
             logger.warning(f"[Sender] Error closing HTTP client: {e}")
 
+        # 4) close outbox
+        self._store.close()
+
     # -------------------------
     # Internal
     # -------------------------
@@ -249,8 +322,6 @@ class LegacySenderAdapter:
             if label_now <= last_label:
                 continue
 
-            snap = self._apply_pt_ct_ratios(snap)
-
             snap_ts: datetime = snap["sampling_datetime"]
             age_sec = (label_now - snap_ts).total_seconds()
             is_stale = 1 if age_sec > self.fresh_window_sec else 0
@@ -259,23 +330,8 @@ class LegacySenderAdapter:
             if snap_ts <= last_ts:
                 continue
 
-            converted = convert_snapshot_to_legacy_payload(
-                gateway_id=self.gateway_id,
-                snapshot=snap,
-                device_manager=self.device_manager,
-            )
-
+            converted = self._stamp_frame(self._frame_for(dev_id, snap), snap_ts, label_now, age_sec, is_stale)
             if converted:
-                age_ms = int(age_sec * 1000)
-                for it in converted:
-                    it.setdefault("Data", {})
-                    it["Data"]["sampling_datetime"] = snap_ts.isoformat()
-                    it["Data"]["report_ts"] = label_now.isoformat()
-                    it["Data"]["sample_age_ms"] = age_ms
-                    if is_stale:
-                        it["Data"]["is_stale"] = 1
-                        it["Data"]["stale_age_ms"] = age_ms
-
                 all_items.extend(converted)
                 sent_candidates_sampling_datetime[dev_id] = snap_ts
 
@@ -299,7 +355,7 @@ class LegacySenderAdapter:
                 for dev_id in sent_candidates_sampling_datetime:
                     self.__last_label_ts_by_device[dev_id] = label_now
                 self.__last_sent_ts_by_device.update(sent_candidates_sampling_datetime)
-                await self._prune_buckets()
+                await self._prune_sent_slots()
 
         self._first_send_done = True
 
@@ -350,7 +406,7 @@ class LegacySenderAdapter:
             if active_phase_count == 0:
                 active_phase_count = 1
 
-            logger.info(f"[DAE_PM210] {device_id}: Active phase count = {active_phase_count}")
+            logger.debug(f"[DAE_PM210] {device_id}: Active phase count = {active_phase_count}")
 
             active_v = [v for v in phase_v if v != 0]
             if active_v:
@@ -376,7 +432,7 @@ class LegacySenderAdapter:
                 f"(sum of all phases / {active_phase_count})"
             )
 
-            logger.info(
+            logger.debug(
                 f"[DAE_PM210] {device_id}: Final - "
                 f"Voltage={values.get('AverageVoltage', 0):.2f}V, "
                 f"Current={values.get('AverageCurrent', 0):.2f}A"
@@ -387,34 +443,89 @@ class LegacySenderAdapter:
 
         return snap
 
+    def _build_frame(self, snap: dict) -> list[dict]:
+        """Convert one snapshot into unstamped legacy items (PT/CT averages + converter)."""
+        snap = self._apply_pt_ct_ratios(snap)
+        return (
+            convert_snapshot_to_legacy_payload(
+                gateway_id=self.gateway_id,
+                snapshot=snap,
+                device_manager=self.device_manager,
+            )
+            or []
+        )
+
+    def _frame_for(self, dev_id: str, snap: dict) -> list[dict]:
+        """Return the prebuilt frame of snap, building it now if the builder has not caught up."""
+        frame = self._frames_by_device.get(dev_id)
+        if frame is not None and frame[0] is snap:
+            return frame[1]
+
+        items = self._build_frame(snap)
+        self._frames_by_device[dev_id] = (snap, items)
+        self._frames_dirty.discard(dev_id)
+        return items
+
+    @staticmethod
+    def _stamp_frame(
+        items: list[dict], snap_ts: datetime, label_time: datetime, age_sec: float, is_stale: int
+    ) -> list[dict]:
+        """Copy frame items with this tick's timestamps; the frame itself stays reusable."""
+        age_ms = int(age_sec * 1000)
+        stamps = {
+            "sampling_datetime": snap_ts.isoformat(),
+            "report_ts": label_time.isoformat(),
+            "sample_age_ms": age_ms,
+        }
+        if is_stale:
+            stamps["is_stale"] = 1
+            stamps["stale_age_ms"] = age_ms
+        return [{**it, "Data": {**(it.get("Data") or {}), **stamps}} for it in items]
+
+    async def _frame_builder_loop(self) -> None:
+        """
+        Keep frames current in the background: wait for dirty devices, coalesce bursts of
+        snapshot updates for prebuild_debounce_sec, then rebuild each dirty device once.
+        """
+        try:
+            while not self._stopping:
+                await self._frames_wakeup.wait()
+                if self.prebuild_debounce_sec > 0:
+                    await asyncio.sleep(self.prebuild_debounce_sec)
+                self._frames_wakeup.clear()
+
+                dirty, self._frames_dirty = self._frames_dirty, set()
+                for dev_id in dirty:
+                    snap = self._latest_by_device.get(dev_id)
+                    if snap is None:
+                        continue
+                    try:
+                        self._frame_for(dev_id, snap)
+                    except Exception as e:
+                        logger.warning(f"[FrameBuilder] {dev_id}: build failed, will convert at tick: {e}")
+                    await asyncio.sleep(0)  # yield between devices to keep the loop responsive
+        except asyncio.CancelledError:
+            logger.info("[FrameBuilder] cancelled")
+            raise
+
     async def _collect_latest_by_device_unlocked(self) -> dict[str, dict]:
         """
-        Compress all buckets → obtain a single "current latest" snapshot per device.
+        Snapshot of the slot table: the "current latest" snapshot per device (O(devices)).
         """
-        async with self._lock:
-            latest_by_device: dict[str, dict] = {}
-            for bucket in self._latest_per_window.values():
-                for dev_id, snap in bucket.items():
-                    prev = latest_by_device.get(dev_id)
-                    if (not prev) or (snap["sampling_datetime"] > prev["sampling_datetime"]):
-                        latest_by_device[dev_id] = snap
-        return latest_by_device
-
-    async def _prune_buckets(self) -> None:
+        return dict(self._latest_by_device)
+
+    async def _prune_sent_slots(self) -> None:
         """
-        Remove snapshots that were already sent or are older,
-        to prevent buckets from growing indefinitely.
+        Drop slots whose snapshot is not newer than the device's last-sent watermark.
         """
-        async with self._lock:
-            for wstart in list(self._latest_per_window.keys()):
-                bucket = self._latest_per_window[wstart]
-                for dev_id in list(bucket.keys()):
-                    snap_ts = bucket[dev_id]["sampling_datetime"]
-                    last_ts = self.__last_sent_ts_by_device.get(dev_id, self._epoch)
-                    if snap_ts <= last_ts:
-                        bucket.pop(dev_id, None)
-                if not bucket:
-                    self._latest_per_window.pop(wstart, None)
+        for dev_id, snap in list(self._latest_by_device.items()):
+            if snap["sampling_datetime"] <= self.__last_sent_ts_by_device.get(dev_id, self._epoch):
+                # Only drop if no newer snapshot replaced it in the meantime
+                if self._latest_by_device.get(dev_id) is snap:
+                    del self._latest_by_device[dev_id]
+                    frame = self._frames_by_device.get(dev_id)
+                    if frame is not None and frame[0] is snap:
+                        del self._frames_by_device[dev_id]
 
     async def _post_with_retry(self, payload: dict) -> bool:
         """
@@ -433,13 +544,15 @@ class LegacySenderAdapter:
         if transport is None:
             timeout = httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0)
             temp_client = httpx.AsyncClient(timeout=timeout)
-            transport = ResendTransport(self.ima_url, temp_client, self._is_ok)
+            transport = self._make_transport(temp_client)
 
+        self._live_sends_inflight += 1
+        self._live_idle.clear()
         try:
             for i in range(self.__attempt_count):
                 try:
                     logger.debug(f"[POST] Attempt {i+1}/{self.__attempt_count}")
-                    ok, status, text = await transport.send(payload)
+                    ok, status, text = await self._send_live(transport, payload)
 
                     if ok:
                         logger.debug(f"[POST][Payload]: {payload}")
@@ -478,6 +591,9 @@ class LegacySenderAdapter:
             logger.warning(f"[POST] ✗ All {self.__attempt_count} attempts exhausted")
 
         finally:
+            self._live_sends_inflight -= 1
+            if self._live_sends_inflight == 0:
+                self._live_idle.set()
             if temp_client is not None:
                 try:
                     await temp_client.aclose()
@@ -487,23 +603,37 @@ class LegacySenderAdapter:
         await asyncio.to_thread(self._store.enforce_budget)
         return False
 
-    @staticmethod
-    def _window_start(ts: datetime, interval_sec: int, tz: ZoneInfo = TIMEZONE_INFO) -> datetime:
-        """
-        Align `sampling_datetime` to tumbling window start by epoch-based alignment.
-        This is ONLY for internal cache bucket key (does not affect sending timestamp).
+    async def _send_live(self, transport: ResendTransport, payload: dict) -> tuple[bool, int, str]:
         """
-        interval = int(interval_sec)
-        if interval <= 0:
-            interval = 1
+        Upload a live payload, compact-encoded when negotiated.
 
-        ts_tz = ts.astimezone(tz) if ts.tzinfo else ts.replace(tzinfo=tz)
-        ts_tz = ts_tz.replace(microsecond=0)
+        A rejected compact body is retried once as full v6.0. If v6.0 goes through:
+          - a rejected delta means the receiver lost our base → next compact payload is self-contained
+          - a rejected self-contained payload means the receiver does not speak v7.0
+            → 'auto' falls back to v6.0 for the rest of the process
+        """
+        if self._compact is None:
+            return await transport.send(payload)
 
-        epoch = datetime(1970, 1, 1, tzinfo=tz)
-        elapsed = int((ts_tz - epoch).total_seconds())
-        aligned_elapsed = (elapsed // interval) * interval
-        return epoch + timedelta(seconds=aligned_elapsed)
+        encoded = self._compact.encode(payload)
+        ok, status, text = await transport.send(encoded)
+        if ok:
+            self._compact.ack(payload)
+            return ok, status, text
+        if status >= 500:
+            return ok, status, text  # server trouble, not an encoding problem
+
+        ok, status, text = await transport.send(payload)
+        if not ok:
+            return ok, status, text
+
+        if encoded["Base"] is None and self.payload_encoding == "auto":
+            self._compact = None
+            logger.warning("[POST] Endpoint rejected compact v7.0 payload, falling back to v6.0 uploads")
+        else:
+            self._compact.reset()
+            logger.warning("[POST] Endpoint rejected compact payload, resending dictionary and full rows next time")
+        return ok, status, text
 
     @staticmethod
     def _resolve_gateway_id(config_gateway_id: str) -> str:
@@ -539,6 +669,15 @@ class LegacySenderAdapter:
             return [LegacySenderAdapter._normalize_missing_deep(x) for x in obj]
         return LegacySenderAdapter._normalize_missing_value(obj)
 
+    def _make_transport(self, client: httpx.AsyncClient) -> ResendTransport:
+        return ResendTransport(
+            self.ima_url,
+            client,
+            self._is_ok,
+            compression=self.sender_config_model.upload_compression,
+            gzip_min_bytes=self.sender_config_model.upload_gzip_min_bytes,
+        )
+
     @staticmethod
     def _is_ok(resp: httpx.Response) -> bool:
         return (resp is not None) and (resp.status_code == 200) and ("00000" in (resp.text or ""))
@@ -622,6 +761,7 @@ class LegacySenderAdapter:
         Scheduled send at a fixed label timestamp.
 
         All legacy items from this tick are persisted as ONE payload file.
+        Device items come from prebuilt frames, so the tick only stamps timestamps and sends.
         """
         latest_by_device = await self._collect_latest_by_device_unlocked()
 
@@ -641,25 +781,8 @@ class LegacySenderAdapter:
             if label_time <= last_label:
                 continue
 
-            snap = self._apply_pt_ct_ratios(snap)
-
-            converted = convert_snapshot_to_legacy_payload(
-                gateway_id=self.gateway_id,
-                snapshot=snap,
-                device_manager=self.device_manager,
-            )
-
+            converted = self._stamp_frame(self._frame_for(dev_id, snap), snap_ts, label_time, age_sec, is_stale)
             if converted:
-                age_ms = int(age_sec * 1000)
-                for it in converted:
-                    it.setdefault("Data", {})
-                    it["Data"]["sampling_datetime"] = snap_ts.isoformat()
-                    it["Data"]["report_ts"] = label_time.isoformat()
-                    it["Data"]["sample_age_ms"] = age_ms
-                    if is_stale:
-                        it["Data"]["is_stale"] = 1
-                        it["Data"]["stale_age_ms"] = age_ms
-
                 all_items.extend(converted)
                 sent_candidates_ts[dev_id] = snap_ts
 
@@ -667,19 +790,23 @@ class LegacySenderAdapter:
         all_items.append(gw_item)
 
         payload = self._store.wrap_items_as_payload(all_items, label_time)
-        outbox_file = await self._store.persist_payload(payload)
 
-        logger.debug(f"Scheduled send: {len(all_items)} items")
+        # Save first, upload later: the payload must be in the outbox before the POST can lose it
+        outbox_file = await self._store.persist_payload(payload)
+        logger.debug(
+            f"Scheduled send: {len(all_items)} items, POST at "
+            f"+{(datetime.now(TIMEZONE_INFO) - label_time).total_seconds():.2f}s after label"
+        )
 
         ok = await self._post_with_retry(payload)
         if ok:
-            self._store.delete(outbox_file)
+            await asyncio.to_thread(self._store.delete_many, [outbox_file])
 
             if sent_candidates_ts:
                 for dev_id in sent_candidates_ts:
                     self.__last_label_ts_by_device[dev_id] = label_time
                 self.__last_sent_ts_by_device.update(sent_candidates_ts)
-                await self._prune_buckets()
+                await self._prune_sent_slots()
 
     async def _make_gw_heartbeat(self, report_datetime: datetime) -> dict:
         cpu_temp_task = asyncio.create_task(self._system_info.get_cpu_temperature())
@@ -739,13 +866,16 @@ class LegacySenderAdapter:
                         continue
 
                 try:
-                    processed, success = await self._resend_process_batch(self.fail_resend_batch)
+                    processed, success = await self._resend_process_batch(self._resend_window.size)
+                    next_batch = self._resend_window.end_round()
 
                     if processed == 0:
                         logger.debug("[ResendWorker] no files to process")
                         continue
 
-                    logger.info(f"[ResendWorker] processed {processed} files, succeeded {success}")
+                    logger.info(
+                        f"[ResendWorker] processed {processed} files, succeeded {success}, next batch {next_batch}"
+                    )
 
                     if success > 0:
                         self._resend_wakeup.set()
@@ -783,8 +913,8 @@ class LegacySenderAdapter:
             return None
 
     async def _resend_process_batch(self, batch: int) -> tuple[int, int]:
-        files: list[str] = await asyncio.to_thread(self._store.pick_batch, batch, min_age_sec=0.0)
-        if not files:
+        entries: list[OutboxEntry] = await asyncio.to_thread(self._store.pick_entries, batch, min_age_sec=0.0)
+        if not entries:
             return 0, 0
 
         temp_client: httpx.AsyncClient | None = None
@@ -792,19 +922,17 @@ class LegacySenderAdapter:
         if transport is None:
             timeout = httpx.Timeout(connect=5.0, read=10.0, write=5.0, pool=5.0)
             temp_client = httpx.AsyncClient(timeout=timeout)
-            transport = ResendTransport(self.ima_url, temp_client, self._is_ok)
+            transport = self._make_transport(temp_client)
 
         processed = 0
-        deleted_total = 0
 
-        full_packets: list[tuple[str, dict]] = []
+        full_packets: list[tuple[OutboxEntry, dict, int]] = []
         item_groups: dict[str, dict] = {}
 
-        for file_path in files:
-            file_name = os.path.basename(file_path)
+        for entry in entries:
+            file_path, file_name = entry.key, entry.name
             try:
-                async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                    raw = await f.read()
+                raw = await self._store.read_entry(file_path)
             except FileNotFoundError:
                 logger.info(f"[ResendWorker] skipped, already gone: {file_name}")
                 processed += 1
@@ -824,11 +952,12 @@ class LegacySenderAdapter:
                 json_obj = None
 
             if isinstance(json_obj, dict) and "FUNC" in json_obj:
-                full_packets.append((file_path, json_obj))
+                full_packets.append((entry, json_obj, len(raw)))
             elif isinstance(json_obj, dict) and "DeviceID" in json_obj:
                 report_timestamp: str = (json_obj.get("Data") or {}).get("report_ts")
                 ts_dt = (
                     self._parse_iso_timestamp(report_timestamp)
+                    or entry.label_ts
                     or self._ts_from_filename(file_name)
                     or datetime.now(TIMEZONE_INFO)
                 )
@@ -837,7 +966,7 @@ class LegacySenderAdapter:
                 item_group["items"].append(json_obj)
                 item_group["paths"].append(file_path)
             else:
-                ts_dt: datetime = self._ts_from_filename(file_name) or datetime.now(TIMEZONE_INFO)
+                ts_dt: datetime = entry.label_ts or self._ts_from_filename(file_name) or datetime.now(TIMEZONE_INFO)
                 ts_key: str = f"RAW-{ts_dt.strftime('%Y%m%d%H%M%S')}#{file_name}"
                 item_groups.setdefault(ts_key, {"ts": ts_dt, "items": [], "paths": []})
                 item_groups[ts_key]["items"].append(json_obj if isinstance(json_obj, dict) else {"_raw": raw})
@@ -845,28 +974,7 @@ class LegacySenderAdapter:
 
             processed += 1
 
-        for file_path, packet in full_packets:
-            file_name = os.path.basename(file_path)
-            try:
-                ok, status, text = await transport.send(packet)
-                logger.info(f"[ResendWorker] (packet) {file_name}, resp: {status} {text[:120]!r}")
-                if ok:
-                    self._store.delete(file_path)
-                    self.last_post_ok_at = datetime.now(TIMEZONE_INFO)
-                    deleted_total += 1
-                    logger.info(f"[ResendWorker] success, deleted: {file_name}")
-                else:
-                    _, failed = self._store.retry_or_fail(file_path, max_retry=self.__max_retry)
-                    if failed:
-                        logger.warning(f"[ResendWorker] marked .fail: {file_name}")
-            except asyncio.CancelledError:
-                logger.info("[ResendWorker] cancelled during packet send")
-                raise
-            except Exception as e:
-                logger.warning(f"[ResendWorker] failed (packet) for {file_name}: {e}")
-                _, failed = self._store.retry_or_fail(file_path, max_retry=self.__max_retry)
-                if failed:
-                    logger.warning(f"[ResendWorker] marked .fail: {file_name}")
+        uploads: list[tuple[str, dict, list[str]]] = self._merge_resend_packets(full_packets)
 
         for ts_key, item_group in sorted(item_groups.items(), key=lambda kv: kv[1]["ts"]):
             ts_dt = item_group["ts"]
@@ -880,41 +988,119 @@ class LegacySenderAdapter:
 
             payload = self._store.wrap_items_as_payload(items, ts_dt)
             logger.debug(f"[ResendWorker] Sending group ts={ts_key} with {len(items)} items")
-            file_paths = item_group["paths"]
+            uploads.append((f"group ts={ts_key}", payload, item_group["paths"]))
 
-            try:
-                ok, status, text = await transport.send(payload)
-                logger.info(f"[ResendWorker] (group ts={ts_key}) resp: {status} {text[:120]!r}")
-                if ok:
-                    for p in file_paths:
-                        self._store.delete(p)
-                        deleted_total += 1
-                    self.last_post_ok_at = datetime.now(TIMEZONE_INFO)
-                    logger.info(f"[ResendWorker] success, deleted group of {len(file_paths)} file(s) for ts={ts_key}")
-                else:
-                    for p in file_paths:
-                        _, failed = self._store.retry_or_fail(p, max_retry=self.__max_retry)
-                        if failed:
-                            logger.warning(f"[ResendWorker] marked .fail: {os.path.basename(p)}")
-            except asyncio.CancelledError:
-                logger.info("[ResendWorker] cancelled during group send")
-                raise
-            except Exception as e:
-                logger.warning(f"[ResendWorker] failed (group ts={ts_key}): {e}")
-                for p in file_paths:
-                    _, failed = self._store.retry_or_fail(p, max_retry=self.__max_retry)
-                    if failed:
-                        logger.warning(f"[ResendWorker] marked .fail: {os.path.basename(p)}")
+        semaphore = asyncio.Semaphore(self.resend_concurrency)
 
-        if temp_client is not None:
-            try:
-                await temp_client.aclose()
-            except Exception:
-                pass
+        async def bounded_upload(label: str, payload: dict, keys: list[str]) -> int:
+            async with semaphore:
+                return await self._resend_upload(transport, label, payload, keys)
+
+        try:
+            deleted_total = sum(await asyncio.gather(*(bounded_upload(*upload) for upload in uploads)))
+        finally:
+            if temp_client is not None:
+                try:
+                    await temp_client.aclose()
+                except Exception:
+                    pass
 
         await asyncio.to_thread(self._store.enforce_budget)
         return processed, deleted_total
 
+    async def _resend_upload(self, transport: ResendTransport, label: str, payload: dict, keys: list[str]) -> int:
+        """
+        Upload one backlog payload (covering `keys`) and ack or retry its entries.
+
+        Waits for in-flight live sends first and reports outcome/latency to the AIMD window.
+        Returns the number of deleted entries.
+        """
+        await self._live_idle.wait()
+
+        started = time.monotonic()
+        try:
+            ok, status, text = await transport.send(payload)
+        except asyncio.CancelledError:
+            logger.info(f"[ResendWorker] cancelled during send ({label})")
+            raise
+        except Exception as e:
+            self._resend_window.observe(False, time.monotonic() - started)
+            logger.warning(f"[ResendWorker] failed ({label}): {e}")
+            await self._resend_retry_or_fail(keys)
+            return 0
+
+        self._resend_window.observe(ok, time.monotonic() - started)
+        logger.info(f"[ResendWorker] ({label}) resp: {status} {text[:120]!r}")
+        if not ok:
+            await self._resend_retry_or_fail(keys)
+            return 0
+
+        await asyncio.to_thread(self._store.delete_many, keys)
+        self.last_post_ok_at = datetime.now(TIMEZONE_INFO)
+        logger.info(f"[ResendWorker] success, deleted {len(keys)} entry(ies) ({label})")
+        return len(keys)
+
+    async def _resend_retry_or_fail(self, keys: list[str]) -> None:
+        results = await asyncio.to_thread(self._store.retry_or_fail_many, keys, max_retry=self.__max_retry)
+        for key, (_, failed) in zip(keys, results):
+            if failed:
+                logger.warning(f"[ResendWorker] marked .fail: {key}")
+
+    def _merge_resend_packets(self, packets: list[tuple[OutboxEntry, dict, int]]) -> list[tuple[str, dict, list[str]]]:
+        """
+        Merge consecutive stored PushIMAData packets into uploads of at most resend_merge_max_bytes.
+
+        A merged upload keeps the oldest packet envelope; every item keeps (or is given)
+        its own Data.report_ts so per-packet timestamps are not lost. Only the newest
+        gateway heartbeat is kept, as every packet carries one.
+        """
+        if self.resend_merge_max_bytes <= 0:
+            return [(f"packet {entry.name}", packet, [entry.key]) for entry, packet, _ in packets]
+
+        uploads: list[tuple[str, dict, list[str]]] = []
+        group: list[tuple[OutboxEntry, dict]] = []
+        group_bytes = 0
+
+        def flush() -> None:
+            if len(group) == 1:
+                entry, packet = group[0]
+                uploads.append((f"packet {entry.name}", packet, [entry.key]))
+            elif group:
+                label = f"{len(group)} packets {group[0][0].name}..{group[-1][0].name}"
+                merged = self._merge_packet_payloads([packet for _, packet in group])
+                uploads.append((label, merged, [entry.key for entry, _ in group]))
+
+        for entry, packet, size in packets:
+            if group:
+                same_envelope = all(packet.get(k) == group[0][1].get(k) for k in ("FUNC", "version", "GatewayID"))
+                if not same_envelope or group_bytes + size > self.resend_merge_max_bytes:
+                    flush()
+                    group, group_bytes = [], 0
+            group.append((entry, packet))
+            group_bytes += size
+        flush()
+        return uploads
+
+    @staticmethod
+    def _merge_packet_payloads(packets: list[dict]) -> dict:
+        items: list[dict] = []
+        for packet in packets:
+            try:
+                ts = datetime.strptime(str(packet.get("Timestamp")), "%Y%m%d%H%M%S").replace(tzinfo=TIMEZONE_INFO)
+                packet_report_ts = ts.isoformat()
+            except ValueError:
+                packet_report_ts = None
+            for item in packet.get("Data") or []:
+                if packet_report_ts is not None and isinstance(item.get("Data"), dict):
+                    item["Data"].setdefault("report_ts", packet_report_ts)
+                items.append(item)
+
+        heartbeats = [i for i, item in enumerate(items) if str(item.get("DeviceID", "")).endswith(EquipmentType.GW)]
+        if len(heartbeats) > 1:
+            stale = set(heartbeats[:-1])
+            items = [item for i, item in enumerate(items) if i not in stale]
+        return {**packets[0], "Data": items}
+
     async def _delayed_resend_start(self):
         """
         Delayed start for Resend Worker, aligned to the configured anchor offset.
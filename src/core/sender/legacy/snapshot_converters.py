@@ -2,7 +2,7 @@
 
 import logging
 import re
-from typing import Any
+from typing import Any, Callable
 
 from core.model.device_constant import DEFAULT_MISSING_VALUE, POWER_METER_FIELDS
 from core.model.enum.equipment_enum import EquipmentType
@@ -12,6 +12,24 @@ from core.util.register_formula import combine_48bit_3word_be
 from core.util.value_util import get_float_or_none, get_int_or_none, to_float, to_int
 
 _COMMON_FIELDS = [k for k, v in POWER_METER_FIELDS.items() if v["common"]]
+_ROUNDING = [(k, v["round"]) for k, v in POWER_METER_FIELDS.items()]
+_DI_PIN_PATTERN = re.compile(r"^DIn(\d+)$")
+_INVERTER_FIELD_MAP = {
+    "KWH": ("kwh", float),
+    "VOLTAGE": ("voltage", float),
+    "CURRENT": ("current", float),
+    "KW": ("kw", float),
+    "HZ": ("hz", float),
+    "ERROR": ("error", int),
+    "ALERT": ("alert", int),
+    # "INVSTATUS" handled in a dedicated section (with derived fields)
+    "RW_HZ": ("set_hz", int),
+    "RW_ON_OFF": ("on_off", int),
+}
+_AI_PIN_SUFFIX_MAP = {"Temp": EquipmentType.ST, "Pressure": EquipmentType.SP}
+
+# A compiled converter: snapshot values → legacy records, for one fixed device and key set
+LegacyConversionPlan = Callable[[dict[str, Any]], list[dict]]
 
 logger = logging.getLogger("SnapshotConverter")
 
@@ -243,17 +261,7 @@ def convert_di_module_snapshot(gateway_id: str, slave_id: str, snapshot: dict[st
     bypass_value: int = _get_bypass_value(snapshot, default=0)
 
     # Dynamically match all DIn pins (DIn01, DIn02, ..., DIn99)
-    di_pattern = re.compile(r"^DIn(\d+)$")
-    di_pins = []
-
-    for key in snapshot.keys():
-        match = di_pattern.match(key)
-        if match:
-            pin_number = int(match.group(1))
-            di_pins.append((pin_number, key))
-
-    # Sort by pin number to ensure consistent order
-    di_pins.sort(key=lambda x: x[0])
+    di_pins = _find_di_pins(snapshot.keys())
 
     if not di_pins:
         logger.debug(f"[LegacyFormat] No DIn pins found in snapshot for {slave_id}")
@@ -299,6 +307,67 @@ def convert_di_module_snapshot(gateway_id: str, slave_id: str, snapshot: dict[st
     return result
 
 
+def _find_di_pins(keys) -> list[tuple[int, str]]:
+    """Return (pin_number, key) for every DInXX key, sorted by pin number."""
+    di_pins = []
+    for key in keys:
+        match = _DI_PIN_PATTERN.match(key)
+        if match:
+            di_pins.append((int(match.group(1)), key))
+    di_pins.sort(key=lambda x: x[0])
+    return di_pins
+
+
+def compile_di_module_converter(
+    gateway_id: str, slave_id: str, model: str | None, keys: tuple[str, ...], resolve_pin_type_map
+) -> LegacyConversionPlan:
+    """
+    Precompute the DI → SR record layout (pin order, DeviceIDs, DOut pin names) for a fixed key set.
+
+    Produces the same records as convert_di_module_snapshot().
+    """
+    policy: DeviceIdPolicy = get_policy()
+    key_set = set(keys)
+    pins: list[tuple[str, str, str | None]] = []
+    for idx, (pin_num, pin_name) in enumerate(_find_di_pins(keys)):
+        device_id = policy.build_device_id(
+            gateway_id=gateway_id, slave_id=slave_id, idx=idx, eq_suffix=EquipmentType.SR
+        )
+        do_pin_name = f"DOut{pin_num:02d}" if model == "IMA_C" else None
+        pins.append((pin_name, device_id, do_pin_name if do_pin_name in key_set else None))
+
+    def convert(snapshot: dict[str, Any]) -> list[dict]:
+        if not pins:
+            return []
+        bypass_value: int = _get_bypass_value(snapshot, default=0)
+        result = []
+        for pin_name, device_id, do_pin_name in pins:
+            try:
+                pin_value = int(float(snapshot[pin_name]))
+            except Exception as e:
+                logger.warning(
+                    f"[LegacyFormat] Invalid value for {pin_name}: "
+                    f"{snapshot.get(pin_name)}, error: {e} - using DEFAULT_MISSING_VALUE"
+                )
+                pin_value = DEFAULT_MISSING_VALUE
+
+            mc_status0 = 0
+            if do_pin_name is not None:
+                try:
+                    mc_status0 = int(float(snapshot[do_pin_name]))
+                except Exception as e:
+                    logger.warning(
+                        f"[LegacyFormat] Invalid DOut value for {do_pin_name}: "
+                        f"{snapshot.get(do_pin_name)}, error: {e} - degrading to 0"
+                    )
+
+            data = {"Relay0": pin_value, "Relay1": 0, "MCStatus0": mc_status0, "MCStatus1": 0, "ByPass": bypass_value}
+            result.append({"DeviceID": device_id, "Data": data})
+        return result
+
+    return convert
+
+
 def convert_inverter_snapshot(gateway_id: str, slave_id: str, snapshot: dict[str, str]) -> list[dict]:
     """
     Convert inverter snapshot data into the Legacy format.
@@ -306,18 +375,7 @@ def convert_inverter_snapshot(gateway_id: str, slave_id: str, snapshot: dict[str
     - INVSTATUS: keep raw value, expose debug-friendly fields (hex/bit flags),
       and compute legacy-compatible status code.
     """
-    field_map = {
-        "KWH": ("kwh", float),
-        "VOLTAGE": ("voltage", float),
-        "CURRENT": ("current", float),
-        "KW": ("kw", float),
-        "HZ": ("hz", float),
-        "ERROR": ("error", int),
-        "ALERT": ("alert", int),
-        # "INVSTATUS" handled in a dedicated section (with derived fields)
-        "RW_HZ": ("set_hz", int),
-        "RW_ON_OFF": ("on_off", int),
-    }
+    field_map = _INVERTER_FIELD_MAP
 
     policy: DeviceIdPolicy = get_policy()
     device_id = policy.build_device_id(gateway_id=gateway_id, slave_id=slave_id, idx=0, eq_suffix=EquipmentType.CI)
@@ -334,6 +392,12 @@ def convert_inverter_snapshot(gateway_id: str, slave_id: str, snapshot: dict[str
         except Exception:
             pass
 
+    _apply_invstatus_fields(data, snapshot)
+
+    return [{"DeviceID": device_id, "Data": data}] if data else []
+
+
+def _apply_invstatus_fields(data: dict, snapshot: dict[str, Any]) -> None:
     # ---- INVSTATUS section: raw + derived fields + compatibility mapping ----
     invstatus_raw: int | None = parse_int_or_none(snapshot.get("INVSTATUS"))
 
@@ -350,7 +414,34 @@ def convert_inverter_snapshot(gateway_id: str, slave_id: str, snapshot: dict[str
     if invstatus_code is not None:
         data["invstatus"] = invstatus_code
 
-    return [{"DeviceID": device_id, "Data": data}] if data else []
+
+def compile_inverter_converter(
+    gateway_id: str, slave_id: str, model: str | None, keys: tuple[str, ...], resolve_pin_type_map
+) -> LegacyConversionPlan:
+    """Precompute DeviceID and the present numeric fields; same output as convert_inverter_snapshot()."""
+    policy: DeviceIdPolicy = get_policy()
+    device_id = policy.build_device_id(gateway_id=gateway_id, slave_id=slave_id, idx=0, eq_suffix=EquipmentType.CI)
+    key_set = set(keys)
+    fields = [
+        (raw_key, target_key, caster)
+        for raw_key, (target_key, caster) in _INVERTER_FIELD_MAP.items()
+        if raw_key in key_set
+    ]
+
+    def convert(snapshot: dict[str, Any]) -> list[dict]:
+        data: dict = {}
+        for raw_key, target_key, caster in fields:
+            raw_val = snapshot.get(raw_key)
+            if raw_val is None:
+                continue
+            try:
+                data[target_key] = caster(float(raw_val))
+            except Exception:
+                pass
+        _apply_invstatus_fields(data, snapshot)
+        return [{"DeviceID": device_id, "Data": data}] if data else []
+
+    return convert
 
 
 def convert_ai_module_snapshot(
@@ -359,7 +450,7 @@ def convert_ai_module_snapshot(
     snapshot: dict[str, str],
     pin_type_map: dict[str, str],
 ) -> list[dict]:
-    pin_suffix_map = {"Temp": EquipmentType.ST, "Pressure": EquipmentType.SP}
+    pin_suffix_map = _AI_PIN_SUFFIX_MAP
     result = []
 
     for key, val in snapshot.items():
@@ -381,6 +472,45 @@ def convert_ai_module_snapshot(
     return result
 
 
+def compile_ai_module_converter(
+    gateway_id: str, slave_id: str, model: str | None, keys: tuple[str, ...], resolve_pin_type_map
+) -> LegacyConversionPlan | None:
+    """
+    Precompute (pin, sensor type, DeviceID) for every typed AI pin; same output as convert_ai_module_snapshot().
+
+    Returns None when the device's pin_type_map cannot be resolved (nothing is compiled).
+    """
+    pin_type_map: dict[str, str] | None = resolve_pin_type_map()
+    if pin_type_map is None:
+        return None
+
+    policy: DeviceIdPolicy = get_policy()
+    pins: list[tuple[str, str, str]] = []
+    for key in keys:
+        sensor_type = pin_type_map.get(key)
+        if not sensor_type:
+            continue
+        device_id = policy.build_device_id(
+            gateway_id=gateway_id,
+            slave_id=slave_id,
+            idx=_infer_idx_from_key(key),
+            eq_suffix=_AI_PIN_SUFFIX_MAP.get(sensor_type, ""),
+        )
+        pins.append((key, sensor_type, device_id))
+
+    def convert(snapshot: dict[str, Any]) -> list[dict]:
+        result = []
+        for key, sensor_type, device_id in pins:
+            try:
+                value = float(snapshot[key])
+            except Exception:
+                continue
+            result.append({"DeviceID": device_id, "Data": {sensor_type: value}})
+        return result
+
+    return convert
+
+
 def convert_flow_meter(gateway_id: str, slave_id: int, values: dict) -> list[dict]:
     """
     Convert flow meter snapshot to legacy format.
@@ -468,16 +598,7 @@ def convert_power_meter_snapshot(
     # --------------------------------------------------
     # Rounding (skip None and -1)
     # --------------------------------------------------
-    for field, config in POWER_METER_FIELDS.items():
-        value = mapped.get(field)
-
-        if value is None:
-            continue
-
-        if value == DEFAULT_MISSING_VALUE:
-            continue  # -1 不做 rounding
-
-        mapped[field] = round(float(value), config["round"])
+    _round_power_meter_fields(mapped)
 
     # --------------------------------------------------
     # Device ID
@@ -493,6 +614,56 @@ def convert_power_meter_snapshot(
     return [{"DeviceID": device_id, "Data": mapped}]
 
 
+def _round_power_meter_fields(mapped: dict[str, float | None]) -> None:
+    for field, digits in _ROUNDING:
+        value = mapped.get(field)
+
+        if value is None:
+            continue
+
+        if value == DEFAULT_MISSING_VALUE:
+            continue  # -1 不做 rounding
+
+        mapped[field] = round(float(value), digits)
+
+
+def compile_power_meter_converter(
+    gateway_id: str, slave_id: str | int, model: str | None, keys: tuple[str, ...], resolve_pin_type_map
+) -> LegacyConversionPlan:
+    """
+    Precompute DeviceID, present common fields and the energy pattern (direct / SUM / 3-word).
+
+    Produces the same record as convert_power_meter_snapshot().
+    """
+    policy = get_policy()
+    device_id = policy.build_device_id(gateway_id=gateway_id, slave_id=slave_id, idx=0, eq_suffix=EquipmentType.SE)
+    key_set = set(keys)
+    common = [(field, field in key_set) for field in _COMMON_FIELDS]
+
+    def energy_source(energy_key: str) -> str | None:
+        if energy_key in key_set:
+            return energy_key
+        if f"{energy_key}_SUM" in key_set:
+            return f"{energy_key}_SUM"
+        return None
+
+    # Direct/SUM energies read one key; the rare 3-word layout keeps the generic resolver
+    energies = [(energy_key, energy_source(energy_key)) for energy_key in ("Kwh", "Kvarh")]
+
+    def convert(snapshot: dict[str, Any]) -> list[dict]:
+        mapped: dict[str, float | None] = {
+            field: (to_float(snapshot.get(field)) if present else None) for field, present in common
+        }
+        for energy_key, source in energies:
+            mapped[energy_key] = (
+                to_float(snapshot.get(source)) if source is not None else _resolve_energy(snapshot, energy_key)
+            )
+        _round_power_meter_fields(mapped)
+        return [{"DeviceID": device_id, "Data": mapped}]
+
+    return convert
+
+
 def convert_dissolved_oxygen_snapshot(gateway_id: str, slave_id: str | int, values: dict[str, str]) -> list[dict]:
     """
     Convert dissolved oxygen sensor snapshot to legacy format.
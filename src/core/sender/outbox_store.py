@@ -1,6 +1,7 @@
 import json
 import os
 import re
+from dataclasses import dataclass
 from datetime import datetime
 from typing import List, Tuple
 from zoneinfo import ZoneInfo
@@ -10,6 +11,15 @@ import aiofiles
 from core.sender.legacy.resend_file_util import extract_retry_count, increment_retry_name, mark_as_fail
 
 
+@dataclass(frozen=True, slots=True)
+class OutboxEntry:
+    """One persisted payload as seen by the resend worker."""
+
+    key: str  # backend-specific handle passed back to read_entry/delete/retry_or_fail
+    name: str  # human-readable name for logs
+    label_ts: datetime | None = None
+
+
 class OutboxStore:
     """
     Encapsulates access and management for the outbox:
@@ -134,6 +144,20 @@ class OutboxStore:
         selected = (retry_files + fresh_files)[: max(0, int(limit))]
         return [os.path.join(self.dir, fn) for fn in selected]
 
+    def pick_entries(self, limit: int, *, min_age_sec: float = 0.0) -> List[OutboxEntry]:
+        """Same selection as pick_batch(), wrapped as OutboxEntry (key = absolute path)."""
+        return [
+            OutboxEntry(key=fp, name=os.path.basename(fp)) for fp in self.pick_batch(limit, min_age_sec=min_age_sec)
+        ]
+
+    async def read_entry(self, key: str) -> str:
+        """Return the raw JSON text of an entry. Raises FileNotFoundError if it is gone."""
+        async with aiofiles.open(key, "r", encoding="utf-8") as f:
+            return await f.read()
+
+    def close(self) -> None:
+        """Release backend resources (nothing to do for the file backend)."""
+
     def delete(self, path: str) -> None:
         try:
             os.remove(path)
@@ -176,6 +200,15 @@ class OutboxStore:
             return None, False
         return new_path, False
 
+    def delete_many(self, keys: List[str]) -> None:
+        """Ack several entries at once (blocking; call via asyncio.to_thread)."""
+        for key in keys:
+            self.delete(key)
+
+    def retry_or_fail_many(self, keys: List[str], *, max_retry: int) -> List[Tuple[str | None, bool]]:
+        """retry_or_fail() for several entries at once (blocking; call via asyncio.to_thread)."""
+        return [self.retry_or_fail(key, max_retry=max_retry) for key in keys]
+
     # ---------- storage budget ----------
 
     def enforce_budget(self) -> None:
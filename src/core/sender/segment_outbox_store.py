@@ -0,0 +1,487 @@
+"""
+Segment-log outbox.
+
+Payloads are appended to size-bounded segment files under <resend_dir>/segments and
+tracked in a small SQLite index (<resend_dir>/outbox_index.db) holding segment, offset,
+length, retry count and label timestamp per entry:
+
+  - enqueue: one append + one INSERT
+  - pick:    one indexed LIMIT query (retried entries first, then fresh, both FIFO)
+  - ack:     DELETEs batched in one transaction; a segment file is unlinked once it holds no live entries
+  - budget:  sizes are tracked per segment; failed entries are dropped before pending ones,
+             oldest first, and emptied segments are unlinked
+
+With compression="gzip" each record is gzip-compressed on append. Records are
+self-describing (gzip magic), so reads transparently handle a mix of plain and
+compressed entries when the setting changes between runs.
+
+Legacy one-file-per-payload outboxes (resend_*.json / *.retryN.json / *.fail) are
+imported once by import_legacy_files().
+"""
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from typing import List, Literal, Tuple
+from zoneinfo import ZoneInfo
+
+from core.sender.legacy.resend_file_util import extract_retry_count
+from core.sender.outbox_store import OutboxEntry, OutboxStore
+
+logger = logging.getLogger("SegmentOutboxStore")
+
+LEGACY_FILE_PATTERN = re.compile(r"^resend_.*(\.retry\d+\.json|\.json|\.fail)$")
+LABEL_TS_PATTERN = re.compile(r"resend_(\d{14})_")
+LABEL_TS_FORMAT = "%Y%m%d%H%M%S"
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+class SegmentOutboxStore(OutboxStore):
+    """
+    OutboxStore backend made of append-only segment files plus a SQLite index.
+
+    Keys handed out by pick_batch()/pick_entries() are entry ids (as str). All index
+    access goes through one connection guarded by a lock, so methods may be called
+    from the event loop or via asyncio.to_thread.
+    """
+
+    INDEX_FILENAME = "outbox_index.db"
+    SEGMENT_DIRNAME = "segments"
+    MIGRATION_CHUNK = 500
+
+    def __init__(
+        self,
+        dirpath: str,
+        tz: ZoneInfo,
+        *,
+        gateway_id: str,
+        resend_quota_mb: int,
+        fs_free_min_mb: int,
+        protect_recent_sec: float,
+        cleanup_batch: int,
+        cleanup_enabled: bool,
+        segment_max_bytes: int = 4 * 1024 * 1024,
+        compression: Literal["none", "gzip"] = "none",
+    ):
+        super().__init__(
+            dirpath,
+            tz,
+            gateway_id=gateway_id,
+            resend_quota_mb=resend_quota_mb,
+            fs_free_min_mb=fs_free_min_mb,
+            protect_recent_sec=protect_recent_sec,
+            cleanup_batch=cleanup_batch,
+            cleanup_enabled=cleanup_enabled,
+        )
+        self.segment_dir = os.path.join(self.dir, self.SEGMENT_DIRNAME)
+        self.segment_max_bytes = int(segment_max_bytes)
+        self.compression = compression
+
+        # The index is opened on first use so constructing a sender does not touch disk
+        self._lock = threading.RLock()
+        self._db: sqlite3.Connection | None = None
+
+        self._active_segment_id: int | None = None
+        self._active_segment_size = 0
+
+    # ---------- persist ----------
+
+    async def persist_item(self, item: dict) -> str:
+        """Persist a SINGLE Data item and return its entry key."""
+        label = (item.get("Data") or {}).get("report_ts")
+        label_ts = self._label_from_iso(label) if isinstance(label, str) else None
+        data = json.dumps(item, ensure_ascii=False).encode("utf-8")
+        return await asyncio.to_thread(self._append, data, label_ts)
+
+    async def persist_payload(self, payload: dict) -> str:
+        """Persist a FULL PushIMAData payload and return its entry key."""
+        data = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        return await asyncio.to_thread(self._append, data, payload.get("Timestamp"))
+
+    # ---------- pick / read / mutate ----------
+
+    def pick_batch(self, limit: int, *, min_age_sec: float = 0.0) -> List[str]:
+        """Pick up to `limit` entry keys. Retried first, then fresh; both FIFO."""
+        return [entry.key for entry in self.pick_entries(limit, min_age_sec=min_age_sec)]
+
+    def pick_entries(self, limit: int, *, min_age_sec: float = 0.0) -> List[OutboxEntry]:
+        limit = max(0, int(limit))
+        if limit == 0:
+            return []
+
+        cutoff = datetime.now(self.tz).timestamp() - float(min_age_sec)
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT id, label_ts FROM entries
+                WHERE state = 'pending' AND created_at <= ?
+                ORDER BY (retry_count = 0), id
+                LIMIT ?
+                """,
+                (cutoff, limit),
+            ).fetchall()
+
+        return [
+            OutboxEntry(key=str(entry_id), name=f"entry#{entry_id}", label_ts=self._parse_label(label))
+            for entry_id, label in rows
+        ]
+
+    async def read_entry(self, key: str) -> str:
+        """Return the raw JSON text of an entry. Raises FileNotFoundError if it is gone."""
+        return await asyncio.to_thread(self._read_sync, key)
+
+    def delete(self, key: str) -> None:
+        self.delete_many([key])
+
+    def delete_many(self, keys: List[str]) -> None:
+        """Ack several entries in one transaction, then unlink segments left without entries."""
+        ids = [(int(key),) for key in keys]
+        if not ids:
+            return
+        with self._lock:
+            segment_ids: set[int] = set()
+            for (entry_id,) in ids:
+                row = self._conn.execute("SELECT segment_id FROM entries WHERE id = ?", (entry_id,)).fetchone()
+                if row is not None:
+                    segment_ids.add(int(row[0]))
+            self._conn.executemany("DELETE FROM entries WHERE id = ?", ids)
+            for segment_id in segment_ids:
+                self._drop_segment_if_empty(segment_id, commit=False)
+            self._conn.commit()
+
+    def retry_or_fail(self, key: str, *, max_retry: int) -> Tuple[str | None, bool]:
+        """
+        Increment retry or mark as failed (same rules as the file backend):
+          - max_retry < 0 → always increment retry (unlimited retries)
+          - otherwise, if retry count reaches the limit → mark as failed
+        return: (key_if_still_pending, failed_marked_bool)
+        """
+        return self.retry_or_fail_many([key], max_retry=max_retry)[0]
+
+    def retry_or_fail_many(self, keys: List[str], *, max_retry: int) -> List[Tuple[str | None, bool]]:
+        """retry_or_fail() for several entries in one transaction; results are in `keys` order."""
+        results: List[Tuple[str | None, bool]] = []
+        with self._lock:
+            for key in keys:
+                row = self._conn.execute(
+                    "SELECT retry_count FROM entries WHERE id = ? AND state = 'pending'", (int(key),)
+                ).fetchone()
+                if row is None:
+                    results.append((None, False))
+                elif max_retry >= 0 and int(row[0]) + 1 >= max_retry:
+                    self._conn.execute("UPDATE entries SET state = 'failed' WHERE id = ?", (int(key),))
+                    results.append((None, True))
+                else:
+                    self._conn.execute("UPDATE entries SET retry_count = retry_count + 1 WHERE id = ?", (int(key),))
+                    results.append((key, False))
+            self._conn.commit()
+        return results
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return int(self._conn.execute("SELECT COUNT(*) FROM entries WHERE state = 'pending'").fetchone()[0])
+
+    def close(self) -> None:
+        with self._lock:
+            if self._db is None:
+                return
+            try:
+                self._db.close()
+            except Exception:
+                pass
+            self._db = None
+
+    # ---------- storage budget ----------
+
+    def enforce_budget(self) -> None:
+        """
+        Drop up to cleanup_batch entries when over budget: failed entries first, then pending,
+        both oldest first. Sealed segments left without entries are unlinked to free the space.
+        """
+        if not self.cleanup_enabled:
+            return
+        try:
+            with self._lock:
+                total_bytes = int(self._conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM segments").fetchone()[0])
+                if not (
+                    total_bytes / (1024 * 1024) > self.resend_quota_mb
+                    or self._fs_free_mb(self.dir) < self.fs_free_min_mb
+                ):
+                    return
+
+                protect_before = datetime.now(self.tz).timestamp() - self.protect_recent_sec
+                victims = self._conn.execute(
+                    """
+                    SELECT id, segment_id FROM entries
+                    WHERE segment_id != ? AND created_at <= ?
+                    ORDER BY (state = 'pending'), id
+                    LIMIT ?
+                    """,
+                    (self._active_segment_id or -1, protect_before, self.cleanup_batch),
+                ).fetchall()
+                if not victims:
+                    return
+
+                self._conn.executemany("DELETE FROM entries WHERE id = ?", [(entry_id,) for entry_id, _ in victims])
+                for segment_id in {segment_id for _, segment_id in victims}:
+                    self._drop_segment_if_empty(segment_id, commit=False)
+                self._conn.commit()
+
+                logger.warning(f"[Outbox] budget cleanup dropped {len(victims)} entries")
+        except Exception:
+            # Fail silently; do not block the main flow
+            pass
+
+    # ---------- migration ----------
+
+    def import_legacy_files(self) -> int:
+        """
+        One-shot import of a legacy one-file-per-payload outbox in the same directory.
+
+        Files are imported in mtime order (keeping FIFO), retry counts come from the
+        .retryN suffix and .fail files become failed entries. Each file is removed once
+        its chunk has been committed to the index.
+        """
+        try:
+            names = [fn for fn in os.listdir(self.dir) if LEGACY_FILE_PATTERN.match(fn)]
+        except FileNotFoundError:
+            return 0
+        if not names:
+            return 0
+
+        def mtime(fn: str) -> float:
+            try:
+                return os.path.getmtime(os.path.join(self.dir, fn))
+            except OSError:
+                return float("inf")
+
+        names.sort(key=mtime)
+        imported = 0
+
+        for start in range(0, len(names), self.MIGRATION_CHUNK):
+            chunk = names[start : start + self.MIGRATION_CHUNK]
+            records: list[tuple[bytes, str | None, int, str, float]] = []
+            imported_paths: list[str] = []
+
+            for fn in chunk:
+                fp = os.path.join(self.dir, fn)
+                try:
+                    with open(fp, "rb") as f:
+                        data = f.read()
+                    created_at = os.path.getmtime(fp)
+                except OSError as e:
+                    logger.warning(f"[Outbox] skip legacy file {fn}: {e}")
+                    continue
+
+                match = LABEL_TS_PATTERN.match(fn)
+                state = "failed" if fn.endswith(".fail") else "pending"
+                records.append(
+                    (
+                        self._encode_record(data),
+                        match.group(1) if match else None,
+                        extract_retry_count(fn),
+                        state,
+                        created_at,
+                    )
+                )
+                imported_paths.append(fp)
+
+            with self._lock:
+                for data, label, retry_count, state, created_at in records:
+                    self._append_locked(data, label, retry_count=retry_count, state=state, created_at=created_at)
+                self._conn.commit()
+
+            for fp in imported_paths:
+                try:
+                    os.remove(fp)
+                except OSError:
+                    pass
+            imported += len(records)
+
+        logger.info(f"[Outbox] imported {imported} legacy outbox file(s) into segment log")
+        return imported
+
+    # ---------- internals ----------
+
+    @property
+    def _conn(self) -> sqlite3.Connection:
+        if self._db is None:
+            with self._lock:
+                if self._db is None:
+                    os.makedirs(self.segment_dir, exist_ok=True)
+                    self._db = sqlite3.connect(os.path.join(self.dir, self.INDEX_FILENAME), check_same_thread=False)
+                    self._init_index()
+                    self._load_active_segment()
+        return self._db
+
+    def _init_index(self) -> None:
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS segments (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    size_bytes INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    segment_id INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    retry_count INTEGER NOT NULL DEFAULT 0,
+                    state TEXT NOT NULL DEFAULT 'pending' CHECK(state IN ('pending', 'failed')),
+                    label_ts TEXT,
+                    created_at REAL NOT NULL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_pick ON entries(state, (retry_count = 0), id)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_segment ON entries(segment_id)")
+            self._conn.commit()
+
+    def _load_active_segment(self) -> None:
+        with self._lock:
+            row = self._conn.execute("SELECT id FROM segments ORDER BY id DESC LIMIT 1").fetchone()
+            if row is None:
+                return
+            segment_id = int(row[0])
+            try:
+                size = os.path.getsize(self._segment_path(segment_id))
+            except OSError:
+                size = 0
+            self._active_segment_id = segment_id
+            self._active_segment_size = size
+
+    def _append(self, data: bytes, label_ts: str | None) -> str:
+        data = self._encode_record(data)
+        with self._lock:
+            entry_id = self._append_locked(data, label_ts)
+            self._conn.commit()
+        return str(entry_id)
+
+    def _append_locked(
+        self,
+        data: bytes,
+        label_ts: str | None,
+        *,
+        retry_count: int = 0,
+        state: str = "pending",
+        created_at: float | None = None,
+    ) -> int:
+        """Append one record to the active segment and index it (caller holds the lock and commits)."""
+        now_ts = datetime.now(self.tz).timestamp()
+        segment_id = self._segment_for_append(len(data) + 1, now_ts)
+
+        with open(self._segment_path(segment_id), "ab") as f:
+            offset = f.tell()
+            f.write(data)
+            f.write(b"\n")
+        self._active_segment_size = offset + len(data) + 1
+
+        cur = self._conn.execute(
+            """
+            INSERT INTO entries (segment_id, offset, length, retry_count, state, label_ts, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            (segment_id, offset, len(data), retry_count, state, label_ts, created_at or now_ts),
+        )
+        self._conn.execute(
+            "UPDATE segments SET size_bytes = ?, updated_at = ? WHERE id = ?",
+            (self._active_segment_size, now_ts, segment_id),
+        )
+        return int(cur.lastrowid)
+
+    def _segment_for_append(self, nbytes: int, now_ts: float) -> int:
+        """Return the active segment id, rolling over to a new segment when it would overflow."""
+        if self._active_segment_id is not None and (
+            self._active_segment_size == 0 or self._active_segment_size + nbytes <= self.segment_max_bytes
+        ):
+            return self._active_segment_id
+
+        previous = self._active_segment_id
+        cur = self._conn.execute(
+            "INSERT INTO segments (size_bytes, created_at, updated_at) VALUES (0, ?, ?)", (now_ts, now_ts)
+        )
+        self._active_segment_id = int(cur.lastrowid)
+        self._active_segment_size = 0
+
+        if previous is not None:
+            self._drop_segment_if_empty(previous)
+        return self._active_segment_id
+
+    def _drop_segment_if_empty(self, segment_id: int, *, commit: bool = True) -> None:
+        """Unlink a sealed segment once no entries reference it (caller holds the lock)."""
+        if segment_id == self._active_segment_id:
+            return
+        if self._conn.execute("SELECT 1 FROM entries WHERE segment_id = ? LIMIT 1", (segment_id,)).fetchone():
+            return
+        self._remove_segment(segment_id)
+        if commit:
+            self._conn.commit()
+
+    def _remove_segment(self, segment_id: int) -> None:
+        self._conn.execute("DELETE FROM segments WHERE id = ?", (segment_id,))
+        try:
+            os.remove(self._segment_path(segment_id))
+        except FileNotFoundError:
+            pass
+
+    def _read_sync(self, key: str) -> str:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT segment_id, offset, length FROM entries WHERE id = ?", (int(key),)
+            ).fetchone()
+        if row is None:
+            raise FileNotFoundError(f"outbox entry {key} not found")
+
+        segment_id, offset, length = row
+        with open(self._segment_path(segment_id), "rb") as f:
+            f.seek(offset)
+            data = f.read(length)
+        if len(data) != length:
+            raise OSError(f"outbox entry {key} truncated ({len(data)}/{length} bytes)")
+        return self._decode_record(data).decode("utf-8")
+
+    def _encode_record(self, data: bytes) -> bytes:
+        if self.compression == "gzip":
+            return gzip.compress(data, compresslevel=6, mtime=0)
+        return data
+
+    @staticmethod
+    def _decode_record(data: bytes) -> bytes:
+        # JSON text never starts with the gzip magic, so plain records pass through
+        if data[:2] == GZIP_MAGIC:
+            return gzip.decompress(data)
+        return data
+
+    def _segment_path(self, segment_id: int) -> str:
+        return os.path.join(self.segment_dir, f"seg_{segment_id:08d}.log")
+
+    def _parse_label(self, label: str | None) -> datetime | None:
+        if not label:
+            return None
+        try:
+            return datetime.strptime(label, LABEL_TS_FORMAT).replace(tzinfo=self.tz)
+        except ValueError:
+            return None
+
+    def _label_from_iso(self, value: str) -> str | None:
+        try:
+            dt = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+        dt = dt.astimezone(self.tz) if dt.tzinfo else dt.replace(tzinfo=self.tz)
+        return dt.strftime(LABEL_TS_FORMAT)
@@ -1,27 +1,93 @@
-from typing import Callable, Union
+import gzip
+import json
+import logging
+from typing import Callable, Literal, Union
 
 import httpx
 
+logger = logging.getLogger("ResendTransport")
+
+UploadCompression = Literal["off", "gzip", "auto"]
+
 
 class ResendTransport:
     """
     Unified wrapper for sending data to the cloud.
     - Supports dict (automatically sent as JSON) or str (sent as JSON string with Content-Type).
     - Returns (ok, status_code, text) for convenient logging by upper layers.
+    - compression:
+        "off"  → plain JSON bodies (default)
+        "gzip" → bodies >= gzip_min_bytes are always sent with Content-Encoding: gzip
+        "auto" → like "gzip", but if the server rejects a gzip body (400/415) and accepts the
+                 same payload uncompressed, gzip is disabled for the rest of the process
     """
 
-    def __init__(self, base_url: str, client: httpx.AsyncClient, is_ok: Callable[[httpx.Response], bool]):
+    GZIP_REJECT_STATUSES = frozenset({400, 415})
+
+    def __init__(
+        self,
+        base_url: str,
+        client: httpx.AsyncClient,
+        is_ok: Callable[[httpx.Response], bool],
+        *,
+        compression: UploadCompression = "off",
+        gzip_min_bytes: int = 1024,
+        gzip_level: int = 6,
+    ):
         self.base_url = base_url
         self.client = client
         self._is_ok = is_ok
+        self.compression = compression
+        self.gzip_min_bytes = int(gzip_min_bytes)
+        self.gzip_level = int(gzip_level)
+        self._gzip_enabled = compression != "off"
+
+    @property
+    def gzip_enabled(self) -> bool:
+        return self._gzip_enabled
 
     async def send(self, payload: Union[dict, str]) -> tuple[bool, int, str]:
+        if not self._gzip_enabled:
+            return await self._send_plain(payload)
+
+        body = self._encode(payload)
+        if len(body) < self.gzip_min_bytes:
+            return await self._post(body, {"Content-Type": "application/json"})
+
+        compressed = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        ok, status, text = await self._post(
+            compressed, {"Content-Type": "application/json", "Content-Encoding": "gzip"}
+        )
+        if ok or self.compression != "auto" or status not in self.GZIP_REJECT_STATUSES:
+            return ok, status, text
+
+        # Negotiation: only blame gzip if the same body goes through uncompressed
+        ok, status, text = await self._post(body, {"Content-Type": "application/json"})
+        if ok:
+            self._gzip_enabled = False
+            logger.warning(f"[Transport] {self.base_url} rejected gzip body, falling back to plain JSON uploads")
+        return ok, status, text
+
+    async def _send_plain(self, payload: Union[dict, str]) -> tuple[bool, int, str]:
         if isinstance(payload, dict):
             resp = await self.client.post(self.base_url, json=payload)
         else:
             resp = await self.client.post(self.base_url, data=payload, headers={"Content-Type": "application/json"})
+        return self._result(resp)
+
+    async def _post(self, body: bytes, headers: dict[str, str]) -> tuple[bool, int, str]:
+        resp = await self.client.post(self.base_url, content=body, headers=headers)
+        return self._result(resp)
+
+    def _result(self, resp: httpx.Response) -> tuple[bool, int, str]:
         try:
             ok = self._is_ok(resp)
         except Exception:
             ok = False
         return ok, resp.status_code, (resp.text or "")
+
+    @staticmethod
+    def _encode(payload: Union[dict, str]) -> bytes:
+        if isinstance(payload, dict):
+            return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return payload.encode("utf-8")
@@ -116,6 +116,8 @@ class ConfigManagerExtension:
                     cfg["scale"] = pin_def.scale
                 if pin_def.scale_from is not None:
                     cfg["scale_from"] = pin_def.scale_from
+                if pin_def.poll_class is not None:
+                    cfg["poll_class"] = pin_def.poll_class.value
 
                 final_map[pin_name] = cfg
                 continue
@@ -147,6 +149,8 @@ class ConfigManagerExtension:
                 base_config["scale_from"] = pin_def.scale_from
             if pin_def.bit is not None:
                 base_config["bit"] = pin_def.bit
+            if pin_def.poll_class is not None:
+                base_config["poll_class"] = pin_def.poll_class.value
 
             final_map[pin_name] = base_config
 
@@ -177,6 +181,8 @@ class ConfigManagerExtension:
                 final_map[pin_name]["unit"] = pin_mapping.unit
             if pin_mapping.precision is not None:
                 final_map[pin_name]["precision"] = pin_mapping.precision
+            if pin_mapping.poll_class is not None:
+                final_map[pin_name]["poll_class"] = pin_mapping.poll_class.value
 
         # ==========================================
         # Step 3: Apply instance-specific overrides
@@ -198,7 +204,7 @@ class ConfigManagerExtension:
 
                 # Composed: allow only safe subset (and ignore None)
                 if final_map[pin_name].get("kind") == "composed":
-                    allowed = {"scale", "scale_from", "unit", "precision", "description", "name", "type"}
+                    allowed = {"scale", "scale_from", "unit", "precision", "description", "name", "type", "poll_class"}
                     for field, value in override_dict.items():
                         if value is None:
                             continue
@@ -1,5 +1,7 @@
 from core.model.device_constant import INVALID_U16_SENTINEL
 
+_BIT_FLAG_KEYS = tuple(f"bit{i}" for i in range(16))
+
 
 def parse_int_or_none(value) -> int | None:
     """
@@ -26,7 +28,7 @@ def u16_to_bit_flags(u16: int | None) -> dict[str, bool]:
     Treat None as 0.
     """
     v = (u16 or 0) & INVALID_U16_SENTINEL
-    return {f"bit{i}": bool((v >> i) & 1) for i in range(16)}
+    return {key: bool((v >> i) & 1) for i, key in enumerate(_BIT_FLAG_KEYS)}
 
 
 def compute_legacy_invstatus_code(u16: int | None, negative_fallback: int = 0) -> int | None:
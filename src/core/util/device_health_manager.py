@@ -14,6 +14,7 @@ from core.device.generic.generic_device import AsyncGenericModbusDevice
 from core.model.device_constant import DEFAULT_MISSING_VALUE, INVERTER
 from core.model.enum.health_check_strategy_enum import HealthCheckStrategyEnum
 from core.schema.health_check_config_schema import HealthCheckConfig
+from core.util.latency_histogram import DeviceLatencyTracker
 from core.util.time_util import now_timestamp
 
 logger = logging.getLogger("DeviceHealthManager")
@@ -116,6 +117,11 @@ class DeviceHealthManager:
         mark_unhealthy_after_failures: int = 1,
         long_term_offline_threshold_sec: float = 3600.0,
         max_failures_cap: int = 5,
+        adaptive_timeout_margin: float = 3.0,
+        adaptive_timeout_min_sec: float = 0.05,
+        adaptive_timeout_min_samples: int = 20,
+        latency_window: int = 200,
+        latency_max_age_sec: float | None = 900.0,
     ):
         self._health_status: dict[str, DeviceHealthStatus] = {}
         self._lock = asyncio.Lock()
@@ -132,6 +138,19 @@ class DeviceHealthManager:
 
         self._health_check_configs: dict[str, HealthCheckConfig] = {}
 
+        # Rolling latency histograms per device (keyed by transaction kind/size) -> adaptive deadlines
+        self._latency_trackers: dict[str, DeviceLatencyTracker] = {}
+        self._latency_params: dict = {
+            "margin": float(adaptive_timeout_margin),
+            "min_deadline_sec": float(adaptive_timeout_min_sec),
+            "min_samples": int(adaptive_timeout_min_samples),
+            "window": int(latency_window),
+            "max_sample_age_sec": latency_max_age_sec,
+        }
+
+        # Devices whose startup probe is still running (the monitor leaves them alone until it ends)
+        self._probing: set[str] = set()
+
         self._critical_backoff_params: dict = {
             "base_cooldown_sec": 10.0,
             "max_cooldown_sec": 10.0,
@@ -387,6 +406,44 @@ class DeviceHealthManager:
 
         return result.is_online, result
 
+    # ==================== Adaptive timeouts ====================
+
+    def latency_tracker(self, device_id: str) -> DeviceLatencyTracker:
+        """Latency histograms of a device (created on first use); shared with its Modbus buses."""
+        tracker = self._latency_trackers.get(device_id)
+        if tracker is None:
+            tracker = self._latency_trackers[device_id] = DeviceLatencyTracker(**self._latency_params)
+        return tracker
+
+    def record_latency(self, device_id: str, key: str, elapsed_sec: float) -> None:
+        """Record a successful transaction's latency."""
+        self.latency_tracker(device_id).record(key, elapsed_sec)
+
+    def record_timeout(self, device_id: str, key: str) -> None:
+        """Record a transaction that hit its deadline (the next one runs under the configured timeout)."""
+        self.latency_tracker(device_id).record_timeout(key)
+
+    def adaptive_timeout(self, device_id: str, key: str, configured_sec: float) -> float:
+        """p99 x margin of the device's history for key, clamped to configured_sec (configured until warmed up)."""
+        deadline = self.latency_tracker(device_id).deadline(key, configured_sec)
+        return configured_sec if deadline is None else deadline
+
+    # ==================== Startup probing ====================
+
+    def begin_startup_probe(self, device_ids) -> None:
+        """Mark devices as probing: not polled by the monitor until end_startup_probe()."""
+        self._probing.update(device_ids)
+
+    def end_startup_probe(self, device_id: str) -> None:
+        self._probing.discard(device_id)
+
+    def is_probing(self, device_id: str) -> bool:
+        return device_id in self._probing
+
+    @property
+    def probing_count(self) -> int:
+        return len(self._probing)
+
     def _to_summary(self, health_status: DeviceHealthStatus) -> dict:
         now_ts = now_timestamp()
         return {
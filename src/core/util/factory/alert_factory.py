@@ -1,6 +1,7 @@
 import logging
 
 from core.evaluator.alert_evaluator import AlertEvaluator
+from core.evaluator.alert_state_manager import AlertStateManager
 from core.evaluator.time_evalutor import TimeControlEvaluator
 from core.model.enum.alert_enum import AlertSeverity
 from core.schema.alert_config_schema import AlertConfig
@@ -10,6 +11,7 @@ from core.util.notifier.base import BaseNotifier
 from core.util.pubsub.base import PubSub
 from core.util.pubsub.subscriber.alert_evaluator_subscriber import AlertEvaluatorSubscriber
 from core.util.pubsub.subscriber.alert_notifier_subscriber import AlertNotifierSubscriber
+from repository.alert_state_store import AlertStateStore
 
 logger = logging.getLogger("AlertFactory")
 
@@ -24,6 +26,7 @@ def build_alert_subscriber(
     monitor_interval: float = 10.0,
     alert_interval: float | None = None,
     outlier_log_path: str = "logs/outlier.log",
+    alert_state_db_path: str | None = None,
 ) -> tuple[AlertEvaluatorSubscriber, AlertNotifierSubscriber]:
     """
     Build alert evaluator and notifier subscribers.
@@ -37,12 +40,16 @@ def build_alert_subscriber(
         monitor_interval: Monitor polling interval in seconds
         alert_interval: Alert evaluation interval in seconds (None = same as monitor_interval)
         outlier_log_path: Path to the outlier log file
+        alert_state_db_path: SQLite path for persisted alert states (None = memory only)
 
     Returns:
         Tuple of (alert_evaluator_subscriber, alert_notifier_subscriber)
     """
     alert_evaluator: AlertEvaluator = build_alert_evaluator(
-        path=alert_path, valid_device_ids=valid_device_ids, time_control_evaluator=time_control_evaluator
+        path=alert_path,
+        valid_device_ids=valid_device_ids,
+        time_control_evaluator=time_control_evaluator,
+        alert_state_db_path=alert_state_db_path,
     )
     alert_eval_subscriber = AlertEvaluatorSubscriber(
         pubsub,
@@ -64,7 +71,10 @@ def build_alert_subscriber(
 
 
 def build_alert_evaluator(
-    path: str, valid_device_ids: set[str], time_control_evaluator: TimeControlEvaluator | None = None
+    path: str,
+    valid_device_ids: set[str],
+    time_control_evaluator: TimeControlEvaluator | None = None,
+    alert_state_db_path: str | None = None,
 ) -> AlertEvaluator:
     """
     Build AlertEvaluator from configuration file.
@@ -76,6 +86,7 @@ def build_alert_evaluator(
     Args:
         path: Path to alert configuration YAML file
         valid_device_ids: Set of valid device IDs
+        alert_state_db_path: SQLite path for persisted alert states (None = memory only)
 
     Returns:
         Configured AlertEvaluator instance
@@ -90,11 +101,27 @@ def build_alert_evaluator(
 
     logger.info(f"Models in config: {list(alert_config.root.keys())}")
 
+    state_manager = AlertStateManager(store=_build_alert_state_store(alert_state_db_path))
+
     return AlertEvaluator(
-        alert_config=alert_config, valid_device_ids=valid_device_ids, time_control_evaluator=time_control_evaluator
+        alert_config=alert_config,
+        valid_device_ids=valid_device_ids,
+        time_control_evaluator=time_control_evaluator,
+        state_manager=state_manager,
     )
 
 
+def _build_alert_state_store(db_path: str | None) -> AlertStateStore | None:
+    """Open the alert state store; fall back to memory-only states if it cannot be opened."""
+    if not db_path:
+        return None
+    try:
+        return AlertStateStore(db_path=db_path)
+    except Exception as e:
+        logger.warning(f"Alert state store unavailable ({db_path}), using memory-only states: {e}")
+        return None
+
+
 def _parse_alert_config_dict(config_dict: dict) -> dict:
     """
     Parse loaded YAML dict into AlertConfig structure.
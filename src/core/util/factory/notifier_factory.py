@@ -4,6 +4,7 @@ from core.schema.notifier_schema import NotificationConfigSchema, NotifierConfig
 from core.util.config_manager import ConfigManager
 from core.util.notifier.base import BaseNotifier
 from core.util.notifier.email_notifier import EmailNotifier
+from core.util.notifier.http_client_pool import HttpClientPool
 from core.util.notifier.sms_notifier import SmsNotifier
 from core.util.notifier.telegram_notifier import TelegramNotifier
 
@@ -39,6 +40,25 @@ def build_notifiers_and_routing(config_path: str) -> tuple[list[BaseNotifier], N
     return notifiers, config
 
 
+async def close_notifiers(notifiers: list[BaseNotifier]) -> None:
+    """Release pooled connections/sessions held by notifiers (call once on shutdown)."""
+    closed_pools: set[int] = set()
+    for notifier in notifiers:
+        pool = getattr(notifier, "client_pool", None)
+        if pool is not None:
+            if id(pool) in closed_pools:
+                continue
+            closed_pools.add(id(pool))
+            try:
+                await pool.aclose()
+            except Exception as e:
+                logger.warning(f"Failed to close HTTP pool of {notifier.notifier_type}: {e}")
+        try:
+            await notifier.aclose()
+        except Exception as e:
+            logger.warning(f"Failed to close {notifier.notifier_type}: {e}")
+
+
 def _parse_env_vars_recursive(obj):
     """Recursively parse environment variables in config"""
     if isinstance(obj, dict):
@@ -55,6 +75,14 @@ def _build_notifiers(config: NotifierConfigSchema) -> list[BaseNotifier]:
     """Build notifier instances from validated schema"""
     notifiers: list[BaseNotifier] = []
 
+    # Shared keep-alive pool for HTTP-based notifiers, released via close_notifiers()
+    http_pool = HttpClientPool(
+        max_connections=config.http_pool.max_connections,
+        max_keepalive_connections=config.http_pool.max_keepalive_connections,
+        keepalive_expiry_sec=config.http_pool.keepalive_expiry_sec,
+        http2=config.http_pool.http2,
+    )
+
     # SMS
     if config.sms and config.sms.enabled:
         notifiers.append(
@@ -79,6 +107,7 @@ def _build_notifiers(config: NotifierConfigSchema) -> list[BaseNotifier]:
                     enabled=config.telegram.enabled,
                     timeout_sec=config.telegram.timeout_sec,
                     parse_mode=config.telegram.parse_mode,
+                    client_pool=http_pool,
                 )
             )
             logger.info(f"[TELEGRAM] Initialized (chat_id={config.telegram.chat_id})")
@@ -1,8 +1,11 @@
+import asyncio
 import logging
+import time
 from dataclasses import dataclass
 
 from core.device.generic.generic_device import AsyncGenericModbusDevice
 from core.device.health_check_strategy_inferencer import HealthCheckStrategyInferencer
+from core.model.enum.modbus_transport_enum import ModbusTransport
 from core.schema.constraint_schema import ConstraintConfigSchema
 from core.schema.health_check_config_schema import HealthCheckConfig
 from core.util.config_manager import ConfigManager
@@ -85,12 +88,7 @@ async def apply_startup_frequencies_with_health_check(
     for device in device_manager.device_list:
         device_id = f"{device.model}_{device.slave_id}"
 
-        startup_freq: float | None = ConfigManager.get_device_startup_frequency(
-            constraint_schema, device.model, device.slave_id
-        )
-        auto_turn_on: bool | None = ConfigManager.get_device_auto_turn_on(
-            constraint_schema, device.model, device.slave_id
-        )
+        startup_freq, auto_turn_on = _startup_settings_for(constraint_schema, device)
 
         if startup_freq is None and auto_turn_on is not True:
             stats.skipped_no_config += 1
@@ -173,6 +171,149 @@ async def perform_initial_health_check_for_all_devices(
     return stats
 
 
+class StartupOrchestrator:
+    """
+    Initial health check + startup initialization, probed in parallel port lanes.
+
+    - One lane per port. Serial / RTU-over-TCP lanes probe their devices one at a time (shared
+      line); native Modbus TCP lanes probe all their devices at once. Lanes run concurrently.
+    - Probes use quick_health_check, i.e. each device's HealthCheckConfig timeout and retries.
+    - start() marks every device as probing; the monitor skips a device until its own probe
+      ends, so verified devices are polled while slow (offline) ones are still probing.
+    - Online devices get startup_frequency / auto_turn_on in their lane before being released.
+    - time_to_first_snapshot_sec: from `started_at` (service start) to the monitor's first
+      published snapshot (record_first_snapshot()).
+    """
+
+    def __init__(
+        self,
+        device_manager: AsyncDeviceManager,
+        health_manager: DeviceHealthManager,
+        constraint_schema: ConstraintConfigSchema | None = None,
+        *,
+        started_at: float | None = None,
+    ):
+        self.device_manager = device_manager
+        self.health_manager = health_manager
+        self.constraint_schema = constraint_schema
+        self.started_at: float = time.monotonic() if started_at is None else float(started_at)
+
+        self.health_stats: dict[str, int] = {"online": 0, "offline": 0, "failed": 0}
+        self.init_stats = InitStats()
+        self.probe_elapsed_sec: float | None = None
+        self.time_to_first_snapshot_sec: float | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> asyncio.Task:
+        """Mark every device as probing and run the lanes in the background."""
+        self.health_manager.begin_startup_probe(
+            f"{device.model}_{device.slave_id}" for device in self.device_manager.device_list
+        )
+        self._task = asyncio.create_task(self.run(), name="startup-probe")
+        return self._task
+
+    async def run(self) -> dict[str, int]:
+        """Probe every port lane; returns {"online", "offline", "failed"} counts."""
+        lanes: dict[str, list[AsyncGenericModbusDevice]] = {}
+        for device in self.device_manager.device_list:
+            lanes.setdefault(device.port, []).append(device)
+
+        logger.info(f"[Startup] Probing {len(self.device_manager.device_list)} devices in {len(lanes)} port lanes")
+        start = time.monotonic()
+
+        await asyncio.gather(*(self._run_lane(devices) for devices in lanes.values()))
+
+        self.probe_elapsed_sec = time.monotonic() - start
+        logger.info(
+            f"[Startup] Probe complete in {self.probe_elapsed_sec:.2f}s: "
+            f"{self.health_stats['online']} online, {self.health_stats['offline']} offline, "
+            f"{self.health_stats['failed']} failed"
+        )
+        logger.info(f"[Startup] Startup init summary: {self.init_stats}")
+        return self.health_stats
+
+    def record_first_snapshot(self) -> None:
+        """Called by the monitor after its first publish (only the first call counts)."""
+        if self.time_to_first_snapshot_sec is not None:
+            return
+        self.time_to_first_snapshot_sec = time.monotonic() - self.started_at
+        logger.info(f"[Startup] time_to_first_snapshot={self.time_to_first_snapshot_sec:.2f}s")
+
+    def summary(self) -> dict:
+        return {
+            "probing": self.health_manager.probing_count,
+            "probe_elapsed_sec": None if self.probe_elapsed_sec is None else round(self.probe_elapsed_sec, 3),
+            "time_to_first_snapshot_sec": (
+                None if self.time_to_first_snapshot_sec is None else round(self.time_to_first_snapshot_sec, 3)
+            ),
+            **self.health_stats,
+        }
+
+    async def _run_lane(self, devices: list[AsyncGenericModbusDevice]) -> None:
+        if devices[0].transport == ModbusTransport.TCP:
+            await asyncio.gather(*(self._probe_device(device) for device in devices))
+            return
+
+        for device in devices:
+            await self._probe_device(device)
+
+    async def _probe_device(self, device: AsyncGenericModbusDevice) -> None:
+        device_id = f"{device.model}_{device.slave_id}"
+
+        try:
+            is_online, health_result = await self.health_manager.quick_health_check(device=device, device_id=device_id)
+            elapsed_ms = health_result.elapsed_ms if health_result else 0.0
+            strategy = health_result.strategy if health_result else "unknown"
+
+            if not is_online:
+                self.health_stats["offline"] += 1
+                logger.warning(f"[{device_id}] ✗ OFFLINE (check: {elapsed_ms:.0f}ms, strategy: {strategy})")
+                return
+
+            self.health_stats["online"] += 1
+            logger.info(f"[{device_id}] ✓ ONLINE (check: {elapsed_ms:.0f}ms, strategy: {strategy})")
+
+            if self.constraint_schema is not None:
+                await self._apply_startup_init(device, device_id, elapsed_ms)
+
+        except Exception as exc:
+            self.health_stats["failed"] += 1
+            logger.warning(f"[{device_id}] Health check failed: {exc}")
+            # Mark as failure so Monitor won't try full read
+            await self.health_manager.mark_failure(device_id)
+
+        finally:
+            self.health_manager.end_startup_probe(device_id)
+
+    async def _apply_startup_init(self, device: AsyncGenericModbusDevice, device_id: str, elapsed_ms: float) -> None:
+        startup_freq, auto_turn_on = _startup_settings_for(self.constraint_schema, device)
+        if startup_freq is None and auto_turn_on is not True:
+            self.init_stats.skipped_no_config += 1
+            return
+
+        try:
+            if startup_freq is not None:
+                await _apply_frequency(device, device_id, startup_freq, self.init_stats, elapsed_ms)
+
+            if auto_turn_on is True:
+                await _apply_turn_on(device, device_id, self.init_stats)
+
+        except Exception as exc:
+            self.init_stats.failed += 1
+            logger.warning(f"[{device_id}] init failed: {exc}")
+
+
+def _startup_settings_for(
+    constraint_schema: ConstraintConfigSchema, device: AsyncGenericModbusDevice
+) -> tuple[float | None, bool | None]:
+    """(startup_frequency, auto_turn_on) configured for a device instance."""
+    startup_freq: float | None = ConfigManager.get_device_startup_frequency(
+        constraint_schema, device.model, device.slave_id
+    )
+    auto_turn_on: bool | None = ConfigManager.get_device_auto_turn_on(constraint_schema, device.model, device.slave_id)
+    return startup_freq, auto_turn_on
+
+
 async def _apply_frequency(
     device: AsyncGenericModbusDevice, device_id: str, startup_freq: float, stats: InitStats, elapsed_ms: float
 ):
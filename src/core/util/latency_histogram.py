@@ -0,0 +1,130 @@
+import bisect
+import time
+from collections import deque
+
+# Bucket upper bounds in seconds: 1ms .. ~20s, geometric (x1.25)
+_BUCKET_BOUNDS: tuple[float, ...] = tuple(0.001 * 1.25**i for i in range(45))
+
+
+class LatencyHistogram:
+    """
+    Rolling latency histogram over the last `window` samples, none older than `max_age_sec`.
+
+    Samples are kept as bucket indices, so quantiles cost O(buckets) and never
+    under-estimate (a quantile is reported as its bucket's upper bound).
+    """
+
+    def __init__(self, window: int = 200, max_age_sec: float | None = None):
+        self._samples: deque[tuple[int, float]] = deque(maxlen=max(1, int(window)))
+        self._counts: list[int] = [0] * (len(_BUCKET_BOUNDS) + 1)
+        self.max_age_sec = max_age_sec
+
+    @property
+    def count(self) -> int:
+        self._expire()
+        return len(self._samples)
+
+    def add(self, elapsed_sec: float, now: float | None = None) -> None:
+        now = time.monotonic() if now is None else now
+        self._expire(now)
+        if len(self._samples) == self._samples.maxlen:
+            self._counts[self._samples[0][0]] -= 1
+        bucket = bisect.bisect_left(_BUCKET_BOUNDS, max(0.0, float(elapsed_sec)))
+        self._samples.append((bucket, now))
+        self._counts[bucket] += 1
+
+    def _expire(self, now: float | None = None) -> None:
+        """Drop samples older than max_age_sec, so the window recovers after a latency shift."""
+        if self.max_age_sec is None:
+            return
+        cutoff = (time.monotonic() if now is None else now) - self.max_age_sec
+        while self._samples and self._samples[0][1] < cutoff:
+            bucket, _ = self._samples.popleft()
+            self._counts[bucket] -= 1
+
+    def quantile(self, q: float) -> float | None:
+        self._expire()
+        if not self._samples:
+            return None
+
+        rank = max(1, round(min(max(q, 0.0), 1.0) * len(self._samples)))
+        seen = 0
+        for bucket, n in enumerate(self._counts):
+            seen += n
+            if seen >= rank:
+                return _BUCKET_BOUNDS[bucket] if bucket < len(_BUCKET_BOUNDS) else _BUCKET_BOUNDS[-1]
+        return _BUCKET_BOUNDS[-1]
+
+
+class DeviceLatencyTracker:
+    """
+    Latency histograms for one device, keyed by transaction kind and size, plus the
+    adaptive deadlines derived from them.
+
+    deadline() = quantile x margin, clamped to [min_deadline_sec, ceiling]. Until a key has
+    min_samples successful transactions it returns None (callers keep their static timeout).
+    Only successful transactions should be recorded, so a dead device never inflates its
+    own deadline.
+
+    A device that merely got slower must not be locked out by its old history: after a
+    timeout (record_timeout) deadline() returns None until the next success, so the next
+    request runs under the configured timeout and its slower latency is recorded. Samples
+    older than max_sample_age_sec are forgotten as well.
+    """
+
+    def __init__(
+        self,
+        *,
+        quantile: float = 0.99,
+        margin: float = 3.0,
+        min_deadline_sec: float = 0.05,
+        min_samples: int = 20,
+        window: int = 200,
+        max_sample_age_sec: float | None = 900.0,
+    ):
+        self.quantile = float(quantile)
+        self.margin = float(margin)
+        self.min_deadline_sec = float(min_deadline_sec)
+        self.min_samples = max(1, int(min_samples))
+        self.window = int(window)
+        self.max_sample_age_sec = max_sample_age_sec
+        self._histograms: dict[str, LatencyHistogram] = {}
+        # Keys whose last transaction timed out: next request falls back to the configured timeout
+        self._timed_out: set[str] = set()
+
+    @staticmethod
+    def size_key(kind: str, count: int = 1) -> str:
+        """Bucket transaction sizes by power of two: read:1, read:2, read:4, ..."""
+        size = 1
+        while size < count:
+            size *= 2
+        return f"{kind}:{size}"
+
+    def record(self, key: str, elapsed_sec: float) -> None:
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.window, self.max_sample_age_sec)
+        histogram.add(elapsed_sec)
+        self._timed_out.discard(key)
+
+    def record_timeout(self, key: str) -> None:
+        self._timed_out.add(key)
+
+    def deadline(self, key: str, ceiling: float) -> float | None:
+        if key in self._timed_out:
+            return None
+        histogram = self._histograms.get(key)
+        if histogram is None or histogram.count < self.min_samples:
+            return None
+        adaptive = histogram.quantile(self.quantile) * self.margin
+        return min(float(ceiling), max(self.min_deadline_sec, adaptive))
+
+    def summary(self) -> dict[str, dict]:
+        return {
+            key: {
+                "samples": h.count,
+                "p50_ms": round(h.quantile(0.5) * 1000, 1),
+                "p99_ms": round(h.quantile(0.99) * 1000, 1),
+            }
+            for key, h in self._histograms.items()
+        }
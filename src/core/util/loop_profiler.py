@@ -0,0 +1,338 @@
+import asyncio
+import contextvars
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from dataclasses import dataclass
+from datetime import datetime
+from types import FrameType
+from typing import Any
+
+from core.util.time_util import TIMEZONE_INFO
+
+logger = logging.getLogger("LoopProfiler")
+
+# Owner label for CPU accounting. Tasks created while it is set (e.g. by a subscriber runner)
+# inherit it through their context, so a subscriber is charged for everything it spawns.
+task_owner: contextvars.ContextVar[str | None] = contextvars.ContextVar("talos_task_owner", default=None)
+
+UNATTRIBUTED = "<unattributed>"
+
+_original_handle_run = asyncio.events.Handle._run
+_active_profiler: "LoopProfiler | None" = None
+
+
+def _profiled_handle_run(handle: asyncio.Handle) -> None:
+    profiler = _active_profiler
+    if profiler is None or handle._loop is not profiler.loop:
+        return _original_handle_run(handle)
+    return profiler._run_handle(handle)
+
+
+@dataclass(frozen=True)
+class LoopProfilerConfig:
+    slow_callback_sec: float = 0.1  # A single callback running longer than this is a stall
+    max_stalls: int = 50  # Ring buffer of recent stalls
+    stack_depth: int = 30  # Frames kept per captured stack (innermost)
+    max_profile_sec: float = 60.0  # Upper bound for one sampling-profiler run
+
+
+@dataclass
+class OwnerStats:
+    runs: int = 0
+    cpu_sec: float = 0.0
+    wall_sec: float = 0.0
+    max_run_sec: float = 0.0
+    stalls: int = 0
+
+
+def _own_frame(frame: FrameType) -> bool:
+    return frame.f_code.co_filename == __file__
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    path = code.co_filename.replace(os.sep, "/").rsplit("/", 2)
+    return f"{code.co_qualname} ({'/'.join(path[-2:])}:{code.co_firstlineno})"
+
+
+def _format_stack(frame: FrameType | None, depth: int) -> list[str]:
+    """Innermost `depth` frames, outermost first."""
+    lines: list[str] = []
+    while frame is not None and len(lines) < depth:
+        if not _own_frame(frame):
+            lines.append(f"{frame.f_code.co_filename}:{frame.f_lineno} in {frame.f_code.co_qualname}")
+        frame = frame.f_back
+    lines.reverse()
+    return lines
+
+
+def collapse_stack(frame: FrameType | None) -> str:
+    """One sample in collapsed-stack form (`outer;...;inner`), as consumed by flamegraph.pl / speedscope."""
+    labels: list[str] = []
+    while frame is not None:
+        if not _own_frame(frame):
+            labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+def sample_thread(thread_id: int, seconds: float, interval_sec: float) -> Counter[str]:
+    """Sample the stack of `thread_id` every `interval_sec` for `seconds`; collapsed stack -> sample count."""
+    samples: Counter[str] = Counter()
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        frame = sys._current_frames().get(thread_id)
+        if frame is None:
+            break
+        samples[collapse_stack(frame)] += 1
+        del frame
+        time.sleep(interval_sec)
+    return samples
+
+
+def format_collapsed(samples: Counter[str]) -> str:
+    return "".join(f"{stack} {count}\n" for stack, count in samples.most_common())
+
+
+class LoopProfiler:
+    """
+    Always-on event loop diagnostics:
+    - Slow-callback detector: every loop callback is timed; a watcher thread captures the loop
+      thread's stack while a callback is still running past the threshold, so the stall is
+      recorded with the code that caused it (no asyncio debug mode needed).
+    - Per-owner CPU accounting: thread CPU / wall time per task owner (see `task_owner`),
+      falling back to the task name for named tasks.
+    - On-demand sampling profiler returning collapsed stacks (flamegraph input).
+    """
+
+    def __init__(self, cfg: LoopProfilerConfig):
+        self.cfg = cfg
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+
+        self._owners: dict[str, OwnerStats] = {}
+        self._stalls: deque[dict[str, Any]] = deque(maxlen=cfg.max_stalls)
+        self._stall_count: int = 0
+        self._handle_count: int = 0
+        self._started_monotonic: float = 0.0
+
+        # Callback currently running on the loop: (sequence, perf_counter start); read by the watcher
+        self._running: tuple[int, float] | None = None
+        self._captured: tuple[int, list[str]] | None = None
+        self._capture_lock = threading.Lock()
+        self._watcher: threading.Thread | None = None
+        self._watcher_stop = threading.Event()
+
+        self._profile_lock = asyncio.Lock()
+
+    # -------------------------
+    # Lifecycle
+    # -------------------------
+
+    def install(self, loop: asyncio.AbstractEventLoop | None = None) -> None:
+        """Start profiling `loop` (defaults to the running loop). Call from the loop thread."""
+        global _active_profiler
+        if _active_profiler is not None and _active_profiler is not self:
+            raise RuntimeError("Another LoopProfiler is already installed")
+
+        self.loop = loop or asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._started_monotonic = time.monotonic()
+        asyncio.events.Handle._run = _profiled_handle_run
+        _active_profiler = self
+
+        self._watcher_stop.clear()
+        self._watcher = threading.Thread(target=self._watch_loop, name="loop-profiler-watcher", daemon=True)
+        self._watcher.start()
+        logger.info(f"[LoopProfiler] installed: slow_callback={self.cfg.slow_callback_sec * 1000:.0f}ms")
+
+    def uninstall(self) -> None:
+        global _active_profiler
+        if _active_profiler is self:
+            asyncio.events.Handle._run = _original_handle_run
+            _active_profiler = None
+
+        self._watcher_stop.set()
+        if self._watcher is not None:
+            self._watcher.join(timeout=1.0)
+            self._watcher = None
+
+    @property
+    def installed(self) -> bool:
+        return _active_profiler is self
+
+    # -------------------------
+    # Callback timing (loop thread)
+    # -------------------------
+
+    def _run_handle(self, handle: asyncio.Handle) -> None:
+        self._handle_count += 1
+        seq = self._handle_count
+        start = time.perf_counter()
+        cpu_start = time.thread_time()
+        self._running = (seq, start)
+        try:
+            _original_handle_run(handle)
+        finally:
+            self._running = None
+            elapsed = time.perf_counter() - start
+            cpu = time.thread_time() - cpu_start
+
+            owner = self._owner_of(handle)
+            stats = self._owners.get(owner)
+            if stats is None:
+                stats = self._owners[owner] = OwnerStats()
+            stats.runs += 1
+            stats.cpu_sec += cpu
+            stats.wall_sec += elapsed
+            if elapsed > stats.max_run_sec:
+                stats.max_run_sec = elapsed
+
+            if elapsed >= self.cfg.slow_callback_sec:
+                stats.stalls += 1
+                self._record_stall(handle, seq, owner, elapsed, cpu)
+
+    @staticmethod
+    def _task_of(handle: asyncio.Handle) -> asyncio.Task | None:
+        task = getattr(handle._callback, "__self__", None)
+        return task if isinstance(task, asyncio.Task) else None
+
+    def _owner_of(self, handle: asyncio.Handle) -> str:
+        owner = handle._context.get(task_owner)
+        if owner is not None:
+            return owner
+        task = self._task_of(handle)
+        if task is not None:
+            name = task.get_name()
+            if not name.startswith("Task-"):
+                return name
+        return UNATTRIBUTED
+
+    def _record_stall(self, handle: asyncio.Handle, seq: int, owner: str, elapsed: float, cpu: float) -> None:
+        # Waits for a capture the watcher may still be formatting for this callback
+        with self._capture_lock:
+            captured = self._captured
+            self._captured = None
+        stack = captured[1] if captured is not None and captured[0] == seq else []
+
+        task = self._task_of(handle)
+        callback = f"task {task.get_name()}" if task is not None else repr(handle._callback)[:200]
+        self._stall_count += 1
+        self._stalls.append(
+            {
+                "ts": datetime.now(TIMEZONE_INFO).isoformat(),
+                "duration_ms": round(elapsed * 1000, 3),
+                "cpu_ms": round(cpu * 1000, 3),
+                "owner": owner,
+                "callback": callback,
+                "stack": stack,
+            }
+        )
+        where = stack[-1] if stack else callback
+        logger.warning(
+            f"[SlowCallback] {elapsed * 1000:.0f}ms (cpu={cpu * 1000:.0f}ms) owner={owner} callback={callback} at {where}"
+        )
+
+    # -------------------------
+    # Watcher thread
+    # -------------------------
+
+    def _watch_loop(self) -> None:
+        threshold = self.cfg.slow_callback_sec
+        poll = max(0.005, threshold / 2)
+        while not self._watcher_stop.wait(poll):
+            running = self._running
+            if running is None:
+                continue
+            seq, start = running
+            if time.perf_counter() - start < threshold:
+                continue
+            captured = self._captured
+            if captured is not None and captured[0] == seq:
+                continue
+            with self._capture_lock:
+                if self._running is None or self._running[0] != seq:
+                    continue
+                frame = sys._current_frames().get(self._loop_thread_id)
+                stack = _format_stack(frame, self.cfg.stack_depth)
+                del frame
+                # The callback may have returned while we were looking; that stack would be the loop's
+                if self._running is not None and self._running[0] == seq:
+                    self._captured = (seq, stack)
+
+    # -------------------------
+    # Reporting
+    # -------------------------
+
+    @property
+    def stall_count(self) -> int:
+        return self._stall_count
+
+    def last_stall(self) -> dict[str, Any] | None:
+        return self._stalls[-1] if self._stalls else None
+
+    def owner_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-owner accounting, busiest (by CPU) first."""
+        uptime = max(1e-9, time.monotonic() - self._started_monotonic)
+        ordered = sorted(self._owners.items(), key=lambda item: item[1].cpu_sec, reverse=True)
+        return {
+            owner: {
+                "runs": stats.runs,
+                "cpu_sec": round(stats.cpu_sec, 6),
+                "wall_sec": round(stats.wall_sec, 6),
+                "cpu_pct": round(stats.cpu_sec / uptime * 100, 3),
+                "max_run_ms": round(stats.max_run_sec * 1000, 3),
+                "stalls": stats.stalls,
+            }
+            for owner, stats in ordered
+        }
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "enabled": self.installed,
+            "slow_callback_ms": self.cfg.slow_callback_sec * 1000,
+            "uptime_sec": round(time.monotonic() - self._started_monotonic, 3) if self.installed else 0.0,
+            "callbacks": self._handle_count,
+            "stall_count": self._stall_count,
+            "owners": self.owner_stats(),
+            "stalls": list(self._stalls),
+        }
+
+    def reset(self) -> None:
+        self._owners.clear()
+        self._stalls.clear()
+        self._stall_count = 0
+        self._handle_count = 0
+        self._started_monotonic = time.monotonic()
+
+    # -------------------------
+    # Sampling profiler
+    # -------------------------
+
+    @property
+    def profiling(self) -> bool:
+        return self._profile_lock.locked()
+
+    async def profile(self, seconds: float, interval_sec: float = 0.005) -> str:
+        """
+        Sample the loop thread for `seconds` and return collapsed stacks (`frame;frame;... count` per line).
+
+        Raises:
+            RuntimeError: If not installed or a profile is already running
+            ValueError: If `seconds` exceeds max_profile_sec
+        """
+        if self._loop_thread_id is None:
+            raise RuntimeError("LoopProfiler is not installed")
+        if seconds > self.cfg.max_profile_sec:
+            raise ValueError(f"seconds must be <= {self.cfg.max_profile_sec}")
+        if self._profile_lock.locked():
+            raise RuntimeError("A profile is already running")
+
+        async with self._profile_lock:
+            logger.info(f"[LoopProfiler] sampling {seconds}s every {interval_sec * 1000:.1f}ms")
+            samples = await asyncio.to_thread(sample_thread, self._loop_thread_id, seconds, interval_sec)
+        return format_collapsed(samples)
@@ -0,0 +1,72 @@
+from core.model.enum.alert_enum import AlertSeverity
+from core.schema.alert_schema import AlertMessageModel
+
+# Most severe first; digests are ordered and titled by this ranking
+SEVERITY_ORDER: tuple[AlertSeverity, ...] = (
+    AlertSeverity.CRITICAL,
+    AlertSeverity.ERROR,
+    AlertSeverity.WARNING,
+    AlertSeverity.INFO,
+    AlertSeverity.RESOLVED,
+)
+
+DIGEST_ALERT_CODE = "DIGEST"
+
+AlertGroups = list[tuple[AlertSeverity, dict[str, list[AlertMessageModel]]]]
+
+
+def device_label(alert: AlertMessageModel) -> str:
+    return f"{alert.device_name} ({alert.model}_{alert.slave_id})"
+
+
+def group_alerts(alerts: list[AlertMessageModel]) -> AlertGroups:
+    """
+    Group alerts by severity (most severe first), then by device (first-seen order).
+    """
+    by_severity: dict[AlertSeverity, dict[str, list[AlertMessageModel]]] = {}
+    for alert in alerts:
+        by_severity.setdefault(alert.level, {}).setdefault(device_label(alert), []).append(alert)
+
+    return [(level, by_severity[level]) for level in SEVERITY_ORDER if level in by_severity]
+
+
+def build_digest_alert(alerts: list[AlertMessageModel]) -> AlertMessageModel:
+    """
+    Collapse several alerts into one AlertMessageModel whose message lists every alert,
+    grouped by severity and device. Used by notifiers without a dedicated digest format.
+    """
+    groups = group_alerts(alerts)
+    lines: list[str] = []
+    for level, devices in groups:
+        lines.append(f"[{level.name}]")
+        for label, device_alerts in devices.items():
+            for message, count in count_messages(device_alerts).items():
+                suffix = f" x{count}" if count > 1 else ""
+                lines.append(f"- {label}: {message}{suffix}")
+
+    top_level = groups[0][0]
+    models = {a.model for a in alerts}
+    device_count = len({device_label(a) for a in alerts})
+    latest = max(alerts, key=lambda a: a.timestamp)
+
+    return AlertMessageModel(
+        model=models.pop() if len(models) == 1 else "MULTI",
+        slave_id=latest.slave_id,
+        level=top_level,
+        message="\n".join(lines),
+        alert_code=DIGEST_ALERT_CODE,
+        timestamp=latest.timestamp,
+        name="digest",
+        device_name=f"{device_count} devices",
+        condition="digest",
+        threshold=0.0,
+        current_value=float(len(alerts)),
+        dashboard_url=latest.dashboard_url,
+    )
+
+
+def count_messages(alerts: list[AlertMessageModel]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    for alert in alerts:
+        counts[alert.message] = counts.get(alert.message, 0) + 1
+    return counts
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from core.schema.alert_schema import AlertMessageModel
+from core.util.notifier.alert_digest import build_digest_alert
 
 
 class BaseNotifier(ABC):
@@ -23,6 +24,16 @@ class BaseNotifier(ABC):
         """
         ...
 
+    async def send_digest(self, alerts: list[AlertMessageModel]) -> bool:
+        """
+        Send several alerts as one message. Default: a synthesized digest alert via send().
+        """
+        return await self.send(build_digest_alert(alerts))
+
+    async def aclose(self) -> None:
+        """Release long-lived resources (connections, sessions). Default: nothing to release."""
+        return None
+
     @property
     def notifier_type(self) -> str:
         """Return notifier type name for logging"""
@@ -0,0 +1,115 @@
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+from core.model.enum.alert_enum import AlertSeverity
+from core.schema.alert_schema import AlertMessageModel
+from core.util.notifier.token_bucket import TokenBucket
+
+DeliverOne = Callable[[AlertMessageModel], Awaitable[bool]]
+DeliverDigest = Callable[[list[AlertMessageModel]], Awaitable[bool]]
+
+
+class NotifierDispatchQueue:
+    """
+    Per-channel dispatch queue that coalesces alerts into digests.
+
+    - Alerts submitted within window_sec of the first pending alert are delivered together:
+      a single alert goes out as-is, several alerts go out as one digest.
+    - A batch is flushed early once max_batch alerts are pending.
+    - Every delivery takes a token from the channel's TokenBucket, so a storm is throttled to
+      the bucket rate; alerts arriving while waiting for a token join the pending batch.
+    - Severities in bypass_severities skip the window and the bucket and are sent immediately.
+
+    submit() resolves to the delivery result of the batch the alert ended up in.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        deliver_one: DeliverOne,
+        deliver_digest: DeliverDigest,
+        *,
+        bucket: TokenBucket,
+        window_sec: float = 10.0,
+        max_batch: int = 50,
+        bypass_severities: frozenset[AlertSeverity] = frozenset({AlertSeverity.CRITICAL}),
+    ):
+        self.name = name
+        self.logger = logging.getLogger("NotifierDispatchQueue")
+        self._deliver_one = deliver_one
+        self._deliver_digest = deliver_digest
+        self.bucket = bucket
+        self.window_sec = max(0.0, float(window_sec))
+        self.max_batch = max(1, int(max_batch))
+        self.bypass_severities = frozenset(bypass_severities)
+
+        self._pending: list[tuple[AlertMessageModel, asyncio.Future]] = []
+        self._batch_full = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._send_lock = asyncio.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    async def submit(self, alert: AlertMessageModel) -> bool:
+        if alert.level in self.bypass_severities:
+            self.bucket.try_acquire()  # counts against the rate, never waits
+            self.logger.info(f"[{self.name.upper()}] {alert.level.name} bypasses digest: {alert.alert_code}")
+            return await self._deliver_one(alert)
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._pending.append((alert, future))
+        if len(self._pending) >= self.max_batch:
+            self._batch_full.set()
+        if self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def aclose(self) -> None:
+        """Cancel the pending flush; alerts still queued resolve as not delivered."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        self._resolve(self._pending, False)
+        self._pending = []
+
+    async def _flush_after_window(self) -> None:
+        try:
+            await asyncio.wait_for(self._batch_full.wait(), timeout=self.window_sec)
+        except asyncio.TimeoutError:
+            pass
+
+        async with self._send_lock:
+            await self.bucket.acquire()
+            batch, self._pending = self._pending[: self.max_batch], self._pending[self.max_batch :]
+            self._batch_full.clear()
+            # Leftovers (storm larger than max_batch) start the next round right away
+            if self._pending:
+                self._batch_full.set()
+                self._flush_task = asyncio.create_task(self._flush_after_window())
+            else:
+                self._flush_task = None
+
+            await self._deliver(batch)
+
+    async def _deliver(self, batch: list[tuple[AlertMessageModel, asyncio.Future]]) -> None:
+        alerts = [alert for alert, _ in batch]
+        try:
+            if len(alerts) == 1:
+                ok = await self._deliver_one(alerts[0])
+            else:
+                self.logger.info(f"[{self.name.upper()}] Sending digest of {len(alerts)} alerts")
+                ok = await self._deliver_digest(alerts)
+        except Exception as e:
+            self.logger.error(f"[{self.name.upper()}] Delivery failed: {e}")
+            ok = False
+        self._resolve(batch, bool(ok))
+
+    @staticmethod
+    def _resolve(batch: list[tuple[AlertMessageModel, asyncio.Future]], ok: bool) -> None:
+        for _, future in batch:
+            if not future.done():
+                future.set_result(ok)
@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import mimetypes
-import smtplib
 from datetime import datetime
 from email.message import EmailMessage
 from email.utils import make_msgid
@@ -9,6 +8,7 @@ from email.utils import make_msgid
 from core.schema.alert_schema import AlertMessageModel
 from core.util.config_manager import ConfigManager
 from core.util.notifier.base import BaseNotifier
+from core.util.notifier.smtp_session import SmtpSessionWorker
 from core.util.time_util import TIMEZONE_INFO
 
 
@@ -28,6 +28,17 @@ class EmailNotifier(BaseNotifier):
 
         self.to_addrs = email_cfg["TO_ADDRESSES"]
 
+        # One long-lived SMTP session shared by all alerts (STARTTLS + login once per session)
+        self.session = SmtpSessionWorker(
+            self.smtp_host,
+            int(self.smtp_port),
+            self.username,
+            self.password,
+            keepalive_sec=float(email_cfg.get("SMTP_KEEPALIVE_SEC", 60)),
+            idle_close_sec=float(email_cfg.get("SMTP_IDLE_CLOSE_SEC", 300)),
+        )
+        self._assets: tuple[str, bytes] | None = None
+
     async def send(self, alert: AlertMessageModel) -> bool:
         if not self.enabled:
             self.logger.debug("[EMAIL] Email notifier is disabled, skipping")
@@ -36,18 +47,32 @@ class EmailNotifier(BaseNotifier):
         self.logger.info(f"[EMAIL] Send Email: [{alert.level}] {alert.model} - {alert.message}")
 
         try:
-            loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self._send_email_sync, alert)
-            self.logger.info(f"[EMAIL] Successfully sent: {alert.alert_code}")
-            return True
+            if self._assets is None:
+                loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+                self._assets = await loop.run_in_executor(None, self._load_assets)
+            msg = self._build_message(alert, *self._assets)
         except Exception as e:
-            self.logger.error(f"[EMAIL] Failed to send: {e}")
+            self.logger.error(f"[EMAIL] Failed to build email: {e}")
             return False
 
-    def _send_email_sync(self, alert: AlertMessageModel):
+        if await self.session.submit(msg):
+            self.logger.info(f"[EMAIL] Successfully sent: {alert.alert_code}")
+            return True
+        self.logger.error(f"[EMAIL] Failed to send: {alert.alert_code}")
+        return False
+
+    async def aclose(self) -> None:
+        await self.session.aclose()
+
+    def _load_assets(self) -> tuple[str, bytes]:
+        """Read template and logo once; they are reused for every message."""
         with open(self.template_path, "r", encoding="utf-8") as f:
             template = f.read()
+        with open(self.logo_path, "rb") as img:
+            logo = img.read()
+        return template, logo
 
+    def _build_message(self, alert: AlertMessageModel, template: str, logo: bytes) -> EmailMessage:
         logo_cid: str = make_msgid(domain="ima-ems.com")[1:-1]
         rendered_html = template.format(
             time=datetime.now(TIMEZONE_INFO).strftime("%Y-%m-%d %H:%M:%S"),
@@ -65,16 +90,6 @@ class EmailNotifier(BaseNotifier):
         msg.set_content("This is an HTML email. Please use an HTML-capable email client.")
         msg.add_alternative(rendered_html, subtype="html")
 
-        with open(self.logo_path, "rb") as img:
-            img_data = img.read()
-            img_type = mimetypes.guess_type(self.logo_path)[0] or "image/png"
-            msg.get_payload()[1].add_related(img_data, maintype="image", subtype=img_type.split("/")[1], cid=logo_cid)
-
-        try:
-            with smtplib.SMTP(self.smtp_host, int(self.smtp_port)) as server:
-                server.starttls()
-                server.login(self.username, self.password)
-                server.send_message(msg)
-            self.logger.info(f"[EMAIL] Successfully sent email for alert: {alert.alert_code}")
-        except Exception as e:
-            self.logger.error(f"[EMAIL] Failed to send email: {e}")
+        img_type = mimetypes.guess_type(self.logo_path)[0] or "image/png"
+        msg.get_payload()[1].add_related(logo, maintype="image", subtype=img_type.split("/")[1], cid=logo_cid)
+        return msg
@@ -0,0 +1,71 @@
+import importlib.util
+import logging
+from urllib.parse import urlsplit
+
+import httpx
+
+logger = logging.getLogger("HttpClientPool")
+
+HTTP2_AVAILABLE: bool = importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    """
+    Long-lived, pooled httpx.AsyncClient instances shared by HTTP-based notifiers.
+
+    One client is kept per endpoint origin (scheme://host:port), so every notifier talking to
+    the same API reuses the same keep-alive connections instead of paying DNS/TCP/TLS setup per
+    alert. HTTP/2 is negotiated only when the optional `h2` package is installed.
+
+    Clients are created lazily on first use and released by aclose(); a closed pool can be
+    reused and will simply open fresh clients.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 10,
+        max_keepalive_connections: int = 5,
+        keepalive_expiry_sec: float = 60.0,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_sec,
+        )
+        self.http2 = bool(http2) and HTTP2_AVAILABLE
+        if http2 and not HTTP2_AVAILABLE:
+            logger.info("[HttpClientPool] 'h2' not installed, using HTTP/1.1 keep-alive")
+
+        self._transport = transport
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    @staticmethod
+    def origin_of(url: str) -> str:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == "https" else 80)
+        return f"{scheme}://{(parts.hostname or '').lower()}:{port}"
+
+    def get(self, url: str) -> httpx.AsyncClient:
+        """Return the shared client for the origin of url, creating it on first use."""
+        origin = self.origin_of(url)
+        client = self._clients.get(origin)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(limits=self.limits, http2=self.http2, transport=self._transport)
+            self._clients[origin] = client
+            logger.debug(f"[HttpClientPool] Opened client for {origin} (http2={self.http2})")
+        return client
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    async def aclose(self) -> None:
+        clients, self._clients = list(self._clients.values()), {}
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning(f"[HttpClientPool] Failed to close client: {e}")
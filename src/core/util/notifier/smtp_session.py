@@ -0,0 +1,162 @@
+import asyncio
+import logging
+import time
+from email.message import EmailMessage
+from typing import Callable
+
+import aiosmtplib
+
+SmtpFactory = Callable[[], aiosmtplib.SMTP]
+
+
+class SmtpSessionWorker:
+    """
+    Single delivery worker that keeps one authenticated SMTP session open.
+
+    - Messages are queued with submit(); the worker drains the queue in batches of up to
+      max_batch messages and sends them back-to-back over the same session, so an alert
+      burst costs one STARTTLS + login instead of one per alert.
+    - While idle, the session is kept alive with NOOP every keepalive_sec and closed after
+      idle_close_sec without traffic (the next message reconnects).
+    - If the server drops the connection mid-batch the worker reconnects once and retries
+      the message before reporting it as failed.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        username: str | None = None,
+        password: str | None = None,
+        *,
+        start_tls: bool = True,
+        timeout_sec: float = 30.0,
+        keepalive_sec: float = 60.0,
+        idle_close_sec: float = 300.0,
+        max_batch: int = 20,
+        smtp_factory: SmtpFactory | None = None,
+    ):
+        self.logger = logging.getLogger("SmtpSessionWorker")
+        self.host = host
+        self.port = int(port)
+        self.keepalive_sec = max(1.0, float(keepalive_sec))
+        self.idle_close_sec = max(self.keepalive_sec, float(idle_close_sec))
+        self.max_batch = max(1, int(max_batch))
+        self._smtp_factory: SmtpFactory = smtp_factory or (
+            lambda: aiosmtplib.SMTP(
+                hostname=host,
+                port=int(port),
+                username=username or None,
+                password=password or None,
+                start_tls=start_tls,
+                timeout=timeout_sec,
+            )
+        )
+
+        self._queue: asyncio.Queue[tuple[EmailMessage, asyncio.Future]] | None = None
+        self._worker_task: asyncio.Task | None = None
+        self._smtp: aiosmtplib.SMTP | None = None
+        self._last_activity = 0.0
+
+    @property
+    def is_connected(self) -> bool:
+        return self._smtp is not None and self._smtp.is_connected
+
+    async def submit(self, message: EmailMessage) -> bool:
+        """Queue a message for delivery and wait for its result."""
+        if self._worker_task is None or self._worker_task.done():
+            self._queue = asyncio.Queue()
+            self._worker_task = asyncio.create_task(self._run())
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((message, future))
+        return await future
+
+    async def aclose(self) -> None:
+        if self._worker_task is not None:
+            self._worker_task.cancel()
+            await asyncio.gather(self._worker_task, return_exceptions=True)
+            self._worker_task = None
+
+        if self._queue is not None:
+            while not self._queue.empty():
+                _, future = self._queue.get_nowait()
+                if not future.done():
+                    future.set_result(False)
+        await self._disconnect()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                first = await asyncio.wait_for(self._queue.get(), timeout=self.keepalive_sec)
+            except asyncio.TimeoutError:
+                await self._on_idle()
+                continue
+
+            batch = [first]
+            while len(batch) < self.max_batch and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            sent = 0
+            try:
+                for message, future in batch:
+                    ok = await self._send_with_reconnect(message)
+                    sent += ok
+                    if not future.done():
+                        future.set_result(ok)
+            finally:
+                # Cancelled mid-batch (aclose): unsent messages fail instead of leaving submitters waiting
+                for _, future in batch:
+                    if not future.done():
+                        future.set_result(False)
+            self.logger.debug(f"[SMTP] Session batch: {sent}/{len(batch)} sent")
+
+    async def _send_with_reconnect(self, message: EmailMessage) -> bool:
+        for attempt in range(2):
+            try:
+                await self._ensure_connected()
+                await self._smtp.send_message(message)
+                self._last_activity = time.monotonic()
+                return True
+            except (aiosmtplib.SMTPServerDisconnected, aiosmtplib.SMTPConnectError, ConnectionError) as e:
+                self.logger.warning(f"[SMTP] Session lost ({e}), reconnecting (attempt {attempt + 1})")
+                await self._disconnect()
+            except Exception as e:
+                self.logger.error(f"[SMTP] Failed to send message: {e}")
+                return False
+        return False
+
+    async def _ensure_connected(self) -> None:
+        if self.is_connected:
+            return
+        await self._disconnect()
+        smtp = self._smtp_factory()
+        await smtp.connect()  # STARTTLS + login happen here when configured
+        self._smtp = smtp
+        self._last_activity = time.monotonic()
+        self.logger.info(f"[SMTP] Session opened to {self.host}:{self.port}")
+
+    async def _on_idle(self) -> None:
+        if not self.is_connected:
+            return
+
+        if time.monotonic() - self._last_activity >= self.idle_close_sec:
+            self.logger.info("[SMTP] Closing idle session")
+            await self._disconnect()
+            return
+
+        try:
+            await self._smtp.noop()
+        except Exception as e:
+            self.logger.warning(f"[SMTP] NOOP keep-alive failed ({e}), session will reconnect on next message")
+            await self._disconnect()
+
+    async def _disconnect(self) -> None:
+        smtp, self._smtp = self._smtp, None
+        if smtp is None:
+            return
+        try:
+            if smtp.is_connected:
+                await smtp.quit()
+        except Exception:
+            smtp.close()
@@ -1,5 +1,7 @@
 from core.schema.alert_schema import AlertMessageModel
 from core.util.locale_manager import LocaleManager
+from core.util.notifier.alert_digest import count_messages, group_alerts
+from core.util.notifier.http_client_pool import HttpClientPool
 from core.util.notifier.webhook_notifier import WebhookNotifier
 
 
@@ -18,6 +20,7 @@ class TelegramNotifier(WebhookNotifier):
         timeout_sec: float = 5.0,
         parse_mode: str = "HTML",
         locale: str = "zh_TW",
+        client_pool: HttpClientPool | None = None,
     ):
         # Build Telegram API URL
         api_url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
@@ -28,6 +31,7 @@ class TelegramNotifier(WebhookNotifier):
             enabled=enabled,
             timeout_sec=timeout_sec,
             platform="telegram",
+            client_pool=client_pool,
         )
         self.chat_id = chat_id
         self.parse_mode = parse_mode
@@ -47,6 +51,48 @@ class TelegramNotifier(WebhookNotifier):
             "parse_mode": self.parse_mode,
         }
 
+    def _build_digest_payload(self, alerts: list[AlertMessageModel]) -> dict:
+        """Build one Telegram message listing all alerts, grouped by severity and device"""
+        return {
+            "chat_id": self.chat_id,
+            "text": self._format_digest(alerts),
+            "parse_mode": self.parse_mode,
+        }
+
+    def _format_digest(self, alerts: list[AlertMessageModel]) -> str:
+        """Format a digest using the locale's level names and emojis"""
+        locale_config = self.locale_manager.get_locale(self.locale)
+        labels = locale_config.field_labels
+        groups = group_alerts(alerts)
+
+        top_level = groups[0][0].name
+        emoji = locale_config.level_emojis.get(top_level, "⚪")
+        first = min(a.timestamp for a in alerts).strftime("%H:%M:%S")
+        last = max(a.timestamp for a in alerts).strftime("%H:%M:%S")
+
+        message_parts = [f"{emoji} <b>{len(alerts)} alerts</b> ({first} - {last})"]
+
+        for level, devices in groups:
+            level_text = locale_config.level_names.get(level.name, level.name)
+            level_emoji = locale_config.level_emojis.get(level.name, "⚪")
+            count = sum(len(device_alerts) for device_alerts in devices.values())
+            message_parts.append(f"\n{level_emoji} <b>{level_text}</b> ({count})")
+
+            for device_alerts in devices.values():
+                sample = device_alerts[0]
+                device_info = f"{sample.device_name} <code>({sample.model}_{sample.slave_id})</code>"
+                for message, repeat in count_messages(device_alerts).items():
+                    suffix = f" ×{repeat}" if repeat > 1 else ""
+                    message_parts.append(f"• {device_info}: {message}{suffix}")
+
+        dashboard_url = next((a.dashboard_url for a in reversed(alerts) if a.dashboard_url), None)
+        if dashboard_url:
+            message_parts.append(
+                f"\n<b>{labels.get('dashboard_link', 'Dashboard')}:</b> <a href='{dashboard_url}'>Open Dashboard</a>"
+            )
+
+        return "\n".join(message_parts)
+
     def _format_message(self, alert: AlertMessageModel) -> str:
         """Format message using locale template"""
 
@@ -0,0 +1,38 @@
+import asyncio
+import time
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter for a single notification channel.
+
+    Holds up to `burst` tokens and refills at rate_per_min / 60 tokens per second.
+    acquire() waits until a token is available; try_acquire() never waits.
+    """
+
+    def __init__(self, rate_per_min: float, burst: int = 1):
+        self.rate_per_sec = max(float(rate_per_min), 1e-6) / 60.0
+        self.burst = max(1, int(burst))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def try_acquire(self) -> bool:
+        self._refill()
+        if self._tokens >= 1.0:
+            self._tokens -= 1.0
+            return True
+        return False
+
+    async def acquire(self) -> None:
+        while not self.try_acquire():
+            await asyncio.sleep((1.0 - self._tokens) / self.rate_per_sec)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_sec)
+        self._updated = now
@@ -4,13 +4,18 @@ from abc import abstractmethod
 import httpx
 
 from core.schema.alert_schema import AlertMessageModel
+from core.util.notifier.alert_digest import build_digest_alert
 from core.util.notifier.base import BaseNotifier
+from core.util.notifier.http_client_pool import HttpClientPool
 
 
 class WebhookNotifier(BaseNotifier):
     """
     Abstract base class for webhook-based notifiers.
     Handles common HTTP logic, subclasses implement platform-specific payload building.
+
+    Requests go through a shared HttpClientPool so connections are kept alive across alerts.
+    When no pool is injected the notifier owns a private one and closes it in aclose().
     """
 
     def __init__(
@@ -20,14 +25,39 @@ class WebhookNotifier(BaseNotifier):
         enabled: bool = True,
         timeout_sec: float = 5.0,
         platform: str = "generic",
+        client_pool: HttpClientPool | None = None,
     ):
         super().__init__(priority=priority, enabled=enabled)
         self.logger = logging.getLogger(self.__class__.__name__)
         self.url = url
         self.timeout_sec = timeout_sec
         self.platform = platform
+        self._owns_pool = client_pool is None
+        self.client_pool = client_pool if client_pool is not None else HttpClientPool()
 
     async def send(self, alert: AlertMessageModel) -> bool:
+        if not self._can_send():
+            return False
+
+        try:
+            payload = self._build_payload(alert)
+        except Exception as e:
+            self.logger.error(f"[{self.platform.upper()}] Failed to build payload: {e}")
+            return False
+        return await self._post(payload, alert.alert_code)
+
+    async def send_digest(self, alerts: list[AlertMessageModel]) -> bool:
+        if not self._can_send():
+            return False
+
+        try:
+            payload = self._build_digest_payload(alerts)
+        except Exception as e:
+            self.logger.error(f"[{self.platform.upper()}] Failed to build digest payload: {e}")
+            return False
+        return await self._post(payload, f"digest of {len(alerts)} alerts")
+
+    def _can_send(self) -> bool:
         if not self.enabled:
             self.logger.debug(f"[{self.platform.upper()}] Notifier is disabled, skipping")
             return False
@@ -35,22 +65,23 @@ class WebhookNotifier(BaseNotifier):
         if not self.url:
             self.logger.warning(f"[{self.platform.upper()}] URL not configured, skipping")
             return False
+        return True
 
+    async def _post(self, payload: dict, label: str) -> bool:
         try:
-            payload = self._build_payload(alert)
             headers = self._get_headers()
 
-            async with httpx.AsyncClient(timeout=self.timeout_sec) as client:
-                response = await client.post(self.url, json=payload, headers=headers)
+            client = self.client_pool.get(self.url)
+            response = await client.post(self.url, json=payload, headers=headers, timeout=self.timeout_sec)
 
-                if self._is_success(response):
-                    self.logger.info(f"[{self.platform.upper()}] Successfully sent: {alert.alert_code}")
-                    return True
-                else:
-                    self.logger.warning(
-                        f"[{self.platform.upper()}] Failed with status {response.status_code}: {response.text[:200]}"
-                    )
-                    return False
+            if self._is_success(response):
+                self.logger.info(f"[{self.platform.upper()}] Successfully sent: {label}")
+                return True
+            else:
+                self.logger.warning(
+                    f"[{self.platform.upper()}] Failed with status {response.status_code}: {response.text[:200]}"
+                )
+                return False
 
         except httpx.TimeoutException:
             self.logger.error(f"[{self.platform.upper()}] Timeout after {self.timeout_sec}s")
@@ -59,6 +90,10 @@ class WebhookNotifier(BaseNotifier):
             self.logger.error(f"[{self.platform.upper()}] Failed to send: {e}")
             return False
 
+    async def aclose(self) -> None:
+        if self._owns_pool:
+            await self.client_pool.aclose()
+
     @abstractmethod
     def _build_payload(self, alert: AlertMessageModel) -> dict:
         """
@@ -67,6 +102,12 @@ class WebhookNotifier(BaseNotifier):
         """
         ...
 
+    def _build_digest_payload(self, alerts: list[AlertMessageModel]) -> dict:
+        """
+        Build the payload for a digest of several alerts. Can be overridden by subclasses.
+        """
+        return self._build_payload(build_digest_alert(alerts))
+
     def _get_headers(self) -> dict:
         """
         Get HTTP headers. Can be overridden by subclasses.
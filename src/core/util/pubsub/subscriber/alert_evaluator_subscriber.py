@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 
@@ -37,20 +38,31 @@ class AlertEvaluatorSubscriber:
             )
 
     async def run(self):
-        async for message in self.pubsub.subscribe(PubSubTopic.SNAPSHOT_ALLOWED):
-            try:
-                model: str = message["model"]
-                slave_id: str = message["slave_id"]
-                snapshot: dict = message["values"]
-                device_id = f"{model}_{slave_id}"
-
-                if self._use_aggregation:
-                    await self._handle_with_aggregation(model, slave_id, device_id, snapshot)
-                else:
-                    await self._handle_direct(model, slave_id, device_id, snapshot)
-
-            except Exception as e:
-                self.logger.error(f"{__class__.__name__} failed: {e}", exc_info=True)
+        persistence_task: asyncio.Task | None = None
+        if self.evaluator.state_manager.is_persistent:
+            persistence_task = asyncio.create_task(
+                self.evaluator.state_manager.run_persistence_loop(), name="alert:state_persistence"
+            )
+
+        try:
+            async for message in self.pubsub.subscribe(PubSubTopic.SNAPSHOT_ALLOWED):
+                try:
+                    model: str = message["model"]
+                    slave_id: str = message["slave_id"]
+                    snapshot: dict = message["values"]
+                    device_id = f"{model}_{slave_id}"
+
+                    if self._use_aggregation:
+                        await self._handle_with_aggregation(model, slave_id, device_id, snapshot)
+                    else:
+                        await self._handle_direct(model, slave_id, device_id, snapshot)
+
+                except Exception as e:
+                    self.logger.error(f"{__class__.__name__} failed: {e}", exc_info=True)
+        finally:
+            if persistence_task is not None:
+                persistence_task.cancel()
+                await asyncio.gather(persistence_task, return_exceptions=True)
 
     async def _handle_with_aggregation(
         self, model: str, slave_id: str, device_id: str, snapshot: dict[str, float]
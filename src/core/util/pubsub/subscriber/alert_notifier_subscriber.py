@@ -1,10 +1,13 @@
 import asyncio
 import logging
+from typing import Awaitable, Callable
 
 from core.model.enum.alert_enum import AlertSeverity
 from core.schema.alert_schema import AlertMessageModel
 from core.schema.notifier_schema import NotificationConfigSchema, NotificationMode, RetryConfigSchema
 from core.util.notifier.base import BaseNotifier
+from core.util.notifier.dispatch_queue import NotifierDispatchQueue
+from core.util.notifier.token_bucket import TokenBucket
 from core.util.pubsub.base import PubSub
 from core.util.pubsub.pubsub_topic import PubSubTopic
 
@@ -28,9 +31,34 @@ class AlertNotifierSubscriber:
             notifier.notifier_type.lower().replace("notifier", ""): notifier for notifier in notifier_list
         }
 
+        # Per-channel digest queues (empty when digest is disabled)
+        self.dispatch_queues: dict[str, NotifierDispatchQueue] = self._build_dispatch_queues()
+        self._inflight: set[asyncio.Task] = set()
+
         # Log routing configuration
         self._log_routing_config()
 
+    def _build_dispatch_queues(self) -> dict[str, NotifierDispatchQueue]:
+        digest = self.config.digest
+        if not digest.enabled:
+            return {}
+
+        queues: dict[str, NotifierDispatchQueue] = {}
+        for name, notifier in self.notifiers_by_type.items():
+            channel_cfg = getattr(self.config.notifiers, name, None)
+            rate_per_min = getattr(channel_cfg, "rate_per_min", 10.0)
+            burst = getattr(channel_cfg, "burst", 3)
+            queues[name] = NotifierDispatchQueue(
+                name,
+                deliver_one=lambda alert, n=notifier: self._send_with_retry(n, alert),
+                deliver_digest=lambda alerts, n=notifier: self._send_digest_with_retry(n, alerts),
+                bucket=TokenBucket(rate_per_min, burst),
+                window_sec=digest.window_sec,
+                max_batch=digest.max_batch,
+                bypass_severities=frozenset(digest.bypass_severities),
+            )
+        return queues
+
     def _log_routing_config(self):
         """Log routing configuration for debugging"""
         self.logger.info("Notification Routing Rules:")
@@ -41,12 +69,26 @@ class AlertNotifierSubscriber:
             )
 
     async def run(self):
-        async for alert in self.pubsub.subscribe(PubSubTopic.ALERT_WARNING):
-            if not isinstance(alert, AlertMessageModel):
-                self.logger.warning(f"[SKIP] Invalid alert object: {alert}")
-                continue
-
-            await self._route_and_send(alert)
+        try:
+            async for alert in self.pubsub.subscribe(PubSubTopic.ALERT_WARNING):
+                if not isinstance(alert, AlertMessageModel):
+                    self.logger.warning(f"[SKIP] Invalid alert object: {alert}")
+                    continue
+
+                if not self.dispatch_queues:
+                    await self._route_and_send(alert)
+                    continue
+
+                # Route concurrently so alerts of a storm can meet in the same digest window
+                task = asyncio.create_task(self._route_and_send(alert))
+                self._inflight.add(task)
+                task.add_done_callback(self._inflight.discard)
+        finally:
+            for task in list(self._inflight):
+                task.cancel()
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+            for queue in self.dispatch_queues.values():
+                await queue.aclose()
 
     async def _route_and_send(self, alert: AlertMessageModel):
         """Route alert based on severity"""
@@ -90,7 +132,7 @@ class AlertNotifierSubscriber:
         min_success: int,
     ):
         """Broadcast to all notifiers"""
-        tasks = [self._send_with_retry(n, alert) for n in notifiers]
+        tasks = [self._dispatch(n, alert) for n in notifiers]
         results = await asyncio.gather(*tasks, return_exceptions=True)
 
         success_count = sum(1 for r in results if r is True)
@@ -107,7 +149,7 @@ class AlertNotifierSubscriber:
     ):
         """Fallback chain"""
         for notifier in notifiers:
-            success = await self._send_with_retry(notifier, alert)
+            success = await self._dispatch(notifier, alert)
             if success:
                 self.logger.info(f"[FALLBACK] via {notifier.notifier_type}")
                 return
@@ -121,17 +163,31 @@ class AlertNotifierSubscriber:
     ):
         """Send to first notifier only"""
         if notifiers:
-            success: bool = await self._send_with_retry(notifiers[0], alert)
+            success: bool = await self._dispatch(notifiers[0], alert)
             status: str = "SUCCESS" if success else "FAILURE"
             self.logger.info(f"[SINGLE] {status} via {notifiers[0].notifier_type}")
 
+    async def _dispatch(self, notifier: BaseNotifier, alert: AlertMessageModel) -> bool:
+        """Send through the notifier's digest queue, or directly when digest is disabled"""
+        queue = self.dispatch_queues.get(notifier.notifier_type.lower().replace("notifier", ""))
+        if queue is None:
+            return await self._send_with_retry(notifier, alert)
+        return await queue.submit(alert)
+
     async def _send_with_retry(self, notifier: BaseNotifier, alert: AlertMessageModel) -> bool:
         """Send with retry (using config schema)"""
+        return await self._retry(notifier, lambda: notifier.send(alert))
+
+    async def _send_digest_with_retry(self, notifier: BaseNotifier, alerts: list[AlertMessageModel]) -> bool:
+        """Send a digest with retry (using config schema)"""
+        return await self._retry(notifier, lambda: notifier.send_digest(alerts))
+
+    async def _retry(self, notifier: BaseNotifier, attempt_send: Callable[[], Awaitable[bool]]) -> bool:
         retry_config: RetryConfigSchema = self.config.retry
 
         for attempt in range(retry_config.max_attempts):
             try:
-                success = await notifier.send(alert)
+                success = await attempt_send()
                 if success:
                     return True
 
@@ -53,6 +53,9 @@ class ControlSubscriber:
 
                 device_id = f"{model}_{slave_id}"
 
+                # Latest raw values back the executor's redundant-write checks
+                self.executor.update_snapshot(device_id, snapshot)
+
                 if self._use_aggregation:
                     await self._handle_with_aggregation(model, slave_id, device_id, snapshot)
                 else:
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 
 from core.handler.time_control_handler import TimeControlHandler
@@ -13,5 +14,12 @@ class TimeControlSubscriber:
         self.handler = time_control_handler
 
     async def run(self):
-        async for snapshot in self.pubsub.subscribe(PubSubTopic.DEVICE_SNAPSHOT):
-            await self.handler.handle_snapshot(snapshot)
+        scheduler_task = asyncio.create_task(
+            self.handler.run_transition_scheduler(), name="time_control:transition_scheduler"
+        )
+        try:
+            async for snapshot in self.pubsub.subscribe(PubSubTopic.DEVICE_SNAPSHOT):
+                await self.handler.handle_snapshot(snapshot)
+        finally:
+            scheduler_task.cancel()
+            await asyncio.gather(scheduler_task, return_exceptions=True)
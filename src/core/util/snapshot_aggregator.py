@@ -1,41 +1,97 @@
+import atexit
 import json
 import logging
 import math
-from collections import deque
+import queue
+from array import array
 from datetime import datetime
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 
 from core.util.time_util import TIMEZONE_INFO
 
+try:
+    import numpy as np
+except ImportError:  # Optional: fall back to array('d') buffers
+    np = None
+
 logger = logging.getLogger(__name__)
 
-_outlier_file_handler_cache: dict[str, RotatingFileHandler] = {}
+_NAN = float("nan")
+
+_outlier_listener_cache: dict[str, QueueListener] = {}
+
+
+class _OutlierQueueHandler(QueueHandler):
+    """Enqueue records untouched; formatting happens on the listener thread."""
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+class _JsonLineFormatter(logging.Formatter):
+    """Serialize dict messages as one JSON line (runs on the listener thread)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        if isinstance(record.msg, dict):
+            return json.dumps(record.msg)
+        return super().format(record)
 
 
 def _get_outlier_file_logger(log_path: str) -> logging.Logger:
-    """Return a dedicated logger for the outlier file, created once per path."""
+    """
+    Return a dedicated logger for the outlier file, created once per path.
+
+    Records are put on an in-memory queue and written by a QueueListener thread,
+    so the aggregation path never blocks on file I/O or log rotation.
+    """
     logger_name = f"outlier_file:{log_path}"
     outlier_logger = logging.getLogger(logger_name)
 
-    if log_path not in _outlier_file_handler_cache:
-        handler = RotatingFileHandler(
+    if log_path not in _outlier_listener_cache:
+        file_handler = RotatingFileHandler(
             log_path,
             maxBytes=10 * 1024 * 1024,  # 10 MB
             backupCount=5,
             encoding="utf-8",
         )
-        handler.setFormatter(logging.Formatter("%(message)s"))
-        outlier_logger.addHandler(handler)
+        file_handler.setFormatter(_JsonLineFormatter("%(message)s"))
+
+        record_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = QueueListener(record_queue, file_handler)
+        listener.start()
+
+        outlier_logger.addHandler(_OutlierQueueHandler(record_queue))
         outlier_logger.setLevel(logging.INFO)
         outlier_logger.propagate = False
-        _outlier_file_handler_cache[log_path] = handler
+        _outlier_listener_cache[log_path] = listener
 
     return outlier_logger
 
 
-def _percentile(values: list[float], percentage: float) -> float:
-    """Calculate the p-th percentile using linear interpolation (no numpy required)."""
-    sorted_values = sorted(values)
+def flush_outlier_log(log_path: str) -> None:
+    """Block until every queued outlier record for *log_path* has been written."""
+    listener = _outlier_listener_cache.get(log_path)
+    if listener is None:
+        return
+    listener.stop()  # Drains the queue and joins the writer thread
+    listener.start()
+
+
+@atexit.register
+def _stop_outlier_listeners() -> None:
+    for listener in _outlier_listener_cache.values():
+        try:
+            listener.stop()
+        except Exception:
+            pass
+
+
+def _quartiles(sorted_values: list[float]) -> tuple[float, float]:
+    """Return (Q1, Q3) of already sorted values using linear interpolation (no numpy required)."""
+    return _percentile_sorted(sorted_values, 25), _percentile_sorted(sorted_values, 75)
+
+
+def _percentile_sorted(sorted_values: list[float], percentage: float) -> float:
     total_count = len(sorted_values)
 
     index = (total_count - 1) * percentage / 100.0
@@ -49,6 +105,115 @@ def _percentile(values: list[float], percentage: float) -> float:
     return sorted_values[lower_bound_index] * (1.0 - fraction) + sorted_values[upper_bound_index] * fraction
 
 
+def _to_float(value) -> float:
+    """Coerce a snapshot value to float; non-numeric values count as missing (NaN)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return _NAN
+
+
+class _SampleBuffer:
+    """
+    Fixed-capacity ring buffer of samples × params.
+
+    Storage is a 2-D NumPy array when available, otherwise a row-major array('d').
+    Parameters missing from a sample are stored as NaN. Columns are added on the
+    first sample that carries a new parameter name.
+    """
+
+    def __init__(self, capacity: int, use_numpy: bool) -> None:
+        self.capacity = capacity
+        self.use_numpy = use_numpy
+
+        self.param_index: dict[str, int] = {}
+        self.param_names: list[str] = []
+        self.timestamps: list[str] = [""] * capacity
+        self.count = 0
+        self._head = 0  # next row to write
+        self._width = 0  # allocated columns
+
+        if use_numpy:
+            self._data = np.empty((capacity, 0), dtype=np.float64)
+        else:
+            self._data = array("d")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def push(self, snapshot: dict[str, float], timestamp: str) -> None:
+        for name in snapshot:
+            if name not in self.param_index:
+                self._add_param(name)
+
+        row = self._head
+        width = self._width
+        index = self.param_index
+
+        if self.use_numpy:
+            row_view = self._data[row]
+            row_view.fill(_NAN)
+            for name, value in snapshot.items():
+                row_view[index[name]] = _to_float(value)
+        else:
+            data = self._data
+            base = row * width
+            for column in range(width):
+                data[base + column] = _NAN
+            for name, value in snapshot.items():
+                data[base + index[name]] = _to_float(value)
+
+        self.timestamps[row] = timestamp
+        self._head = (row + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def ordered_rows(self) -> list[int]:
+        """Physical row indices from oldest to newest."""
+        if self.count < self.capacity:
+            return list(range(self.count))
+        return list(range(self._head, self.capacity)) + list(range(0, self._head))
+
+    def block(self):
+        """Chronological (samples × params) NumPy view (NumPy backend only)."""
+        n_params = len(self.param_names)
+        if self.count < self.capacity:
+            return self._data[: self.count, :n_params]
+        return np.roll(self._data[:, :n_params], -self._head, axis=0)
+
+    def column(self, column: int, rows: list[int]) -> tuple[list[float], list[str]]:
+        """Present values of one parameter and their timestamps (array backend)."""
+        data, width, timestamps = self._data, self._width, self.timestamps
+        values: list[float] = []
+        value_timestamps: list[str] = []
+        for row in rows:
+            value = data[row * width + column]
+            if value == value:  # skip NaN (missing)
+                values.append(value)
+                value_timestamps.append(timestamps[row])
+        return values, value_timestamps
+
+    def _add_param(self, name: str) -> None:
+        column = len(self.param_names)
+        self.param_index[name] = column
+        self.param_names.append(name)
+
+        if column < self._width:
+            return
+
+        new_width = max(8, self._width * 2)
+        if self.use_numpy:
+            grown = np.full((self.capacity, new_width), _NAN, dtype=np.float64)
+            grown[:, : self._width] = self._data
+            self._data = grown
+        else:
+            grown = array("d", [_NAN]) * (self.capacity * new_width)
+            old, old_width = self._data, self._width
+            for row in range(self.capacity):
+                grown[row * new_width : row * new_width + old_width] = old[row * old_width : (row + 1) * old_width]
+            self._data = grown
+        self._width = new_width
+
+
 class SnapshotAggregator:
     """
     Per-device rolling buffer with IQR-based outlier filtering and mean aggregation.
@@ -57,6 +222,10 @@ class SnapshotAggregator:
 
     Buffer capacity is auto-calculated: max_capacity = ceil(eval_interval / monitor_interval).
     After each successful evaluation the caller must call clear(device_id).
+
+    Buffers are array-backed (samples × params). With NumPy the IQR fences and means
+    of all parameters are computed in one vectorized pass; otherwise each parameter
+    is sorted once for both quartiles.
     """
 
     def __init__(
@@ -64,13 +233,15 @@ class SnapshotAggregator:
         monitor_interval: float,
         eval_interval: float,
         outlier_log_path: str = "logs/outlier.log",
+        use_numpy: bool | None = None,
     ) -> None:
         self.monitor_interval = monitor_interval
         self.eval_interval = eval_interval
         self._max_capacity: int = math.ceil(eval_interval / monitor_interval)
+        self._use_numpy: bool = (np is not None) if use_numpy is None else (use_numpy and np is not None)
 
-        # device_id -> deque of (snapshot_dict, iso_timestamp)
-        self._device_snapshots: dict[str, deque[tuple[dict[str, float], str]]] = {}
+        # device_id -> ring buffer of samples
+        self._device_buffers: dict[str, _SampleBuffer] = {}
 
         self._outlier_log_path = outlier_log_path
         self._outlier_file_logger = _get_outlier_file_logger(outlier_log_path)
@@ -90,11 +261,13 @@ class SnapshotAggregator:
         timestamp: str | None = None,
     ) -> None:
         """Push a snapshot into the rolling buffer for *device_id*."""
-        if device_id not in self._device_snapshots:
-            self._device_snapshots[device_id] = deque(maxlen=self._max_capacity)
+        buffer = self._device_buffers.get(device_id)
+        if buffer is None:
+            buffer = _SampleBuffer(self._max_capacity, self._use_numpy)
+            self._device_buffers[device_id] = buffer
 
         current_timestamp = timestamp or datetime.now(TIMEZONE_INFO).isoformat()
-        self._device_snapshots[device_id].append((snapshot, current_timestamp))
+        buffer.push(snapshot, current_timestamp)
 
     def aggregate(self, device_id: str) -> dict[str, float] | None:
         """
@@ -104,25 +277,18 @@ class SnapshotAggregator:
             Aggregated snapshot dict, or None when evaluation should be skipped
             (all values for at least one parameter were outliers).
         """
-        snapshot_entries = list(self._device_snapshots.get(device_id, []))
-        if not snapshot_entries:
+        buffer = self._device_buffers.get(device_id)
+        if buffer is None or not len(buffer):
             return None
 
-        # Collect all unique parameter names
-        unique_parameters: set[str] = set()
-        for snapshot, _ in snapshot_entries:
-            unique_parameters.update(snapshot.keys())
+        if self._use_numpy:
+            return self._aggregate_vectorized(buffer, device_id)
 
         aggregated_result: dict[str, float] = {}
+        rows = buffer.ordered_rows()
 
-        for parameter_name in unique_parameters:
-            parameter_values: list[float] = []
-            recorded_timestamps: list[str] = []
-
-            for snapshot, timestamp in snapshot_entries:
-                if parameter_name in snapshot:
-                    parameter_values.append(snapshot[parameter_name])
-                    recorded_timestamps.append(timestamp)
+        for column, parameter_name in enumerate(buffer.param_names):
+            parameter_values, recorded_timestamps = buffer.column(column, rows)
 
             if not parameter_values:
                 continue
@@ -134,11 +300,7 @@ class SnapshotAggregator:
                 filtered_values = self._iqr_filter(parameter_values, recorded_timestamps, device_id, parameter_name)
 
                 if not filtered_values:
-                    # All values were outliers – skip entire evaluation
-                    logger.warning(
-                        f"[Aggregation] device_id={device_id} parameter={parameter_name} "
-                        "all values were outliers, evaluation skipped"
-                    )
+                    self._warn_all_outliers(device_id, parameter_name)
                     return None
 
                 aggregated_result[parameter_name] = sum(filtered_values) / len(filtered_values)
@@ -147,16 +309,73 @@ class SnapshotAggregator:
 
     def clear(self, device_id: str) -> None:
         """Clear the rolling buffer for *device_id* after evaluation."""
-        self._device_snapshots.pop(device_id, None)
+        self._device_buffers.pop(device_id, None)
 
     def buffer_size(self, device_id: str) -> int:
         """Return the current number of buffered snapshots for *device_id*."""
-        return len(self._device_snapshots.get(device_id, []))
+        buffer = self._device_buffers.get(device_id)
+        return len(buffer) if buffer is not None else 0
+
+    def flush_outlier_log(self) -> None:
+        """Wait until queued outlier records are written to the outlier file."""
+        flush_outlier_log(self._outlier_log_path)
 
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
 
+    def _aggregate_vectorized(self, buffer: _SampleBuffer, device_id: str) -> dict[str, float] | None:
+        """IQR-filtered mean of every parameter in one pass over the samples × params block."""
+        block = buffer.block()
+        present = ~np.isnan(block)
+        counts = present.sum(axis=0)
+
+        # NaN sorts last, so the first `counts[j]` entries of each sorted column are its values
+        sorted_block = np.sort(block, axis=0)
+        positions = np.stack([(counts - 1) * 0.25, (counts - 1) * 0.75]).clip(min=0)
+        lower_index = positions.astype(np.intp)
+        upper_index = np.minimum(lower_index + 1, np.maximum(counts - 1, 0))
+        fraction = positions - lower_index
+        lower_values = np.take_along_axis(sorted_block, lower_index, axis=0)
+        upper_values = np.take_along_axis(sorted_block, upper_index, axis=0)
+        first_quartile, third_quartile = lower_values + (upper_values - lower_values) * fraction
+
+        interquartile_range = third_quartile - first_quartile
+        lower_fence = first_quartile - 1.5 * interquartile_range
+        upper_fence = third_quartile + 1.5 * interquartile_range
+
+        # Fewer than 3 samples: no IQR filtering (plain mean)
+        filter_columns = counts >= 3
+        with np.errstate(invalid="ignore"):
+            in_fence = (block >= lower_fence) & (block <= upper_fence)
+        keep = present & (in_fence | ~filter_columns)
+        kept_counts = keep.sum(axis=0)
+
+        all_outliers = (counts > 0) & (kept_counts == 0)
+        if all_outliers.any():
+            self._warn_all_outliers(device_id, buffer.param_names[int(np.argmax(all_outliers))])
+            return None
+
+        outlier_rows, outlier_columns = np.nonzero(present & ~keep)
+        if outlier_rows.size:
+            ordered_timestamps = [buffer.timestamps[row] for row in buffer.ordered_rows()]
+            for row, column in zip(outlier_rows.tolist(), outlier_columns.tolist()):
+                self._record_outlier(
+                    device_id=device_id,
+                    parameter_name=buffer.param_names[column],
+                    value=float(block[row, column]),
+                    timestamp=ordered_timestamps[row],
+                    first_quartile=float(first_quartile[column]),
+                    third_quartile=float(third_quartile[column]),
+                    lower_fence=float(lower_fence[column]),
+                    upper_fence=float(upper_fence[column]),
+                )
+
+        means = np.where(keep, block, 0.0).sum(axis=0) / np.maximum(kept_counts, 1)
+        return {
+            name: float(mean) for name, mean, count in zip(buffer.param_names, means.tolist(), counts.tolist()) if count
+        }
+
     def _iqr_filter(
         self,
         values: list[float],
@@ -172,8 +391,7 @@ class SnapshotAggregator:
 
         Returns the list of non-outlier values.
         """
-        first_quartile = _percentile(values, 25)
-        third_quartile = _percentile(values, 75)
+        first_quartile, third_quartile = _quartiles(sorted(values))
         interquartile_range = third_quartile - first_quartile
 
         lower_fence = first_quartile - 1.5 * interquartile_range
@@ -185,22 +403,52 @@ class SnapshotAggregator:
             if lower_fence <= value <= upper_fence:
                 filtered_values.append(value)
             else:
-                # journalctl WARNING
-                logger.warning(
-                    f"[Outlier] device_id={device_id} parameter={parameter_name} "
-                    f"value={value:.4f} timestamp={timestamp} excluded from aggregation"
+                self._record_outlier(
+                    device_id=device_id,
+                    parameter_name=parameter_name,
+                    value=value,
+                    timestamp=timestamp,
+                    first_quartile=first_quartile,
+                    third_quartile=third_quartile,
+                    lower_fence=lower_fence,
+                    upper_fence=upper_fence,
                 )
-                # Dedicated outlier log file (JSON per line)
-                outlier_record = {
-                    "timestamp": timestamp,
-                    "device_id": device_id,
-                    "parameter": parameter_name,
-                    "value": value,
-                    "q1": first_quartile,
-                    "q3": third_quartile,
-                    "iqr_lower": lower_fence,
-                    "iqr_upper": upper_fence,
-                }
-                self._outlier_file_logger.info(json.dumps(outlier_record))
 
         return filtered_values
+
+    def _record_outlier(
+        self,
+        device_id: str,
+        parameter_name: str,
+        value: float,
+        timestamp: str,
+        first_quartile: float,
+        third_quartile: float,
+        lower_fence: float,
+        upper_fence: float,
+    ) -> None:
+        # journalctl WARNING
+        logger.warning(
+            f"[Outlier] device_id={device_id} parameter={parameter_name} "
+            f"value={value:.4f} timestamp={timestamp} excluded from aggregation"
+        )
+        # Dedicated outlier log file (JSON per line, written by the queue listener)
+        outlier_record = {
+            "timestamp": timestamp,
+            "device_id": device_id,
+            "parameter": parameter_name,
+            "value": value,
+            "q1": first_quartile,
+            "q3": third_quartile,
+            "iqr_lower": lower_fence,
+            "iqr_upper": upper_fence,
+        }
+        self._outlier_file_logger.info(outlier_record)
+
+    @staticmethod
+    def _warn_all_outliers(device_id: str, parameter_name: str) -> None:
+        # All values were outliers – skip entire evaluation
+        logger.warning(
+            f"[Aggregation] device_id={device_id} parameter={parameter_name} "
+            "all values were outliers, evaluation skipped"
+        )
@@ -1,8 +1,10 @@
 import asyncio
+import contextvars
 import logging
 from typing import Awaitable, Callable
 
 from core.schema.system_config_schema import SubscribersConfig
+from core.util.loop_profiler import task_owner
 
 logger = logging.getLogger("SubscriberRegistry")
 
@@ -35,7 +37,10 @@ class SubscriberRegistry:
                 continue
 
             logger.info(f"[Starting {name}")
-            self.tasks[name] = asyncio.create_task(runner(), name=f"sub:{name}")
+            # Tasks spawned by the runner inherit this context, so LoopProfiler charges them to the subscriber
+            ctx = contextvars.copy_context()
+            ctx.run(task_owner.set, f"sub:{name}")
+            self.tasks[name] = asyncio.create_task(runner(), name=f"sub:{name}", context=ctx)
 
     async def stop(self, name: str) -> None:
         task = self.tasks.get(name)
@@ -10,6 +10,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from core.util.loop_profiler import LoopProfiler
 from core.util.time_util import TIMEZONE_INFO
 
 logger = logging.getLogger("WatchdogHeartbeat")
@@ -35,10 +36,12 @@ class WatchdogHeartbeat:
     - Writes a heartbeat file periodically (for external watchdog).
     - Measures event loop lag (drift) and logs when abnormal.
     - Optionally embeds lag info into the heartbeat file (JSON mode).
+    - With a LoopProfiler, names the slow callback behind a lag in the log.
     """
 
-    def __init__(self, cfg: WatchdogHeartbeatConfig):
+    def __init__(self, cfg: WatchdogHeartbeatConfig, profiler: LoopProfiler | None = None):
         self.cfg = cfg
+        self._profiler = profiler
         self._stopping = asyncio.Event()
 
         # latest measured stats
@@ -102,9 +105,28 @@ class WatchdogHeartbeat:
 
             # log on thresholds
             if lag >= self.cfg.lag_critical_sec:
-                logger.error(f"[LoopLag] critical lag={lag:.3f}s (expected={expected:.3f}s, actual={actual:.3f}s)")
+                logger.error(
+                    f"[LoopLag] critical lag={lag:.3f}s (expected={expected:.3f}s, actual={actual:.3f}s)"
+                    f"{self._culprit(actual)}"
+                )
             elif lag >= self.cfg.lag_warn_sec:
-                logger.warning(f"[LoopLag] warning lag={lag:.3f}s (expected={expected:.3f}s, actual={actual:.3f}s)")
+                logger.warning(
+                    f"[LoopLag] warning lag={lag:.3f}s (expected={expected:.3f}s, actual={actual:.3f}s)"
+                    f"{self._culprit(actual)}"
+                )
+
+    def _culprit(self, window_sec: float) -> str:
+        """Slow callback recorded by the profiler within the last lag window, if any."""
+        if self._profiler is None:
+            return ""
+        stall = self._profiler.last_stall()
+        if stall is None:
+            return ""
+        age_sec = datetime.now(TIMEZONE_INFO).timestamp() - datetime.fromisoformat(stall["ts"]).timestamp()
+        if age_sec > window_sec:
+            return ""
+        where = stall["stack"][-1] if stall["stack"] else stall["callback"]
+        return f" slow_callback={stall['duration_ms']:.0f}ms owner={stall['owner']} at {where}"
 
     async def _heartbeat_loop(self) -> None:
         """
@@ -125,6 +147,8 @@ class WatchdogHeartbeat:
                     "loop_lag_sec": round(self._last_lag_sec, 6),
                     "loop_lag_max_sec": round(self._max_lag_sec, 6),
                 }
+                if self._profiler is not None:
+                    obj["slow_callbacks"] = self._profiler.stall_count
                 payload = json.dumps(obj, ensure_ascii=False)
             else:
                 payload = now_dt.isoformat()
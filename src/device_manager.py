@@ -4,14 +4,17 @@ import logging
 import os
 
 from pymodbus import ModbusException
-from pymodbus.client import AsyncModbusSerialClient
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.framer import FramerType
 
 from core.device.generic.constraints_policy import ConstraintPolicy
 from core.device.generic.generic_device import AsyncGenericModbusDevice
+from core.device.modbus.tcp_client_pool import ModbusTcpClientPool
 from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.model.enum.modbus_transport_enum import ModbusTransport
 from core.schema.constraint_schema import ConstraintConfig, ConstraintConfigSchema
 from core.schema.driver_schema import DriverConfig
-from core.schema.modbus_device_schema import ModbusDeviceFileConfig
+from core.schema.modbus_device_schema import ModbusDeviceConfig, ModbusDeviceFileConfig
 from core.schema.pin_mapping_schema import PinMappingConfig
 from core.util.config_manager import ConfigManager
 from core.util.config_manager_extension import ConfigManagerExtension
@@ -56,7 +59,8 @@ class AsyncDeviceManager:
     """
     DeviceManager is responsible for:
     - Loading device configurations
-    - Building Modbus clients with per-port locks
+    - Building Modbus clients with per-port locks (serial, RTU-over-TCP gateways)
+      and pooled connections per host:port (native Modbus TCP)
     - Building devices with cached model configs
     - Three-layer configuration merging (Driver + Pin Mapping + Instance Override)
     - Managing device lifecycle (startup/shutdown)
@@ -82,7 +86,8 @@ class AsyncDeviceManager:
             pin_mapping_base_path: Base path for pin mapping YAML files
         """
         self.device_list: list[AsyncGenericModbusDevice] = []
-        self.client_dict: dict[str, AsyncModbusSerialClient] = {}
+        # Endpoint key (serial port or "<transport>://host:port") -> client
+        self.client_dict: dict[str, AsyncModbusSerialClient | AsyncModbusTcpClient | ModbusTcpClientPool] = {}
         self.config_path = config_path
         self.constraint_config_schema = constraint_config_schema
         self.model_base_path = model_base_path
@@ -114,8 +119,9 @@ class AsyncDeviceManager:
         modbus_device_config = ModbusDeviceFileConfig.model_validate(config_raw)
 
         for device_config in modbus_device_config.resolve_device_bus_settings():
-            if not device_config.port:
-                logger.warning(f"Skip device without port: {device_config.model}_{device_config.slave_id}")
+            port: str | None = device_config.endpoint
+            if not port:
+                logger.warning(f"Skip device without port/host: {device_config.model}_{device_config.slave_id}")
                 continue
 
             # Load driver config (Layer 1: Hardware definition)
@@ -128,17 +134,15 @@ class AsyncDeviceManager:
                 self.driver_config_by_model[model] = model_config_raw
 
             slave_id: int = device_config.slave_id
-            port: str = device_config.port
-            baudrate: int = int(device_config.baudrate or 9600)
-            timeout: float = float(device_config.timeout or 1.0)
+            transport: ModbusTransport = device_config.transport
 
-            # Create port lock if not exists
-            if port not in self._port_locks:
+            # Create port lock if not exists (native TCP devices are not serialized)
+            if transport != ModbusTransport.TCP and port not in self._port_locks:
                 self._port_locks[port] = asyncio.Lock()
 
             # Create and connect Modbus client
             if port not in self.client_dict:
-                client = AsyncModbusSerialClient(port=port, baudrate=baudrate, timeout=timeout, retries=1)
+                client = self._build_client(device_config)
                 is_connected: bool = await client.connect()
                 if not is_connected:
                     logger.warning(f"Failed to connect to port {port}")
@@ -201,8 +205,11 @@ class AsyncDeviceManager:
                 table_dict=model_tables,
                 mode_dict=final_modes,
                 write_hooks=model_config_raw.get("write_hooks", []),
-                port_lock=self._port_locks[port],
+                port_lock=self._port_locks.get(port),
                 port=port,
+                transport=transport,
+                request_timeout_sec=float(device_config.timeout or 1.0),
+                poll_class=device_config.poll_class,
                 model_config=model_config_raw,
             )
 
@@ -210,6 +217,26 @@ class AsyncDeviceManager:
 
         logger.info("Device connections ready (startup frequencies will be applied after health check initialization)")
 
+    @staticmethod
+    def _build_client(
+        device_config: ModbusDeviceConfig,
+    ) -> AsyncModbusSerialClient | AsyncModbusTcpClient | ModbusTcpClientPool:
+        """Build the (not yet connected) client for a device's endpoint."""
+        timeout: float = float(device_config.timeout or 1.0)
+
+        if device_config.transport == ModbusTransport.TCP:
+            return ModbusTcpClientPool(
+                device_config.host, device_config.tcp_port, size=device_config.pool_size, timeout=timeout
+            )
+
+        if device_config.transport == ModbusTransport.RTU_OVER_TCP:
+            return AsyncModbusTcpClient(
+                device_config.host, port=device_config.tcp_port, framer=FramerType.RTU, timeout=timeout, retries=1
+            )
+
+        baudrate: int = int(device_config.baudrate or 9600)
+        return AsyncModbusSerialClient(port=device_config.port, baudrate=baudrate, timeout=timeout, retries=1)
+
     def get_device_by_model_and_slave_id(self, model: str, slave_id: str | int) -> AsyncGenericModbusDevice | None:
         """
         Get device instance by model name and slave ID.
@@ -1,10 +1,12 @@
 import asyncio
 import logging
+from collections.abc import Callable, Collection
 from datetime import datetime
 from typing import Any
 
 from core.device.generic.generic_device import AsyncGenericModbusDevice
 from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.model.enum.modbus_transport_enum import ModbusTransport
 from core.schema.health_check_config_schema import HealthCheckConfig
 from core.util.device_health_manager import DeviceHealthManager, DeviceHealthStatus
 from core.util.pubsub.base import PubSub
@@ -13,6 +15,8 @@ from core.util.time_util import TIMEZONE_INFO, now_timestamp
 from core.util.virtual_device_manager import VirtualDeviceManager
 from device_manager import AsyncDeviceManager
 
+READ_ALL_LATENCY_KEY = "read_all"
+
 logger = logging.getLogger("AsyncDeviceMonitor")
 
 
@@ -23,8 +27,11 @@ class AsyncDeviceMonitor:
     Guarantees:
     - Fixed number of reader tasks (no task storm)
     - Offline fast-skip
-    - Bounded timeout per device
+    - Bounded timeout per device (adaptive: p99 x margin of its own latency history)
     - Non-blocking publish
+    - Multi-rate: each poll class (fast/normal/slow) has its own interval; a tick reads only the
+      classes that are due and publishes merged snapshots with per-value timestamps
+    - Devices still in their startup probe are skipped until the probe ends
     """
 
     def __init__(
@@ -41,11 +48,27 @@ class AsyncDeviceMonitor:
         recovery_check_interval_sec: float = 60.0,
         critical_recovery_interval_sec: float = 10.0,
         log_each_device: bool = False,
+        poll_intervals: dict[str, float | None] | None = None,
+        on_first_snapshot: Callable[[], None] | None = None,
     ):
         self.device_manager = async_device_manager
         self.pubsub = pubsub
         self.interval = float(interval)
 
+        # Poll class -> interval (classes without one poll at `interval`); ticks run at the fastest one
+        used_poll_classes: set[str] = set()
+        for device in self.device_manager.device_list:
+            used_poll_classes.update(device.poll_classes)
+        self.class_intervals: dict[str, float] = {
+            poll_class: float((poll_intervals or {}).get(poll_class) or self.interval)
+            for poll_class in sorted(used_poll_classes)
+        }
+        self.tick_interval: float = min(self.class_intervals.values(), default=self.interval)
+        self._last_class_poll: dict[str, float] = {}
+
+        self._on_first_snapshot = on_first_snapshot
+        self._first_snapshot_published = False
+
         self.health_manager = health_manager or DeviceHealthManager()
         self.virtual_device_manager = virtual_device_manager
 
@@ -75,8 +98,11 @@ class AsyncDeviceMonitor:
             device_id: str = f"{device.model}_{device.slave_id}"
             device_type: str = device.device_type
             self.health_manager.register_device(device_id, device_type=device_type)
+            device.attach_latency_tracker(self.health_manager.latency_tracker(device_id))
 
-        self._queue: asyncio.Queue[tuple[AsyncGenericModbusDevice, bool, dict[str, dict[str, Any]]]] = asyncio.Queue()
+        self._queue: asyncio.Queue[
+            tuple[AsyncGenericModbusDevice, bool, dict[str, dict[str, Any]], frozenset[str] | None]
+        ] = asyncio.Queue()
 
     # ------------------------------------------------------------------
 
@@ -90,6 +116,8 @@ class AsyncDeviceMonitor:
         logger.info(f"Read concurrency: {self.read_concurrency}")
         logger.info(f"Publish concurrency: {self.publish_concurrency}")
         logger.info(f"Interval: {self.interval}s")
+        if len(self.class_intervals) > 1:
+            logger.info(f"Poll classes: {self.class_intervals} (tick={self.tick_interval}s)")
         logger.info("=" * 60)
 
         workers = [asyncio.create_task(self._reader_worker(i)) for i in range(self.read_concurrency)]
@@ -98,11 +126,12 @@ class AsyncDeviceMonitor:
             while True:
                 cycle_start = asyncio.get_running_loop().time()
 
-                snapshots = await self._run_one_cycle()
+                due_classes = self._due_poll_classes(cycle_start)
+                snapshots = await self._run_one_cycle(due_classes)
                 await self._publish_snapshots(snapshots)
 
                 elapsed = asyncio.get_running_loop().time() - cycle_start
-                sleep_time = max(0.0, self.interval - elapsed)
+                sleep_time = max(0.0, self.tick_interval - elapsed)
                 logger.debug(f"[Monitor] cycle={elapsed:.2f}s sleep={sleep_time:.2f}s")
                 await asyncio.sleep(sleep_time)
 
@@ -114,14 +143,39 @@ class AsyncDeviceMonitor:
                 worker.cancel()
 
     # ------------------------------------------------------------------
-    async def _run_one_cycle(self) -> list[dict[str, Any]]:
+    def _due_poll_classes(self, now: float) -> frozenset[str]:
+        """Poll classes whose interval has elapsed (half a tick of slack absorbs cycle jitter)."""
+        slack = self.tick_interval / 2
+        due = frozenset(
+            poll_class
+            for poll_class, interval in self.class_intervals.items()
+            if poll_class not in self._last_class_poll or now - self._last_class_poll[poll_class] >= interval - slack
+        )
+        for poll_class in due:
+            self._last_class_poll[poll_class] = now
+        return due
+
+    async def _run_one_cycle(self, due_classes: Collection[str] | None = None) -> list[dict[str, Any]]:
         """
         Run one monitoring cycle with sequential device processing per port.
 
         Critical for RS-485: Devices on same port must be processed sequentially
-        with delay to prevent response frame confusion.
+        with delay to prevent response frame confusion. Native Modbus TCP endpoints have
+        no shared line: their devices are handed to the workers together.
+
+        due_classes limits the cycle to devices with pins in those poll classes (None: every device,
+        every class). Devices with nothing due, or still in their startup probe, are neither read nor
+        published.
         """
-        device_list: list[AsyncGenericModbusDevice] = self.device_manager.device_list
+        device_list: list[AsyncGenericModbusDevice] = [
+            device
+            for device in self.device_manager.device_list
+            if not self.health_manager.is_probing(f"{device.model}_{device.slave_id}")
+        ]
+        if due_classes is not None:
+            device_list = [
+                device for device in device_list if self._poll_classes_for(device, due_classes) != frozenset()
+            ]
         now_ts: float = now_timestamp()
 
         should_recover: bool = (now_ts - self._last_recovery_check) > self._recovery_check_interval
@@ -148,12 +202,19 @@ class AsyncDeviceMonitor:
         for port, port_devices in devices_by_port.items():
             logger.debug(f"[Monitor] Processing {len(port_devices)} devices on port {port}")
 
+            if port_devices[0].transport == ModbusTransport.TCP:
+                for device in port_devices:
+                    recovery_window = self._recovery_window_for(device, should_recover, critical_should_recover)
+                    poll_classes = self._poll_classes_for(device, due_classes)
+                    await self._queue.put((device, recovery_window, result_map, poll_classes))
+                await self._queue.join()
+                continue
+
             for i, device in enumerate(port_devices):
-                device_id = f"{device.model}_{device.slave_id}"
-                is_critical = device_id in self._critical_device_ids
-                recovery_window = critical_should_recover if is_critical else should_recover
+                recovery_window = self._recovery_window_for(device, should_recover, critical_should_recover)
+                poll_classes = self._poll_classes_for(device, due_classes)
 
-                await self._queue.put((device, recovery_window, result_map))
+                await self._queue.put((device, recovery_window, result_map, poll_classes))
                 await self._queue.join()
 
                 if i < len(port_devices) - 1:
@@ -163,13 +224,28 @@ class AsyncDeviceMonitor:
         await self._process_virtual_devices(snapshots)
         return snapshots
 
+    @staticmethod
+    def _poll_classes_for(
+        device: AsyncGenericModbusDevice, due_classes: Collection[str] | None
+    ) -> frozenset[str] | None:
+        """Due classes of the device; None means a full read (nothing filtered, or every class due)."""
+        if due_classes is None or device.poll_classes <= set(due_classes):
+            return None
+        return device.poll_classes & set(due_classes)
+
+    def _recovery_window_for(
+        self, device: AsyncGenericModbusDevice, should_recover: bool, critical_should_recover: bool
+    ) -> bool:
+        device_id = f"{device.model}_{device.slave_id}"
+        return critical_should_recover if device_id in self._critical_device_ids else should_recover
+
     async def _reader_worker(self, worker_id: int) -> None:
         while True:
-            device, should_recover, result_map = await self._queue.get()
+            device, should_recover, result_map, poll_classes = await self._queue.get()
             device_id = f"{device.model}_{device.slave_id}"
 
             try:
-                snapshot: dict = await self.__get_snapshot_for_device(device, device_id, should_recover)
+                snapshot: dict = await self.__get_snapshot_for_device(device, device_id, should_recover, poll_classes)
                 logger.info(f"[{device_id}] Snapshot: {snapshot['values']}")
                 result_map[device_id] = snapshot
 
@@ -180,7 +256,9 @@ class AsyncDeviceMonitor:
             finally:
                 self._queue.task_done()
 
-    async def _read_one_device(self, device: AsyncGenericModbusDevice, device_id: str) -> dict[str, Any]:
+    async def _read_one_device(
+        self, device: AsyncGenericModbusDevice, device_id: str, poll_classes: frozenset[str] | None = None
+    ) -> dict[str, Any]:
         health_status: DeviceHealthStatus | None = self.health_manager._health_status.get(device_id)
         has_recent_failures = (
             health_status
@@ -212,15 +290,30 @@ class AsyncDeviceMonitor:
                     logger.debug(f"[{device_id}] Adaptive health check error: {exc}")
                     # Continue to try read_all
 
+        # Adaptive deadline: p99 x margin of this device's read_all history (per poll-class subset),
+        # capped at device_timeout_sec
+        latency_key: str = (
+            READ_ALL_LATENCY_KEY if poll_classes is None else f"{READ_ALL_LATENCY_KEY}:{'+'.join(sorted(poll_classes))}"
+        )
+        timeout_sec: float = self.health_manager.adaptive_timeout(device_id, latency_key, self.device_timeout_sec)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+
         try:
-            values: dict[str, Any] = await asyncio.wait_for(device.read_all(), timeout=self.device_timeout_sec)
+            read = device.read_all() if poll_classes is None else device.read_all(poll_classes)
+            values: dict[str, Any] = await asyncio.wait_for(read, timeout=timeout_sec)
 
+            # Judge liveness on the pins read in this cycle: values cached from other poll classes
+            # would keep a dead device "online" until its slowest class refreshes
+            read_now = getattr(device, "last_read_values", None)
+            fresh: dict[str, Any] = read_now if isinstance(read_now, dict) else values
             is_online: bool = any(
-                v != DEFAULT_MISSING_VALUE and v is not None for v in values.values() if isinstance(v, (int, float))
+                v != DEFAULT_MISSING_VALUE and v is not None for v in fresh.values() if isinstance(v, (int, float))
             )
 
             if is_online:
                 await self.health_manager.mark_success(device_id)
+                self.health_manager.record_latency(device_id, latency_key, loop.time() - start)
             else:
                 await self.health_manager.mark_failure(device_id)
 
@@ -236,10 +329,13 @@ class AsyncDeviceMonitor:
                 "is_online": is_online,
                 "sampling_datetime": datetime.now(tz=TIMEZONE_INFO),
                 "values": values,
+                "value_timestamps": dict(device.value_timestamps),
             }
 
         except asyncio.TimeoutError:
             await self.health_manager.mark_failure(device_id)
+            self.health_manager.record_timeout(device_id, latency_key)
+            logger.debug(f"[{device_id}] read_all timed out after {timeout_sec:.3f}s")
             return self._create_offline_snapshot(device_id, error="timeout")
 
         except Exception as exc:
@@ -263,6 +359,11 @@ class AsyncDeviceMonitor:
                 did = snapshots[idx].get("device_id", "unknown")
                 logger.warning(f"[Monitor] publish failed: {did}", exc_info=result)
 
+        if not self._first_snapshot_published:
+            self._first_snapshot_published = True
+            if self._on_first_snapshot:
+                self._on_first_snapshot()
+
     def _create_offline_snapshot(self, device_id: str, error: str = "offline") -> dict[str, Any]:
         model, slave_id_str = device_id.rsplit("_", 1)
         try:
@@ -321,7 +422,9 @@ class AsyncDeviceMonitor:
         except Exception as exc:
             logger.error("[Monitor] virtual device computation failed", exc_info=exc)
 
-    async def __get_snapshot_for_device(self, device, device_id: str, should_recover: bool):
+    async def __get_snapshot_for_device(
+        self, device, device_id: str, should_recover: bool, poll_classes: frozenset[str] | None = None
+    ):
         # 0) Global gate (prevents full read storms)
         allowed, reason = await self.health_manager.should_poll(device_id)
         if not allowed:
@@ -329,7 +432,7 @@ class AsyncDeviceMonitor:
 
         # 1) Healthy: normal full read
         if self.health_manager.is_healthy(device_id):
-            return await self._read_one_device(device, device_id)
+            return await self._read_one_device(device, device_id, poll_classes)
 
         # 2) Unhealthy and not recovery: do NOT probe every cycle
         if not should_recover:
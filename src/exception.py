@@ -27,6 +27,12 @@ class DeviceConnectionError(DeviceError):
     pass
 
 
+class PortInUseError(DeviceConnectionError):
+    """Port / endpoint already owned by configured devices"""
+
+    pass
+
+
 class DeviceTimeoutError(DeviceError):
     """Device response timeout"""
 
@@ -8,6 +8,7 @@ import argparse
 import asyncio
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import LiteralString
 
@@ -26,18 +27,15 @@ from core.util.factory.alert_factory import build_alert_subscriber
 from core.util.factory.constraint_factory import build_constraint_subscriber
 from core.util.factory.control_factory import build_control_subscriber
 from core.util.factory.initialization_factory import build_initialization_subscriber
-from core.util.factory.notifier_factory import build_notifiers_and_routing
+from core.util.factory.notifier_factory import build_notifiers_and_routing, close_notifiers
 from core.util.factory.sender_factory import build_sender_subscriber, init_sender
 from core.util.factory.snapshot_factory import build_snapshot_subscriber
 from core.util.factory.time_factory import build_time_control_subscriber
 from core.util.factory.virtual_device_factory import initialize_virtual_device_manager
-from core.util.health_check_util import (
-    apply_startup_frequencies_with_health_check,
-    initialize_health_check_configs,
-    perform_initial_health_check_for_all_devices,
-)
+from core.util.health_check_util import StartupOrchestrator, initialize_health_check_configs
 from core.util.logger_config import LOG_LEVEL_MAP, setup_logging
 from core.util.logging_noise import install_asyncio_noise_suppressor
+from core.util.loop_profiler import LoopProfiler, LoopProfilerConfig, task_owner
 from core.util.pubsub.in_memory_pubsub import InMemoryPubSub
 from core.util.pubsub.pubsub_util import PUBSUB_POLICIES, pubsub_drop_metrics_loop
 from core.util.pubsub.subscriber.constraint_evaluator_subscriber import ConstraintSubscriber
@@ -85,6 +83,7 @@ def parse_arguments():
 
 async def main():
     """Main entry point for unified service."""
+    started_at: float = time.monotonic()
     args = parse_arguments()
 
     # Configure logging
@@ -118,12 +117,16 @@ async def main():
     cleanup_task_handle: asyncio.Task | None = None
     snapshot_db_manager: SQLiteSnapshotDBManager | None = None
 
+    loop_profiler: LoopProfiler | None = None
+
     watchdog: WatchdogHeartbeat | None = None
     watchdog_task: asyncio.Task | None = None
 
     systemd_watchdog: SystemdWatchdog | None = None
     systemd_watchdog_task: asyncio.Task | None = None
 
+    startup_task: asyncio.Task | None = None
+
     try:
         # ========== Load System Configuration ==========
         logger.info("")
@@ -133,6 +136,24 @@ async def main():
         system_config_raw: dict = ConfigManager.load_yaml_file(args.system_config)
         system_config = SystemConfig(**system_config_raw)
 
+        # =====================================================================
+        # Event loop profiler (slow callbacks, per-subscriber CPU)
+        # =====================================================================
+        if system_config.LOOP_PROFILER.ENABLED:
+            try:
+                profiler_settings = system_config.LOOP_PROFILER
+                loop_profiler = LoopProfiler(
+                    LoopProfilerConfig(
+                        slow_callback_sec=profiler_settings.SLOW_CALLBACK_MS / 1000,
+                        max_stalls=profiler_settings.MAX_STALLS,
+                        max_profile_sec=profiler_settings.MAX_PROFILE_SEC,
+                    )
+                )
+                loop_profiler.install()
+            except Exception as e:
+                loop_profiler = None
+                logger.warning(f"[LoopProfiler] init failed: {e}")
+
         # =====================================================================
         # Watchdog Heartbeat + SIGUSR1 stackdump
         # =====================================================================
@@ -150,7 +171,7 @@ async def main():
                 json_mode=True,
                 atomic_write=True,
             )
-            watchdog = WatchdogHeartbeat(watchdog_cfg)
+            watchdog = WatchdogHeartbeat(watchdog_cfg, profiler=loop_profiler)
             watchdog_task = asyncio.create_task(watchdog.run())
             logger.info(f"[WatchdogHeartbeat] started: path={heartbeat_path}")
         except Exception as e:
@@ -213,6 +234,14 @@ async def main():
             config_path=args.virtual_device_config, device_manager=async_device_manager
         )
 
+        # Startup probing runs in parallel port lanes; the monitor skips devices until their probe ends
+        startup = StartupOrchestrator(
+            device_manager=async_device_manager,
+            health_manager=health_manager,
+            constraint_schema=constraint_schema,
+            started_at=started_at,
+        )
+
         monitor = AsyncDeviceMonitor(
             async_device_manager=async_device_manager,
             pubsub=pubsub,
@@ -222,6 +251,8 @@ async def main():
             device_timeout_sec=system_config.MONITOR_DEVICE_TIMEOUT_SEC,
             read_concurrency=system_config.MONITOR_READ_CONCURRENCY,
             log_each_device=system_config.MONITOR_LOG_EACH_DEVICE,
+            poll_intervals=system_config.MONITOR_POLL_INTERVALS.as_class_intervals(),
+            on_first_snapshot=startup.record_first_snapshot,
         )
 
         logger.info("Monitor initialized")
@@ -229,20 +260,8 @@ async def main():
         initialize_health_check_configs(async_device_manager, health_manager)
         logger.info("Health check configs initialized")
 
-        initial_health_stats: dict[str, int] = await perform_initial_health_check_for_all_devices(
-            device_manager=async_device_manager, health_manager=health_manager
-        )
-
-        logger.info("")
-        logger.info("Initial Health Check Summary:")
-        logger.info(f"  Online devices:  {initial_health_stats['online']}")
-        logger.info(f"  Offline devices: {initial_health_stats['offline']}")
-        logger.info(f"  Failed checks:   {initial_health_stats['failed']}")
-        logger.info("")
-
-        await apply_startup_frequencies_with_health_check(
-            device_manager=async_device_manager, health_manager=health_manager, constraint_schema=constraint_schema
-        )
+        startup_task = startup.start()
+        logger.info("Startup probing started (initial health check + startup frequencies)")
 
         valid_device_ids = {f"{d.model}_{d.slave_id}" for d in async_device_manager.device_list}
 
@@ -284,6 +303,7 @@ async def main():
             time_control_evaluator=time_control_evaluator,
             monitor_interval=system_config.MONITOR_INTERVAL_SECONDS,
             outlier_log_path=system_config.PATHS.OUTLIER_LOG_PATH,
+            alert_state_db_path=system_config.PATHS.ALERT_STATE_DB_PATH,
         )
         logger.info("Alert subscribers built")
 
@@ -370,6 +390,8 @@ async def main():
         app.state.talos.snapshot_config_path = args.snapshot_storage_config
         app.state.talos.heartbeat_path = str(heartbeat_path)
         app.state.talos.heartbeat_max_age_sec = 60.0  # TODO: make configurable
+        app.state.talos.startup = startup
+        app.state.talos.loop_profiler = loop_profiler
 
         logger.info("Shared instances injected:")
         logger.info("  - AsyncDeviceManager")
@@ -435,6 +457,8 @@ async def main():
         logger.info("Press Ctrl+C to stop")
         logger.info("=" * 80)
 
+        # Everything uvicorn spawns from here on is accounted to "api" by the loop profiler
+        task_owner.set("api")
         await server.serve()
 
     except KeyboardInterrupt:
@@ -466,6 +490,10 @@ async def main():
                 await asyncio.gather(watchdog_task, return_exceptions=True)
                 logger.info("[WatchdogHeartbeat] stopped")
 
+            if startup_task is not None and not startup_task.done():
+                startup_task.cancel()
+                await asyncio.gather(startup_task, return_exceptions=True)
+
             if systemd_watchdog:
                 systemd_watchdog.stop()
             if systemd_watchdog_task:
@@ -476,6 +504,10 @@ async def main():
                 await subscriber_registry.stop_all()
                 logger.info("All subscribers stopped")
 
+            if "notifier_list" in locals():
+                await close_notifiers(notifier_list)
+                logger.info("Notifiers closed")
+
             # Stop cleanup task
             if cleanup_task_handle:
                 cleanup_task_handle.cancel()
@@ -498,6 +530,9 @@ async def main():
                 await async_device_manager.shutdown()
                 logger.info("AsyncDeviceManager shutdown")
 
+            if loop_profiler is not None:
+                loop_profiler.uninstall()
+
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
 
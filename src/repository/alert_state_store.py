@@ -0,0 +1,193 @@
+"""
+Alert State Storage
+
+Persists AlertStateManager records in SQLite (schema: doc/alert_state_schema.sql),
+so active alarms survive restarts without re-sending TRIGGERED notifications.
+
+The store is write-behind: AlertStateManager keeps the hot path in memory and
+hands over batched changes, which are applied here in a single transaction.
+"""
+
+import logging
+import sqlite3
+from datetime import datetime, timedelta
+from pathlib import Path
+from zoneinfo import ZoneInfo
+
+from core.evaluator.alert_state_manager import AlertStateRecord
+from core.model.enum.alert_enum import AlertSeverity
+from core.model.enum.alert_state_enum import AlertState
+
+logger = logging.getLogger(__name__)
+
+
+class AlertStateStore:
+    """SQLite backing store for alert states"""
+
+    def __init__(self, db_path: str, timezone: str = "Asia/Taipei"):
+        """
+        Initialize the alert state store.
+
+        Args:
+            db_path: Path to SQLite database file
+            timezone: Timezone for timestamp handling
+        """
+        self.db_path = Path(db_path)
+        self.tz = ZoneInfo(timezone)
+        self._init_database()
+
+    def _init_database(self):
+        """Create the alert state table if it doesn't exist"""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+            with sqlite3.connect(self.db_path) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS alert_states (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        device_id TEXT NOT NULL,
+                        alert_code TEXT NOT NULL,
+                        state TEXT NOT NULL CHECK(state IN ('NORMAL', 'TRIGGERED', 'ACTIVE', 'RESOLVED')),
+                        severity TEXT NOT NULL CHECK(severity IN ('INFO', 'WARNING', 'ERROR', 'CRITICAL')),
+                        triggered_at TIMESTAMP,
+                        resolved_at TIMESTAMP,
+                        last_value REAL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(device_id, alert_code)
+                    )
+                """
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_device_alert ON alert_states(device_id, alert_code)")
+                conn.execute("CREATE INDEX IF NOT EXISTS idx_state ON alert_states(state)")
+                conn.commit()
+                logger.info(f"[STORE] Initialized alert state store at {self.db_path}")
+
+        except Exception as e:
+            logger.error(f"[STORE] Failed to initialize database: {e}", exc_info=True)
+            raise
+
+    def load_all(self) -> list[AlertStateRecord]:
+        """
+        Load all non-NORMAL alert states (called once at startup).
+
+        Returns:
+            List of AlertStateRecord
+        """
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                rows = conn.execute(
+                    """
+                    SELECT device_id, alert_code, state, severity, triggered_at, resolved_at, last_value
+                    FROM alert_states
+                    WHERE state != 'NORMAL'
+                """
+                ).fetchall()
+
+        except Exception as e:
+            logger.error(f"[STORE] Failed to load alert states: {e}", exc_info=True)
+            return []
+
+        records: list[AlertStateRecord] = []
+        for device_id, alert_code, state, severity, triggered_at, resolved_at, last_value in rows:
+            try:
+                records.append(
+                    AlertStateRecord(
+                        device_id=device_id,
+                        alert_code=alert_code,
+                        state=AlertState(state),
+                        severity=AlertSeverity(severity),
+                        triggered_at=self._parse_ts(triggered_at),
+                        resolved_at=self._parse_ts(resolved_at),
+                        last_value=last_value,
+                    )
+                )
+            except ValueError as e:
+                logger.warning(f"[STORE] Skip invalid alert state row ({device_id}, {alert_code}): {e}")
+
+        logger.info(f"[STORE] Loaded {len(records)} alert states")
+        return records
+
+    def apply_changes(self, upserts: list[AlertStateRecord], deletes: list[tuple[str, str]]) -> None:
+        """
+        Apply a batch of state changes in a single transaction.
+
+        Args:
+            upserts: Records to insert or update
+            deletes: (device_id, alert_code) keys to remove (RESOLVED → NORMAL cleanup)
+        """
+        if not upserts and not deletes:
+            return
+
+        now_str = datetime.now(self.tz).isoformat()
+        with sqlite3.connect(self.db_path) as conn:
+            if upserts:
+                conn.executemany(
+                    """
+                    INSERT INTO alert_states
+                    (device_id, alert_code, state, severity, triggered_at, resolved_at, last_value, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(device_id, alert_code) DO UPDATE SET
+                        state = excluded.state,
+                        severity = excluded.severity,
+                        triggered_at = excluded.triggered_at,
+                        resolved_at = excluded.resolved_at,
+                        last_value = excluded.last_value,
+                        updated_at = excluded.updated_at
+                """,
+                    [
+                        (
+                            r.device_id,
+                            r.alert_code,
+                            r.state.value,
+                            r.severity.value,
+                            r.triggered_at.isoformat() if r.triggered_at else None,
+                            r.resolved_at.isoformat() if r.resolved_at else None,
+                            r.last_value,
+                            now_str,
+                        )
+                        for r in upserts
+                    ],
+                )
+            if deletes:
+                conn.executemany("DELETE FROM alert_states WHERE device_id = ? AND alert_code = ?", deletes)
+            conn.commit()
+
+        logger.debug(f"[STORE] Flushed alert states: {len(upserts)} upserted, {len(deletes)} deleted")
+
+    def compact(self, resolved_retention_hours: float = 24.0) -> int:
+        """
+        Drop rows that no longer carry notification state.
+
+        Removes NORMAL rows and RESOLVED rows older than the retention window
+        (e.g. alerts removed from config that never went back to NORMAL).
+
+        Returns:
+            Number of deleted rows
+        """
+        cutoff = (datetime.now(self.tz) - timedelta(hours=resolved_retention_hours)).isoformat()
+        try:
+            with sqlite3.connect(self.db_path) as conn:
+                cursor = conn.execute(
+                    "DELETE FROM alert_states WHERE state = 'NORMAL' OR (state = 'RESOLVED' AND resolved_at < ?)",
+                    (cutoff,),
+                )
+                conn.commit()
+                deleted = cursor.rowcount
+        except Exception as e:
+            logger.error(f"[STORE] Failed to compact alert states: {e}", exc_info=True)
+            return 0
+
+        if deleted:
+            logger.info(f"[STORE] Compacted {deleted} alert state rows")
+        return deleted
+
+    def _parse_ts(self, value: str | None) -> datetime | None:
+        if not value:
+            return None
+        dt = datetime.fromisoformat(value)
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=self.tz)
+        return dt
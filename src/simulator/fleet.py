@@ -0,0 +1,241 @@
+import logging
+import os
+import random
+import socket
+from dataclasses import dataclass, field
+
+import yaml
+from pymodbus.datastore import ModbusServerContext
+from pymodbus.framer import FramerType
+from pymodbus.server import ModbusSerialServer, ModbusTcpServer
+
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.schema.modbus_device_schema import ModbusDeviceConfig, ModbusDeviceFileConfig
+from core.util.config_manager import ConfigManager
+from simulator.pty_link import PtyLink
+from simulator.register_image import RegisterImage
+from simulator.simulator_schema import SimulatorConfig
+from simulator.slave_context import SimulatedSlaveContext
+
+logger = logging.getLogger("SimulatorFleet")
+
+MAX_SLAVE_ID = 247
+
+
+@dataclass
+class SimulatedDevice:
+    config: ModbusDeviceConfig  # Talos-side row; endpoint fields are rewritten when the bus starts
+    context: SimulatedSlaveContext
+
+    @property
+    def key(self) -> str:
+        return f"{self.config.model}_{self.config.slave_id}"
+
+
+@dataclass
+class SimulatedBus:
+    """One simulated link: a pty pair (serial) or a TCP listener, serving its slaves."""
+
+    source_endpoint: str  # endpoint in the source modbus_device.yml
+    copy_index: int
+    transport: ModbusTransport
+    baudrate: int | None
+    devices: list[SimulatedDevice] = field(default_factory=list)
+
+    port: str | None = None  # serial: pty link path
+    host: str | None = None  # TCP transports: listen address
+    tcp_port: int | None = None
+
+    server: ModbusSerialServer | ModbusTcpServer | None = None
+    link: PtyLink | None = None
+
+    @property
+    def endpoint(self) -> str | None:
+        if self.transport == ModbusTransport.SERIAL:
+            return self.port
+        return f"{self.transport}://{self.host}:{self.tcp_port}" if self.host else None
+
+
+class SimulatorFleet:
+    """
+    Simulated Modbus field bus built from modbus_device.yml and the driver files it references.
+
+    - Each bus of the source config becomes a pty pair (serial) or a local TCP server
+      (tcp / rtu_over_tcp) serving all of its slaves; `copies` replicates the whole device
+      list onto extra buses with fresh slave IDs, so MODEL_SLAVEID keys stay unique.
+    - Slave behaviour (latency, timeouts, exceptions) comes from SimulatorConfig profiles.
+    - talos_config() is a modbus_device.yml pointing at the simulated endpoints, so the
+      main service runs against the fleet unchanged.
+    """
+
+    def __init__(
+        self, modbus_device_path: str, config: SimulatorConfig | None = None, *, model_base_path: str = "./res"
+    ):
+        self.modbus_device_path = modbus_device_path
+        self.config = config or SimulatorConfig()
+        self.model_base_path = model_base_path
+        self.rng = random.Random(self.config.seed)
+        self.buses: list[SimulatedBus] = self._build_buses()
+
+    @property
+    def devices(self) -> list[SimulatedDevice]:
+        return [device for bus in self.buses for device in bus.devices]
+
+    async def start(self) -> None:
+        next_tcp_port = self.config.tcp_base_port
+        serial_index = 0
+
+        for bus in self.buses:
+            context = ModbusServerContext(
+                slaves={device.config.slave_id: device.context for device in bus.devices}, single=False
+            )
+
+            if bus.transport == ModbusTransport.SERIAL:
+                bus.link = PtyLink(os.path.join(self.config.link_dir, f"ttySIM{serial_index}"))
+                serial_index += 1
+                bus.link.open()
+                bus.port = bus.link.link_path
+                bus.server = ModbusSerialServer(
+                    context,
+                    framer=FramerType.RTU,
+                    port=bus.link.server_path,
+                    baudrate=bus.baudrate or 9600,
+                    ignore_missing_slaves=True,
+                )
+            else:
+                bus.host = self.config.tcp_host
+                if next_tcp_port:
+                    bus.tcp_port, next_tcp_port = next_tcp_port, next_tcp_port + 1
+                else:
+                    bus.tcp_port = _free_tcp_port(bus.host)
+                framer = FramerType.RTU if bus.transport == ModbusTransport.RTU_OVER_TCP else FramerType.SOCKET
+                bus.server = ModbusTcpServer(
+                    context, framer=framer, address=(bus.host, bus.tcp_port), ignore_missing_slaves=True
+                )
+
+            await bus.server.serve_forever(background=True)
+            logger.info(f"[SIM] {bus.source_endpoint}#{bus.copy_index} -> {bus.endpoint} ({len(bus.devices)} slaves)")
+
+        logger.info(f"[SIM] fleet up: {len(self.devices)} slaves on {len(self.buses)} buses")
+
+    async def stop(self) -> None:
+        for bus in self.buses:
+            if bus.server is not None:
+                try:
+                    await bus.server.shutdown()
+                except Exception as e:
+                    logger.warning(f"[SIM] {bus.endpoint}: shutdown failed: {e}")
+                bus.server = None
+            if bus.link is not None:
+                bus.link.close()
+                bus.link = None
+
+    def talos_config(self) -> dict:
+        """modbus_device.yml content pointing at the simulated endpoints (call after start())."""
+        rows: list[dict] = []
+        for bus in self.buses:
+            for device in bus.devices:
+                row = device.config.model_copy(
+                    update={"transport": bus.transport, "port": bus.port, "host": bus.host, "bus": None}
+                )
+                if bus.tcp_port is not None:
+                    row.tcp_port = bus.tcp_port
+                rows.append(row.model_dump(mode="json", exclude_none=True, exclude={"bus"}))
+        return {"devices": rows}
+
+    def write_talos_config(self, path: str) -> str:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            yaml.safe_dump(self.talos_config(), f, sort_keys=False, allow_unicode=True)
+        return path
+
+    def stats(self) -> dict:
+        per_device = {
+            device.key: {
+                "endpoint": bus.endpoint,
+                "requests": device.context.stats.requests,
+                "timeouts": device.context.stats.timeouts,
+                "exceptions": device.context.stats.exceptions,
+            }
+            for bus in self.buses
+            for device in bus.devices
+        }
+        return {
+            "buses": len(self.buses),
+            "devices": len(per_device),
+            "requests": sum(s["requests"] for s in per_device.values()),
+            "timeouts": sum(s["timeouts"] for s in per_device.values()),
+            "exceptions": sum(s["exceptions"] for s in per_device.values()),
+            "per_device": per_device,
+        }
+
+    # ==================== Internal helpers ====================
+
+    def _build_buses(self) -> list[SimulatedBus]:
+        raw: dict = ConfigManager.load_yaml_file(self.modbus_device_path) or {}
+        sources: list[ModbusDeviceConfig] = [
+            device
+            for device in ModbusDeviceFileConfig.model_validate(raw).resolve_device_bus_settings()
+            if device.endpoint
+        ]
+
+        used_ids: dict[str, set[int]] = {}
+        for device in sources:
+            used_ids.setdefault(device.model, set()).add(device.slave_id)
+
+        drivers: dict[str, dict] = {}
+        buses: dict[tuple[str, int], SimulatedBus] = {}
+
+        for copy_index in range(self.config.copies):
+            for source in sources:
+                bus_key = (str(source.endpoint), copy_index)
+                bus = buses.get(bus_key)
+                if bus is None:
+                    bus = buses[bus_key] = SimulatedBus(
+                        source_endpoint=str(source.endpoint),
+                        copy_index=copy_index,
+                        transport=source.transport,
+                        baudrate=source.baudrate if source.transport != ModbusTransport.TCP else None,
+                    )
+
+                bus_ids = {device.config.slave_id for device in bus.devices}
+                if copy_index == 0:
+                    slave_id = source.slave_id
+                    if slave_id in bus_ids:
+                        raise ValueError(f"duplicate slave_id {slave_id} on {source.endpoint}")
+                else:
+                    slave_id = _next_free_id(used_ids, source.model, bus_ids)
+
+                if source.model_file not in drivers:
+                    drivers[source.model_file] = ConfigManager.load_yaml_file(
+                        os.path.join(self.model_base_path, source.model_file)
+                    )
+
+                config = source.model_copy(update={"slave_id": slave_id})
+                key = f"{config.model}_{slave_id}"
+                slave_rng = random.Random(self.rng.random())
+                context = SimulatedSlaveContext(
+                    RegisterImage(drivers[source.model_file], rng=slave_rng),
+                    self.config.profile_for(key),
+                    baudrate=bus.baudrate if self.config.wire_time else None,
+                    rng=slave_rng,
+                )
+                bus.devices.append(SimulatedDevice(config=config, context=context))
+
+        return list(buses.values())
+
+
+def _next_free_id(used_ids: dict[str, set[int]], model: str, bus_ids: set[int]) -> int:
+    """Lowest slave ID free both for the model (MODEL_SLAVEID keys) and on the bus (addressing)."""
+    used = used_ids.setdefault(model, set())
+    for slave_id in range(1, MAX_SLAVE_ID + 1):
+        if slave_id not in used and slave_id not in bus_ids:
+            used.add(slave_id)
+            return slave_id
+    raise ValueError(f"no free slave ID left for model {model} (max {MAX_SLAVE_ID})")
+
+
+def _free_tcp_port(host: str) -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind((host, 0))
+        return sock.getsockname()[1]
@@ -0,0 +1,72 @@
+import asyncio
+import logging
+import os
+import tty
+
+logger = logging.getLogger("PtyLink")
+
+
+class PtyLink:
+    """
+    Virtual null-modem cable: two pseudo-terminals whose master sides are bridged in-process
+    (what `socat pty,raw pty,raw` does, without the external tool).
+
+    - server_path: opened by the simulated slaves' serial server
+    - link_path:   symlink to the other end, used as `port:` in the emitted modbus_device.yml
+    """
+
+    def __init__(self, link_path: str):
+        self.link_path = link_path
+        self.server_path: str | None = None
+        self._fds: list[int] = []
+        self._masters: tuple[int, int] | None = None
+
+    def open(self) -> None:
+        master_a, slave_a = os.openpty()
+        master_b, slave_b = os.openpty()
+        self._fds = [master_a, slave_a, master_b, slave_b]
+
+        # Raw line discipline on both ends; the slave fds stay open so the link survives
+        # clients reconnecting (a pty master reads EIO while no slave is open)
+        tty.setraw(slave_a)
+        tty.setraw(slave_b)
+        os.set_blocking(master_a, False)
+        os.set_blocking(master_b, False)
+
+        self.server_path = os.ttyname(slave_a)
+        os.makedirs(os.path.dirname(self.link_path) or ".", exist_ok=True)
+        if os.path.islink(self.link_path):
+            os.unlink(self.link_path)
+        os.symlink(os.ttyname(slave_b), self.link_path)
+
+        loop = asyncio.get_running_loop()
+        loop.add_reader(master_a, self._pump, master_a, master_b)
+        loop.add_reader(master_b, self._pump, master_b, master_a)
+        self._masters = (master_a, master_b)
+        logger.info(f"[PTY] {self.link_path} <-> {self.server_path}")
+
+    def close(self) -> None:
+        if self._masters is not None:
+            loop = asyncio.get_running_loop()
+            for fd in self._masters:
+                loop.remove_reader(fd)
+            self._masters = None
+        for fd in self._fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+        self._fds = []
+        if os.path.islink(self.link_path):
+            os.unlink(self.link_path)
+
+    @staticmethod
+    def _pump(src: int, dst: int) -> None:
+        try:
+            data = os.read(src, 4096)
+            if data:
+                os.write(dst, data)
+        except (BlockingIOError, InterruptedError):
+            pass
+        except OSError as e:
+            logger.debug(f"[PTY] pump fd={src}->{dst} failed: {e}")
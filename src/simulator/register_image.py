@@ -0,0 +1,253 @@
+import logging
+import random
+from dataclasses import dataclass
+
+from pymodbus.client.mixin import ModbusClientMixin
+from pymodbus.pdu import ExceptionResponse
+
+from core.model.enum.decode_format import DecodeFormat
+from core.model.enum.register_type_enum import RegisterType
+
+logger = logging.getLogger("RegisterImage")
+
+# Engineering ranges by driver `unit`: (low, high, is_counter)
+_UNIT_RANGES: dict[str, tuple[float, float, bool]] = {
+    "V": (215.0, 230.0, False),
+    "A": (5.0, 45.0, False),
+    "Hz": (59.9, 60.1, False),
+    "kW": (2.0, 30.0, False),
+    "kVA": (2.0, 32.0, False),
+    "kvar": (0.5, 8.0, False),
+    "kWh": (1000.0, 50000.0, True),
+    "kvarh": (200.0, 9000.0, True),
+    "m³": (100.0, 5000.0, True),
+    "m³/h": (1.0, 60.0, False),
+    "°C": (22.0, 38.0, False),
+    "kg/cm²": (5.0, 8.0, False),
+    "%vol": (18.0, 21.0, False),
+}
+_DEFAULT_RANGE: tuple[float, float, bool] = (0.0, 100.0, False)
+
+# Datastore tables as pymodbus names them: function code -> table
+TABLE_BY_FC: dict[int, str] = {1: "c", 5: "c", 15: "c", 2: "d", 3: "h", 6: "h", 16: "h", 22: "h", 23: "h", 4: "i"}
+_TABLE_BY_REGISTER_TYPE: dict[str, str] = {
+    RegisterType.HOLDING.value: "h",
+    RegisterType.INPUT.value: "i",
+    RegisterType.COIL.value: "c",
+    RegisterType.DISCRETE_INPUT.value: "d",
+}
+
+# Largest raw magnitude per format; values are kept well below it (0xFFFF reads as "missing")
+_RAW_LIMITS: dict[DecodeFormat | None, float] = {
+    DecodeFormat.I16: 0x7FFF,
+    DecodeFormat.U32: 0xFFFFFFFF,
+    DecodeFormat.U32_LE: 0xFFFFFFFF,
+    DecodeFormat.U32_BE: 0xFFFFFFFF,
+}
+_RAW_LIMIT_DEFAULT: float = 0xFFFF
+
+_FLOAT_FORMATS: frozenset[DecodeFormat] = frozenset(
+    {DecodeFormat.F32, DecodeFormat.F32_LE, DecodeFormat.F32_BE, DecodeFormat.F32_BE_SWAP}
+)
+_WIDE_FORMATS: frozenset[DecodeFormat] = _FLOAT_FORMATS | frozenset(
+    {DecodeFormat.U32, DecodeFormat.U32_LE, DecodeFormat.U32_BE}
+)
+
+
+@dataclass
+class SimulatedPoint:
+    """One driver pin backed by the image (a whole register, or one bit of it)."""
+
+    name: str
+    table: str
+    offset: int
+    fmt: DecodeFormat | None
+    bit: int | None
+    low: float
+    high: float
+    counter: bool
+    scale: float | None
+    formula: tuple[float, float, float] | None
+    is_bool: bool
+    value: float
+
+    @property
+    def width(self) -> int:
+        return 2 if self.fmt in _WIDE_FORMATS else 1
+
+
+class RegisterImage:
+    """
+    Register image of one simulated slave, built from its driver register_map.
+
+    - Every readable physical pin gets a plausible engineering value (ranged by `unit`),
+      converted back through scale / formula and encoded in the pin's `format`.
+    - refresh() drifts gauges (bounded random walk) and advances counters (kWh, m³).
+    - Addresses inside a table's mapped span read as 0; outside it answer
+      ILLEGAL DATA ADDRESS, like most meters do.
+    - Writes are stored; a written register is no longer drifted.
+    """
+
+    def __init__(self, driver: dict, *, rng: random.Random | None = None, drift_interval_sec: float = 1.0):
+        self.model: str = str(driver.get("model", "UNKNOWN"))
+        self.rng = rng or random.Random()
+        self.drift_interval_sec = float(drift_interval_sec)
+        self.tables: dict[str, dict[int, int]] = {"h": {}, "i": {}, "c": {}, "d": {}}
+        self.points: list[SimulatedPoint] = []
+        self._pinned: set[tuple[str, int]] = set()
+        self._last_refresh: float | None = None
+
+        default_type: str = driver.get("register_type") or RegisterType.HOLDING.value
+        for name, cfg in (driver.get("register_map") or {}).items():
+            point = self._build_point(name, cfg, default_type)
+            if point is not None:
+                self.points.append(point)
+
+        self._spans: dict[str, tuple[int, int]] = {}
+        for point in self.points:
+            lo, hi = self._spans.get(point.table, (point.offset, point.offset + point.width - 1))
+            self._spans[point.table] = (min(lo, point.offset), max(hi, point.offset + point.width - 1))
+            for addr in range(point.offset, point.offset + point.width):
+                self.tables[point.table].setdefault(addr, 0)
+
+        self._encode_all()
+
+    # ==================== Datastore API ====================
+
+    def read(self, table: str, address: int, count: int) -> list[int] | int:
+        """Register/bit values, or a Modbus exception code."""
+        span = self._spans.get(table)
+        if span is None or address < span[0] or address + count - 1 > span[1]:
+            return ExceptionResponse.ILLEGAL_ADDRESS
+        values = self.tables[table]
+        return [values.get(addr, 0) for addr in range(address, address + count)]
+
+    def write(self, table: str, address: int, values: list[int | bool]) -> int | None:
+        span = self._spans.get(table)
+        if span is None or address < span[0] or address + len(values) - 1 > span[1]:
+            return ExceptionResponse.ILLEGAL_ADDRESS
+        for i, value in enumerate(values):
+            self.tables[table][address + i] = int(value)
+            self._pinned.add((table, address + i))
+        return None
+
+    def refresh(self, now: float) -> None:
+        """Advance the simulated process to `now` (monotonic seconds); cheap when called often."""
+        if self._last_refresh is None:
+            self._last_refresh = now
+            return
+        elapsed = now - self._last_refresh
+        if elapsed < self.drift_interval_sec:
+            return
+        self._last_refresh = now
+
+        for point in self.points:
+            if point.is_bool:
+                if self.rng.random() < 0.01:
+                    point.value = 1.0 - point.value
+            elif point.counter:
+                point.value += (point.high - point.low) * 1e-6 * elapsed * self.rng.uniform(0.5, 1.5)
+            else:
+                step = (point.high - point.low) * 0.02 * self.rng.uniform(-1.0, 1.0)
+                point.value = min(point.high, max(point.low, point.value + step))
+        self._encode_all()
+
+    # ==================== Internal helpers ====================
+
+    def _build_point(self, name: str, cfg: dict, default_type: str) -> SimulatedPoint | None:
+        if not isinstance(cfg, dict) or cfg.get("offset") is None or cfg.get("composed_of"):
+            return None
+
+        table = _TABLE_BY_REGISTER_TYPE.get(cfg.get("register_type") or default_type)
+        if table is None:
+            logger.warning(f"[{self.model}] {name}: unsupported register_type, skipped")
+            return None
+
+        fmt_raw = cfg.get("format")
+        fmt = DecodeFormat.from_string(fmt_raw) if isinstance(fmt_raw, str) else None
+        low, high, counter = _UNIT_RANGES.get(str(cfg.get("unit") or ""), _DEFAULT_RANGE)
+        bit = cfg.get("bit")
+        is_bool = bit is not None or fmt_raw == "bit" or table in ("c", "d") or cfg.get("unit") == "bool"
+        if is_bool:
+            low, high, counter = 0.0, 1.0, False
+
+        scale = cfg.get("scale")
+        formula = cfg.get("formula")
+        point = SimulatedPoint(
+            name=name,
+            table=table,
+            offset=int(cfg["offset"]),
+            fmt=fmt,
+            bit=int(bit) if bit is not None else None,
+            low=low,
+            high=high,
+            counter=counter,
+            scale=float(scale) if isinstance(scale, (int, float)) and scale else None,
+            formula=(
+                tuple(float(x) for x in formula) if isinstance(formula, (list, tuple)) and len(formula) == 3 else None
+            ),
+            is_bool=is_bool,
+            value=0.0,
+        )
+
+        # Shrink the range until its raw encoding fits the register (keeps the shape, drops magnitude)
+        if not point.is_bool and point.fmt not in _FLOAT_FORMATS:
+            limit = _RAW_LIMITS.get(point.fmt, _RAW_LIMIT_DEFAULT) * 0.5
+            raw_high = abs(self._to_raw(point, point.high))
+            if raw_high > limit:
+                point.low *= limit / raw_high
+                point.high *= limit / raw_high
+
+        point.value = float(self.rng.random() < 0.5) if is_bool else self.rng.uniform(point.low, point.high)
+        return point
+
+    def _encode_all(self) -> None:
+        for point in self.points:
+            if (point.table, point.offset) in self._pinned:
+                continue
+            table = self.tables[point.table]
+
+            if point.table in ("c", "d"):
+                table[point.offset] = int(point.value >= 0.5)
+            elif point.bit is not None:
+                mask = 1 << point.bit
+                word = table.get(point.offset, 0)
+                table[point.offset] = (word | mask) if point.value >= 0.5 else (word & ~mask)
+            else:
+                for i, word in enumerate(encode_value(self._to_raw(point, point.value), point.fmt)):
+                    table[point.offset + i] = word
+
+    @staticmethod
+    def _to_raw(point: SimulatedPoint, value: float) -> float:
+        """Invert the device-side transforms (formula: (raw + N1) * N2 + N3, then scale)."""
+        if point.scale:
+            value /= point.scale
+        if point.formula and point.formula[1]:
+            n1, n2, n3 = point.formula
+            value = (value - n3) / n2 - n1
+        return value
+
+
+def encode_value(value: float, fmt: DecodeFormat | None) -> list[int]:
+    """Encode one engineering value into registers; inverse of decode_modbus_registers()."""
+    mixin = ModbusClientMixin
+    match fmt:
+        case DecodeFormat.U32 | DecodeFormat.U32_LE:
+            return mixin.convert_to_registers(_clamp_int(value, 0, 0xFFFFFFFF), mixin.DATATYPE.UINT32, "little")
+        case DecodeFormat.U32_BE:
+            return mixin.convert_to_registers(_clamp_int(value, 0, 0xFFFFFFFF), mixin.DATATYPE.UINT32, "big")
+        case DecodeFormat.F32 | DecodeFormat.F32_BE:
+            return mixin.convert_to_registers(float(value), mixin.DATATYPE.FLOAT32, "big")
+        case DecodeFormat.F32_LE:
+            return mixin.convert_to_registers(float(value), mixin.DATATYPE.FLOAT32, "little")
+        case DecodeFormat.F32_BE_SWAP:
+            words = mixin.convert_to_registers(float(value), mixin.DATATYPE.FLOAT32, "big")
+            return [words[1], words[0]]
+        case DecodeFormat.I16:
+            return [_clamp_int(value, -0x8000, 0x7FFF) & 0xFFFF]
+        case _:
+            return [_clamp_int(value, 0, 0xFFFF)]
+
+
+def _clamp_int(value: float, low: int, high: int) -> int:
+    return max(low, min(high, int(round(value))))
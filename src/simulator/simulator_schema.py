@@ -0,0 +1,69 @@
+from fnmatch import fnmatch
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+
+class SlaveFaultProfile(BaseModel):
+    """Response behaviour of one simulated slave."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    latency_ms: float = Field(default=5.0, ge=0, description="Processing delay before each reply")
+    jitter_ms: float = Field(default=0.0, ge=0, description="Uniform extra delay added on top of latency_ms")
+    timeout_rate: float = Field(default=0.0, ge=0, le=1, description="Share of requests left unanswered")
+    exception_rate: float = Field(default=0.0, ge=0, le=1, description="Share of requests answered with an exception")
+    exception_code: int = Field(
+        default=0x06, ge=1, le=255, description="Injected exception (default SLAVE DEVICE BUSY)"
+    )
+    offline: bool = Field(default=False, description="Never answer (device unplugged)")
+
+
+class SlaveFaultOverride(BaseModel):
+    """Profile fields applied to every slave whose device key matches `match` (fnmatch, e.g. 'SD400_*')."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    match: str = Field(..., description="fnmatch pattern on 'MODEL_SLAVEID'")
+    latency_ms: float | None = Field(default=None, ge=0)
+    jitter_ms: float | None = Field(default=None, ge=0)
+    timeout_rate: float | None = Field(default=None, ge=0, le=1)
+    exception_rate: float | None = Field(default=None, ge=0, le=1)
+    exception_code: int | None = Field(default=None, ge=1, le=255)
+    offline: bool | None = None
+
+
+class SimulatorConfig(BaseModel):
+    """
+    Root config for the Modbus simulator fleet (see res/template/simulator.template.yml).
+
+    Devices come from modbus_device.yml; this file only shapes how they behave and scale.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    link_dir: str = Field(default="/tmp/talos-sim", description="Where serial pty links and the emitted config go")
+    tcp_host: str = Field(default="127.0.0.1", description="Bind address for TCP / RTU-over-TCP buses")
+    tcp_base_port: int = Field(default=0, ge=0, le=65535, description="First TCP port; 0 = ephemeral ports")
+
+    copies: int = Field(default=1, ge=1, le=247, description="Replicate the device list N times on extra buses")
+    wire_time: bool = Field(default=True, description="Add RS-485 frame time (11 bits/char at the bus baudrate)")
+    seed: int | None = Field(default=None, description="Seed for values and fault draws (reproducible runs)")
+
+    defaults: SlaveFaultProfile = Field(default_factory=SlaveFaultProfile)
+    overrides: list[SlaveFaultOverride] = Field(default_factory=list, description="Applied in order, later wins")
+
+    @field_validator("defaults", "overrides", mode="before")
+    @classmethod
+    def _none_to_default(cls, v: Any, info) -> Any:
+        # A section left with only commented-out entries loads as None
+        if v is None:
+            return [] if info.field_name == "overrides" else {}
+        return v
+
+    def profile_for(self, device_key: str) -> SlaveFaultProfile:
+        profile = self.defaults.model_dump()
+        for override in self.overrides:
+            if fnmatch(device_key, override.match):
+                profile.update(override.model_dump(exclude={"match"}, exclude_none=True))
+        return SlaveFaultProfile(**profile)
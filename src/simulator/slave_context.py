@@ -0,0 +1,98 @@
+import asyncio
+import random
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from pymodbus.datastore import ModbusBaseSlaveContext
+from pymodbus.exceptions import NoSuchSlaveException
+
+from simulator.register_image import TABLE_BY_FC, RegisterImage
+from simulator.simulator_schema import SlaveFaultProfile
+
+# RTU frame overhead: slave + fc + CRC (+ address/count on requests, byte count on replies)
+_REQUEST_FRAME_BYTES = 8
+_REPLY_OVERHEAD_BYTES = 5
+_BITS_PER_CHAR = 11
+
+
+@dataclass
+class SlaveStats:
+    requests: int = 0
+    timeouts: int = 0
+    exceptions: int = 0
+
+
+class SimulatedSlaveContext(ModbusBaseSlaveContext):
+    """
+    pymodbus slave context for one simulated device.
+
+    Every request waits latency (+ jitter, + RS-485 frame time when baudrate is set), then
+    either stays silent (timeout_rate / offline), answers the injected exception
+    (exception_rate), or is served from the RegisterImage.
+
+    Silence is signalled with NoSuchSlaveException: the server must run with
+    ignore_missing_slaves=True so the master simply times out, as on a real bus.
+    """
+
+    def __init__(
+        self,
+        image: RegisterImage,
+        profile: SlaveFaultProfile,
+        *,
+        baudrate: int | None = None,
+        rng: random.Random | None = None,
+    ):
+        self.image = image
+        self.profile = profile
+        self.baudrate = baudrate
+        self.rng = rng or random.Random()
+        self.stats = SlaveStats()
+        # pymodbus reads back right after a single write (FC05/06 echo): don't delay / fault twice
+        self._echo_pending = False
+
+    async def async_getValues(self, fc_as_hex: int, address: int, count: int = 1) -> Sequence[int | bool] | int:
+        if self._echo_pending:
+            self._echo_pending = False
+        else:
+            reply_bytes = 2 * count if fc_as_hex in (3, 4) else (count + 7) // 8
+            fault = await self._respond(reply_bytes)
+            if fault is not None:
+                return fault
+        self.image.refresh(time.monotonic())
+        return self.image.read(TABLE_BY_FC[fc_as_hex], address, count)
+
+    async def async_setValues(self, fc_as_hex: int, address: int, values: Sequence[int | bool]) -> None | int:
+        fault = await self._respond(reply_bytes=4)
+        if fault is not None:
+            return fault
+        rc = self.image.write(TABLE_BY_FC[fc_as_hex], address, list(values))
+        self._echo_pending = rc is None and fc_as_hex in (5, 6)
+        return rc
+
+    def reset(self) -> None:
+        self.stats = SlaveStats()
+
+    # ==================== Internal helpers ====================
+
+    async def _respond(self, reply_bytes: int) -> int | None:
+        """Delay like the device would; exception code to inject, or None to serve the request."""
+        profile = self.profile
+        self.stats.requests += 1
+
+        if profile.offline or (profile.timeout_rate and self.rng.random() < profile.timeout_rate):
+            self.stats.timeouts += 1
+            raise NoSuchSlaveException("simulated timeout")
+
+        delay = profile.latency_ms + (self.rng.uniform(0.0, profile.jitter_ms) if profile.jitter_ms else 0.0)
+        delay /= 1000.0
+        if self.baudrate:
+            frame_bytes = _REQUEST_FRAME_BYTES + _REPLY_OVERHEAD_BYTES + reply_bytes
+            delay += frame_bytes * _BITS_PER_CHAR / self.baudrate
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        if profile.exception_rate and self.rng.random() < profile.exception_rate:
+            self.stats.exceptions += 1
+            return profile.exception_code
+        return None
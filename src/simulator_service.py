@@ -0,0 +1,88 @@
+"""
+Talos Modbus Simulator Entry Point
+
+Serves every device of a modbus_device.yml from simulated slaves (pty pairs / local TCP)
+and writes a modbus_device.yml pointing at them, so the main service runs unchanged:
+
+    python src/simulator_service.py --modbus_device res/modbus_device.yml --copies 20
+    python src/main_service.py --modbus_device /tmp/talos-sim/modbus_device.yml ...
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+
+from core.util.config_manager import ConfigManager
+from core.util.logger_config import LOG_LEVEL_MAP, setup_logging
+from simulator.fleet import SimulatorFleet
+from simulator.simulator_schema import SimulatorConfig
+
+logger = logging.getLogger("SimulatorService")
+
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description="Talos Modbus Simulator Fleet")
+
+    parser.add_argument("--modbus_device", default="res/modbus_device.yml", help="Modbus device configuration file")
+    parser.add_argument("--simulator_config", help="Simulator configuration file (faults, scaling)")
+    parser.add_argument("--model_base_path", default="./res", help="Base path of driver files (model_file)")
+    parser.add_argument("--copies", type=int, help="Replicate the device list N times (overrides config)")
+    parser.add_argument("--seed", type=int, help="Random seed (overrides config)")
+    parser.add_argument("--emit_config", help="Where to write the Talos-side modbus_device.yml")
+    parser.add_argument("--stats_interval", type=float, default=30.0, help="Seconds between stats logs (0 = off)")
+    parser.add_argument("--log-level", default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"])
+
+    return parser.parse_args()
+
+
+def load_simulator_config(args: argparse.Namespace) -> SimulatorConfig:
+    raw: dict = {}
+    if args.simulator_config:
+        raw = ConfigManager.load_yaml_file(args.simulator_config) or {}
+    if args.copies is not None:
+        raw["copies"] = args.copies
+    if args.seed is not None:
+        raw["seed"] = args.seed
+    return SimulatorConfig.model_validate(raw)
+
+
+async def run(args: argparse.Namespace) -> None:
+    config = load_simulator_config(args)
+    fleet = SimulatorFleet(args.modbus_device, config, model_base_path=args.model_base_path)
+
+    stop_event = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop_event.set)
+
+    await fleet.start()
+    try:
+        emitted = fleet.write_talos_config(args.emit_config or os.path.join(config.link_dir, "modbus_device.yml"))
+        logger.info(f"[SIM] Talos config written to {emitted} ({len(fleet.devices)} devices)")
+
+        while not stop_event.is_set():
+            timeout = args.stats_interval if args.stats_interval > 0 else None
+            try:
+                await asyncio.wait_for(stop_event.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                stats = fleet.stats()
+                stats.pop("per_device")
+                logger.info(f"[SIM] {json.dumps(stats)}")
+    finally:
+        await fleet.stop()
+        logger.info("[SIM] fleet stopped")
+
+
+def main():
+    args = parse_arguments()
+    setup_logging(log_level=LOG_LEVEL_MAP[args.log_level.upper()])
+    # Injected timeouts surface as pymodbus "slave does not exist" errors on every request
+    logging.getLogger("pymodbus").setLevel(logging.CRITICAL)
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
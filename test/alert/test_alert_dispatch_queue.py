@@ -0,0 +1,174 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+
+from core.model.enum.alert_enum import AlertSeverity
+from core.schema.alert_schema import AlertMessageModel
+from core.schema.notifier_schema import NotificationConfigSchema
+from core.util.notifier.alert_digest import DIGEST_ALERT_CODE, build_digest_alert
+from core.util.notifier.dispatch_queue import NotifierDispatchQueue
+from core.util.notifier.telegram_notifier import TelegramNotifier
+from core.util.notifier.token_bucket import TokenBucket
+
+
+def _alert(slave_id: int = 1, level: AlertSeverity = AlertSeverity.WARNING, message: str = "COMM LOST"):
+    return AlertMessageModel(
+        model="TECO_VFD",
+        slave_id=slave_id,
+        level=level,
+        message=message,
+        alert_code=f"CODE_{slave_id}",
+        timestamp=datetime(2025, 1, 1, 12, 0, slave_id),
+        name="comm_lost",
+        device_name=f"VFD {slave_id}",
+        condition="eq",
+        threshold=0.0,
+        current_value=0.0,
+    )
+
+
+class _Recorder:
+    def __init__(self):
+        self.singles: list[AlertMessageModel] = []
+        self.digests: list[list[AlertMessageModel]] = []
+
+    async def deliver_one(self, alert):
+        self.singles.append(alert)
+        return True
+
+    async def deliver_digest(self, alerts):
+        self.digests.append(list(alerts))
+        return True
+
+
+def _make_queue(recorder: _Recorder, **overrides) -> NotifierDispatchQueue:
+    kwargs = dict(bucket=TokenBucket(rate_per_min=6000, burst=10), window_sec=0.05, max_batch=50)
+    kwargs.update(overrides)
+    return NotifierDispatchQueue("telegram", recorder.deliver_one, recorder.deliver_digest, **kwargs)
+
+
+class TestNotifierDispatchQueue:
+    """Test coalescing, bypass and rate limiting of per-channel dispatch"""
+
+    @pytest.mark.asyncio
+    async def test_when_alerts_arrive_within_window_then_single_digest_is_sent(self):
+        # Arrange
+        recorder = _Recorder()
+        queue = _make_queue(recorder)
+
+        # Act
+        results = await asyncio.gather(*(queue.submit(_alert(i)) for i in range(1, 6)))
+
+        # Assert
+        assert results == [True] * 5
+        assert recorder.singles == []
+        assert len(recorder.digests) == 1 and len(recorder.digests[0]) == 5
+
+    @pytest.mark.asyncio
+    async def test_when_only_one_alert_in_window_then_sent_as_plain_alert(self):
+        # Arrange
+        recorder = _Recorder()
+        queue = _make_queue(recorder)
+
+        # Act
+        ok = await queue.submit(_alert(1))
+
+        # Assert
+        assert ok is True
+        assert [a.alert_code for a in recorder.singles] == ["CODE_1"]
+        assert recorder.digests == []
+
+    @pytest.mark.asyncio
+    async def test_when_critical_then_bypasses_window(self):
+        # Arrange
+        recorder = _Recorder()
+        queue = _make_queue(recorder, window_sec=60)
+
+        # Act
+        ok = await asyncio.wait_for(queue.submit(_alert(1, level=AlertSeverity.CRITICAL)), timeout=1)
+
+        # Assert
+        assert ok is True
+        assert len(recorder.singles) == 1
+        await queue.aclose()
+
+    @pytest.mark.asyncio
+    async def test_when_max_batch_reached_then_flushes_before_window(self):
+        # Arrange
+        recorder = _Recorder()
+        queue = _make_queue(recorder, window_sec=60, max_batch=3)
+
+        # Act
+        results = await asyncio.wait_for(asyncio.gather(*(queue.submit(_alert(i)) for i in range(1, 4))), timeout=1)
+
+        # Assert
+        assert results == [True] * 3
+        assert len(recorder.digests) == 1
+
+    @pytest.mark.asyncio
+    async def test_when_bucket_empty_then_late_alerts_join_next_digest(self):
+        # Arrange: one token, refilling every 0.1s
+        recorder = _Recorder()
+        queue = _make_queue(recorder, bucket=TokenBucket(rate_per_min=600, burst=1), window_sec=0.01)
+
+        # Act
+        first = asyncio.create_task(queue.submit(_alert(1)))
+        await asyncio.sleep(0.03)
+        rest = [asyncio.create_task(queue.submit(_alert(i))) for i in range(2, 6)]
+        await asyncio.gather(first, *rest)
+
+        # Assert: storm of 5 alerts delivered in 2 messages
+        assert len(recorder.singles) + len(recorder.digests) == 2
+        assert [len(batch) for batch in recorder.digests] == [4]
+
+
+class TestDigestConfig:
+    """Test digest opt-in"""
+
+    def test_when_digest_section_missing_then_digest_is_disabled(self):
+        # Act
+        config = NotificationConfigSchema.model_validate({})
+
+        # Assert
+        assert config.digest.enabled is False
+
+
+class TestAlertDigest:
+    """Test digest alert construction"""
+
+    def test_when_build_digest_then_grouped_by_severity_and_device(self):
+        # Arrange
+        alerts = [
+            _alert(1),
+            _alert(2, level=AlertSeverity.ERROR, message="Overcurrent"),
+            _alert(1),
+        ]
+
+        # Act
+        digest = build_digest_alert(alerts)
+
+        # Assert
+        assert digest.alert_code == DIGEST_ALERT_CODE
+        assert digest.level == AlertSeverity.ERROR
+        assert digest.message.splitlines() == [
+            "[ERROR]",
+            "- VFD 2 (TECO_VFD_2): Overcurrent",
+            "[WARNING]",
+            "- VFD 1 (TECO_VFD_1): COMM LOST x2",
+        ]
+        assert digest.current_value == 3.0
+
+    def test_when_telegram_formats_digest_then_each_device_listed_once(self):
+        # Arrange
+        notifier = TelegramNotifier(bot_token="t", chat_id="1")
+        alerts = [_alert(1), _alert(2), _alert(1)]
+
+        # Act
+        payload = notifier._build_digest_payload(alerts)
+
+        # Assert
+        assert payload["chat_id"] == "1"
+        assert "3 alerts" in payload["text"]
+        assert payload["text"].count("TECO_VFD_1") == 1
+        assert "COMM LOST ×2" in payload["text"]
@@ -326,6 +326,67 @@ def test_when_alert_re_triggers_after_resolution_then_notifies(mock_alert_config
     assert results[0].notification_type == AlertState.TRIGGERED.name
 
 
+# ============================================================
+# Input Change Skipping Tests
+# ============================================================
+
+
+def test_when_inputs_unchanged_and_state_normal_then_evaluation_skipped(mock_alert_config, valid_device_ids):
+    """Test NORMAL alerts with unchanged source pins are not re-evaluated"""
+    # Arrange
+    evaluator = AlertEvaluator(mock_alert_config, valid_device_ids)
+    fake_snapshot = {"AIn01": 48.0, "OTHER": 1.0}
+
+    # Act
+    evaluator.evaluate("SD400_3", fake_snapshot)
+    results = evaluator.evaluate("SD400_3", {**fake_snapshot, "OTHER": 2.0})  # Unrelated pin changed
+
+    # Assert
+    assert results == []
+    assert evaluator.skipped_evaluations == 1
+
+
+def test_when_source_input_changes_then_alert_re_evaluated(mock_alert_config, valid_device_ids):
+    """Test a changed source pin is evaluated even when the alert is NORMAL"""
+    # Arrange
+    evaluator = AlertEvaluator(mock_alert_config, valid_device_ids)
+    evaluator.evaluate("SD400_3", {"AIn01": 48.0})
+
+    # Act
+    results = evaluator.evaluate("SD400_3", {"AIn01": 50.0})
+
+    # Assert
+    assert len(results) == 1
+    assert results[0].notification_type == AlertState.TRIGGERED.name
+    assert evaluator.skipped_evaluations == 0
+
+
+def test_when_alert_active_then_unchanged_inputs_still_evaluated(mock_alert_config, valid_device_ids):
+    """Test skipping never applies to alerts outside the NORMAL state"""
+    # Arrange
+    evaluator = AlertEvaluator(mock_alert_config, valid_device_ids)
+    evaluator.evaluate("SD400_3", {"AIn01": 50.0})  # TRIGGERED
+
+    # Act
+    evaluator.evaluate("SD400_3", {"AIn01": 50.0})
+
+    # Assert
+    assert evaluator.skipped_evaluations == 0
+    assert evaluator.state_manager.get_state("SD400_3", "AIN01_HIGH") == AlertState.ACTIVE
+
+
+def test_when_config_loaded_then_alerts_indexed_by_device_id(mock_alert_config, valid_device_ids):
+    """Test alert configs are compiled into a flat device_id index with source pins"""
+    # Arrange & Act
+    evaluator = AlertEvaluator(mock_alert_config, valid_device_ids)
+
+    # Assert
+    compiled = evaluator.alerts_by_device["SD400_3"]
+    assert [c.alert.code for c in compiled] == ["AIN01_HIGH"]
+    assert compiled[0].sources == ("AIn01",)
+    assert compiled[0].time_dependent is False
+
+
 # ============================================================
 # Condition Operator Tests
 # ============================================================
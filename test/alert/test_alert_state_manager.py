@@ -1,5 +1,8 @@
+import pytest
+
 from core.evaluator.alert_state_manager import AlertState, AlertStateManager
 from core.schema.alert_schema import AlertSeverity
+from repository.alert_state_store import AlertStateStore
 
 
 class TestAlertStateManager:
@@ -117,3 +120,93 @@ class TestAlertStateManager:
         assert should_notify is True
         assert manager.get_state("SD400_3", "AIN01_HIGH") == AlertState.TRIGGERED
         assert manager.get_state("SD400_3", "AIN02_LOW") == AlertState.TRIGGERED
+
+
+class TestAlertStateManagerPersistence:
+
+    @pytest.mark.asyncio
+    async def test_when_restarted_with_active_alert_then_no_duplicate_notify(self, tmp_path):
+        """Active alarms restored from the store should not re-send TRIGGERED"""
+        # Arrange
+        db_path = str(tmp_path / "alert_state.db")
+        manager = AlertStateManager(store=AlertStateStore(db_path))
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 50.0)
+        await manager.flush()
+
+        # Act
+        restarted = AlertStateManager(store=AlertStateStore(db_path))
+        should_notify, notification_type = restarted.should_notify(
+            "SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 51.0
+        )
+
+        # Assert
+        assert should_notify is False
+        assert notification_type is None
+        assert restarted.get_state("SD400_3", "AIN01_HIGH") == AlertState.ACTIVE
+
+    @pytest.mark.asyncio
+    async def test_when_state_cleared_to_normal_then_row_deleted_on_flush(self, tmp_path):
+        """RESOLVED → NORMAL cleanup should drop the persisted row"""
+        # Arrange
+        store = AlertStateStore(str(tmp_path / "alert_state.db"))
+        manager = AlertStateManager(store=store)
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 50.0)
+        await manager.flush()
+
+        # Act
+        manager.should_notify("SD400_3", "AIN01_HIGH", False, AlertSeverity.WARNING, 48.0)  # RESOLVED
+        manager.should_notify("SD400_3", "AIN01_HIGH", False, AlertSeverity.WARNING, 47.0)  # NORMAL
+        await manager.flush()
+
+        # Assert
+        assert store.load_all() == []
+
+    def test_when_changes_pending_then_not_written_until_flush(self, tmp_path):
+        """Transitions should be written behind, not on the hot path"""
+        # Arrange
+        store = AlertStateStore(str(tmp_path / "alert_state.db"))
+        manager = AlertStateManager(store=store)
+
+        # Act
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 50.0)
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 51.0)
+        upserts, deletes = manager.collect_changes()
+
+        # Assert
+        assert store.load_all() == []
+        assert [(r.alert_code, r.state) for r in upserts] == [("AIN01_HIGH", AlertState.ACTIVE)]
+        assert deletes == []
+
+    def test_when_active_alert_value_unchanged_then_row_not_rewritten(self, tmp_path):
+        """ACTIVE → ACTIVE with the same value should not mark the row dirty"""
+        # Arrange
+        manager = AlertStateManager(store=AlertStateStore(str(tmp_path / "alert_state.db")))
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 50.0)
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 51.0)
+        manager.collect_changes()
+
+        # Act
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 51.0)
+        unchanged, _ = manager.collect_changes()
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 52.0)
+        changed, _ = manager.collect_changes()
+
+        # Assert
+        assert unchanged == []
+        assert [r.last_value for r in changed] == [52.0]
+
+    def test_when_compacting_then_old_resolved_rows_removed(self, tmp_path):
+        """Compaction should drop RESOLVED rows past retention"""
+        # Arrange
+        store = AlertStateStore(str(tmp_path / "alert_state.db"))
+        manager = AlertStateManager(store=store)
+        manager.should_notify("SD400_3", "AIN01_HIGH", True, AlertSeverity.WARNING, 50.0)
+        manager.should_notify("SD400_3", "AIN01_HIGH", False, AlertSeverity.WARNING, 48.0)
+        store.apply_changes(*manager.collect_changes())
+
+        # Act
+        deleted = store.compact(resolved_retention_hours=-1)
+
+        # Assert
+        assert deleted == 1
+        assert store.load_all() == []
@@ -0,0 +1,87 @@
+"""
+Test DiagnosticsRouter endpoints
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.app import create_application
+from api.app_state import TalosAppState
+from core.util.loop_profiler import LoopProfiler
+
+
+@pytest.fixture
+def client():
+    """Create test client with a mocked LoopProfiler"""
+    app = create_application()
+    app.state.talos = TalosAppState(unified_mode=False)
+
+    mock_profiler = MagicMock(spec=LoopProfiler)
+    mock_profiler.profiling = False
+    mock_profiler.summary.return_value = {"enabled": True, "stall_count": 1, "owners": {}, "stalls": []}
+    mock_profiler.profile = AsyncMock(return_value="main;run_forever;select 40\nmain;sub 2\n")
+    app.state.talos.loop_profiler = mock_profiler
+
+    return TestClient(app), mock_profiler
+
+
+class TestLoopSummary:
+    """Test GET /api/diagnostics/loop endpoint"""
+
+    def test_when_profiler_enabled_then_returns_summary(self, client):
+        test_client, mock_profiler = client
+
+        response = test_client.get("/api/diagnostics/loop")
+
+        assert response.status_code == 200
+        assert response.json()["stall_count"] == 1
+        mock_profiler.reset.assert_not_called()
+
+    def test_when_reset_requested_then_counters_cleared_after_read(self, client):
+        test_client, mock_profiler = client
+
+        response = test_client.get("/api/diagnostics/loop", params={"reset": True})
+
+        assert response.status_code == 200
+        mock_profiler.reset.assert_called_once()
+
+    def test_when_profiler_disabled_then_returns_503(self, client):
+        test_client, _ = client
+        test_client.app.state.talos.loop_profiler = None
+
+        response = test_client.get("/api/diagnostics/loop")
+
+        assert response.status_code == 503
+
+
+class TestLoopProfile:
+    """Test GET /api/diagnostics/profile endpoint"""
+
+    def test_when_success_then_returns_collapsed_stacks(self, client):
+        test_client, mock_profiler = client
+
+        response = test_client.get("/api/diagnostics/profile", params={"seconds": 2, "interval_ms": 10})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert response.text.splitlines()[0] == "main;run_forever;select 40"
+        mock_profiler.profile.assert_awaited_once_with(2.0, interval_sec=0.01)
+
+    def test_when_profile_already_running_then_returns_409(self, client):
+        test_client, mock_profiler = client
+        mock_profiler.profiling = True
+
+        response = test_client.get("/api/diagnostics/profile")
+
+        assert response.status_code == 409
+        mock_profiler.profile.assert_not_awaited()
+
+    def test_when_seconds_above_limit_then_returns_422(self, client):
+        test_client, mock_profiler = client
+        mock_profiler.profile.side_effect = ValueError("seconds must be <= 60.0")
+
+        response = test_client.get("/api/diagnostics/profile", params={"seconds": 120})
+
+        assert response.status_code == 422
@@ -0,0 +1,75 @@
+"""
+Test DiscoveryRouter endpoints
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api.app import create_application
+from api.app_state import TalosAppState
+from api.dependency import get_discovery_service
+from api.model.discovery import DiscoveryScanResponse, PortScanInfo
+from api.service.discovery_service import DiscoveryService
+from exception import PortInUseError
+
+
+@pytest.fixture
+def client():
+    """Create test client with mocked DiscoveryService"""
+    app = create_application()
+    app.state.talos = TalosAppState(unified_mode=False)
+
+    mock_service = MagicMock(spec=DiscoveryService)
+    mock_service.scan = AsyncMock(
+        return_value=DiscoveryScanResponse(
+            results=[
+                PortScanInfo(endpoint="/dev/ttyUSB0", hits=[{"slave_id": 3, "baudrate": 9600, "latency_ms": 8.0}])
+            ],
+            total_found=1,
+        )
+    )
+    app.dependency_overrides[get_discovery_service] = lambda: mock_service
+
+    return TestClient(app), mock_service
+
+
+class TestScan:
+    """Test POST /api/discovery/scan endpoint"""
+
+    def test_when_success_then_returns_hits(self, client):
+        test_client, mock_service = client
+
+        response = test_client.post("/api/discovery/scan", json={"targets": [{"port": "/dev/ttyUSB0"}]})
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_found"] == 1
+        assert data["results"][0]["hits"][0]["slave_id"] == 3
+        mock_service.scan.assert_awaited_once()
+
+    def test_when_port_in_use_then_returns_409(self, client):
+        test_client, mock_service = client
+        mock_service.scan.side_effect = PortInUseError("/dev/ttyUSB0 is in use by configured devices")
+
+        response = test_client.post("/api/discovery/scan", json={"targets": [{"port": "/dev/ttyUSB0"}]})
+
+        assert response.status_code == 409
+
+    def test_when_serial_target_without_port_then_returns_422(self, client):
+        test_client, _ = client
+
+        response = test_client.post("/api/discovery/scan", json={"targets": [{"transport": "serial"}]})
+
+        assert response.status_code == 422
+
+    def test_when_slave_range_inverted_then_returns_422(self, client):
+        test_client, _ = client
+
+        response = test_client.post(
+            "/api/discovery/scan",
+            json={"targets": [{"port": "/dev/ttyUSB0", "slave_id_start": 10, "slave_id_end": 2}]},
+        )
+
+        assert response.status_code == 422
@@ -0,0 +1,280 @@
+"""
+Benchmark harness: timing loops, process resource probes and baseline comparison.
+
+Stdlib only, so it runs on a gateway as-is. Results are plain dicts of metrics; every
+metric listed in `compare` is "lower is better" and is checked against the stored baseline.
+"""
+
+import json
+import math
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - non-POSIX
+    resource = None
+
+REPORT_VERSION = 1
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    kind: str  # "micro" | "macro"
+    metrics: dict[str, float]
+    compare: tuple[str, ...] = ()  # lower-is-better metrics checked against the baseline
+    info: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"kind": self.kind, "metrics": self.metrics, "compare": list(self.compare), "info": self.info}
+
+
+@dataclass
+class Comparison:
+    name: str
+    metric: str
+    baseline: float | None
+    current: float
+    status: str  # "ok" | "regression" | "improved" | "new"
+
+    @property
+    def change_pct(self) -> float | None:
+        if not self.baseline:
+            return None
+        return (self.current / self.baseline - 1.0) * 100.0
+
+    def to_dict(self) -> dict[str, Any]:
+        change = self.change_pct
+        return {
+            "name": self.name,
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "current": self.current,
+            "change_pct": round(change, 1) if change is not None else None,
+            "status": self.status,
+        }
+
+
+# ==================== Timing ====================
+
+
+def percentile(values: Iterable[float], q: float) -> float:
+    """Nearest-rank percentile (q in 0..1) of a non-empty sample."""
+    ordered = sorted(values)
+    if not ordered:
+        raise ValueError("percentile of an empty sample")
+    index = min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _calibrate(run_batch: Callable[[int], float], min_batch_sec: float) -> int:
+    """Smallest power-of-ten call count whose batch takes at least min_batch_sec."""
+    number = 1
+    while True:
+        if run_batch(number) >= min_batch_sec or number >= 10**7:
+            return number
+        number *= 10
+
+
+def _micro_result(name: str, per_call_sec: list[float], number: int, info: dict[str, Any] | None) -> BenchmarkResult:
+    p50 = statistics.median(per_call_sec)
+    return BenchmarkResult(
+        name=name,
+        kind="micro",
+        metrics={
+            "p50_us": round(p50 * 1e6, 3),
+            "min_us": round(min(per_call_sec) * 1e6, 3),
+            "mean_us": round(statistics.fmean(per_call_sec) * 1e6, 3),
+            "max_us": round(max(per_call_sec) * 1e6, 3),
+            "ops_per_sec": round(1.0 / p50, 1) if p50 > 0 else 0.0,
+        },
+        compare=("min_us",),  # the fastest batch is the least disturbed by other load
+        info={"calls_per_batch": number, "batches": len(per_call_sec), **(info or {})},
+    )
+
+
+def measure(
+    name: str,
+    func: Callable[[], Any],
+    *,
+    repeat: int = 15,
+    min_batch_sec: float = 0.05,
+    info: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    """
+    Time a synchronous callable: calibrate the batch size, then report per-call
+    statistics over `repeat` batches.
+    """
+
+    def run_batch(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        return time.perf_counter() - start
+
+    number = _calibrate(run_batch, min_batch_sec)
+    per_call = [run_batch(number) / number for _ in range(repeat)]
+    return _micro_result(name, per_call, number, info)
+
+
+async def measure_async(
+    name: str,
+    func: Callable[[], Awaitable[Any]],
+    *,
+    repeat: int = 15,
+    min_batch_sec: float = 0.05,
+    info: dict[str, Any] | None = None,
+) -> BenchmarkResult:
+    """Async counterpart of measure(); each call is awaited on the running loop."""
+
+    async def run_batch(number: int) -> float:
+        start = time.perf_counter()
+        for _ in range(number):
+            await func()
+        return time.perf_counter() - start
+
+    number = 1
+    while await run_batch(number) < min_batch_sec and number < 10**7:
+        number *= 10
+    per_call = [await run_batch(number) / number for _ in range(repeat)]
+    return _micro_result(name, per_call, number, info)
+
+
+# ==================== Process resources ====================
+
+
+def current_rss_mb() -> float:
+    """Resident set size of this process, in MiB."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+    except (OSError, ValueError, IndexError):
+        return peak_rss_mb()
+
+
+def peak_rss_mb() -> float:
+    if resource is None:
+        return 0.0
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+class ResourceProbe:
+    """CPU time, wall time and RSS of this process over a `with` block."""
+
+    def __enter__(self) -> "ResourceProbe":
+        self.rss_start_mb = current_rss_mb()
+        self.cpu_start = time.process_time()
+        self.wall_start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.cpu_sec = time.process_time() - self.cpu_start
+        self.wall_sec = time.perf_counter() - self.wall_start
+        self.rss_end_mb = current_rss_mb()
+        self.rss_peak_mb = peak_rss_mb()
+
+    def metrics(self) -> dict[str, float]:
+        return {
+            "wall_sec": round(self.wall_sec, 3),
+            "cpu_sec": round(self.cpu_sec, 3),
+            "cpu_pct": round(self.cpu_sec / self.wall_sec * 100.0, 1) if self.wall_sec > 0 else 0.0,
+            "rss_mb": round(self.rss_end_mb, 1),
+            "rss_growth_mb": round(self.rss_end_mb - self.rss_start_mb, 1),
+            "rss_peak_mb": round(self.rss_peak_mb, 1),
+        }
+
+
+# ==================== Report & baseline ====================
+
+
+def environment_info() -> dict[str, Any]:
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5, check=False
+        ).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        revision = ""
+    return {
+        "created_at": datetime.now().astimezone().isoformat(timespec="seconds"),
+        "git_revision": revision or None,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def build_report(results: list[BenchmarkResult], comparisons: list[Comparison] | None = None) -> dict[str, Any]:
+    report: dict[str, Any] = {
+        "version": REPORT_VERSION,
+        "meta": environment_info(),
+        "results": {result.name: result.to_dict() for result in results},
+    }
+    if comparisons is not None:
+        report["comparison"] = [comparison.to_dict() for comparison in comparisons]
+    return report
+
+
+def write_report(path: str, report: dict[str, Any]) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=False)
+        f.write("\n")
+
+
+def load_report(path: str) -> dict[str, Any] | None:
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare_with_baseline(
+    results: list[BenchmarkResult], baseline: dict[str, Any] | None, tolerance: float
+) -> list[Comparison]:
+    """
+    Compare each result's `compare` metrics with the baseline report.
+
+    A metric regresses when it grew by more than `tolerance` (0.25 = 25 %), and improves
+    when it shrank by more than that. Benchmarks or metrics missing from the baseline are "new".
+    """
+    baseline_results: dict[str, Any] = (baseline or {}).get("results", {})
+    comparisons: list[Comparison] = []
+
+    for result in results:
+        previous = baseline_results.get(result.name, {}).get("metrics", {})
+        for metric in result.compare:
+            current = float(result.metrics[metric])
+            reference = previous.get(metric)
+            if reference is None or reference <= 0:
+                status = "new"
+            elif current > reference * (1.0 + tolerance):
+                status = "regression"
+            elif current < reference * (1.0 - tolerance):
+                status = "improved"
+            else:
+                status = "ok"
+            comparisons.append(Comparison(result.name, metric, reference, current, status))
+
+    return comparisons
+
+
+def format_comparison_table(comparisons: list[Comparison]) -> list[str]:
+    lines = [f"{'benchmark':<50} {'metric':<20} {'baseline':>12} {'current':>12} {'change':>8}  status"]
+    for c in comparisons:
+        baseline = f"{c.baseline:.3f}" if c.baseline is not None else "-"
+        change = f"{c.change_pct:+.1f}%" if c.change_pct is not None else "-"
+        lines.append(f"{c.name:<50} {c.metric:<20} {baseline:>12} {c.current:>12.3f} {change:>8}  {c.status}")
+    return lines
@@ -0,0 +1,112 @@
+"""
+Benchmark suite options and result collection.
+
+Benchmarks are skipped unless --benchmark is given (run from the repo root):
+
+    python -m pytest test/benchmark --benchmark
+    python -m pytest test/benchmark --benchmark --benchmark-devices 200 --benchmark-cycles 20
+    python -m pytest test/benchmark --benchmark --benchmark-save-baseline   # refresh baseline.json
+
+Results go to --benchmark-json; every compared metric is checked against --benchmark-baseline
+and the session fails when one grew by more than --benchmark-tolerance.
+"""
+
+import os
+
+import pytest
+from benchmark_harness import (
+    BenchmarkResult,
+    build_report,
+    compare_with_baseline,
+    format_comparison_table,
+    load_report,
+    write_report,
+)
+
+DEFAULT_BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+_results_key = pytest.StashKey[list[BenchmarkResult]]()
+_comparison_key = pytest.StashKey[list]()
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("benchmark")
+    group.addoption("--benchmark", action="store_true", default=False, help="Run the benchmark suite")
+    group.addoption("--benchmark-json", default="logs/benchmark_results.json", help="Where to write the JSON results")
+    group.addoption("--benchmark-baseline", default=DEFAULT_BASELINE_PATH, help="Baseline JSON to compare against")
+    group.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=0.25,
+        help="Allowed growth of a compared metric before it counts as a regression (0.25 = 25%%)",
+    )
+    group.addoption(
+        "--benchmark-save-baseline", action="store_true", default=False, help="Overwrite the baseline with this run"
+    )
+    group.addoption("--benchmark-devices", type=int, default=100, help="Simulated devices in macro scenarios")
+    group.addoption("--benchmark-cycles", type=int, default=10, help="Monitor cycles measured per macro scenario")
+
+
+def pytest_configure(config):
+    config.stash[_results_key] = []
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark", default=False):
+        return
+    skip = pytest.mark.skip(reason="benchmarks run only with --benchmark")
+    for item in items:
+        if item.get_closest_marker("benchmark"):
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def benchmark_results(request) -> list[BenchmarkResult]:
+    """Session-wide result list; benchmarks append their BenchmarkResult to it."""
+    return request.config.stash[_results_key]
+
+
+@pytest.fixture
+def benchmark_devices(request) -> int:
+    return int(request.config.getoption("--benchmark-devices", default=100))
+
+
+@pytest.fixture
+def benchmark_cycles(request) -> int:
+    return int(request.config.getoption("--benchmark-cycles", default=10))
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    results: list[BenchmarkResult] = config.stash.get(_results_key, [])
+    if not results or not config.getoption("--benchmark", default=False):
+        return
+
+    baseline_path: str = config.getoption("--benchmark-baseline")
+    comparisons = compare_with_baseline(results, load_report(baseline_path), config.getoption("--benchmark-tolerance"))
+    config.stash[_comparison_key] = comparisons
+
+    write_report(config.getoption("--benchmark-json"), build_report(results, comparisons))
+    if config.getoption("--benchmark-save-baseline"):
+        write_report(baseline_path, build_report(results))
+        return
+
+    if any(c.status == "regression" for c in comparisons) and session.exitstatus == pytest.ExitCode.OK:
+        session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    comparisons = config.stash.get(_comparison_key, None)
+    if comparisons is None:
+        return
+
+    terminalreporter.section("benchmark")
+    for line in format_comparison_table(comparisons):
+        terminalreporter.write_line(line)
+    terminalreporter.write_line(f"results: {config.getoption('--benchmark-json')}")
+    if config.getoption("--benchmark-save-baseline"):
+        terminalreporter.write_line(f"baseline saved: {config.getoption('--benchmark-baseline')}")
+    elif any(c.status == "regression" for c in comparisons):
+        terminalreporter.write_line(
+            f"regressions above {config.getoption('--benchmark-tolerance'):.0%} of baseline", red=True
+        )
@@ -0,0 +1,87 @@
+import pytest
+from benchmark_harness import (
+    BenchmarkResult,
+    build_report,
+    compare_with_baseline,
+    load_report,
+    measure,
+    percentile,
+    write_report,
+)
+
+
+def _result(name: str, **metrics: float) -> BenchmarkResult:
+    return BenchmarkResult(name=name, kind="micro", metrics=metrics, compare=tuple(metrics))
+
+
+class TestBaselineComparison:
+    """Regression detection against a stored baseline report"""
+
+    def test_when_metric_grows_beyond_tolerance_then_regression(self):
+        # Arrange
+        baseline = build_report([_result("decode", p50_us=10.0), _result("plan", p50_us=10.0)])
+        current = [_result("decode", p50_us=13.0), _result("plan", p50_us=12.0)]
+
+        # Act
+        comparisons = compare_with_baseline(current, baseline, tolerance=0.25)
+
+        # Assert
+        assert [(c.name, c.status) for c in comparisons] == [("decode", "regression"), ("plan", "ok")]
+        assert comparisons[0].change_pct == pytest.approx(30.0)
+
+    def test_when_metric_shrinks_beyond_tolerance_then_improved(self):
+        # Arrange
+        baseline = build_report([_result("decode", p50_us=10.0)])
+
+        # Act
+        comparisons = compare_with_baseline([_result("decode", p50_us=5.0)], baseline, tolerance=0.25)
+
+        # Assert
+        assert comparisons[0].status == "improved"
+
+    def test_when_benchmark_or_baseline_missing_then_new(self):
+        # Arrange
+        baseline = build_report([_result("decode", p50_us=10.0)])
+
+        # Act
+        with_baseline = compare_with_baseline([_result("pubsub", p50_us=1.0)], baseline, tolerance=0.25)
+        without_baseline = compare_with_baseline([_result("decode", p50_us=1.0)], None, tolerance=0.25)
+
+        # Assert
+        assert with_baseline[0].status == "new" and with_baseline[0].change_pct is None
+        assert without_baseline[0].status == "new"
+
+    def test_when_report_written_then_it_loads_back_as_baseline(self, tmp_path):
+        # Arrange
+        path = str(tmp_path / "nested" / "baseline.json")
+        write_report(path, build_report([_result("decode", p50_us=10.0)]))
+
+        # Act
+        baseline = load_report(path)
+        comparisons = compare_with_baseline([_result("decode", p50_us=10.5)], baseline, tolerance=0.25)
+
+        # Assert
+        assert baseline["meta"]["python"]
+        assert comparisons[0].status == "ok"
+        assert load_report(str(tmp_path / "missing.json")) is None
+
+
+class TestTiming:
+    """Timing helpers"""
+
+    def test_when_percentile_taken_then_nearest_rank_is_returned(self):
+        samples = [float(v) for v in range(1, 101)]
+
+        assert percentile(samples, 0.5) == 50.0
+        assert percentile(samples, 0.99) == 99.0
+        assert percentile(samples, 1.0) == 100.0
+        assert percentile([3.0], 0.99) == 3.0
+
+    def test_when_callable_measured_then_batches_are_calibrated(self):
+        # Act
+        result = measure("noop", lambda: None, repeat=3, min_batch_sec=0.001)
+
+        # Assert
+        assert result.kind == "micro" and result.compare == ("min_us",)
+        assert result.info["batches"] == 3 and result.info["calls_per_batch"] >= 1
+        assert result.metrics["min_us"] <= result.metrics["p50_us"] <= result.metrics["max_us"]
@@ -0,0 +1,335 @@
+import asyncio
+import contextlib
+import math
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any
+
+import pytest
+import yaml
+from benchmark_harness import BenchmarkResult, ResourceProbe, percentile
+
+from core.evaluator.alert_evaluator import AlertEvaluator
+from core.schema.alert_config_schema import AlertConfig
+from core.schema.constraint_schema import ConstraintConfigSchema
+from core.sender.legacy.legacy_format_adapter import convert_snapshot_to_legacy_payload
+from core.util.device_health_manager import DeviceHealthManager
+from core.util.factory.snapshot_factory import build_snapshot_subscriber
+from core.util.factory.time_factory import build_time_control_subscriber
+from core.util.pubsub.in_memory_pubsub import InMemoryPubSub
+from core.util.pubsub.pubsub_topic import PubSubTopic
+from core.util.pubsub.pubsub_util import PUBSUB_POLICIES
+from core.util.pubsub.subscriber.alert_evaluator_subscriber import AlertEvaluatorSubscriber
+from core.util.pubsub.subscriber.sender_subscriber import SenderSubscriber
+from device_manager import AsyncDeviceManager
+from device_monitor import AsyncDeviceMonitor
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+RES_DIR = REPO_ROOT / "res"
+SIMULATOR_ENTRY = REPO_ROOT / "src" / "simulator_service.py"
+
+MODEL = "DAE_PM210"
+DEVICES_PER_BUS = 10
+MONITOR_INTERVAL_SEC = 1.0
+READ_CONCURRENCY = 50
+SIMULATED_LATENCY_MS = 2
+WARMUP_CYCLES = 1
+STAGES = ("saver", "sender", "alert")
+PIPELINE_TOPICS = (PubSubTopic.DEVICE_SNAPSHOT, PubSubTopic.SNAPSHOT_ALLOWED)
+
+pytestmark = pytest.mark.benchmark
+
+
+class _TimedMonitor(AsyncDeviceMonitor):
+    """Monitor that times each polling cycle and stamps the snapshots it publishes."""
+
+    def __init__(self, *args, cycles: int, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cycles = cycles
+        self.cycle_sec: list[float] = []
+        self.sampled_at: dict[int, float] = {}  # id(snapshot["values"]) -> sampling epoch seconds
+        self.published: list[dict[str, Any]] = []  # keeps measured snapshots alive, so their ids stay unique
+        self.measuring = asyncio.Event()
+        self.finished = asyncio.Event()
+        self._seen_cycles = 0
+
+    async def _run_one_cycle(self, due_classes=None) -> list[dict[str, Any]]:
+        start = time.perf_counter()
+        snapshots = await super()._run_one_cycle(due_classes)
+        elapsed = time.perf_counter() - start
+
+        self._seen_cycles += 1
+        if self._seen_cycles == WARMUP_CYCLES:
+            self.measuring.set()
+        elif self.measuring.is_set() and not self.finished.is_set():
+            self.cycle_sec.append(elapsed)
+            for snapshot in snapshots:
+                self.sampled_at[id(snapshot["values"])] = snapshot["sampling_datetime"].timestamp()
+            self.published.extend(snapshots)
+            if len(self.cycle_sec) >= self.cycles:
+                self.finished.set()
+        return snapshots
+
+
+class _LatencyRecorder:
+    """Sampling-to-completion latency per pipeline stage, and end to end once every stage is done."""
+
+    def __init__(self, sampled_at: dict[int, float]):
+        self.sampled_at = sampled_at
+        self.by_stage: dict[str, list[float]] = defaultdict(list)
+        self.end_to_end: list[float] = []
+        self._pending: dict[int, set[str]] = {}
+
+    def done(self, stage: str, values: dict) -> None:
+        key = id(values)
+        sampled = self.sampled_at.get(key)
+        if sampled is None:
+            return
+        latency = time.time() - sampled
+        self.by_stage[stage].append(latency)
+        pending = self._pending.setdefault(key, set(STAGES))
+        pending.discard(stage)
+        if not pending:
+            self.end_to_end.append(latency)
+
+
+class _LegacyPayloadHandler:
+    """Sender stage without the network: the per-snapshot legacy conversion the live sender runs."""
+
+    def __init__(self, device_manager: AsyncDeviceManager, recorder: _LatencyRecorder):
+        self.device_manager = device_manager
+        self.recorder = recorder
+
+    async def handle_snapshot(self, snapshot: dict) -> None:
+        convert_snapshot_to_legacy_payload("GW_BENCH", snapshot, self.device_manager)
+        self.recorder.done("sender", snapshot["values"])
+
+
+@contextlib.asynccontextmanager
+async def _simulator_process(workdir: Path, devices: int):
+    """Simulated TCP buses in a child process (its CPU stays out of the measurement); yields the Talos config."""
+    source = workdir / "sim_source.yml"
+    source.write_text(
+        yaml.safe_dump(
+            {
+                "devices": [
+                    {
+                        "model": MODEL,
+                        "type": "power_meter",
+                        "model_file": "driver/dae_pm210.yml",
+                        "transport": "tcp",
+                        "host": "127.0.0.1",
+                        "slave_id": slave_id,
+                    }
+                    for slave_id in range(1, min(devices, DEVICES_PER_BUS) + 1)
+                ]
+            }
+        )
+    )
+    sim_config = workdir / "simulator.yml"
+    sim_config.write_text(
+        yaml.safe_dump(
+            {
+                "link_dir": str(workdir / "links"),
+                "tcp_host": "127.0.0.1",
+                "copies": math.ceil(devices / DEVICES_PER_BUS),
+                "seed": 1,
+                "defaults": {"latency_ms": SIMULATED_LATENCY_MS},
+            }
+        )
+    )
+    talos_config = workdir / "talos_devices.yml"
+
+    process = subprocess.Popen(
+        [
+            sys.executable,
+            str(SIMULATOR_ENTRY),
+            "--modbus_device",
+            str(source),
+            "--simulator_config",
+            str(sim_config),
+            "--model_base_path",
+            str(RES_DIR),
+            "--emit_config",
+            str(talos_config),
+            "--stats_interval",
+            "0",
+            "--log-level",
+            "WARNING",
+        ],
+        cwd=workdir,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        deadline = time.monotonic() + 60.0
+        while not talos_config.exists():
+            if process.poll() is not None or time.monotonic() > deadline:
+                raise RuntimeError(f"simulator did not start (exit code {process.poll()})")
+            await asyncio.sleep(0.05)
+        await asyncio.sleep(0.2)  # config is written right after the listeners are up
+        yield str(talos_config)
+    finally:
+        process.terminate()
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def _alert_config(device_ids: set[str]) -> AlertConfig:
+    """Never-firing threshold alerts on the meter's gauges, so every snapshot takes the full evaluation path."""
+    pins = ["Phase_A_Voltage", "Phase_B_Voltage", "Phase_C_Voltage", "Phase_A_Current", "Kw", "AveragePowerFactor"]
+    alerts = [
+        {
+            "code": f"{pin.upper()}_HIGH",
+            "name": f"{pin} high",
+            "sources": [pin],
+            "condition": "gt",
+            "threshold": 1e6,
+            "severity": "WARNING",
+            "type": "threshold",
+        }
+        for pin in pins
+    ]
+    instances = {device_id.rsplit("_", 1)[1]: {"use_default_alerts": True} for device_id in device_ids}
+    return AlertConfig.model_validate({"root": {MODEL: {"default_alerts": alerts, "instances": instances}}})
+
+
+async def _pipeline_drained(recorder: _LatencyRecorder, expected: int, timeout: float = 30.0) -> None:
+    """Wait until every measured snapshot has passed all stages (or the timeout, when some were dropped)."""
+    deadline = time.monotonic() + timeout
+    while len(recorder.end_to_end) < expected and time.monotonic() < deadline:
+        await asyncio.sleep(0.01)
+
+
+def _ms(values: list[float], q: float) -> float:
+    return round(percentile(values, q) * 1000.0, 2) if values else 0.0
+
+
+class TestPipelineScenario:
+    """Simulated devices through AsyncDeviceMonitor -> pubsub -> time control / saver / sender / alerts"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("scale", [0.1, 1.0], ids=["tenth", "full"])
+    async def test_monitor_pipeline(
+        self, benchmark_results: list[BenchmarkResult], benchmark_devices, benchmark_cycles, tmp_path, scale
+    ):
+        devices = max(1, int(benchmark_devices * scale))
+
+        async with _simulator_process(tmp_path, devices) as talos_config:
+            manager = AsyncDeviceManager(talos_config, ConstraintConfigSchema(), model_base_path=str(RES_DIR))
+            await manager.init()
+            device_ids = {f"{d.model}_{d.slave_id}" for d in manager.device_list}
+
+            pubsub = InMemoryPubSub()
+            for topic, policy in PUBSUB_POLICIES.items():
+                pubsub.set_topic_policy_model(topic, policy)
+
+            health_manager = DeviceHealthManager(**DeviceHealthManager().calculate_health_params(MONITOR_INTERVAL_SEC))
+            health_manager.configure_for_device_list(
+                device_list=manager.device_list, poll_interval=MONITOR_INTERVAL_SEC
+            )
+            monitor = _TimedMonitor(
+                manager,
+                pubsub,
+                interval=MONITOR_INTERVAL_SEC,
+                health_manager=health_manager,
+                read_concurrency=READ_CONCURRENCY,
+                cycles=benchmark_cycles,
+            )
+            recorder = _LatencyRecorder(monitor.sampled_at)
+
+            # Time control (empty schedule: everything allowed) feeds SNAPSHOT_ALLOWED, as in production
+            time_config = tmp_path / "time_condition.yml"
+            time_config.write_text("work_hours: {}\n")
+            time_control_subscriber, _ = build_time_control_subscriber(pubsub, device_ids, str(time_config))
+
+            alert_evaluator = AlertEvaluator(_alert_config(device_ids), valid_device_ids=device_ids)
+            evaluate = alert_evaluator.evaluate
+
+            def timed_evaluate(device_id: str, snapshot: dict) -> list:
+                results = evaluate(device_id=device_id, snapshot=snapshot)
+                recorder.done("alert", snapshot)
+                return results
+
+            alert_evaluator.evaluate = timed_evaluate
+            alert_subscriber = AlertEvaluatorSubscriber(pubsub, alert_evaluator, monitor_interval=MONITOR_INTERVAL_SEC)
+
+            storage_config = tmp_path / "snapshot_storage.yml"
+            storage_config.write_text(yaml.safe_dump({"enabled": True, "db_path": str(tmp_path / "snapshots.db")}))
+            saver_subscriber, repository, db_manager = await build_snapshot_subscriber(str(storage_config), pubsub)
+            insert_snapshot = repository.insert_snapshot
+
+            async def timed_insert(snapshot: dict) -> None:
+                await insert_snapshot(snapshot)
+                recorder.done("saver", snapshot["values"])
+
+            repository.insert_snapshot = timed_insert
+            sender_subscriber = SenderSubscriber(pubsub, [_LegacyPayloadHandler(manager, recorder)])
+
+            tasks = [
+                asyncio.create_task(subscriber.run())
+                for subscriber in (time_control_subscriber, alert_subscriber, saver_subscriber, sender_subscriber)
+            ]
+            await asyncio.sleep(0)
+            tasks.append(asyncio.create_task(monitor.run()))
+
+            try:
+                await asyncio.wait_for(monitor.measuring.wait(), timeout=120)
+                with ResourceProbe() as probe:
+                    await asyncio.wait_for(monitor.finished.wait(), timeout=120 + benchmark_cycles * 30)
+                    await _pipeline_drained(recorder, len(device_ids) * benchmark_cycles)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await manager.shutdown()
+                await db_manager.close_engine()
+
+        # Report
+        cycles = len(monitor.cycle_sec)
+        offline = sum(1 for snapshot in monitor.published if not snapshot.get("is_online"))
+        dropped = {topic.value: pubsub.get_dropped_count(topic) for topic in PIPELINE_TOPICS}
+        resources = probe.metrics()
+
+        metrics: dict[str, float] = {
+            "devices": len(device_ids),
+            "cycles": cycles,
+            "cycle_ms_p50": round(statistics.median(monitor.cycle_sec) * 1000.0, 2),
+            "cycle_ms_max": round(max(monitor.cycle_sec) * 1000.0, 2),
+            "snapshots": len(monitor.published),
+            "offline_snapshots": offline,
+            "dropped": sum(dropped.values()),
+            "e2e_ms_p50": _ms(recorder.end_to_end, 0.5),
+            "e2e_ms_p99": _ms(recorder.end_to_end, 0.99),
+            **{f"{stage}_ms_p50": _ms(recorder.by_stage[stage], 0.5) for stage in STAGES},
+            **{f"{stage}_ms_p99": _ms(recorder.by_stage[stage], 0.99) for stage in STAGES},
+            "cpu_ms_per_cycle": round(resources["cpu_sec"] * 1000.0 / cycles, 2),
+            **resources,
+        }
+        benchmark_results.append(
+            BenchmarkResult(
+                name=f"monitor_pipeline[{len(device_ids)}_devices]",
+                kind="macro",
+                metrics=metrics,
+                compare=("cycle_ms_p50", "e2e_ms_p50", "cpu_ms_per_cycle", "rss_mb"),
+                info={
+                    "model": MODEL,
+                    "devices_per_bus": DEVICES_PER_BUS,
+                    "transport": "tcp",
+                    "simulated_latency_ms": SIMULATED_LATENCY_MS,
+                    "monitor_interval_sec": MONITOR_INTERVAL_SEC,
+                    "read_concurrency": READ_CONCURRENCY,
+                    "dropped_by_topic": dropped,
+                },
+            )
+        )
+
+        assert cycles == benchmark_cycles
+        assert offline == 0
+        assert len(recorder.end_to_end) == len(monitor.published)
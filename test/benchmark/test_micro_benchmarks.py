@@ -0,0 +1,312 @@
+import asyncio
+import logging
+import random
+from pathlib import Path
+
+import pytest
+from benchmark_harness import BenchmarkResult, measure, measure_async
+
+from core.device.modbus.bulk_reader import BulkRange, ModbusBulkReader
+from core.device.modbus.register_handler import ModbusRegisterHandler
+from core.evaluator.alert_evaluator import AlertEvaluator
+from core.evaluator.composite_evaluator import CompositeEvaluator
+from core.model.control_composite import CompositeNode
+from core.model.enum.decode_format import DecodeFormat
+from core.schema.alert_config_schema import AlertConfig
+from core.sender.legacy.converter_compiler import LegacyConverterCompiler
+from core.sender.legacy.converter_registry import CONVERTER_MAP
+from core.sender.legacy.legacy_format_adapter import convert_snapshot_to_legacy_payload
+from core.util.config_manager import ConfigManager
+from core.util.data_decoder import decode_modbus_registers
+from core.util.loop_profiler import LoopProfiler, LoopProfilerConfig
+from core.util.pubsub.in_memory_pubsub import InMemoryPubSub
+from core.util.pubsub.pubsub_topic import PubSubTopic
+from core.util.snapshot_aggregator import SnapshotAggregator
+from simulator.register_image import RegisterImage, encode_value
+
+DRIVER_DIR = Path(__file__).resolve().parents[2] / "res" / "driver"
+
+# A three-phase meter and an inverter: the two most common gateway loads
+DRIVERS = {"DAE_PM210": "dae_pm210.yml", "TECO_VFD": "teco_inverter.yml"}
+
+SNAPSHOT_POOL_SIZE = 64
+
+pytestmark = pytest.mark.benchmark
+
+
+def _load_driver(model: str) -> dict:
+    return ConfigManager.load_yaml_file(str(DRIVER_DIR / DRIVERS[model]))
+
+
+def _bulk_reader(driver: dict) -> ModbusBulkReader:
+    return ModbusBulkReader(driver["register_map"], driver.get("register_type", "holding"), logging.getLogger("bench"))
+
+
+def _range_registers(image: RegisterImage, bulk_range: BulkRange) -> list[int]:
+    table = {"holding": "h", "input": "i", "coil": "c", "discrete_input": "d"}[bulk_range.register_type]
+    words = image.read(table, bulk_range.start, bulk_range.count)
+    return words if isinstance(words, list) else [0] * bulk_range.count
+
+
+def _snapshot_pool(model: str, size: int = SNAPSHOT_POOL_SIZE) -> list[dict[str, float]]:
+    """Decoded value dicts of a drifting simulated slave, as read_all() would return them."""
+    driver = _load_driver(model)
+    image = RegisterImage(driver, rng=random.Random(7))
+    reader = _bulk_reader(driver)
+    handler = ModbusRegisterHandler(model, driver["register_map"], None, logging.getLogger("bench"))
+    ranges = reader.build_bulk_ranges()
+
+    pool: list[dict[str, float]] = []
+    for step in range(size):
+        image.refresh(float(step * 10))
+        values: dict[str, float] = {}
+        for bulk_range in ranges:
+            values.update(
+                reader.process_bulk_range_result(
+                    bulk_range, _range_registers(image, bulk_range), handler.is_invalid_raw
+                )
+            )
+        pool.append(values)
+    return pool
+
+
+def _cycler(items: list):
+    """Zero-argument callable returning the next item round-robin (defeats unchanged-input fast paths)."""
+    state = {"i": 0}
+
+    def next_item():
+        state["i"] = (state["i"] + 1) % len(items)
+        return items[state["i"]]
+
+    return next_item
+
+
+class TestDecodeBenchmarks:
+    """Register decoding, per value and per bulk range"""
+
+    @pytest.mark.parametrize(
+        "fmt", [DecodeFormat.U16, DecodeFormat.I16, DecodeFormat.U32_LE, DecodeFormat.F32_BE, DecodeFormat.F32_BE_SWAP]
+    )
+    def test_decode_modbus_registers(self, benchmark_results: list[BenchmarkResult], fmt):
+        words = encode_value(1234.5 if fmt.value.startswith("f") else 1234, fmt)
+
+        result = measure(f"decode_modbus_registers[{fmt.value}]", lambda: decode_modbus_registers(words, fmt))
+
+        benchmark_results.append(result)
+        assert result.metrics["p50_us"] > 0
+
+    @pytest.mark.parametrize("model", sorted(DRIVERS))
+    def test_bulk_reader_plan(self, benchmark_results: list[BenchmarkResult], model):
+        reader = _bulk_reader(_load_driver(model))
+
+        result = measure(
+            f"bulk_reader_plan[{model}]", reader.build_bulk_ranges, info={"pins": len(reader.register_map)}
+        )
+
+        benchmark_results.append(result)
+        assert reader.build_bulk_ranges()
+
+    @pytest.mark.parametrize("model", sorted(DRIVERS))
+    def test_bulk_reader_decode(self, benchmark_results: list[BenchmarkResult], model):
+        driver = _load_driver(model)
+        reader = _bulk_reader(driver)
+        handler = ModbusRegisterHandler(model, driver["register_map"], None, logging.getLogger("bench"))
+        image = RegisterImage(driver, rng=random.Random(1))
+        blocks = [(r, _range_registers(image, r)) for r in reader.build_bulk_ranges()]
+
+        def decode_all() -> dict:
+            values: dict = {}
+            for bulk_range, registers in blocks:
+                values.update(reader.process_bulk_range_result(bulk_range, registers, handler.is_invalid_raw))
+            return values
+
+        result = measure(f"bulk_reader_decode[{model}]", decode_all, info={"ranges": len(blocks)})
+
+        benchmark_results.append(result)
+        assert decode_all()
+
+
+class TestEvaluatorBenchmarks:
+    """Per-snapshot evaluator cost"""
+
+    def test_composite_evaluator(self, benchmark_results: list[BenchmarkResult]):
+        def leaf(pin: str, operator: str, threshold: float) -> dict:
+            return {
+                "type": "threshold",
+                "sources": [{"device": "DAE_PM210", "slave_id": "1", "pins": [pin]}],
+                "operator": operator,
+                "threshold": threshold,
+                "hysteresis": 0.5,
+            }
+
+        node = CompositeNode.model_validate(
+            {
+                "any": [
+                    {"all": [leaf("Phase_A_Current", "gt", 30.0), leaf("AveragePowerFactor", "lt", 0.9)]},
+                    {"all": [leaf("Kw", "gt", 20.0), {"not": leaf("Phase_A_Voltage", "lt", 200.0)}]},
+                    leaf("Kva", "gt", 31.0),
+                ]
+            }
+        )
+        evaluator = CompositeEvaluator()
+        next_snapshot = _cycler(_snapshot_pool("DAE_PM210"))
+
+        def evaluate() -> bool:
+            values = next_snapshot()
+            return evaluator.evaluate_composite_node(node, lambda source: values.get(source.pins[0]))
+
+        result = measure("composite_evaluator[3_groups_5_leaves]", evaluate)
+
+        benchmark_results.append(result)
+        assert isinstance(evaluate(), bool)
+
+    def test_alert_evaluator(self, benchmark_results: list[BenchmarkResult]):
+        pins = ["Phase_A_Voltage", "Phase_B_Voltage", "Phase_C_Voltage", "Phase_A_Current", "Kw", "AveragePowerFactor"]
+        alerts = [
+            {
+                "code": f"{pin.upper()}_{condition.upper()}",
+                "name": f"{pin} {condition}",
+                "sources": [pin],
+                "condition": condition,
+                "threshold": threshold,
+                "severity": "WARNING",
+                "type": "threshold",
+            }
+            for pin in pins
+            for condition, threshold in (("gt", 1e6), ("lt", -1e6))
+        ]
+        config = AlertConfig.model_validate(
+            {"root": {"DAE_PM210": {"default_alerts": alerts, "instances": {"1": {"use_default_alerts": True}}}}}
+        )
+        evaluator = AlertEvaluator(config, valid_device_ids={"DAE_PM210_1"})
+        next_snapshot = _cycler(_snapshot_pool("DAE_PM210"))
+
+        result = measure(
+            f"alert_evaluator[{len(alerts)}_alerts]",
+            lambda: evaluator.evaluate("DAE_PM210_1", next_snapshot()),
+            info={"alerts": len(alerts)},
+        )
+
+        benchmark_results.append(result)
+        assert evaluator.evaluate("DAE_PM210_1", next_snapshot()) == []
+
+    @pytest.mark.parametrize("use_numpy", [True, False], ids=["numpy", "stdlib"])
+    def test_snapshot_aggregator(self, benchmark_results: list[BenchmarkResult], tmp_path, use_numpy):
+        aggregator = SnapshotAggregator(
+            monitor_interval=1.0,
+            eval_interval=10.0,
+            outlier_log_path=str(tmp_path / "outlier.log"),
+            use_numpy=use_numpy,
+        )
+        next_snapshot = _cycler(_snapshot_pool("DAE_PM210"))
+
+        def window() -> dict | None:
+            for _ in range(aggregator.max_capacity):
+                aggregator.push("DAE_PM210_1", next_snapshot(), timestamp="2026-01-01T00:00:00+08:00")
+            aggregated = aggregator.aggregate("DAE_PM210_1")
+            aggregator.clear("DAE_PM210_1")
+            return aggregated
+
+        result = measure(
+            f"snapshot_aggregator[{'numpy' if use_numpy else 'stdlib'}]",
+            window,
+            info={"samples_per_window": aggregator.max_capacity},
+        )
+
+        benchmark_results.append(result)
+        assert window()
+
+
+class TestPipelineBenchmarks:
+    """Sender conversion and pubsub fan-out"""
+
+    @pytest.mark.parametrize("model, device_type", [("DAE_PM210", "power_meter"), ("TECO_VFD", "inverter")])
+    def test_convert_snapshot_to_legacy_payload(self, benchmark_results: list[BenchmarkResult], model, device_type):
+        snapshots = [
+            {"device_id": f"{model}_1", "model": model, "slave_id": 1, "type": device_type, "values": values}
+            for values in _snapshot_pool(model)
+        ]
+        next_snapshot = _cycler(snapshots)
+
+        result = measure(
+            f"convert_snapshot_to_legacy_payload[{device_type}]",
+            lambda: convert_snapshot_to_legacy_payload("GW0001", next_snapshot(), None),
+        )
+
+        benchmark_results.append(result)
+        assert convert_snapshot_to_legacy_payload("GW0001", next_snapshot(), None)
+
+    @pytest.mark.parametrize("compiled", [False, True], ids=["reference", "compiled"])
+    @pytest.mark.parametrize("model, device_type", [("DAE_PM210", "power_meter"), ("TECO_VFD", "inverter")])
+    def test_legacy_converter(self, benchmark_results: list[BenchmarkResult], model, device_type, compiled):
+        """Reference converter vs its compiled plan on the same snapshots (plan compiled once, as in the sender)."""
+        converter_fn = CONVERTER_MAP[device_type]
+        next_values = _cycler(_snapshot_pool(model))
+        plan = (
+            LegacyConverterCompiler().plan_for(
+                converter_fn, gateway_id="GW0001", model=model, slave_id=1, values=next_values(), device_manager=None
+            )
+            if compiled
+            else None
+        )
+
+        def convert() -> list[dict]:
+            values = next_values()
+            return plan(values) if plan is not None else converter_fn("GW0001", 1, values)
+
+        result = measure(f"legacy_converter[{device_type}_{'compiled' if compiled else 'reference'}]", convert)
+
+        benchmark_results.append(result)
+        assert convert()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("subscribers", [1, 5])
+    async def test_in_memory_pubsub_fanout(self, benchmark_results: list[BenchmarkResult], subscribers):
+        pubsub = InMemoryPubSub()
+        received = [0]
+        all_received = asyncio.Event()
+        expected = [0]
+
+        async def consume() -> None:
+            async for _ in pubsub.subscribe(PubSubTopic.DEVICE_SNAPSHOT):
+                received[0] += 1
+                if received[0] >= expected[0]:
+                    all_received.set()
+
+        tasks = [asyncio.create_task(consume()) for _ in range(subscribers)]
+        await asyncio.sleep(0)
+        message = {"device_id": "DAE_PM210_1", "values": _snapshot_pool("DAE_PM210", size=1)[0]}
+
+        async def publish_and_deliver() -> None:
+            all_received.clear()
+            expected[0] = received[0] + subscribers
+            await pubsub.publish(PubSubTopic.DEVICE_SNAPSHOT, message)
+            await all_received.wait()
+
+        try:
+            result = await measure_async(f"in_memory_pubsub_fanout[{subscribers}_subscribers]", publish_and_deliver)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        benchmark_results.append(result)
+        assert received[0] > 0
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("profiled", [False, True], ids=["off", "on"])
+    async def test_loop_profiler_overhead(self, benchmark_results: list[BenchmarkResult], profiled):
+        """One task step (sleep(0) round trip) with and without the always-on loop profiler."""
+        profiler = LoopProfiler(LoopProfilerConfig())
+        if profiled:
+            profiler.install()
+
+        try:
+            result = await measure_async(
+                f"loop_task_step[profiler_{'on' if profiled else 'off'}]", lambda: asyncio.sleep(0)
+            )
+        finally:
+            profiler.uninstall()
+
+        benchmark_results.append(result)
+        assert profiler.summary()["callbacks"] > 0 or not profiled
@@ -0,0 +1,227 @@
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.device.generic.generic_device import AsyncGenericModbusDevice
+from core.executor.control_executor import ControlExecutor
+from core.schema.control_condition_schema import ControlActionSchema, ControlActionType, PulseConfig
+
+
+def _set_action(target: str, value: float, action_type=ControlActionType.SET_FREQUENCY) -> ControlActionSchema:
+    return ControlActionSchema(model="TECO_VFD", slave_id="2", type=action_type, target=target, value=value)
+
+
+class TestControlExecutorSnapshotCache:
+    """Redundant-write checks use cached snapshot values before reading the device"""
+
+    @pytest.mark.asyncio
+    async def test_when_cached_value_matches_then_skips_without_reading(
+        self, control_executor, mock_device_manager, mock_device
+    ):
+        # Arrange
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = mock_device
+        control_executor.update_snapshot("TECO_VFD_2", {"RW_HZ": 50.0})
+
+        # Act
+        await control_executor.execute([_set_action("RW_HZ", 50.0)])
+
+        # Assert
+        mock_device.read_value.assert_not_called()
+        mock_device.write_value.assert_not_called()
+        assert control_executor._execution_stats.skipped_redundant == 1
+
+    @pytest.mark.asyncio
+    async def test_when_cached_value_is_missing_then_reads_device(
+        self, control_executor, mock_device_manager, mock_device
+    ):
+        # Arrange
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = mock_device
+        mock_device.read_value.return_value = 50.0
+        control_executor.update_snapshot("TECO_VFD_2", {"RW_HZ": -1})
+
+        # Act
+        await control_executor.execute([_set_action("RW_HZ", 50.0)])
+
+        # Assert
+        mock_device.read_value.assert_called_once_with("RW_HZ")
+        mock_device.write_value.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_when_cached_snapshot_is_stale_then_reads_device(self, mock_device_manager, mock_device):
+        # Arrange
+        executor = ControlExecutor(mock_device_manager, snapshot_max_age_sec=0.0)
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = mock_device
+        mock_device.read_value.return_value = 40.0
+        executor.update_snapshot("TECO_VFD_2", {"RW_HZ": 50.0})
+
+        # Act
+        await executor.execute([_set_action("RW_HZ", 50.0)])
+
+        # Assert
+        mock_device.read_value.assert_called_once_with("RW_HZ")
+        mock_device.write_value.assert_called_once_with("RW_HZ", 50.0)
+
+    @pytest.mark.asyncio
+    async def test_when_write_succeeds_then_cache_reflects_written_value(
+        self, control_executor, mock_device_manager, mock_device
+    ):
+        # Arrange
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = mock_device
+        control_executor.update_snapshot("TECO_VFD_2", {"RW_HZ": 40.0})
+
+        # Act
+        await control_executor.execute([_set_action("RW_HZ", 50.0)])
+        await control_executor.execute([_set_action("RW_HZ", 50.0)])
+
+        # Assert
+        mock_device.write_value.assert_called_once_with("RW_HZ", 50.0)
+        mock_device.read_value.assert_not_called()
+
+
+class TestControlExecutorWriteBatching:
+    """Writes are planned per device and flushed once per execute()"""
+
+    @pytest.mark.asyncio
+    async def test_when_adjust_follows_planned_set_then_uses_planned_value(
+        self, control_executor, mock_device_manager, mock_device
+    ):
+        # Arrange
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = mock_device
+        mock_device.read_value.return_value = 40.0
+        actions = [
+            _set_action("RW_HZ", 45.0),
+            _set_action("RW_HZ", 2.0, action_type=ControlActionType.ADJUST_FREQUENCY),
+        ]
+
+        # Act
+        await control_executor.execute(actions)
+
+        # Assert: the adjustment builds on the planned 45.0, not the device's 40.0
+        assert mock_device.write_value.call_args_list[-1].args == ("RW_HZ", 47.0)
+        mock_device.read_value.assert_called_once_with("RW_HZ")
+
+    @pytest.mark.asyncio
+    async def test_when_generic_device_then_writes_are_sent_in_one_call(self, control_executor, mock_device_manager):
+        # Arrange
+        device = Mock(spec=AsyncGenericModbusDevice)
+        device.model = "TECO_VFD"
+        device.slave_id = "2"
+        device.register_map = {"RW_HZ": {"writable": True}, "RW_DO": {"writable": True}}
+        device.supports_on_off = Mock(return_value=True)
+        device.read_value = AsyncMock(return_value=0)
+        device.write_values = AsyncMock(return_value=[True, True, True])
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = device
+
+        actions = [
+            _set_action("RW_HZ", 45.0),
+            ControlActionSchema(model="TECO_VFD", slave_id="2", type=ControlActionType.TURN_ON),
+            _set_action("RW_DO", 1, action_type=ControlActionType.WRITE_DO),
+        ]
+
+        # Act
+        await control_executor.execute(actions)
+
+        # Assert
+        device.write_values.assert_awaited_once_with([("RW_HZ", 45.0), ("RW_ON_OFF", 1), ("RW_DO", 1)])
+        assert control_executor._execution_stats.successful_writes == 3
+
+    @pytest.mark.asyncio
+    async def test_when_generic_device_reports_failure_then_not_counted(self, control_executor, mock_device_manager):
+        # Arrange
+        device = Mock(spec=AsyncGenericModbusDevice)
+        device.model = "TECO_VFD"
+        device.slave_id = "2"
+        device.register_map = {"RW_HZ": {"writable": True}, "RW_DO": {"writable": True}}
+        device.read_value = AsyncMock(return_value=0)
+        device.write_values = AsyncMock(return_value=[True, False])
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = device
+
+        # Act
+        await control_executor.execute(
+            [_set_action("RW_HZ", 45.0), _set_action("RW_DO", 1, action_type=ControlActionType.WRITE_DO)]
+        )
+
+        # Assert
+        assert control_executor._execution_stats.successful_writes == 1
+
+
+class TestControlExecutorPriorityAfterFlush:
+    """Only writes that succeeded protect their target from lower-priority actions"""
+
+    @staticmethod
+    def _generic_device(outcomes: list[list[bool]]) -> Mock:
+        device = Mock(spec=AsyncGenericModbusDevice)
+        device.model = "TECO_VFD"
+        device.slave_id = "2"
+        device.register_map = {"RW_HZ": {"writable": True}}
+        device.read_value = AsyncMock(return_value=0)
+        device.write_values = AsyncMock(side_effect=outcomes)
+        return device
+
+    @staticmethod
+    def _prioritized(value: float, priority: int) -> ControlActionSchema:
+        action = _set_action("RW_HZ", value)
+        action.priority = priority
+        return action
+
+    @pytest.mark.asyncio
+    async def test_when_higher_priority_write_succeeds_then_lower_priority_is_protected(
+        self, control_executor, mock_device_manager
+    ):
+        # Arrange
+        device = self._generic_device([[True]])
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = device
+
+        # Act
+        await control_executor.execute([self._prioritized(50.0, 1), self._prioritized(30.0, 5)])
+
+        # Assert
+        device.write_values.assert_awaited_once_with([("RW_HZ", 50.0)])
+        assert control_executor._execution_stats.protected_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_when_higher_priority_write_fails_then_lower_priority_is_written(
+        self, control_executor, mock_device_manager
+    ):
+        # Arrange
+        device = self._generic_device([[False], [True]])
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = device
+
+        # Act
+        await control_executor.execute([self._prioritized(50.0, 1), self._prioritized(30.0, 5)])
+
+        # Assert
+        assert [c.args[0] for c in device.write_values.await_args_list] == [[("RW_HZ", 50.0)], [("RW_HZ", 30.0)]]
+        assert control_executor._execution_stats.protected_writes == 0
+        assert control_executor._execution_stats.successful_writes == 1
+
+    @pytest.mark.asyncio
+    async def test_when_higher_priority_write_is_planned_then_lower_priority_pulse_is_protected(
+        self, control_executor, mock_device_manager
+    ):
+        # Arrange
+        device = self._generic_device([[True]])
+        device.register_map = {"RW_DO": {"writable": True}}
+        device.write_value = AsyncMock()
+        mock_device_manager.get_device_by_model_and_slave_id.return_value = device
+        write_do = _set_action("RW_DO", 1, ControlActionType.WRITE_DO)
+        write_do.priority = 1
+        pulse = ControlActionSchema(
+            model="TECO_VFD",
+            slave_id="2",
+            type=ControlActionType.WRITE_DO,
+            target="RW_DO",
+            value=0,
+            priority=5,
+            switch_mode="pulse",
+            pulse=PulseConfig(start_value=0, end_value=1, duration_ms=50),
+        )
+
+        # Act
+        await control_executor.execute([write_do, pulse])
+
+        # Assert
+        device.write_values.assert_awaited_once_with([("RW_DO", 1)])
+        device.write_value.assert_not_awaited()
+        assert control_executor._execution_stats.successful_writes == 1
+        assert control_executor._execution_stats.protected_writes == 1
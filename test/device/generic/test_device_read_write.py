@@ -2,7 +2,9 @@ from types import SimpleNamespace
 
 import pytest
 
+from core.device.generic.constraints_policy import ConstraintPolicy
 from core.device.generic.generic_device import AsyncGenericModbusDevice
+from core.schema.constraint_schema import ConstraintConfig
 
 
 class FakeClient:
@@ -53,3 +55,184 @@ async def test_read_and_write_flow():
     # write_value with scale 0.1 → raw = round(12.3 / 0.1) = 123
     await dev.write_value("VAL", 12.3)
     assert regs[0] == 123
+
+
+class CountingClient(FakeClient):
+    def __init__(self, registers: dict[int, int], support_write_multiple: bool = True):
+        super().__init__(registers)
+        self.support_write_multiple = support_write_multiple
+        self.requests: list[tuple] = []
+
+    async def read_holding_registers(self, address, count, slave):
+        self.requests.append(("read", address, count))
+        return await super().read_holding_registers(address, count, slave)
+
+    async def write_register(self, address, value, slave):
+        self.requests.append(("write_register", address, value))
+        return await super().write_register(address, value, slave)
+
+    async def write_coil(self, address, value, slave):
+        self.requests.append(("write_coil", address, value))
+        return SimpleNamespace(isError=lambda: False)
+
+    async def write_registers(self, address, values, slave):
+        self.requests.append(("write_registers", address, list(values)))
+        if not self.support_write_multiple:
+            return SimpleNamespace(isError=lambda: True, exception_code=1)
+        for i, value in enumerate(values):
+            self._regs[address + i] = value
+        return SimpleNamespace(isError=lambda: False)
+
+
+def _batch_device(client) -> AsyncGenericModbusDevice:
+    return AsyncGenericModbusDevice(
+        model="TEST",
+        client=client,
+        slave_id=1,
+        register_type="holding",
+        register_map={
+            "RW_HZ": {"offset": 0, "readable": True, "writable": True, "scale": 0.1},
+            "RW_ON_OFF": {"offset": 1, "readable": True, "writable": True},
+            "RW_DO_1": {"offset": 5, "bit": 0, "readable": True, "writable": True},
+            "RW_DO_2": {"offset": 5, "bit": 3, "readable": True, "writable": True},
+        },
+        device_type="inverter",
+        port="MockPort",
+    )
+
+
+@pytest.mark.asyncio
+async def test_when_write_values_then_contiguous_registers_and_shared_bits_are_coalesced():
+    regs = {0: 0, 1: 0, 5: 0b0100}
+    client = CountingClient(regs)
+    dev = _batch_device(client)
+
+    results = await dev.write_values([("RW_HZ", 45.0), ("RW_ON_OFF", 1), ("RW_DO_1", 1), ("RW_DO_2", 1)])
+
+    assert results == [True, True, True, True]
+    assert regs[0] == 450 and regs[1] == 1
+    assert regs[5] == 0b1101
+    assert client.requests == [
+        ("read", 5, 1),
+        ("write_registers", 0, [450, 1]),
+        ("write_register", 5, 0b1101),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_same_pin_repeated_then_writes_keep_order():
+    regs = {0: 0, 1: 0, 5: 0}
+    client = CountingClient(regs)
+    dev = _batch_device(client)
+
+    results = await dev.write_values([("RW_ON_OFF", 1), ("RW_ON_OFF", 0)])
+
+    assert results == [True, True]
+    assert client.requests == [("write_register", 1, 1), ("write_register", 1, 0)]
+    assert regs[1] == 0
+
+
+@pytest.mark.asyncio
+async def test_when_write_multiple_unsupported_then_falls_back_to_single_writes():
+    regs = {0: 0, 1: 0, 5: 0}
+    client = CountingClient(regs, support_write_multiple=False)
+    dev = _batch_device(client)
+
+    first = await dev.write_values([("RW_HZ", 45.0), ("RW_ON_OFF", 1)])
+    client.requests.clear()
+    second = await dev.write_values([("RW_HZ", 50.0), ("RW_ON_OFF", 0)])
+
+    assert first == [True, True] and second == [True, True]
+    assert regs[0] == 500 and regs[1] == 0
+    assert client.requests == [("write_register", 0, 500), ("write_register", 1, 0)]
+
+
+@pytest.mark.asyncio
+async def test_when_write_multiple_fails_transiently_then_keeps_using_it():
+    class BusyOnceClient(CountingClient):
+        busy = True
+
+        async def write_registers(self, address, values, slave):
+            if self.busy:
+                self.busy = False
+                self.requests.append(("write_registers", address, list(values)))
+                return SimpleNamespace(isError=lambda: True, exception_code=6)  # SLAVE_DEVICE_BUSY
+            return await super().write_registers(address, values, slave)
+
+    regs = {0: 0, 1: 0, 5: 0}
+    client = BusyOnceClient(regs)
+    dev = _batch_device(client)
+
+    first = await dev.write_values([("RW_HZ", 45.0), ("RW_ON_OFF", 1)])
+    client.requests.clear()
+    second = await dev.write_values([("RW_HZ", 50.0), ("RW_ON_OFF", 0)])
+
+    assert first == [True, True] and second == [True, True]
+    assert regs[0] == 500 and regs[1] == 0
+    assert client.requests == [("write_registers", 0, [500, 0])]
+
+
+@pytest.mark.asyncio
+async def test_when_offsets_descend_then_writes_keep_action_order():
+    regs = {0: 0, 1: 0}
+    client = CountingClient(regs)
+    dev = AsyncGenericModbusDevice(
+        model="TEST",
+        client=client,
+        slave_id=1,
+        register_type="holding",
+        register_map={
+            "RW_ON_OFF": {"offset": 0, "readable": True, "writable": True},
+            "RW_HZ": {"offset": 1, "readable": True, "writable": True, "scale": 0.1},
+        },
+        device_type="inverter",
+        port="MockPort",
+    )
+
+    results = await dev.write_values([("RW_HZ", 45.0), ("RW_ON_OFF", 1)])
+
+    assert results == [True, True]
+    assert client.requests == [("write_register", 1, 450), ("write_register", 0, 1)]
+
+
+@pytest.mark.asyncio
+async def test_when_coil_follows_registers_then_registers_are_written_first():
+    regs = {0: 0, 1: 0, 5: 0}
+    client = CountingClient(regs)
+    dev = _batch_device(client)
+    dev.register_map["RW_RUN"] = {"offset": 7, "register_type": "coil", "readable": True, "writable": True}
+
+    results = await dev.write_values([("RW_HZ", 45.0), ("RW_RUN", 1), ("RW_ON_OFF", 1)])
+
+    assert results == [True, True, True]
+    assert client.requests == [
+        ("write_register", 0, 450),
+        ("write_coil", 7, True),
+        ("write_register", 1, 1),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_when_write_values_has_unwritable_pin_then_raises_without_writing():
+    regs = {0: 0, 1: 0, 5: 0}
+    client = CountingClient(regs)
+    dev = _batch_device(client)
+    dev.register_map["RW_HZ"]["writable"] = False
+
+    with pytest.raises(ValueError, match="RW_HZ"):
+        await dev.write_values([("RW_ON_OFF", 1), ("RW_HZ", 45.0)])
+
+    assert client.requests == []
+
+
+@pytest.mark.asyncio
+async def test_when_value_rejected_by_constraints_then_reported_and_others_written():
+    regs = {0: 0, 1: 0, 5: 0}
+    client = CountingClient(regs)
+    dev = _batch_device(client)
+    dev.constraints = ConstraintPolicy(constraints={"RW_HZ": ConstraintConfig(min=0, max=60)}, logger=dev.logger)
+
+    results = await dev.write_values([("RW_HZ", 75.0), ("RW_ON_OFF", 1)])
+
+    assert results == [False, True]
+    assert regs[0] == 0 and regs[1] == 1
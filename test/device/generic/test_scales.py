@@ -41,3 +41,21 @@ async def test_energy_auto_and_kwh():
     svc.invalidate(["kwh"])  # selective invalidation
     kwh3 = await svc.get_factor("kwh", idx_reader)
     assert kwh3 == pytest.approx(0.05)
+
+
+@pytest.mark.asyncio
+async def test_refresh_indices_invalidates_only_changed_kinds():
+    tables = {"current_table": [0.01, 0.1], "voltage_table": [1.0, 10.0]}
+    svc = ScaleService(tables, {}, DummyLogger())
+
+    svc.refresh_indices({"SCALE_CurrentIndex": 0, "SCALE_VoltageIndex": 0})
+    reader = await _idx_reader_factory({"SCALE_CurrentIndex": 0, "SCALE_VoltageIndex": 0})
+    assert await svc.get_factor("current", reader) == pytest.approx(0.01)
+    assert await svc.get_factor("voltage", reader) == pytest.approx(1.0)
+
+    # unchanged index keeps the cached factor, changed index drops it
+    svc.refresh_indices({"SCALE_CurrentIndex": 1, "SCALE_VoltageIndex": 0})
+    assert set(svc.cache) == {"voltage"}
+
+    reader = await _idx_reader_factory({"SCALE_CurrentIndex": 1})
+    assert await svc.get_factor("current", reader) == pytest.approx(0.1)
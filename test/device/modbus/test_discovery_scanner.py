@@ -0,0 +1,180 @@
+import asyncio
+import time
+
+import pytest
+
+from core.device.modbus.discovery_scanner import DiscoveryTarget, ModbusDiscoveryScanner, load_driver_signatures
+from core.model.enum.modbus_transport_enum import ModbusTransport
+
+
+class _Reply:
+    def __init__(self, exception_code: int | None = None):
+        self.exception_code = exception_code
+        self.registers = [0]
+
+    def isError(self) -> bool:
+        return self.exception_code is not None
+
+
+class _FakeBusClient:
+    """
+    Fake serial line: `slaves` maps baudrate -> {slave_id: readable offsets}. Absent slaves
+    stay silent (the probe times out); unknown offsets answer ILLEGAL DATA ADDRESS (0x02).
+    """
+
+    def __init__(self, slaves: dict[int | None, dict[int, set[int]]], baudrate: int | None, delay: float = 0.001):
+        self.slaves = slaves.get(baudrate, {})
+        self.delay = delay
+        self.requests: list[tuple[int, int]] = []
+
+    async def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        pass
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, slave: int = 1):
+        self.requests.append((slave, address))
+        if slave not in self.slaves:
+            await asyncio.sleep(10)
+        await asyncio.sleep(self.delay)
+        return _Reply() if address in self.slaves[slave] else _Reply(exception_code=0x02)
+
+    read_input_registers = read_holding_registers
+
+
+def _scanner(slaves: dict, clients: list | None = None, **kwargs) -> ModbusDiscoveryScanner:
+    def factory(target, baudrate, timeout):
+        client = _FakeBusClient(slaves, baudrate)
+        if clients is not None:
+            clients.append((target.endpoint, baudrate, client))
+        return client
+
+    kwargs.setdefault("probe_timeout_sec", 0.05)
+    kwargs.setdefault("min_timeout_sec", 0.005)
+    return ModbusDiscoveryScanner(client_factory=factory, **kwargs)
+
+
+class TestModbusDiscoveryScanner:
+    """Slave ID x baud rate discovery"""
+
+    @pytest.mark.asyncio
+    async def test_when_full_range_scanned_then_timeout_adapts_after_first_reply(self):
+        # Arrange
+        scanner = _scanner({9600: {1: {0}, 17: {0}, 200: {0}}})
+        target = DiscoveryTarget(port="/dev/ttyUSB0", baudrates=[9600])
+
+        # Act
+        start = time.monotonic()
+        [result] = await scanner.scan([target])
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert [hit.slave_id for hit in result.hits] == [1, 17, 200]
+        assert result.probes == 247
+        # Static timeout would cost 244 x 50ms = 12.2s
+        assert elapsed < 4.0
+
+    @pytest.mark.asyncio
+    async def test_when_slave_answers_with_exception_then_it_counts_as_present(self):
+        # Arrange
+        scanner = _scanner({9600: {3: set()}})
+        target = DiscoveryTarget(port="/dev/ttyUSB0", baudrates=[9600], slave_id_end=5)
+
+        # Act
+        [result] = await scanner.scan([target])
+
+        # Assert
+        assert [(hit.slave_id, hit.exception_code) for hit in result.hits] == [(3, 0x02)]
+
+    @pytest.mark.asyncio
+    async def test_when_max_devices_reached_then_port_stops_early(self):
+        # Arrange
+        clients: list = []
+        scanner = _scanner({9600: {2: {0}, 4: {0}, 30: {0}}}, clients)
+        target = DiscoveryTarget(port="/dev/ttyUSB0", baudrates=[9600, 19200], max_devices=2)
+
+        # Act
+        [result] = await scanner.scan([target])
+
+        # Assert
+        assert [hit.slave_id for hit in result.hits] == [2, 4]
+        assert result.probes == 4
+        assert result.baudrates_tried == [9600]
+
+    @pytest.mark.asyncio
+    async def test_when_baudrate_has_hits_then_remaining_baudrates_are_skipped(self):
+        # Arrange
+        scanner = _scanner({19200: {1: {0}}, 38400: {2: {0}}})
+        target = DiscoveryTarget(port="/dev/ttyUSB0", baudrates=[9600, 19200, 38400], slave_id_end=3)
+
+        # Act
+        [result] = await scanner.scan([target])
+
+        # Assert
+        assert result.baudrates_tried == [9600, 19200]
+        assert [(hit.slave_id, hit.baudrate) for hit in result.hits] == [(1, 19200)]
+
+    @pytest.mark.asyncio
+    async def test_when_several_ports_given_then_they_are_scanned_in_parallel(self):
+        # Arrange: all slaves silent, each port costs 10 x 50ms sequentially
+        scanner = _scanner({})
+        targets = [DiscoveryTarget(port=f"/dev/ttyUSB{i}", baudrates=[9600], slave_id_end=10) for i in range(4)]
+
+        # Act
+        start = time.monotonic()
+        results = await scanner.scan(targets)
+        elapsed = time.monotonic() - start
+
+        # Assert
+        assert [r.endpoint for r in results] == [f"/dev/ttyUSB{i}" for i in range(4)]
+        assert all(r.probes == 10 and not r.hits for r in results)
+        assert elapsed < 4 * 10 * 0.05
+
+    @pytest.mark.asyncio
+    async def test_when_tcp_target_then_single_pass_without_baudrate(self):
+        # Arrange
+        scanner = _scanner({None: {5: {0}}})
+        target = DiscoveryTarget(transport=ModbusTransport.TCP, host="10.0.0.5", slave_id_end=6)
+
+        # Act
+        [result] = await scanner.scan([target])
+
+        # Assert
+        assert result.endpoint == "tcp://10.0.0.5:502"
+        assert result.baudrates_tried == [None]
+        assert [hit.slave_id for hit in result.hits] == [5]
+
+    @pytest.mark.asyncio
+    async def test_when_fingerprint_enabled_then_hit_matches_driver_signature(self, tmp_path):
+        # Arrange
+        (tmp_path / "meter.yml").write_text(
+            "model: METER_A\nregister_type: holding\nregister_map:\n"
+            "  V: {offset: 0}\n  I: {offset: 10}\n  KWH: {offset: 40}\n"
+        )
+        (tmp_path / "inverter.yml").write_text(
+            "model: INV_B\nregister_type: holding\nregister_map:\n  HZ: {offset: 0}\n  KW: {offset: 300}\n"
+        )
+        scanner = _scanner({9600: {7: {0, 10, 40}}}, driver_dir=str(tmp_path))
+        target = DiscoveryTarget(port="/dev/ttyUSB0", baudrates=[9600], slave_id_end=8, fingerprint=True)
+
+        # Act
+        [result] = await scanner.scan([target])
+
+        # Assert
+        assert [(hit.slave_id, hit.models) for hit in result.hits] == [(7, ["METER_A"])]
+
+
+def test_when_loading_driver_signatures_then_first_middle_last_offsets_are_picked(tmp_path):
+    # Arrange
+    (tmp_path / "drv.yml").write_text(
+        "model: DRV\nregister_type: holding\nregister_map:\n"
+        "  A: {offset: 5}\n  B: {offset: 1}\n  C: {offset: 9}\n  D: {offset: 20}\n  W: {offset: 99, readable: false}\n"
+    )
+    (tmp_path / "coils.yml").write_text("model: IO\nregister_type: coil\nregister_map:\n  DO1: {offset: 0}\n")
+
+    # Act
+    signatures = load_driver_signatures(str(tmp_path))
+
+    # Assert
+    assert [(s.model, s.offsets) for s in signatures] == [("DRV", (1, 9, 20))]
@@ -0,0 +1,232 @@
+import asyncio
+import socket
+
+import pytest
+from pydantic import ValidationError
+from pymodbus.client import AsyncModbusTcpClient
+from pymodbus.datastore import ModbusSequentialDataBlock, ModbusServerContext, ModbusSlaveContext
+from pymodbus.framer import FramerType
+from pymodbus.server import ModbusTcpServer
+
+from core.device.generic.modbus_bus import ModbusBus
+from core.device.modbus.tcp_client_pool import ModbusTcpClientPool
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.schema.modbus_device_schema import ModbusBusConfig, ModbusDeviceFileConfig
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class _LocalModbusServer:
+    """Local pymodbus TCP server stand-in for a gateway / native TCP meter."""
+
+    def __init__(self, framer: FramerType = FramerType.SOCKET):
+        self.port = _free_port()
+        # Holding register N holds value N (pymodbus datastores are 1-based internally)
+        blocks = {name: ModbusSequentialDataBlock(1, list(range(100))) for name in ("di", "co", "ir", "hr")}
+        store = ModbusSlaveContext(**blocks)
+        self.server = ModbusTcpServer(
+            ModbusServerContext(slaves=store, single=True),
+            framer=framer,
+            address=("127.0.0.1", self.port),
+        )
+
+    async def __aenter__(self):
+        await self.server.listen()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.server.shutdown()
+
+
+class _BlockingClient:
+    """Fake client that holds every request until released, to observe concurrency."""
+
+    def __init__(self, release: asyncio.Event):
+        self.connected = True
+        self.release = release
+
+    async def connect(self) -> bool:
+        return True
+
+    def close(self) -> None:
+        self.connected = False
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, slave: int = 1):
+        await self.release.wait()
+        return address
+
+
+class TestModbusTcpClientPool:
+    """Pooled native Modbus TCP connections"""
+
+    @pytest.mark.asyncio
+    async def test_when_reading_through_pool_then_returns_server_registers(self):
+        async with _LocalModbusServer() as server:
+            # Arrange
+            pool = ModbusTcpClientPool("127.0.0.1", server.port, size=2, timeout=1.0)
+            bus = ModbusBus(pool, slave_id=1, register_type="holding", transport=ModbusTransport.TCP)
+
+            # Act
+            connected = await pool.connect()
+            regs = await bus.read_regs(10, 3)
+            pool.close()
+
+        # Assert
+        assert connected is True
+        assert regs == [10, 11, 12]
+
+    @pytest.mark.asyncio
+    async def test_when_reads_run_concurrently_then_they_spread_over_pooled_connections(self):
+        async with _LocalModbusServer() as server:
+            # Arrange
+            pool = ModbusTcpClientPool("127.0.0.1", server.port, size=3, timeout=1.0)
+            await pool.connect()
+            buses = [ModbusBus(pool, slave_id=1, register_type="holding", transport="tcp") for _ in range(6)]
+
+            # Act
+            results = await asyncio.gather(*(bus.read_regs(i * 5, 2) for i, bus in enumerate(buses)))
+            live_connections = sum(client.connected for client in pool._clients)
+            pool.close()
+
+        # Assert
+        assert results == [[i * 5, i * 5 + 1] for i in range(6)]
+        assert live_connections == 3
+
+    @pytest.mark.asyncio
+    async def test_when_requests_pending_then_one_is_in_flight_per_connection(self):
+        # Arrange
+        release = asyncio.Event()
+        pool = ModbusTcpClientPool("gw", size=3, client_factory=lambda: _BlockingClient(release))
+
+        # Act
+        tasks = [asyncio.create_task(pool.read_holding_registers(i, count=1)) for i in range(3)]
+        await asyncio.sleep(0)
+        peak = pool.in_flight
+        per_connection = list(pool._in_flight)
+        release.set()
+        results = await asyncio.gather(*tasks)
+
+        # Assert
+        assert peak == 3
+        assert per_connection == [1, 1, 1]
+        assert results == [0, 1, 2]
+        assert pool.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_when_server_unreachable_then_bus_returns_missing_values(self):
+        # Arrange
+        pool = ModbusTcpClientPool("127.0.0.1", _free_port(), size=1, timeout=0.2)
+        bus = ModbusBus(pool, slave_id=1, register_type="holding", transport=ModbusTransport.TCP)
+
+        # Act
+        regs = await bus.read_regs(0, 2)
+
+        # Assert
+        assert regs == [-1, -1]
+        assert pool.connected is False
+
+    @pytest.mark.asyncio
+    async def test_when_one_member_times_out_then_only_that_member_is_closed(self):
+        # Arrange
+        release = asyncio.Event()
+        pool = ModbusTcpClientPool("gw", size=2, client_factory=lambda: _BlockingClient(release))
+        survivor = asyncio.create_task(pool.read_holding_registers(7, count=1))
+        await asyncio.sleep(0)
+
+        # Act
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(pool.read_holding_registers(8, count=1), timeout=0.05)
+        release.set()
+        result = await survivor
+
+        # Assert
+        assert [client.connected for client in pool._clients] == [True, False]
+        assert result == 7
+        assert pool.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_when_bus_forces_reset_then_pooled_connections_stay_open(self):
+        # Arrange
+        pool = ModbusTcpClientPool("gw", size=2, client_factory=lambda: _BlockingClient(asyncio.Event()))
+        bus = ModbusBus(pool, slave_id=1, register_type="holding", transport=ModbusTransport.TCP)
+
+        # Act
+        await bus._reset_connection_locked(reason="invalid_payload", force_close=True)
+
+        # Assert
+        assert all(client.connected for client in pool._clients)
+
+
+class TestRtuOverTcpTransport:
+    """RTU frames through an Ethernet-to-RS485 gateway keep serialized port semantics"""
+
+    @pytest.mark.asyncio
+    async def test_when_reading_rtu_over_tcp_then_requests_are_serialized_by_port_lock(self):
+        async with _LocalModbusServer(framer=FramerType.RTU) as server:
+            # Arrange
+            client = AsyncModbusTcpClient("127.0.0.1", port=server.port, framer=FramerType.RTU, timeout=1.0)
+            lock = asyncio.Lock()
+            buses = [
+                ModbusBus(client, slave_id=1, register_type="holding", lock=lock, transport="rtu_over_tcp")
+                for _ in range(3)
+            ]
+
+            # Act
+            await client.connect()
+            results = await asyncio.gather(*(bus.read_regs(i, 1) for i, bus in enumerate(buses)))
+            client.close()
+
+        # Assert
+        assert results == [[0], [1], [2]]
+        assert not lock.locked()
+
+    def test_when_transport_is_not_serial_then_buffer_clear_is_skipped(self):
+        # Arrange
+        bus = ModbusBus(object(), slave_id=1, register_type="holding", transport="rtu_over_tcp")
+
+        # Act
+        cleared = bus._try_clear_receive_buffer()
+
+        # Assert
+        assert cleared is False
+        assert not hasattr(bus, "_buffer_clear_warning_shown")
+
+
+class TestModbusTransportSchema:
+    """transport / host settings in modbus_device.yml"""
+
+    def test_when_tcp_bus_has_no_host_then_validation_fails(self):
+        with pytest.raises(ValidationError):
+            ModbusBusConfig(transport="tcp")
+
+    def test_when_serial_bus_has_no_port_then_validation_fails(self):
+        with pytest.raises(ValidationError):
+            ModbusBusConfig()
+
+    def test_when_device_references_tcp_bus_then_endpoint_is_resolved(self):
+        # Arrange
+        config = ModbusDeviceFileConfig.model_validate(
+            {
+                "buses": {
+                    "gw0": {"transport": "rtu_over_tcp", "host": "10.0.0.5", "tcp_port": 4001},
+                    "meters": {"transport": "tcp", "host": "10.0.0.9", "pool_size": 4},
+                },
+                "devices": [
+                    {"model": "A", "type": "power_meter", "model_file": "a.yml", "slave_id": 1, "bus": "gw0"},
+                    {"model": "B", "type": "power_meter", "model_file": "b.yml", "slave_id": 2, "bus": "meters"},
+                ],
+            }
+        )
+
+        # Act
+        gw_device, tcp_device = config.resolve_device_bus_settings()
+
+        # Assert
+        assert gw_device.transport == ModbusTransport.RTU_OVER_TCP
+        assert gw_device.endpoint == "rtu_over_tcp://10.0.0.5:4001"
+        assert tcp_device.endpoint == "tcp://10.0.0.9:502"
+        assert tcp_device.pool_size == 4
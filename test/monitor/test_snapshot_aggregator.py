@@ -20,6 +20,9 @@ from pydantic import ValidationError
 
 from core.schema.system_config_schema import SystemConfig
 from core.util.snapshot_aggregator import SnapshotAggregator
+from core.util.snapshot_aggregator import np as numpy_module
+
+numpy_available = numpy_module is not None
 
 # ---------------------------------------------------------------------------
 # 1. Schema validation tests
@@ -213,7 +216,8 @@ def test_when_all_values_are_outliers_then_fallback_to_median():
 
     SnapshotAggregator._iqr_filter = always_empty
     try:
-        agg2 = SnapshotAggregator(monitor_interval=10, eval_interval=60)
+        # _iqr_filter is the per-parameter step of the array('d') backend
+        agg2 = SnapshotAggregator(monitor_interval=10, eval_interval=60, use_numpy=False)
         for v in [10.0, 20.0, 30.0, 40.0, 50.0]:
             agg2.push("devX", {"temperature": v})
         result = agg2.aggregate("devX")
@@ -241,6 +245,7 @@ def test_when_outlier_detected_then_written_to_outlier_log_file(tmp_path):
     agg.push("devA", {"sensor": outlier_val})
 
     agg.aggregate("devA")
+    agg.flush_outlier_log()  # Records are written by a background queue listener
 
     # Outlier log file must exist and contain the outlier entry
     assert os.path.exists(outlier_log), "Outlier log file was not created"
@@ -270,6 +275,7 @@ def test_when_no_outliers_then_outlier_log_file_is_empty(tmp_path):
         agg.push("devB", {"sensor": v})
 
     agg.aggregate("devB")
+    agg.flush_outlier_log()
 
     if os.path.exists(outlier_log):
         with open(outlier_log) as f:
@@ -357,3 +363,61 @@ def test_when_aggregate_on_empty_buffer_returns_none():
     agg = SnapshotAggregator(monitor_interval=10, eval_interval=60)
     result = agg.aggregate("unknown_device")
     assert result is None
+
+
+# ---------------------------------------------------------------------------
+# 9. Array backends (NumPy / array('d'))
+# ---------------------------------------------------------------------------
+
+BACKENDS = [pytest.param(False, id="array")]
+if numpy_available:
+    BACKENDS.append(pytest.param(True, id="numpy"))
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_when_backends_aggregate_same_buffer_then_results_match_reference(use_numpy):
+    """Both backends produce the IQR-filtered mean, with parameters missing in some samples."""
+    agg = SnapshotAggregator(monitor_interval=10, eval_interval=60, use_numpy=use_numpy)
+    samples = [
+        {"temp": 20.0, "hz": 50.0},
+        {"temp": 21.0},
+        {"temp": 22.0, "hz": 50.5},
+        {"temp": 23.0, "kwh": 1.0},
+        {"temp": 24.0, "hz": 49.5},
+        {"temp": 200.0, "hz": 50.0},
+    ]
+    for sample in samples:
+        agg.push("dev1", sample)
+
+    result = agg.aggregate("dev1")
+
+    assert result is not None
+    assert result["temp"] == pytest.approx(22.0)
+    assert result["hz"] == pytest.approx(50.0)
+    assert result["kwh"] == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_when_ring_buffer_wraps_then_only_latest_samples_aggregated(use_numpy):
+    """Oldest samples are overwritten in place once capacity is reached."""
+    agg = SnapshotAggregator(monitor_interval=10, eval_interval=20, use_numpy=use_numpy)  # capacity 2
+    for v in [1.0, 2.0, 3.0, 4.0]:
+        agg.push("dev1", {"temp": v})
+
+    result = agg.aggregate("dev1")
+
+    assert result == {"temp": pytest.approx(3.5)}
+
+
+@pytest.mark.parametrize("use_numpy", BACKENDS)
+def test_when_new_parameter_appears_late_then_buffer_grows_columns(use_numpy):
+    """Parameters first seen in later samples are added without losing earlier data."""
+    agg = SnapshotAggregator(monitor_interval=10, eval_interval=60, use_numpy=use_numpy)
+    agg.push("dev1", {"p0": 1.0})
+    agg.push("dev1", {f"p{i}": float(i) for i in range(20)})
+
+    result = agg.aggregate("dev1")
+
+    assert result["p0"] == pytest.approx(0.5)
+    assert result["p19"] == pytest.approx(19.0)
+    assert len(result) == 20
@@ -0,0 +1,52 @@
+from core.sender.aimd_window import AimdWindow
+
+
+class TestAimdWindow:
+    """Test additive increase / multiplicative decrease of the resend batch window"""
+
+    def test_when_round_succeeds_then_window_grows_additively(self):
+        # Arrange
+        window = AimdWindow(3, maximum=10)
+
+        # Act
+        window.observe(True, 0.1)
+        first = window.end_round()
+        window.observe(True, 0.1)
+        second = window.end_round()
+
+        # Assert
+        assert (first, second) == (6, 9)
+
+    def test_when_window_reaches_maximum_then_stays_capped(self):
+        # Arrange
+        window = AimdWindow(8, maximum=10, increase=5)
+
+        # Act
+        window.observe(True, 0.1)
+
+        # Assert
+        assert window.end_round() == 10
+
+    def test_when_any_upload_fails_then_window_halves(self):
+        # Arrange
+        window = AimdWindow(40, maximum=100)
+        window.observe(True, 0.1)
+        window.observe(False, 0.1)
+
+        # Act / Assert
+        assert window.end_round() == 20
+
+    def test_when_upload_is_slow_then_window_shrinks_but_not_below_minimum(self):
+        # Arrange
+        window = AimdWindow(3, minimum=2, slow_latency_sec=1.0)
+        window.observe(True, 2.5)
+
+        # Act / Assert
+        assert window.end_round() == 2
+
+    def test_when_round_is_empty_then_window_unchanged(self):
+        # Arrange
+        window = AimdWindow(5)
+
+        # Act / Assert
+        assert window.end_round() == 5
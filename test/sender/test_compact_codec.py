@@ -0,0 +1,177 @@
+import json
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.sender.compact_codec import (
+    COMPACT_VERSION,
+    CompactBaseMismatch,
+    CompactPayloadDecoder,
+    CompactPayloadEncoder,
+)
+from core.sender.legacy.legacy_sender import LegacySenderAdapter
+from core.sender.transport import ResendTransport
+
+
+def _payload(ts: str, hz: float, devices: int = 20) -> dict:
+    return {
+        "FUNC": "PushIMAData",
+        "version": "6.0",
+        "GatewayID": "test_gw_001",
+        "Timestamp": ts,
+        "Data": [
+            {
+                "DeviceID": f"test_gw_001_{n:03d}",
+                "Data": {"HZ": hz, "KW": 1.5, "KWH": 1000.0 + n, "Status": 1, "report_ts": ts},
+            }
+            for n in range(devices)
+        ],
+    }
+
+
+class TestCompactPayloadCodec:
+    """Test v7.0 dictionary/delta encoding round trip"""
+
+    def test_when_sequence_encoded_then_decoder_rebuilds_every_payload(self):
+        # Arrange
+        encoder, decoder = CompactPayloadEncoder(), CompactPayloadDecoder()
+        payloads = [_payload(f"2025010112{m:02d}00", 50.0 + (m % 2)) for m in range(5)]
+
+        # Act / Assert
+        for payload in payloads:
+            encoded = encoder.encode(payload)
+            assert decoder.decode(json.loads(json.dumps(encoded))) == payload
+            encoder.ack(payload)
+
+    def test_when_delta_sent_then_unchanged_fields_omitted(self):
+        # Arrange
+        encoder = CompactPayloadEncoder()
+        first, second = _payload("20250101120000", 50.0), _payload("20250101120100", 51.0)
+        encoder.encode(first)
+        encoder.ack(first)
+
+        # Act
+        encoded = encoder.encode(second)
+
+        # Assert
+        assert encoded["version"] == COMPACT_VERSION
+        assert encoded["Base"] == "20250101120000"
+        assert "Dict" not in encoded
+        assert len(json.dumps(encoded)) * 2 < len(json.dumps(second))
+        assert all(len(row[2]) == 2 for row in encoded["Rows"])  # HZ + report_ts only
+
+    def test_when_not_acked_then_next_delta_keeps_old_base(self):
+        # Arrange
+        encoder = CompactPayloadEncoder()
+        first = _payload("20250101120000", 50.0)
+        encoder.encode(first)
+        encoder.ack(first)
+
+        # Act: second payload is never acknowledged
+        encoder.encode(_payload("20250101120100", 51.0))
+        third = encoder.encode(_payload("20250101120200", 52.0))
+
+        # Assert
+        assert third["Base"] == "20250101120000"
+
+    def test_when_full_every_reached_then_self_contained_payload_sent(self):
+        # Arrange
+        encoder = CompactPayloadEncoder(full_every=2)
+        bases = []
+
+        # Act
+        for m in range(4):
+            payload = _payload(f"2025010112{m:02d}00", 50.0)
+            bases.append(encoder.encode(payload)["Base"])
+            encoder.ack(payload)
+
+        # Assert
+        assert bases == [None, "20250101120000", "20250101120100", None]
+
+    def test_when_device_drops_field_then_full_row_replaces_state(self):
+        # Arrange
+        encoder, decoder = CompactPayloadEncoder(), CompactPayloadDecoder()
+        first = _payload("20250101120000", 50.0, devices=1)
+        decoder.decode(encoder.encode(first))
+        encoder.ack(first)
+        second = _payload("20250101120100", 50.0, devices=1)
+        del second["Data"][0]["Data"]["KW"]
+
+        # Act
+        decoded = decoder.decode(encoder.encode(second))
+
+        # Assert
+        assert decoded == second
+
+    def test_when_decoder_lacks_base_then_raises(self):
+        # Arrange
+        encoder = CompactPayloadEncoder()
+        first = _payload("20250101120000", 50.0)
+        encoder.encode(first)
+        encoder.ack(first)
+
+        # Act / Assert
+        with pytest.raises(CompactBaseMismatch):
+            CompactPayloadDecoder().decode(encoder.encode(_payload("20250101120100", 51.0)))
+
+
+def _response(ok: bool, status: int = 200) -> Mock:
+    resp = Mock()
+    resp.status_code = status
+    resp.text = '{"result": "00000"}' if ok else "unsupported version"
+    return resp
+
+
+class TestLegacySenderCompactNegotiation:
+    """Test v7.0 negotiation and v6.0 fallback in the live upload path"""
+
+    @staticmethod
+    def _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, encoding: str):
+        config = sender_config_minimal.model_copy(update={"payload_encoding": encoding, "attempt_count": 1})
+        adapter = LegacySenderAdapter(
+            sender_config_schema=config,
+            system_config=system_config_minimal,
+            device_manager=mock_device_manager,
+            series_number=1,
+        )
+        return adapter
+
+    @staticmethod
+    def _attach(adapter: LegacySenderAdapter, post: AsyncMock) -> None:
+        client = Mock()
+        client.post = post
+        adapter._transport = ResendTransport(adapter.ima_url, client, adapter._is_ok)
+
+    @pytest.mark.asyncio
+    async def test_when_endpoint_accepts_compact_then_v7_sent(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = self._make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, "auto")
+        post = AsyncMock(return_value=_response(True))
+        self._attach(adapter, post)
+
+        # Act
+        ok = await adapter._post_with_retry(_payload("20250101120000", 50.0))
+
+        # Assert
+        assert ok is True
+        assert post.await_args.kwargs["json"]["version"] == COMPACT_VERSION
+
+    @pytest.mark.asyncio
+    async def test_when_endpoint_rejects_compact_then_auto_falls_back_to_v6(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange: legacy endpoint only understands v6.0
+        adapter = self._make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, "auto")
+        post = AsyncMock(side_effect=lambda url, json: _response(json["version"] == "6.0"))
+        self._attach(adapter, post)
+
+        # Act
+        first = await adapter._post_with_retry(_payload("20250101120000", 50.0))
+        second = await adapter._post_with_retry(_payload("20250101120100", 50.0))
+
+        # Assert
+        assert first is True and second is True
+        assert [c.kwargs["json"]["version"] for c in post.await_args_list] == ["7.0", "6.0", "6.0"]
+        assert adapter._compact is None
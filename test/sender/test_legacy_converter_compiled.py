@@ -0,0 +1,141 @@
+from unittest.mock import Mock
+
+import pytest
+
+from core.sender.legacy.converter_compiler import LegacyConverterCompiler
+from core.sender.legacy.snapshot_converters import (
+    convert_ai_module_snapshot,
+    convert_di_module_snapshot,
+    convert_inverter_snapshot,
+    convert_panel_meter_snapshot,
+    convert_power_meter_snapshot,
+)
+
+
+class DummyPolicy:
+    def build_device_id(self, gateway_id, slave_id, idx, eq_suffix):
+        return f"{gateway_id}_{slave_id}_{idx}{eq_suffix}"
+
+
+@pytest.fixture(autouse=True)
+def patch_policy(monkeypatch):
+    monkeypatch.setattr("core.sender.legacy.snapshot_converters.get_policy", lambda: DummyPolicy())
+
+
+@pytest.fixture
+def compiler():
+    return LegacyConverterCompiler()
+
+
+@pytest.fixture
+def device_manager():
+    device = Mock()
+    device.pin_type_map = {"AIn01": "Temp", "AIn02": "Pressure", "AIn03": "Temp"}
+    manager = Mock()
+    manager.get_device_by_model_and_slave_id = Mock(return_value=device)
+    return manager
+
+
+DI_VALUES = {"DIn01": "1", "DIn03": "bad", "DIn02": "0", "DOut01": "1", "DOut03": "x", "ByPass": "1"}
+INVERTER_VALUES = {"KWH": "12.5", "HZ": "50", "ERROR": 0, "RW_ON_OFF": None, "VOLTAGE": "bad", "INVSTATUS": 3}
+POWER_METER_VALUES = {"Kw": "1.23456", "Kva": -1, "AveragePowerFactor": "0.98765", "Kwh_SUM": "100.123"}
+POWER_METER_3WORD_VALUES = {
+    "Kw": "2",
+    "Kwh_W1_HI": 0,
+    "Kwh_W2_MD": 1,
+    "Kwh_W3_LO": 2,
+    "SCALE_EnergyIndex": 1,
+}
+AI_VALUES = {"AIn01": "21.5", "AIn02": "bad", "AIn03": 3, "AIn04": "7"}
+
+
+def _plan(compiler, converter_fn, values, device_manager, model="M"):
+    return compiler.plan_for(
+        converter_fn, gateway_id="GW", model=model, slave_id="5", values=values, device_manager=device_manager
+    )
+
+
+class TestCompiledConverterEquivalence:
+    """Compiled plans must produce exactly what the reference converters produce"""
+
+    @pytest.mark.parametrize("model", ["IMA_C", "SD400"])
+    def test_di_module(self, compiler, device_manager, model):
+        # Act
+        result = _plan(compiler, convert_di_module_snapshot, DI_VALUES, device_manager, model)(DI_VALUES)
+
+        # Assert
+        assert result == convert_di_module_snapshot("GW", "5", DI_VALUES, model)
+
+    @pytest.mark.parametrize("values", [INVERTER_VALUES, {}])
+    def test_inverter(self, compiler, device_manager, values):
+        # Act
+        result = _plan(compiler, convert_inverter_snapshot, values, device_manager)(values)
+
+        # Assert
+        assert result == convert_inverter_snapshot("GW", "5", values)
+
+    @pytest.mark.parametrize("values", [POWER_METER_VALUES, POWER_METER_3WORD_VALUES, {}])
+    def test_power_meter(self, compiler, device_manager, values):
+        # Act
+        result = _plan(compiler, convert_power_meter_snapshot, values, device_manager)(values)
+
+        # Assert
+        assert result == convert_power_meter_snapshot("GW", "5", values)
+
+    def test_ai_module(self, compiler, device_manager):
+        # Arrange
+        pin_type_map = device_manager.get_device_by_model_and_slave_id.return_value.pin_type_map
+
+        # Act
+        result = _plan(compiler, convert_ai_module_snapshot, AI_VALUES, device_manager)(AI_VALUES)
+
+        # Assert
+        assert result == convert_ai_module_snapshot("GW", "5", AI_VALUES, pin_type_map)
+
+    def test_when_values_change_but_keys_do_not_then_plan_tracks_values(self, compiler, device_manager):
+        # Arrange
+        plan = _plan(compiler, convert_di_module_snapshot, DI_VALUES, device_manager, "IMA_C")
+        changed = {**DI_VALUES, "DIn01": "0", "DOut01": "0"}
+
+        # Act
+        result = plan(changed)
+
+        # Assert
+        assert result == convert_di_module_snapshot("GW", "5", changed, "IMA_C")
+
+
+class TestLegacyConverterCompilerCache:
+    """Test plan caching and fallbacks"""
+
+    def test_when_same_key_set_then_plan_compiled_once(self, compiler, device_manager):
+        # Act
+        first = _plan(compiler, convert_ai_module_snapshot, AI_VALUES, device_manager)
+        second = _plan(compiler, convert_ai_module_snapshot, dict(AI_VALUES), device_manager)
+
+        # Assert
+        assert first is second
+        device_manager.get_device_by_model_and_slave_id.assert_called_once_with("M", "5")
+
+    def test_when_key_set_changes_then_new_plan(self, compiler, device_manager):
+        # Act
+        first = _plan(compiler, convert_di_module_snapshot, {"DIn01": 1}, device_manager)
+        second = _plan(compiler, convert_di_module_snapshot, {"DIn01": 1, "DIn02": 0}, device_manager)
+
+        # Assert
+        assert first is not second
+        assert len(second({"DIn01": 1, "DIn02": 0})) == 2
+
+    def test_when_converter_has_no_compiler_then_returns_none(self, compiler, device_manager):
+        # Act / Assert
+        assert _plan(compiler, convert_panel_meter_snapshot, {"RATE": 1}, device_manager) is None
+
+    def test_when_ai_device_missing_then_nothing_is_cached(self, compiler, device_manager):
+        # Arrange
+        device_manager.get_device_by_model_and_slave_id.return_value = None
+
+        # Act
+        plan = _plan(compiler, convert_ai_module_snapshot, AI_VALUES, device_manager)
+
+        # Assert
+        assert plan is None
+        assert compiler._plans == {}
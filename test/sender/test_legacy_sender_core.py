@@ -18,8 +18,8 @@ class TestSnapshotHandling:
     """Test snapshot bucketing and storage logic"""
 
     @pytest.mark.asyncio
-    async def test_when_snapshot_received_then_stored_in_correct_window(self, sender_adapter):
-        """Test that snapshot is stored in the correct time window bucket"""
+    async def test_when_snapshot_received_then_stored_in_device_slot(self, sender_adapter):
+        """Test that snapshot is stored by reference in the device's latest slot"""
         # Arrange
         sampling_datetime = datetime(2025, 1, 1, 12, 0, 30, tzinfo=TIMEZONE_INFO)
         snapshot = {
@@ -35,10 +35,7 @@ class TestSnapshotHandling:
         await sender_adapter.handle_snapshot(snapshot)
 
         # Assert
-        window_start = LegacySenderAdapter._window_start(sampling_datetime, int(sender_adapter.send_interval_sec))
-        assert window_start in sender_adapter._latest_per_window
-        assert "device_001" in sender_adapter._latest_per_window[window_start]
-        assert sender_adapter._latest_per_window[window_start]["device_001"]["device_id"] == "device_001"
+        assert sender_adapter._latest_by_device["device_001"] is snapshot
 
     @pytest.mark.asyncio
     async def test_when_multiple_snapshots_same_window_then_keeps_latest(self, sender_adapter):
@@ -65,6 +62,42 @@ class TestSnapshotHandling:
         latest = await sender_adapter._collect_latest_by_device_unlocked()
         assert latest["device_001"]["values"]["HZ"] == 50.0
 
+    @pytest.mark.asyncio
+    async def test_when_older_snapshot_arrives_late_then_slot_keeps_newer(self, sender_adapter):
+        """Test that an out-of-order older snapshot does not replace a newer slot"""
+        # Arrange
+        base_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=TIMEZONE_INFO)
+        newer = {
+            "device_id": "device_001",
+            "sampling_datetime": base_time + timedelta(seconds=70),
+            "values": {"HZ": 50.0},
+        }
+        older = {"device_id": "device_001", "sampling_datetime": base_time, "values": {"HZ": 40.0}}
+
+        # Act
+        await sender_adapter.handle_snapshot(newer)
+        await sender_adapter.handle_snapshot(older)
+
+        # Assert
+        latest = await sender_adapter._collect_latest_by_device_unlocked()
+        assert latest["device_001"] is newer
+
+    @pytest.mark.asyncio
+    async def test_when_many_windows_pass_then_one_slot_per_device(self, sender_adapter):
+        """Test that memory stays bounded when the scheduler does not run"""
+        # Arrange
+        base_time = datetime(2025, 1, 1, 12, 0, 0, tzinfo=TIMEZONE_INFO)
+
+        # Act
+        for minute in range(100):
+            for dev in ("device_001", "device_002"):
+                await sender_adapter.handle_snapshot(
+                    {"device_id": dev, "sampling_datetime": base_time + timedelta(minutes=minute), "values": {}}
+                )
+
+        # Assert
+        assert len(sender_adapter._latest_by_device) == 2
+
     @pytest.mark.asyncio
     async def test_when_first_snapshot_then_triggers_warmup_event(self, sender_adapter):
         """Test that first snapshot sets the warmup event"""
@@ -167,14 +200,14 @@ class TestDeduplication:
         assert should_send is False
 
 
-# ==================== Bucket Pruning Tests ====================
+# ==================== Slot Pruning Tests ====================
 
 
-class TestBucketPruning:
-    """Test bucket cleanup after successful send"""
+class TestSlotPruning:
+    """Test slot cleanup after successful send"""
 
     @pytest.mark.asyncio
-    async def test_when_prune_buckets_then_removes_sent_snapshots(self, sender_adapter):
+    async def test_when_prune_slots_then_removes_sent_snapshots(self, sender_adapter):
         """Test that sent snapshots are removed from buckets"""
         # Arrange
         device_id = "device_001"
@@ -187,67 +220,105 @@ class TestBucketPruning:
         sender_adapter._LegacySenderAdapter__last_sent_ts_by_device[device_id] = old_ts
 
         # Act
-        await sender_adapter._prune_buckets()
+        await sender_adapter._prune_sent_slots()
 
         # Assert
         latest = await sender_adapter._collect_latest_by_device_unlocked()
         assert device_id not in latest
 
     @pytest.mark.asyncio
-    async def test_when_bucket_empty_then_removes_bucket(self, sender_adapter):
-        """Test that empty buckets are removed"""
+    async def test_when_newer_snapshot_than_watermark_then_slot_kept(self, sender_adapter):
+        """Test that a slot newer than the last-sent watermark survives pruning"""
         # Arrange
         device_id = "device_001"
+        sent_ts = datetime.now(TIMEZONE_INFO) - timedelta(seconds=60)
         sampling_datetime = datetime.now(TIMEZONE_INFO)
 
         snapshot = {"device_id": device_id, "sampling_datetime": sampling_datetime, "values": {}}
         await sender_adapter.handle_snapshot(snapshot)
-
-        window_start = LegacySenderAdapter._window_start(sampling_datetime, int(sender_adapter.send_interval_sec))
-        assert window_start in sender_adapter._latest_per_window
-
-        # Mark as sent and prune
-        sender_adapter._LegacySenderAdapter__last_sent_ts_by_device[device_id] = sampling_datetime
+        sender_adapter._LegacySenderAdapter__last_sent_ts_by_device[device_id] = sent_ts
 
         # Act
-        await sender_adapter._prune_buckets()
+        await sender_adapter._prune_sent_slots()
 
         # Assert
-        assert window_start not in sender_adapter._latest_per_window
+        assert sender_adapter._latest_by_device[device_id] is snapshot
+
+
+# ==================== Prebuilt Frame Tests ====================
+
 
+class TestPrebuiltFrames:
+    """Test background conversion of snapshots into reusable legacy frames"""
 
-# ==================== Window Alignment Tests ====================
+    @staticmethod
+    def _snapshot(seconds: int, hz: float) -> dict:
+        return {
+            "device_id": "device_001",
+            "sampling_datetime": datetime(2025, 1, 1, 12, 0, seconds, tzinfo=TIMEZONE_INFO),
+            "values": {"HZ": hz},
+        }
 
+    @pytest.mark.asyncio
+    async def test_when_burst_of_snapshots_then_frame_built_once_for_latest(self, sender_adapter):
+        # Arrange
+        sender_adapter.prebuild_debounce_sec = 0.05
+        convert = Mock(side_effect=lambda **kw: [{"DeviceID": "dev", "Data": dict(kw["snapshot"]["values"])}])
 
-class TestWindowAlignment:
-    """Test time window alignment logic"""
+        with patch("core.sender.legacy.legacy_sender.convert_snapshot_to_legacy_payload", convert):
+            builder = asyncio.create_task(sender_adapter._frame_builder_loop())
 
-    def test_when_window_start_then_aligns_to_interval(self):
-        """Test that timestamps are aligned to interval boundaries"""
+            # Act
+            for n in range(5):
+                await sender_adapter.handle_snapshot(self._snapshot(n, 50.0 + n))
+            await asyncio.sleep(0.15)
+            builder.cancel()
+            await asyncio.gather(builder, return_exceptions=True)
+
+        # Assert
+        snap, items = sender_adapter._frames_by_device["device_001"]
+        assert convert.call_count == 1
+        assert snap is sender_adapter._latest_by_device["device_001"]
+        assert items == [{"DeviceID": "dev", "Data": {"HZ": 54.0}}]
+
+    @pytest.mark.asyncio
+    async def test_when_frame_stamped_then_frame_reused_unmodified(self, sender_adapter):
         # Arrange
-        ts = datetime(2025, 1, 1, 12, 0, 35, tzinfo=TIMEZONE_INFO)
-        interval = 60
+        snapshot = self._snapshot(30, 50.0)
+        await sender_adapter.handle_snapshot(snapshot)
+        label = datetime(2025, 1, 1, 12, 1, 0, tzinfo=TIMEZONE_INFO)
+        convert = Mock(return_value=[{"DeviceID": "dev", "Data": {"HZ": 50.0}}])
 
-        # Act
-        window_start = LegacySenderAdapter._window_start(ts, interval)
+        with patch("core.sender.legacy.legacy_sender.convert_snapshot_to_legacy_payload", convert):
+            # Act
+            first = sender_adapter._stamp_frame(
+                sender_adapter._frame_for("device_001", snapshot), snapshot["sampling_datetime"], label, 30.0, 1
+            )
+            second = sender_adapter._frame_for("device_001", snapshot)
 
         # Assert
-        assert window_start.second == 0  # Aligned to minute boundary
-        assert window_start.microsecond == 0
+        assert convert.call_count == 1
+        assert first[0]["Data"]["report_ts"] == label.isoformat()
+        assert first[0]["Data"]["is_stale"] == 1
+        assert second == [{"DeviceID": "dev", "Data": {"HZ": 50.0}}]
 
-    def test_when_different_seconds_same_window_then_same_start(self):
-        """Test that timestamps in same window have same start"""
+    @pytest.mark.asyncio
+    async def test_when_builder_behind_then_tick_converts_newer_snapshot(self, sender_adapter):
         # Arrange
-        ts1 = datetime(2025, 1, 1, 12, 0, 10, tzinfo=TIMEZONE_INFO)
-        ts2 = datetime(2025, 1, 1, 12, 0, 50, tzinfo=TIMEZONE_INFO)
-        interval = 60
+        old, new = self._snapshot(10, 40.0), self._snapshot(20, 50.0)
+        convert = Mock(side_effect=lambda **kw: [{"DeviceID": "dev", "Data": dict(kw["snapshot"]["values"])}])
 
-        # Act
-        window1 = LegacySenderAdapter._window_start(ts1, interval)
-        window2 = LegacySenderAdapter._window_start(ts2, interval)
+        with patch("core.sender.legacy.legacy_sender.convert_snapshot_to_legacy_payload", convert):
+            await sender_adapter.handle_snapshot(old)
+            sender_adapter._frame_for("device_001", old)
+            await sender_adapter.handle_snapshot(new)
+
+            # Act
+            items = sender_adapter._frame_for("device_001", sender_adapter._latest_by_device["device_001"])
 
         # Assert
-        assert window1 == window2
+        assert items == [{"DeviceID": "dev", "Data": {"HZ": 50.0}}]
+        assert convert.call_count == 2
 
 
 # ==================== Warmup Logic Tests ====================
@@ -339,6 +410,32 @@ class TestSchedulerLogic:
         # Assert
         assert next_label.second == 15
 
+    @pytest.mark.asyncio
+    async def test_when_scheduled_send_then_payload_persisted_before_post(self, sender_adapter):
+        """Test that the tick payload is in the outbox before the POST starts and stays there on failure"""
+        # Arrange
+        calls: list[str] = []
+
+        async def persist(payload: dict) -> str:
+            calls.append("persist")
+            return "entry-1"
+
+        async def post(payload: dict) -> bool:
+            calls.append("post")
+            return False
+
+        sender_adapter._store.persist_payload = persist
+        sender_adapter._store.delete_many = Mock()
+        sender_adapter._post_with_retry = post
+        sender_adapter._make_gw_heartbeat = AsyncMock(return_value={"DeviceID": "gw", "Data": {"HB": 1}})
+
+        # Act
+        await sender_adapter._send_at_label_time(datetime(2025, 1, 1, 12, 1, 0, tzinfo=TIMEZONE_INFO))
+
+        # Assert
+        assert calls == ["persist", "post"]
+        sender_adapter._store.delete_many.assert_not_called()
+
 
 # ==================== Payload Conversion Tests ====================
 
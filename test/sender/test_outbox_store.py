@@ -172,6 +172,25 @@ class TestOutboxStoreRetryOrFail:
         assert failed is False
         assert ".retry100.json" in new_path
 
+    def test_when_retry_or_fail_many_then_each_file_handled(self, outbox_store, tmp_path):
+        """Test that the batch form applies retry_or_fail per file, in order"""
+        # Arrange
+        outbox_dir = tmp_path / "outbox"
+        outbox_dir.mkdir(parents=True, exist_ok=True)
+
+        fresh_file = outbox_dir / "resend_20250101120000_000_aaa.json"
+        retry_file = outbox_dir / "resend_20250101120001_000_bbb.retry2.json"
+        fresh_file.write_text('{"test": 1}')
+        retry_file.write_text('{"test": 2}')
+
+        # Act
+        results = outbox_store.retry_or_fail_many([str(fresh_file), str(retry_file)], max_retry=3)
+        outbox_store.delete_many([results[0][0]])
+
+        # Assert
+        assert results[1] == (None, True)
+        assert sorted(os.listdir(outbox_dir)) == ["resend_20250101120001_000_bbb.fail"]
+
 
 class TestOutboxStoreWrapPayload:
     """Test payload wrapping"""
@@ -0,0 +1,194 @@
+import asyncio
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.sender.legacy.legacy_sender import LegacySenderAdapter
+from core.sender.transport import ResendTransport
+
+
+def _response(ok: bool) -> Mock:
+    resp = Mock()
+    resp.status_code = 200 if ok else 500
+    resp.text = '{"result": "00000"}' if ok else "error"
+    return resp
+
+
+def _packet(ts: str, device_id: str) -> dict:
+    return {
+        "FUNC": "PushIMAData",
+        "version": "6.0",
+        "GatewayID": "test_gw_001",
+        "Timestamp": ts,
+        "Data": [{"DeviceID": device_id, "Data": {"HZ": 50.0}}],
+    }
+
+
+def _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, **overrides):
+    config = sender_config_minimal.model_copy(update=overrides)
+    return LegacySenderAdapter(
+        sender_config_schema=config,
+        system_config=system_config_minimal,
+        device_manager=mock_device_manager,
+        series_number=1,
+    )
+
+
+def _attach_client(adapter: LegacySenderAdapter, post: AsyncMock) -> Mock:
+    client = Mock()
+    client.post = post
+    adapter._client = client
+    adapter._transport = ResendTransport(adapter.ima_url, client, adapter._is_ok)
+    return client
+
+
+class TestResendDrain:
+    """Test the adaptive backlog drain of the resend worker"""
+
+    @pytest.mark.asyncio
+    async def test_when_batch_succeeds_then_entries_deleted_and_window_grows(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager)
+        for n in range(3):
+            await adapter._store.persist_payload(_packet(f"2025010112000{n}", f"dev_{n}"))
+        _attach_client(adapter, AsyncMock(return_value=_response(True)))
+
+        # Act
+        processed, deleted = await adapter._resend_process_batch(adapter._resend_window.size)
+        next_batch = adapter._resend_window.end_round()
+
+        # Assert
+        assert (processed, deleted) == (3, 3)
+        assert adapter._store.pick_batch(10) == []
+        assert next_batch == 6
+
+    @pytest.mark.asyncio
+    async def test_when_upload_fails_then_entries_kept_and_window_shrinks(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, fail_resend_batch=8)
+        for n in range(4):
+            await adapter._store.persist_payload(_packet(f"2025010112000{n}", f"dev_{n}"))
+        _attach_client(adapter, AsyncMock(side_effect=[_response(True), _response(False)] * 2))
+
+        # Act
+        _, deleted = await adapter._resend_process_batch(adapter._resend_window.size)
+
+        # Assert
+        assert deleted == 2
+        assert len(adapter._store.pick_batch(10)) == 2
+        assert adapter._resend_window.end_round() == 4
+
+    @pytest.mark.asyncio
+    async def test_when_concurrency_limited_then_in_flight_uploads_are_bounded(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager, resend_concurrency=2)
+        for n in range(6):
+            await adapter._store.persist_payload(_packet(f"2025010112000{n}", f"dev_{n}"))
+
+        in_flight = 0
+        peak = 0
+
+        async def slow_post(*args, **kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _response(True)
+
+        _attach_client(adapter, AsyncMock(side_effect=slow_post))
+
+        # Act
+        _, deleted = await adapter._resend_process_batch(6)
+
+        # Assert
+        assert deleted == 6
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_when_merge_enabled_then_packets_merged_into_one_upload(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(
+            sender_config_minimal, system_config_minimal, mock_device_manager, resend_merge_max_kb=64
+        )
+        await adapter._store.persist_payload(_packet("20250101120000", "dev_a"))
+        await adapter._store.persist_payload(_packet("20250101120100", "dev_b"))
+        client = _attach_client(adapter, AsyncMock(return_value=_response(True)))
+
+        # Act
+        _, deleted = await adapter._resend_process_batch(10)
+
+        # Assert
+        assert deleted == 2
+        client.post.assert_awaited_once()
+        sent = client.post.await_args.kwargs["json"]
+        assert sent["Timestamp"] == "20250101120000"
+        assert [item["DeviceID"] for item in sent["Data"]] == ["dev_a", "dev_b"]
+        assert sent["Data"][1]["Data"]["report_ts"] == "2025-01-01T12:01:00+08:00"
+
+    @pytest.mark.asyncio
+    async def test_when_merged_packets_carry_heartbeats_then_only_newest_is_sent(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(
+            sender_config_minimal, system_config_minimal, mock_device_manager, resend_merge_max_kb=64
+        )
+        for ts, device_id in (("20250101120000", "dev_a"), ("20250101120100", "dev_b")):
+            packet = _packet(ts, device_id)
+            packet["Data"].append({"DeviceID": "test_gw_001_100GW", "Data": {"HB": 1}})
+            await adapter._store.persist_payload(packet)
+        client = _attach_client(adapter, AsyncMock(return_value=_response(True)))
+
+        # Act
+        _, deleted = await adapter._resend_process_batch(10)
+
+        # Assert
+        assert deleted == 2
+        sent = client.post.await_args.kwargs["json"]
+        assert [item["DeviceID"] for item in sent["Data"]] == ["dev_a", "dev_b", "test_gw_001_100GW"]
+        assert sent["Data"][2]["Data"]["report_ts"] == "2025-01-01T12:01:00+08:00"
+
+    @pytest.mark.asyncio
+    async def test_when_live_send_in_flight_then_backlog_upload_waits(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(sender_config_minimal, system_config_minimal, mock_device_manager)
+        await adapter._store.persist_payload(_packet("20250101120000", "dev_a"))
+        client = _attach_client(adapter, AsyncMock(return_value=_response(True)))
+        adapter._live_idle.clear()
+
+        # Act
+        task = asyncio.create_task(adapter._resend_process_batch(10))
+        await asyncio.sleep(0.05)
+        posted_while_live = client.post.await_count
+        adapter._live_idle.set()
+        _, deleted = await task
+
+        # Assert
+        assert posted_while_live == 0
+        assert deleted == 1
+
+    def test_when_drain_disabled_then_window_is_pinned(
+        self, sender_config_minimal, system_config_minimal, mock_device_manager
+    ):
+        # Arrange
+        adapter = _make_adapter(
+            sender_config_minimal, system_config_minimal, mock_device_manager, resend_drain_enabled=False
+        )
+
+        # Act
+        adapter._resend_window.observe(True, 0.1)
+
+        # Assert
+        assert adapter._resend_window.end_round() == 3
+        assert adapter.resend_concurrency == 1
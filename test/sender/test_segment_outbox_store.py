@@ -0,0 +1,313 @@
+import json
+import os
+from datetime import datetime
+
+import pytest
+
+from core.sender.segment_outbox_store import SegmentOutboxStore
+from core.util.time_util import TIMEZONE_INFO
+
+
+def _make_store(dirpath, **overrides) -> SegmentOutboxStore:
+    kwargs = dict(
+        gateway_id="test_gw",
+        resend_quota_mb=256,
+        fs_free_min_mb=512,
+        protect_recent_sec=300,
+        cleanup_batch=100,
+        cleanup_enabled=False,
+    )
+    kwargs.update(overrides)
+    return SegmentOutboxStore(str(dirpath), TIMEZONE_INFO, **kwargs)
+
+
+@pytest.fixture
+def segment_store(tmp_path):
+    store = _make_store(tmp_path / "outbox")
+    yield store
+    store.close()
+
+
+def _payload(n: int) -> dict:
+    return {"FUNC": "PushIMAData", "Timestamp": f"2025010112{n:04d}", "Data": [{"DeviceID": f"dev_{n}"}]}
+
+
+class TestSegmentOutboxStorePersist:
+    """Test enqueue / read round trip"""
+
+    @pytest.mark.asyncio
+    async def test_when_persist_payload_then_entry_can_be_read_back(self, segment_store):
+        # Arrange
+        payload = _payload(1)
+
+        # Act
+        key = await segment_store.persist_payload(payload)
+        raw = await segment_store.read_entry(key)
+
+        # Assert
+        assert json.loads(raw) == payload
+        assert segment_store.pending_count() == 1
+
+    @pytest.mark.asyncio
+    async def test_when_persist_many_then_single_segment_file_is_used(self, segment_store):
+        # Act
+        for n in range(50):
+            await segment_store.persist_payload(_payload(n))
+
+        # Assert
+        assert len(os.listdir(segment_store.segment_dir)) == 1
+        assert not [fn for fn in os.listdir(segment_store.dir) if fn.endswith(".json")]
+
+    @pytest.mark.asyncio
+    async def test_when_segment_full_then_rolls_over(self, tmp_path):
+        # Arrange
+        store = _make_store(tmp_path / "outbox", segment_max_bytes=200)
+
+        # Act
+        for n in range(5):
+            await store.persist_payload(_payload(n))
+
+        # Assert
+        assert len(os.listdir(store.segment_dir)) > 1
+        assert [json.loads(await store.read_entry(k))["Timestamp"] for k in store.pick_batch(10)] == [
+            _payload(n)["Timestamp"] for n in range(5)
+        ]
+        store.close()
+
+
+class TestSegmentOutboxStorePickAndAck:
+    """Test batch selection, ack and retry bookkeeping"""
+
+    @pytest.mark.asyncio
+    async def test_when_pick_batch_then_retried_first_then_fifo(self, segment_store):
+        # Arrange
+        keys = [await segment_store.persist_payload(_payload(n)) for n in range(4)]
+        segment_store.retry_or_fail(keys[2], max_retry=-1)
+
+        # Act
+        picked = segment_store.pick_batch(10)
+
+        # Assert
+        assert picked == [keys[2], keys[0], keys[1], keys[3]]
+
+    @pytest.mark.asyncio
+    async def test_when_pick_entries_then_label_ts_comes_from_payload_timestamp(self, segment_store):
+        # Arrange
+        await segment_store.persist_payload(_payload(1))
+
+        # Act
+        entry = segment_store.pick_entries(1)[0]
+
+        # Assert
+        assert entry.label_ts == datetime(2025, 1, 1, 12, 0, 1, tzinfo=TIMEZONE_INFO)
+
+    @pytest.mark.asyncio
+    async def test_when_all_entries_of_sealed_segment_deleted_then_segment_file_removed(self, tmp_path):
+        # Arrange
+        store = _make_store(tmp_path / "outbox", segment_max_bytes=200)
+        keys = [await store.persist_payload(_payload(n)) for n in range(5)]
+        segments_before = len(os.listdir(store.segment_dir))
+
+        # Act
+        for key in keys[:-1]:
+            store.delete(key)
+
+        # Assert
+        assert segments_before > 1
+        assert len(os.listdir(store.segment_dir)) == 1
+        assert store.pick_batch(10) == [keys[-1]]
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_when_retry_limit_reached_then_entry_is_failed_and_not_picked(self, segment_store):
+        # Arrange
+        key = await segment_store.persist_payload(_payload(1))
+
+        # Act
+        first = segment_store.retry_or_fail(key, max_retry=2)
+        second = segment_store.retry_or_fail(key, max_retry=2)
+
+        # Assert
+        assert first == (key, False)
+        assert second == (None, True)
+        assert segment_store.pick_batch(10) == []
+
+    @pytest.mark.asyncio
+    async def test_when_entry_deleted_then_read_raises_file_not_found(self, segment_store):
+        # Arrange
+        key = await segment_store.persist_payload(_payload(1))
+        segment_store.delete(key)
+
+        # Act / Assert
+        with pytest.raises(FileNotFoundError):
+            await segment_store.read_entry(key)
+
+    @pytest.mark.asyncio
+    async def test_when_store_reopened_then_pending_entries_survive(self, tmp_path):
+        # Arrange
+        store = _make_store(tmp_path / "outbox")
+        key = await store.persist_payload(_payload(1))
+        store.close()
+
+        # Act
+        reopened = _make_store(tmp_path / "outbox")
+        await reopened.persist_payload(_payload(2))
+
+        # Assert
+        assert reopened.pick_batch(10)[0] == key
+        assert json.loads(await reopened.read_entry(key)) == _payload(1)
+        reopened.close()
+
+    @pytest.mark.asyncio
+    async def test_when_delete_many_then_acked_in_one_transaction(self, tmp_path):
+        # Arrange
+        store = _make_store(tmp_path / "outbox", segment_max_bytes=200)
+        keys = [await store.persist_payload(_payload(n)) for n in range(5)]
+        statements: list[str] = []
+        store._conn.set_trace_callback(statements.append)
+
+        # Act
+        store.delete_many(keys[:-1])
+
+        # Assert
+        assert [sql for sql in statements if sql.strip().upper() == "COMMIT"] == ["COMMIT"]
+        assert len(os.listdir(store.segment_dir)) == 1
+        assert store.pick_batch(10) == [keys[-1]]
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_when_retry_or_fail_many_then_results_follow_key_order(self, segment_store):
+        # Arrange
+        retried = await segment_store.persist_payload(_payload(1))
+        fresh = await segment_store.persist_payload(_payload(2))
+        segment_store.retry_or_fail(retried, max_retry=2)
+
+        # Act
+        results = segment_store.retry_or_fail_many([retried, fresh, "999"], max_retry=2)
+
+        # Assert
+        assert results == [(None, True), (fresh, False), (None, False)]
+        assert segment_store.pick_batch(10) == [fresh]
+
+
+class TestSegmentOutboxStoreCompression:
+    """Test at-rest gzip compression of records"""
+
+    @pytest.mark.asyncio
+    async def test_when_gzip_enabled_then_records_are_smaller_and_read_back(self, tmp_path):
+        # Arrange
+        plain = _make_store(tmp_path / "plain")
+        packed = _make_store(tmp_path / "packed", compression="gzip")
+        payload = {
+            "FUNC": "PushIMAData",
+            "Timestamp": "20250101120000",
+            "Data": [{"DeviceID": f"dev_{i}", "Data": {"HZ": 50.0, "KW": 1.2}} for i in range(50)],
+        }
+
+        # Act
+        await plain.persist_payload(payload)
+        key = await packed.persist_payload(payload)
+
+        # Assert
+        plain_size = sum(os.path.getsize(os.path.join(plain.segment_dir, fn)) for fn in os.listdir(plain.segment_dir))
+        packed_size = sum(
+            os.path.getsize(os.path.join(packed.segment_dir, fn)) for fn in os.listdir(packed.segment_dir)
+        )
+        assert packed_size * 5 < plain_size
+        assert json.loads(await packed.read_entry(key)) == payload
+        plain.close()
+        packed.close()
+
+    @pytest.mark.asyncio
+    async def test_when_compression_toggled_then_mixed_records_are_readable(self, tmp_path):
+        # Arrange
+        store = _make_store(tmp_path / "outbox")
+        plain_key = await store.persist_payload(_payload(1))
+        store.close()
+        store = _make_store(tmp_path / "outbox", compression="gzip")
+        packed_key = await store.persist_payload(_payload(2))
+
+        # Act / Assert
+        assert json.loads(await store.read_entry(plain_key)) == _payload(1)
+        assert json.loads(await store.read_entry(packed_key)) == _payload(2)
+        store.close()
+
+
+class TestSegmentOutboxStoreBudget:
+    """Test budget enforcement"""
+
+    @pytest.mark.asyncio
+    async def test_when_over_quota_then_oldest_sealed_segments_dropped(self, tmp_path):
+        # Arrange
+        store = _make_store(
+            tmp_path / "outbox",
+            segment_max_bytes=200,
+            resend_quota_mb=1,
+            fs_free_min_mb=10**9,  # force "low disk" so cleanup triggers
+            protect_recent_sec=0,
+            cleanup_batch=2,
+            cleanup_enabled=True,
+        )
+        keys = [await store.persist_payload(_payload(n)) for n in range(5)]
+
+        # Act
+        store.enforce_budget()
+
+        # Assert: oldest entries dropped, the newest (active segment) kept
+        remaining = store.pick_batch(10)
+        assert keys[0] not in remaining
+        assert keys[-1] in remaining
+        assert 3 <= len(remaining) < 5
+        store.close()
+
+    @pytest.mark.asyncio
+    async def test_when_over_quota_then_failed_entries_dropped_before_pending(self, tmp_path):
+        # Arrange
+        store = _make_store(
+            tmp_path / "outbox",
+            segment_max_bytes=200,
+            resend_quota_mb=1,
+            fs_free_min_mb=10**9,
+            protect_recent_sec=0,
+            cleanup_batch=2,
+            cleanup_enabled=True,
+        )
+        keys = [await store.persist_payload(_payload(n)) for n in range(5)]
+        store.retry_or_fail_many(keys[2:4], max_retry=1)
+
+        # Act
+        store.enforce_budget()
+
+        # Assert: the failed entries went first, every pending one survives
+        assert store.pick_batch(10) == [keys[0], keys[1], keys[4]]
+        assert store._conn.execute("SELECT COUNT(*) FROM entries WHERE state = 'failed'").fetchone()[0] == 0
+        store.close()
+
+
+class TestSegmentOutboxStoreMigration:
+    """Test one-shot import of legacy resend_*.json files"""
+
+    def test_when_legacy_files_present_then_imported_with_retry_and_fail_state(self, tmp_path):
+        # Arrange
+        outbox_dir = tmp_path / "outbox"
+        outbox_dir.mkdir()
+        fresh = outbox_dir / "resend_20250101120000_000_aaa.json"
+        retried = outbox_dir / "resend_20250101120001_000_bbb.retry2.json"
+        failed = outbox_dir / "resend_20250101120002_000_ccc.fail"
+        fresh.write_text('{"FUNC": "PushIMAData", "n": 1}')
+        retried.write_text('{"FUNC": "PushIMAData", "n": 2}')
+        failed.write_text('{"FUNC": "PushIMAData", "n": 3}')
+        store = _make_store(outbox_dir)
+
+        # Act
+        imported = store.import_legacy_files()
+        entries = store.pick_entries(10)
+
+        # Assert
+        assert imported == 3
+        assert not fresh.exists() and not retried.exists() and not failed.exists()
+        assert len(entries) == 2  # .fail is kept but not picked
+        assert entries[0].label_ts == datetime(2025, 1, 1, 12, 0, 1, tzinfo=TIMEZONE_INFO)  # retried first
+        assert store.retry_or_fail(entries[0].key, max_retry=3) == (None, True)  # retry count carried over
+        assert store.import_legacy_files() == 0
+        store.close()
@@ -0,0 +1,116 @@
+import gzip
+import json
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.sender.transport import ResendTransport
+
+
+def _response(status: int) -> SimpleNamespace:
+    return SimpleNamespace(status_code=status, text="")
+
+
+def _payload(n_devices: int = 50) -> dict:
+    return {
+        "FUNC": "PushIMAData",
+        "Timestamp": "20250101120000",
+        "Data": [{"DeviceID": f"dev_{i}", "Data": {"HZ": 50.0, "KW": 1.2}} for i in range(n_devices)],
+    }
+
+
+def _transport(client, **kwargs) -> ResendTransport:
+    return ResendTransport("http://test.com", client, lambda resp: resp.status_code == 200, **kwargs)
+
+
+class TestResendTransportCompression:
+    """Test Content-Encoding negotiation for uploads"""
+
+    @pytest.mark.asyncio
+    async def test_when_compression_off_then_posts_plain_json(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(return_value=_response(200))
+        payload = _payload()
+
+        # Act
+        ok, status, _ = await _transport(client).send(payload)
+
+        # Assert
+        assert ok and status == 200
+        client.post.assert_awaited_once_with("http://test.com", json=payload)
+
+    @pytest.mark.asyncio
+    async def test_when_gzip_then_body_is_compressed_with_header(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(return_value=_response(200))
+        payload = _payload()
+
+        # Act
+        ok, _, _ = await _transport(client, compression="gzip").send(payload)
+
+        # Assert
+        kwargs = client.post.await_args.kwargs
+        assert ok
+        assert kwargs["headers"]["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(kwargs["content"])) == payload
+
+    @pytest.mark.asyncio
+    async def test_when_body_below_threshold_then_not_compressed(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(return_value=_response(200))
+
+        # Act
+        await _transport(client, compression="gzip", gzip_min_bytes=10_000).send(_payload(1))
+
+        # Assert
+        assert "Content-Encoding" not in client.post.await_args.kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_when_auto_and_gzip_rejected_then_falls_back_and_disables_gzip(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(side_effect=[_response(415), _response(200), _response(200)])
+        transport = _transport(client, compression="auto")
+
+        # Act
+        first = await transport.send(_payload())
+        second = await transport.send(_payload())
+
+        # Assert
+        assert first[0] and second[0]
+        assert transport.gzip_enabled is False
+        assert client.post.await_count == 3
+        assert "Content-Encoding" not in client.post.await_args_list[1].kwargs["headers"]
+
+    @pytest.mark.asyncio
+    async def test_when_auto_and_plain_also_fails_then_gzip_stays_enabled(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(side_effect=[_response(400), _response(400)])
+        transport = _transport(client, compression="auto")
+
+        # Act
+        ok, status, _ = await transport.send(_payload())
+
+        # Assert
+        assert not ok and status == 400
+        assert transport.gzip_enabled is True
+
+    @pytest.mark.asyncio
+    async def test_when_forced_gzip_rejected_then_no_fallback(self):
+        # Arrange
+        client = Mock()
+        client.post = AsyncMock(return_value=_response(415))
+        transport = _transport(client, compression="gzip")
+
+        # Act
+        ok, _, _ = await transport.send(_payload())
+
+        # Assert
+        assert not ok
+        client.post.assert_awaited_once()
+        assert transport.gzip_enabled is True
@@ -0,0 +1,143 @@
+import random
+
+import pytest
+
+from core.model.enum.decode_format import DecodeFormat
+from core.util.data_decoder import decode_modbus_registers
+from simulator.register_image import RegisterImage, encode_value
+from simulator.simulator_schema import SimulatorConfig
+
+_DRIVER = {
+    "model": "TST_METER",
+    "register_type": "holding",
+    "register_map": {
+        "VOLTAGE": {"offset": 10, "format": "u16", "scale": 0.1, "unit": "V", "readable": True},
+        "KWH": {"offset": 12, "format": "u16", "scale": 0.1, "unit": "kWh", "readable": True},
+        "POWER": {"offset": 20, "format": "f32_be", "unit": "kW", "readable": True},
+        "DI1": {"offset": 30, "bit": 0, "readable": True},
+        "DI2": {"offset": 30, "bit": 1, "readable": True},
+        "TEMP": {"offset": 2, "register_type": "input", "format": "i16", "formula": [0, 0.01, 0], "unit": "°C"},
+    },
+}
+
+
+class TestEncodeValue:
+    """Simulator encoding is the inverse of the device-side decoder"""
+
+    @pytest.mark.parametrize(
+        "fmt, value",
+        [
+            (DecodeFormat.U16, 1234),
+            (DecodeFormat.I16, -321),
+            (DecodeFormat.U32_LE, 123456),
+            (DecodeFormat.U32_BE, 123456),
+            (DecodeFormat.F32_BE, 12.5),
+            (DecodeFormat.F32_LE, -3.25),
+            (DecodeFormat.F32_BE_SWAP, 20.75),
+        ],
+    )
+    def test_when_value_encoded_then_decoder_returns_it(self, fmt, value):
+        assert decode_modbus_registers(encode_value(value, fmt), fmt) == pytest.approx(value)
+
+
+class TestRegisterImage:
+    """Register images built from driver register maps"""
+
+    def test_when_built_then_scaled_values_are_in_unit_range(self):
+        # Arrange
+        image = RegisterImage(_DRIVER, rng=random.Random(1))
+
+        # Act
+        voltage = image.read("h", 10, 1)[0] * 0.1
+        power = decode_modbus_registers(image.read("h", 20, 2), "f32_be")
+        temp = decode_modbus_registers(image.read("i", 2, 1), "i16") * 0.01
+
+        # Assert
+        assert 215.0 <= voltage <= 230.0
+        assert 2.0 <= power <= 30.0
+        assert 22.0 <= temp <= 38.0
+
+    def test_when_range_exceeds_register_then_value_is_fitted_below_missing_marker(self):
+        # Arrange: kWh up to 50000 / 0.1 would overflow u16
+        image = RegisterImage(_DRIVER, rng=random.Random(2))
+
+        # Act
+        raw = image.read("h", 12, 1)[0]
+
+        # Assert
+        assert 0 < raw < 0xFFFF
+
+    def test_when_reading_inside_span_then_gaps_read_zero_and_outside_is_illegal_address(self):
+        # Arrange
+        image = RegisterImage(_DRIVER, rng=random.Random(3))
+
+        # Act
+        inside = image.read("h", 13, 5)
+        outside = image.read("h", 40, 1)
+        missing_table = image.read("c", 0, 1)
+
+        # Assert
+        assert inside[1:] == [0, 0, 0, 0]
+        assert outside == 2
+        assert missing_table == 2
+
+    def test_when_bit_pins_share_a_register_then_only_bits_are_set(self):
+        # Arrange
+        image = RegisterImage(_DRIVER, rng=random.Random(4))
+
+        # Act
+        word = image.read("h", 30, 1)[0]
+
+        # Assert
+        assert word & ~0b11 == 0
+
+    def test_when_register_written_then_value_is_kept_across_refresh(self):
+        # Arrange
+        image = RegisterImage(_DRIVER, rng=random.Random(5))
+        image.refresh(0.0)
+
+        # Act
+        image.write("h", 10, [2345])
+        image.refresh(10.0)
+
+        # Assert
+        assert image.read("h", 10, 1) == [2345]
+
+    def test_when_refreshed_then_counters_never_decrease(self):
+        # Arrange
+        image = RegisterImage(_DRIVER, rng=random.Random(6))
+        image.refresh(0.0)
+        before = image.read("h", 12, 1)[0]
+
+        # Act
+        for t in range(1, 50):
+            image.refresh(float(t * 100))
+
+        # Assert
+        assert image.read("h", 12, 1)[0] >= before
+
+
+class TestSimulatorConfig:
+    """Fault profiles resolved per device key"""
+
+    def test_when_overrides_match_then_later_rules_win(self):
+        # Arrange
+        config = SimulatorConfig.model_validate(
+            {
+                "defaults": {"latency_ms": 5},
+                "overrides": [
+                    {"match": "SD400_*", "latency_ms": 50, "timeout_rate": 0.1},
+                    {"match": "SD400_3", "offline": True, "latency_ms": 1},
+                ],
+            }
+        )
+
+        # Act
+        other = config.profile_for("TECO_VFD_1")
+        flaky = config.profile_for("SD400_2")
+        offline = config.profile_for("SD400_3")
+
+        # Assert
+        assert (other.latency_ms, other.timeout_rate) == (5, 0.0)
+        assert (flaky.latency_ms, flaky.timeout_rate) == (50, 0.1)
+        assert (offline.latency_ms, offline.timeout_rate, offline.offline) == (1, 0.1, True)
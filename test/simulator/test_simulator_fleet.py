@@ -0,0 +1,171 @@
+import time
+
+import pytest
+import yaml
+from pymodbus.client import AsyncModbusSerialClient, AsyncModbusTcpClient
+from pymodbus.exceptions import ModbusIOException
+
+from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.schema.constraint_schema import ConstraintConfigSchema
+from device_manager import AsyncDeviceManager
+from simulator.fleet import SimulatorFleet
+from simulator.simulator_schema import SimulatorConfig
+
+_DRIVER = """
+model: SIM_METER
+register_type: holding
+type: power_meter
+register_map:
+  VOLTAGE: {offset: 0, format: u16, scale: 0.1, unit: "V", readable: true}
+  CURRENT: {offset: 1, format: u16, scale: 0.01, unit: "A", readable: true}
+  KWH: {offset: 4, format: u32_le, scale: 0.1, unit: "kWh", readable: true}
+  SETPOINT: {offset: 8, format: u16, readable: true, writable: true}
+"""
+
+
+@pytest.fixture
+def sim_env(tmp_path):
+    (tmp_path / "driver").mkdir()
+    (tmp_path / "driver" / "sim_meter.yml").write_text(_DRIVER)
+
+    def write_devices(devices: list[dict]) -> str:
+        path = tmp_path / "modbus_device.yml"
+        path.write_text(yaml.safe_dump({"devices": devices}))
+        return str(path)
+
+    return tmp_path, write_devices
+
+
+def _device(slave_id: int, **bus) -> dict:
+    return {
+        "model": "SIM_METER",
+        "type": "power_meter",
+        "model_file": "driver/sim_meter.yml",
+        "slave_id": slave_id,
+        **bus,
+    }
+
+
+class TestSimulatorFleet:
+    """Simulated buses served to real Modbus clients"""
+
+    def test_when_copies_requested_then_keys_and_bus_addresses_stay_unique(self, sim_env):
+        # Arrange
+        tmp_path, write_devices = sim_env
+        source = write_devices(
+            [_device(1, port="/dev/ttyA"), _device(2, port="/dev/ttyA"), _device(3, port="/dev/ttyB")]
+        )
+
+        # Act
+        fleet = SimulatorFleet(source, SimulatorConfig(copies=5), model_base_path=str(tmp_path))
+
+        # Assert
+        keys = [device.key for device in fleet.devices]
+        assert len(fleet.buses) == 10
+        assert len(keys) == 15 and len(set(keys)) == 15
+        for bus in fleet.buses:
+            slave_ids = [device.config.slave_id for device in bus.devices]
+            assert len(slave_ids) == len(set(slave_ids))
+
+    @pytest.mark.asyncio
+    async def test_when_device_manager_runs_on_emitted_config_then_all_pins_read(self, sim_env):
+        # Arrange
+        tmp_path, write_devices = sim_env
+        source = write_devices(
+            [
+                _device(1, port="/dev/ttyA", baudrate=38400),
+                _device(2, port="/dev/ttyA", baudrate=38400),
+                _device(3, transport="tcp", host="10.0.0.9"),
+                _device(4, transport="rtu_over_tcp", host="10.0.0.10", tcp_port=4001),
+            ]
+        )
+        config = SimulatorConfig(link_dir=str(tmp_path / "links"), seed=7, defaults={"latency_ms": 1})
+        fleet = SimulatorFleet(source, config, model_base_path=str(tmp_path))
+        await fleet.start()
+
+        try:
+            manager = AsyncDeviceManager(
+                fleet.write_talos_config(str(tmp_path / "talos.yml")),
+                ConstraintConfigSchema(),
+                model_base_path=str(tmp_path),
+            )
+            await manager.init()
+
+            # Act
+            snapshots = {f"{d.model}_{d.slave_id}": await d.read_all() for d in manager.device_list}
+            for client in manager.client_dict.values():
+                client.close()
+        finally:
+            await fleet.stop()
+
+        # Assert
+        assert sorted(snapshots) == ["SIM_METER_1", "SIM_METER_2", "SIM_METER_3", "SIM_METER_4"]
+        for values in snapshots.values():
+            assert DEFAULT_MISSING_VALUE not in values.values()
+            assert 215.0 <= values["VOLTAGE"] <= 230.0
+        assert fleet.stats()["requests"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_when_faults_configured_then_slaves_time_out_and_answer_exceptions(self, sim_env):
+        # Arrange
+        tmp_path, write_devices = sim_env
+        source = write_devices(
+            [_device(1, port="/dev/ttyA"), _device(2, port="/dev/ttyA"), _device(3, port="/dev/ttyA")]
+        )
+        config = SimulatorConfig(
+            link_dir=str(tmp_path / "links"),
+            wire_time=False,
+            defaults={"latency_ms": 30},
+            overrides=[
+                {"match": "SIM_METER_2", "offline": True},
+                {"match": "SIM_METER_3", "exception_rate": 1.0, "exception_code": 6},
+            ],
+        )
+        fleet = SimulatorFleet(source, config, model_base_path=str(tmp_path))
+        await fleet.start()
+        client = AsyncModbusSerialClient(port=fleet.buses[0].port, baudrate=9600, timeout=0.3, retries=0)
+        await client.connect()
+
+        try:
+            # Act
+            start = time.monotonic()
+            healthy = await client.read_holding_registers(0, count=2, slave=1)
+            latency = time.monotonic() - start
+
+            with pytest.raises(ModbusIOException):
+                await client.read_holding_registers(0, count=1, slave=2)
+
+            busy = await client.read_holding_registers(0, count=1, slave=3)
+        finally:
+            client.close()
+            await fleet.stop()
+
+        # Assert
+        assert not healthy.isError() and latency >= 0.03
+        assert busy.isError() and busy.exception_code == 6
+        per_device = fleet.stats()["per_device"]
+        assert per_device["SIM_METER_2"]["timeouts"] == 1
+        assert per_device["SIM_METER_3"]["exceptions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_when_register_written_over_tcp_then_it_reads_back(self, sim_env):
+        # Arrange
+        tmp_path, write_devices = sim_env
+        source = write_devices([_device(5, transport="tcp", host="10.0.0.9")])
+        fleet = SimulatorFleet(source, SimulatorConfig(defaults={"latency_ms": 0}), model_base_path=str(tmp_path))
+        await fleet.start()
+        bus = fleet.buses[0]
+        client = AsyncModbusTcpClient(bus.host, port=bus.tcp_port, timeout=1.0, retries=0)
+        await client.connect()
+
+        try:
+            # Act
+            written = await client.write_register(8, 321, slave=5)
+            read_back = await client.read_holding_registers(8, count=1, slave=5)
+        finally:
+            client.close()
+            await fleet.stop()
+
+        # Assert
+        assert not written.isError()
+        assert read_back.registers == [321]
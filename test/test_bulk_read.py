@@ -51,7 +51,7 @@ def test_build_bulk_ranges_no_eligible_pins():
     register_map = {
         "A": {"offset": 0, "format": "u16", "readable": False},  # not readable
         "B": {"offset": 1, "format": "u16", "writable": True},  # no readable flag
-        "C": {"offset": 2, "format": "u16", "readable": True, "register_type": "coil"},  # coil not eligible
+        "C": {"offset": 2, "format": "u16", "readable": True, "composed_of": ["HI", "LO"]},  # composed not eligible
     }
     reader = _make_bulk_reader(register_map)
     ranges = reader.build_bulk_ranges()
@@ -193,24 +193,53 @@ def test_build_bulk_ranges_exclude_composed_of():
     assert [name for name, cfg in ranges[1].items] == ["C"]
 
 
-def test_build_bulk_ranges_exclude_scale_from():
-    """Test that pins with scale_from are excluded from bulk read."""
+def test_build_bulk_ranges_include_scale_from_and_its_index():
+    """Test that scale_from pins are bulk-read together with their (non-readable) index register."""
     register_map = {
         "A": {"offset": 0, "format": "u16", "readable": True},
         "B": {"offset": 1, "format": "u16", "readable": True, "scale_from": "voltage_index"},
         "C": {"offset": 2, "format": "u16", "readable": True},
+        "SCALE_VoltageIndex": {"offset": 3, "format": "u16", "readable": False},
     }
     reader = _make_bulk_reader(register_map)
     ranges = reader.build_bulk_ranges()
 
-    # B should be excluded
-    assert len(ranges) == 2
-    assert [name for name, cfg in ranges[0].items] == ["A"]
-    assert [name for name, cfg in ranges[1].items] == ["C"]
+    assert len(ranges) == 1
+    assert (ranges[0].start, ranges[0].count) == (0, 4)
+    assert [name for name, cfg in ranges[0].items] == ["A", "B", "C", "SCALE_VoltageIndex"]
+
+
+def test_build_bulk_ranges_include_composed_sub_registers():
+    """Test that composed_of sub-registers are planned even when not readable themselves."""
+    register_map = {
+        "KWH": {"readable": True, "composed_of": ["HI", "LO"]},
+        "HI": {"offset": 10, "format": "u16"},
+        "LO": {"offset": 11, "format": "u16"},
+    }
+    reader = _make_bulk_reader(register_map)
+    ranges = reader.build_bulk_ranges()
+
+    assert [(r.start, r.count, [name for name, _ in r.items]) for r in ranges] == [(10, 2, ["HI", "LO"])]
+
+
+def test_compose_from_words_applies_dynamic_scale():
+    """Test assembling a composed pin and applying its dynamic scale from the bulk buffer."""
+    register_map = {
+        "KWH": {"readable": True, "composed_of": ["HI", "MD", "LO"], "scale_from": "kwh_scale", "precision": 2},
+        "HI": {"offset": 0, "format": "u16"},
+        "MD": {"offset": 1, "format": "u16"},
+        "LO": {"offset": 2, "format": "u16"},
+    }
+    reader = _make_bulk_reader(register_map)
+    words = {("holding", 0): 0, ("holding", 1): 1, ("holding", 2): 4}
+
+    assert reader.compose_from_words(words, {"kwh_scale": 0.01}) == {"KWH": 655.4}
+    assert reader.compose_from_words(words) == {}  # factor unknown: left to the per-pin fallback
+    assert reader.compose_from_words({("holding", 0): 0}, {"kwh_scale": 0.01}) == {}  # words missing
 
 
-def test_build_bulk_ranges_exclude_coil_and_discrete_input():
-    """Test that coil and discrete_input pins are excluded."""
+def test_build_bulk_ranges_coil_and_discrete_input_get_own_ranges():
+    """Test that coil and discrete_input pins are bulk-read in their own bit ranges."""
     register_map = {
         "A": {"offset": 0, "format": "u16", "readable": True, "register_type": "holding"},
         "B": {"offset": 1, "format": "u16", "readable": True, "register_type": "coil"},
@@ -220,10 +249,36 @@ def test_build_bulk_ranges_exclude_coil_and_discrete_input():
     reader = _make_bulk_reader(register_map)
     ranges = reader.build_bulk_ranges()
 
-    # Only A and D should be included, but they're not contiguous
-    assert len(ranges) == 2
-    assert [name for name, cfg in ranges[0].items] == ["A"]
-    assert [name for name, cfg in ranges[1].items] == ["D"]
+    # Bit tables never merge with word tables; A and D are not contiguous
+    assert [(r.register_type, [name for name, _ in r.items]) for r in ranges] == [
+        ("coil", ["B"]),
+        ("discrete_input", ["C"]),
+        ("holding", ["A"]),
+        ("holding", ["D"]),
+    ]
+
+
+def test_build_bulk_ranges_merges_contiguous_bits():
+    """Test that a 16-DI / 8-DO IO module is planned as one FC02 and one FC01 request."""
+    register_map = {
+        f"DIn{i:02d}": {"offset": i - 1, "readable": True, "register_type": "discrete_input"} for i in range(1, 17)
+    }
+    register_map.update(
+        {f"DOut{i:02d}": {"offset": i - 1, "readable": True, "register_type": "coil"} for i in range(1, 9)}
+    )
+    reader = _make_bulk_reader(register_map, default_register_type="discrete_input")
+    ranges = reader.build_bulk_ranges()
+
+    assert [(r.register_type, r.start, r.count) for r in ranges] == [("coil", 0, 8), ("discrete_input", 0, 16)]
+
+
+def test_build_bulk_ranges_splits_bits_by_max_bits():
+    """Test that bit ranges are capped by max_bits_per_req, not max_regs_per_req."""
+    register_map = {f"C{i}": {"offset": i, "readable": True, "register_type": "coil"} for i in range(10)}
+    reader = _make_bulk_reader(register_map)
+    ranges = reader.build_bulk_ranges(max_regs_per_req=2, max_bits_per_req=4)
+
+    assert [(r.start, r.count) for r in ranges] == [(0, 4), (4, 4), (8, 2)]
 
 
 # ==================== Tests for process_bulk_range_result ====================
@@ -316,6 +371,35 @@ def test_process_bulk_range_result_with_precision():
     assert result["A"] == 12.3
 
 
+def test_process_bulk_range_result_dynamic_scale_and_dependencies():
+    """Test that dynamic scale applies before precision and dependency-only registers are not reported."""
+    register_map = {
+        "V": {"offset": 0, "format": "u16", "readable": True, "scale_from": "voltage_index", "precision": 1},
+        "SCALE_VoltageIndex": {"offset": 1, "format": "u16", "readable": False},
+    }
+    reader = _make_bulk_reader(register_map)
+    bulk_range = BulkRange(register_type="holding", start=0, count=2, items=list(register_map.items()))
+
+    result = reader.process_bulk_range_result(bulk_range, [2205, 2], lambda cfg, words: False, {"voltage_index": 0.1})
+
+    assert result == {"V": 220.5}
+
+
+def test_process_bulk_range_result_bits():
+    """Test mapping FC01/FC02 bits back to pins, keeping missing bits as -1."""
+    register_map = {
+        "X": {"offset": 4, "readable": True, "register_type": "coil", "scale": 10},
+        "Y": {"offset": 5, "readable": True, "register_type": "coil"},
+        "Z": {"offset": 6, "readable": True, "register_type": "coil"},
+    }
+    reader = _make_bulk_reader(register_map)
+    bulk_range = BulkRange(register_type="coil", start=4, count=3, items=list(register_map.items()))
+
+    result = reader.process_bulk_range_result(bulk_range, [1, 0, DEFAULT_MISSING_VALUE], lambda cfg, words: False)
+
+    assert result == {"X": 1, "Y": 0, "Z": DEFAULT_MISSING_VALUE}
+
+
 # ==================== Integration tests with AsyncGenericModbusDevice ====================
 
 
@@ -360,5 +444,20 @@ async def test_device_read_all_uses_bulk_reader():
     assert result["B"] == 200
 
 
+@pytest.mark.asyncio
+async def test_device_read_all_reads_discrete_inputs_in_one_request():
+    """Test that read_all polls contiguous discrete inputs with a single FC02 request."""
+    register_map = {f"DIn{i}": {"offset": i, "readable": True, "register_type": "discrete_input"} for i in range(4)}
+    device = _make_device_for_test(register_map)
+    device.bus.ensure_connected = AsyncMock(return_value=True)
+    di_bus = await device._get_or_create_bus("discrete_input")
+    di_bus.read_discrete_inputs = AsyncMock(return_value=[1, 0, 0, 1])
+
+    result = await device.read_all()
+
+    di_bus.read_discrete_inputs.assert_awaited_once_with(0, 4)
+    assert result == {"DIn0": 1, "DIn1": 0, "DIn2": 0, "DIn3": 1}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
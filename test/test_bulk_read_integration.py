@@ -76,7 +76,7 @@ async def test_read_all_bulk_should_reduce_read_regs_calls(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_read_all_bulk_should_skip_non_holding_and_still_bulk_read_dependencies(monkeypatch):
+async def test_read_all_bulk_should_read_bits_separately_and_still_bulk_read_dependencies(monkeypatch):
     """
     Integration-ish expectation for current bulk design:
 
@@ -85,14 +85,14 @@ async def test_read_all_bulk_should_skip_non_holding_and_still_bulk_read_depende
       e.g. composed_of depends on HI/MD/LO => bulk reads HI/MD/LO
            scale_from depends on KWH_SCALE_INDEX => bulk reads KWH_SCALE_INDEX
 
-    - Non-holding pins (coil/discrete_input) must NOT be included in holding bulk;
-      they should go through fallback read_value().
+    - Bit pins (coil/discrete_input) must NOT be included in holding bulk;
+      they are bulk-read in their own FC01/FC02 ranges instead.
     """
     register_map = {
         # eligible (holding)
         "H0": {"offset": 0, "format": "u16", "readable": True},
         "H1": {"offset": 1, "format": "u16", "readable": True},
-        # non-holding (excluded from holding bulk)
+        # bit pins (own coil / discrete_input bulk ranges)
         "C0": {"offset": 0, "register_type": "coil", "readable": True},
         "D0": {"offset": 0, "register_type": "discrete_input", "readable": True},
         # computed (not directly bulk), but its dependencies are holding-readable
@@ -125,6 +125,8 @@ async def test_read_all_bulk_should_skip_non_holding_and_still_bulk_read_depende
             return [200, 201]
         if (start, count) == (10, 3):  # HI,MD,LO
             return [1, 2, 3]
+        if (start, count) == (20, 1):  # S0 (dynamic scale resolved from the bulk buffer)
+            return [1234]
         if (start, count) == (30, 1):  # KWH_SCALE_INDEX
             return [7]
         raise AssertionError(f"Unexpected bulk range: start={start}, count={count}")
@@ -132,24 +134,20 @@ async def test_read_all_bulk_should_skip_non_holding_and_still_bulk_read_depende
     read_regs_mock = AsyncMock(side_effect=_read_regs_side_effect)
     monkeypatch.setattr(ModbusBus, "read_regs", read_regs_mock)
 
-    # fallback for non-holding pins only
-    read_value_mock = AsyncMock()
+    read_coils_mock = AsyncMock(return_value=[1])
+    read_discrete_inputs_mock = AsyncMock(return_value=[0])
+    monkeypatch.setattr(ModbusBus, "read_coils", read_coils_mock)
+    monkeypatch.setattr(ModbusBus, "read_discrete_inputs", read_discrete_inputs_mock)
 
-    async def _read_value_side_effect(name: str):
-        mapping = {
-            "C0": 1,
-            "D0": 0,
-        }
-        return mapping.get(name, DEFAULT_MISSING_VALUE)
-
-    read_value_mock.side_effect = _read_value_side_effect
+    # fallback for computed pins only
+    read_value_mock = AsyncMock(return_value=DEFAULT_MISSING_VALUE)
     device.read_value = read_value_mock
 
     values = await device.read_all()
 
     # ---- Assert: bulk ranges include holding readable regs and dependencies
     called_ranges = {(c.args[0], c.args[1]) for c in read_regs_mock.await_args_list}
-    assert called_ranges == {(0, 2), (10, 3), (30, 1)}
+    assert called_ranges == {(0, 2), (10, 3), (20, 1), (30, 1)}
 
     assert values["H0"] == 200
     assert values["H1"] == 201
@@ -158,21 +156,21 @@ async def test_read_all_bulk_should_skip_non_holding_and_still_bulk_read_depende
     assert values["LO"] == 3
     assert values["KWH_SCALE_INDEX"] == 7
 
-    # ---- Assert: non-holding pins go through fallback
+    # ---- Assert: bit pins are bulk-read, not through fallback
+    read_coils_mock.assert_awaited_once_with(0, 1)
+    read_discrete_inputs_mock.assert_awaited_once_with(0, 1)
     called_names = {c.args[0] for c in read_value_mock.await_args_list}
-    assert "C0" in called_names
-    assert "D0" in called_names
+    assert "C0" not in called_names
+    assert "D0" not in called_names
 
     assert values["C0"] == 1
     assert values["D0"] == 0
 
-    # ---- Computed pins presence depends on your implementation:
-    # If read_all computes X48/S0 internally, they should exist and not be DEFAULT_MISSING_VALUE.
-    # If not computed in read_all, they may be missing or DEFAULT_MISSING_VALUE.
-    #
-    # Therefore we only assert "no crash" + "type stable" here:
-    assert "X48" in values
-    assert "S0" in values
+    # ---- Composed / scaled pins are resolved from the bulk buffer, not through fallback
+    assert "X48" not in called_names
+    assert "S0" not in called_names
+    assert values["X48"] == (1 << 32) | (2 << 16) | 3
+    assert values["S0"] == pytest.approx(1234 * 0.001)  # no energy table: default factor x post multiplier
 
 
 @pytest.mark.asyncio
@@ -264,3 +262,50 @@ async def test_read_all_bulk_should_handle_u32_word_count(monkeypatch):
     assert values["U16"] == 0x0003
     # U32 depends on your ValueDecoder endianness; just assert it's not missing.
     assert values["U32"] != DEFAULT_MISSING_VALUE
+
+
+@pytest.mark.asyncio
+async def test_read_all_dynamic_scale_meter_polls_like_fixed_scale_meter(monkeypatch):
+    """
+    A meter whose pins use scale_from (and a composed energy total) should need exactly the
+    bulk requests of its address map: index and sub-registers come from the same buffer.
+    """
+    register_map = {
+        "Kwh_W1_HI": {"offset": 0, "format": "u16", "readable": True},
+        "Kwh_W2_MD": {"offset": 1, "format": "u16", "readable": True},
+        "Kwh_W3_LO": {"offset": 2, "format": "u16", "readable": True},
+        "AverageCurrent": {"offset": 3, "format": "u16", "readable": True, "scale_from": "current_index"},
+        "Kw": {"offset": 4, "format": "i16", "readable": True, "scale_from": "energy_index", "precision": 3},
+        "SCALE_CurrentIndex": {"offset": 5, "format": "u16", "readable": True},
+        "SCALE_EnergyIndex": {"offset": 6, "format": "u16", "readable": True},
+        "Kwh_SUM": {
+            "readable": True,
+            "composed_of": ["Kwh_W1_HI", "Kwh_W2_MD", "Kwh_W3_LO"],
+            "scale_from": "kwh_scale",
+        },
+    }
+    device = AsyncGenericModbusDevice(
+        model="TST",
+        client=DummyClient(),
+        slave_id=1,
+        register_type="holding",
+        register_map=dict(register_map),
+        device_type="power_meter",
+        port="/dev/ttyFAKE",
+        port_lock=asyncio.Lock(),
+        table_dict={"current_table": [0.001, 0.01], "energy_table": [1.0, 10.0], "energy_post_multiplier": 0.001},
+    )
+    monkeypatch.setattr(ModbusBus, "ensure_connected", AsyncMock(return_value=True))
+    read_regs_mock = AsyncMock(return_value=[0, 1, 2, 500, 250, 1, 1])
+    read_u16_mock = AsyncMock(side_effect=AssertionError("per-register read"))
+    monkeypatch.setattr(ModbusBus, "read_regs", read_regs_mock)
+    monkeypatch.setattr(ModbusBus, "read_u16", read_u16_mock)
+
+    first = await device.read_all()
+    second = await device.read_all()
+
+    assert read_regs_mock.await_count == 2  # one request per poll
+    assert first == second
+    assert first["AverageCurrent"] == pytest.approx(5.0)  # 500 * 0.01
+    assert first["Kw"] == pytest.approx(2.5)  # 250 * 10 * 0.001
+    assert first["Kwh_SUM"] == pytest.approx(((1 << 16) | 2) * 0.01)
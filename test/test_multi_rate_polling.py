@@ -0,0 +1,200 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.device.generic.generic_device import AsyncGenericModbusDevice
+from core.device.generic.modbus_bus import ModbusBus
+from core.util.device_health_manager import DeviceHealthManager
+from device_monitor import AsyncDeviceMonitor
+
+
+class DummyClient:
+    def __init__(self) -> None:
+        self.connected = True
+
+    async def connect(self) -> bool:
+        return True
+
+
+class DummyPubSub:
+    def __init__(self) -> None:
+        self.published: list[dict] = []
+
+    async def publish(self, topic, snapshot) -> None:
+        self.published.append(snapshot)
+
+
+def _make_device(register_map: dict, **kwargs) -> AsyncGenericModbusDevice:
+    return AsyncGenericModbusDevice(
+        model="TST",
+        client=DummyClient(),
+        slave_id=1,
+        register_type="holding",
+        register_map=dict(register_map),
+        device_type="power_meter",
+        port="/dev/ttyFAKE",
+        port_lock=asyncio.Lock(),
+        **kwargs,
+    )
+
+
+REGISTER_MAP = {
+    "HZ": {"offset": 0, "format": "u16", "readable": True, "poll_class": "fast"},
+    "ALARM": {"offset": 1, "format": "u16", "readable": True, "poll_class": "fast"},
+    "VOLT": {"offset": 10, "format": "u16", "readable": True},
+    "KWH": {"offset": 20, "format": "u16", "readable": True, "poll_class": "slow"},
+}
+
+
+def _fake_bus_reads(monkeypatch, words: dict[int, int]) -> AsyncMock:
+    async def _read(offset, count=1):
+        return [words.get(offset + i, 0) for i in range(count)]
+
+    monkeypatch.setattr(ModbusBus, "ensure_connected", AsyncMock(return_value=True))
+    read_mock = AsyncMock(side_effect=_read)
+    monkeypatch.setattr(ModbusBus, "read_regs", read_mock)
+    return read_mock
+
+
+def test_poll_classes_default_to_instance_then_driver_then_normal():
+    device = _make_device(REGISTER_MAP)
+    assert device.poll_classes == {"fast", "normal", "slow"}
+    assert device.pin_poll_classes["VOLT"] == "normal"
+
+    device = _make_device({"A": {"offset": 0, "readable": True}}, model_config={"poll_class": "slow"})
+    assert device.poll_classes == {"slow"}
+
+    device = _make_device(
+        {"A": {"offset": 0, "readable": True}}, model_config={"poll_class": "slow"}, poll_class="fast"
+    )
+    assert device.poll_classes == {"fast"}
+
+
+@pytest.mark.asyncio
+async def test_read_all_with_poll_classes_reads_only_due_ranges_and_merges_stale_values(monkeypatch):
+    device = _make_device(REGISTER_MAP)
+    words = {0: 50, 1: 0, 10: 230, 20: 1000}
+    read_mock = _fake_bus_reads(monkeypatch, words)
+
+    full = await device.read_all()
+    full_ts = dict(device.value_timestamps)
+    assert full == {"HZ": 50, "ALARM": 0, "VOLT": 230, "KWH": 1000}
+    assert read_mock.await_count == 3
+
+    read_mock.reset_mock()
+    words.update({0: 49, 1: 1, 10: 231, 20: 1001})
+    fast = await device.read_all({"fast"})
+
+    # Only the fast range went on the wire; the others keep their last value and timestamp
+    assert [call.args for call in read_mock.await_args_list] == [(0, 2)]
+    assert fast == {"HZ": 49, "ALARM": 1, "VOLT": 230, "KWH": 1000}
+    assert device.value_timestamps["VOLT"] == full_ts["VOLT"]
+    assert device.value_timestamps["HZ"] >= full_ts["HZ"]
+
+
+@pytest.mark.asyncio
+async def test_read_all_with_poll_classes_still_reads_dependencies_of_selected_pins(monkeypatch):
+    register_map = {
+        "KWH": {"readable": True, "composed_of": ["HI", "LO"], "poll_class": "slow"},
+        "HI": {"offset": 10, "format": "u16", "readable": False},
+        "LO": {"offset": 11, "format": "u16", "readable": False},
+        "HZ": {"offset": 0, "format": "u16", "readable": True, "poll_class": "fast"},
+    }
+    device = _make_device(register_map)
+    read_mock = _fake_bus_reads(monkeypatch, {0: 50, 10: 1, 11: 2})
+
+    values = await device.read_all({"slow"})
+
+    assert [call.args for call in read_mock.await_args_list] == [(10, 2)]
+    assert values["KWH"] == 65538
+
+
+@pytest.mark.asyncio
+async def test_monitor_schedules_each_poll_class_on_its_own_interval(monkeypatch):
+    device = _make_device(REGISTER_MAP)
+    _fake_bus_reads(monkeypatch, {0: 50, 10: 230, 20: 1000})
+    monitor = AsyncDeviceMonitor(
+        async_device_manager=SimpleNamespace(device_list=[device]),
+        pubsub=DummyPubSub(),
+        interval=10.0,
+        health_manager=DeviceHealthManager(),
+        poll_intervals={"fast": 1.0, "slow": 60.0},
+    )
+
+    assert monitor.tick_interval == 1.0
+    assert monitor.class_intervals == {"fast": 1.0, "normal": 10.0, "slow": 60.0}
+
+    due_per_tick = [monitor._due_poll_classes(float(t)) for t in range(0, 21)]
+
+    assert due_per_tick[0] == {"fast", "normal", "slow"}
+    assert all("fast" in due for due in due_per_tick)
+    assert [t for t, due in enumerate(due_per_tick) if "normal" in due] == [0, 10, 20]
+    assert [t for t, due in enumerate(due_per_tick) if "slow" in due] == [0]
+
+
+@pytest.mark.asyncio
+async def test_monitor_cycle_publishes_merged_snapshot_with_value_timestamps(monkeypatch):
+    device = _make_device(REGISTER_MAP)
+    other = AsyncGenericModbusDevice(
+        model="SLOWONLY",
+        client=DummyClient(),
+        slave_id=2,
+        register_type="holding",
+        register_map={"KWH": {"offset": 20, "format": "u16", "readable": True, "poll_class": "slow"}},
+        device_type="power_meter",
+        port="/dev/ttyFAKE",
+        port_lock=asyncio.Lock(),
+    )
+    words = {0: 50, 1: 0, 10: 230, 20: 1000}
+    _fake_bus_reads(monkeypatch, words)
+    monitor = AsyncDeviceMonitor(
+        async_device_manager=SimpleNamespace(device_list=[device, other]),
+        pubsub=DummyPubSub(),
+        interval=10.0,
+        health_manager=DeviceHealthManager(),
+        poll_intervals={"fast": 1.0, "slow": 60.0},
+    )
+    workers = [asyncio.create_task(monitor._reader_worker(i)) for i in range(2)]
+
+    try:
+        first = await monitor._run_one_cycle(frozenset({"fast", "normal", "slow"}))
+        words[0] = 49
+        second = await monitor._run_one_cycle(frozenset({"fast"}))
+    finally:
+        for worker in workers:
+            worker.cancel()
+
+    assert {s["device_id"] for s in first} == {"TST_1", "SLOWONLY_2"}
+    assert [s["device_id"] for s in second] == ["TST_1"]  # nothing due on the slow-only device
+
+    snapshot = second[0]
+    assert snapshot["values"] == {"HZ": 49, "ALARM": 0, "VOLT": 230, "KWH": 1000}
+    assert snapshot["value_timestamps"]["HZ"] >= snapshot["value_timestamps"]["KWH"]
+    assert set(snapshot["value_timestamps"]) == {"HZ", "ALARM", "VOLT", "KWH"}
+
+
+@pytest.mark.asyncio
+async def test_when_due_class_reads_fail_then_cached_values_do_not_keep_device_online(monkeypatch):
+    device = _make_device(REGISTER_MAP)
+    words = {0: 50, 1: 0, 10: 230, 20: 1000}
+    read_mock = _fake_bus_reads(monkeypatch, words)
+    health = DeviceHealthManager()
+    monitor = AsyncDeviceMonitor(
+        async_device_manager=SimpleNamespace(device_list=[device]),
+        pubsub=DummyPubSub(),
+        interval=10.0,
+        health_manager=health,
+        poll_intervals={"fast": 1.0, "slow": 60.0},
+    )
+    full = await monitor._read_one_device(device, "TST_1")
+
+    # The slave stops answering: the bus reports every register of the fast range as missing
+    read_mock.side_effect = lambda offset, count=1: [-1] * count
+    fast = await monitor._read_one_device(device, "TST_1", frozenset({"fast"}))
+
+    assert full["is_online"] is True
+    assert fast["is_online"] is False
+    assert fast["values"]["KWH"] == 1000  # cached slow value is still published
+    assert device.last_read_values == {"HZ": -1, "ALARM": -1}
@@ -1,7 +1,11 @@
+from datetime import time, timedelta
+
 import pytest
 from time_control.conftest import _build_datetime
 
+from core.evaluator.time_evalutor import TimeControlEvaluator
 from core.schema.control_condition_schema import ControlActionType
+from core.schema.time_control_schema import DeviceSchedule, TimeControlConfig, TimeInterval
 
 
 @pytest.mark.parametrize(
@@ -86,3 +90,89 @@ def test_when_status_changes_from_disallowed_to_allowed_then_return_turn_on(eval
 
     # Assert
     assert result == ControlActionType.TURN_ON
+
+
+def test_when_inside_interval_then_next_transition_is_just_after_interval_end(evaluator):
+    # Arrange
+    stub_datetime = _build_datetime(10, 0, 1)
+
+    # Act
+    next_transition = evaluator.next_transition("DEVICE_1", stub_datetime)
+
+    # Assert
+    assert next_transition is not None
+    assert next_transition > _build_datetime(18, 0, 1)
+    assert next_transition < _build_datetime(18, 1, 1)
+    assert evaluator.allow("DEVICE_1", next_transition) is False
+
+
+def test_when_before_interval_then_next_transition_is_interval_start(evaluator):
+    # Arrange
+    stub_datetime = _build_datetime(7, 0, 1)
+
+    # Act
+    next_transition = evaluator.next_transition("DEVICE_1", stub_datetime)
+
+    # Assert
+    assert next_transition == _build_datetime(8, 0, 1)
+
+
+def test_when_on_weekend_then_next_transition_skips_to_monday_start(evaluator):
+    # Arrange
+    stub_datetime = _build_datetime(12, 0, 6)  # Saturday
+    next_monday_start = _build_datetime(8, 0, 1) + timedelta(days=7)
+
+    # Act
+    next_transition = evaluator.next_transition("DEVICE_1", stub_datetime)
+
+    # Assert
+    assert next_transition == next_monday_start
+
+
+def test_when_device_has_no_schedule_then_no_transition_and_always_allowed():
+    # Arrange
+    evaluator = TimeControlEvaluator(TimeControlConfig(timezone="Asia/Taipei", work_hours={}))
+    stub_datetime = _build_datetime(3, 0, 7)
+
+    # Act
+    next_transition = evaluator.next_transition("ANY_DEVICE", stub_datetime)
+
+    # Assert
+    assert next_transition is None
+    assert evaluator.allow("ANY_DEVICE", stub_datetime) is True
+
+
+def test_when_overnight_interval_then_transitions_follow_midnight_crossing():
+    # Arrange
+    evaluator = TimeControlEvaluator(
+        TimeControlConfig(
+            timezone="Asia/Taipei",
+            work_hours={
+                "default": DeviceSchedule(
+                    intervals=[TimeInterval(start=time.fromisoformat("22:00"), end=time.fromisoformat("06:00"))]
+                )
+            },
+        )
+    )
+    stub_datetime = _build_datetime(23, 0, 1)
+
+    # Act
+    next_transition = evaluator.next_transition("DEVICE_X", stub_datetime)
+
+    # Assert
+    assert evaluator.allow("DEVICE_X", stub_datetime) is True
+    assert _build_datetime(6, 0, 2) < next_transition < _build_datetime(6, 1, 2)
+
+
+def test_when_time_passes_transition_then_cached_state_is_recomputed(evaluator):
+    # Arrange
+    inside = _build_datetime(17, 59, 1)
+    outside = _build_datetime(18, 1, 1)
+
+    # Act
+    first = evaluator.allow("DEVICE_1", inside)
+    second = evaluator.allow("DEVICE_1", outside)
+
+    # Assert
+    assert first is True
+    assert second is False
@@ -0,0 +1,109 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from core.evaluator.time_evalutor import TimeControlEvaluator
+from core.handler.time_control_handler import TimeControlHandler
+from core.model.device_constant import INVERTER
+from core.schema.control_condition_schema import ControlActionType
+from core.schema.time_control_schema import DeviceSchedule, TimeControlConfig, TimeInterval
+from core.util.time_util import TIMEZONE_INFO
+
+# Mid-day anchor: schedules built around it never wrap past midnight
+FROZEN_NOW = datetime(2025, 1, 1, 12, 0, 0, tzinfo=TIMEZONE_INFO)
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch) -> datetime:
+    """Wall clock pinned to FROZEN_NOW at test start; it still advances with real elapsed time."""
+    started = time.monotonic()
+    clock = SimpleNamespace(time=lambda: FROZEN_NOW.timestamp() + (time.monotonic() - started))
+    monkeypatch.setattr("core.handler.time_control_handler.time", clock)
+    monkeypatch.setattr("core.evaluator.time_evalutor._time", clock)
+    return FROZEN_NOW
+
+
+def _build_handler(now: datetime, end_in_sec: float) -> tuple[TimeControlHandler, Mock]:
+    """Build a handler whose default schedule started an hour before `now` and ends `end_in_sec` after it."""
+    cfg = TimeControlConfig(
+        timezone="Asia/Taipei",
+        work_hours={
+            "default": DeviceSchedule(
+                intervals=[
+                    TimeInterval(
+                        start=(now - timedelta(hours=1)).time(),
+                        end=(now + timedelta(seconds=end_in_sec)).time(),
+                    )
+                ]
+            )
+        },
+    )
+    executor = Mock()
+    executor.send_control = AsyncMock()
+    executor.defer_control = AsyncMock()
+    executor.on_device_recovered = AsyncMock()
+    pubsub = Mock()
+    pubsub.publish = AsyncMock()
+    handler = TimeControlHandler(pubsub=pubsub, time_control_evaluator=TimeControlEvaluator(cfg), executor=executor)
+    return handler, executor
+
+
+def _snapshot(device_id: str = "TECO_VFD_1") -> dict:
+    return {"device_id": device_id, "slave_id": 1, "type": INVERTER, "is_online": True, "values": {}}
+
+
+@pytest.mark.asyncio
+async def test_when_transition_reached_then_scheduler_emits_turn_off_without_new_snapshot(frozen_clock):
+    # Arrange
+    handler, executor = _build_handler(frozen_clock, end_in_sec=0.3)
+    await handler.handle_snapshot(_snapshot())
+    executor.send_control.reset_mock()
+
+    # Act
+    task = asyncio.create_task(handler.run_transition_scheduler())
+    await asyncio.sleep(0.8)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    # Assert
+    executor.send_control.assert_awaited_once()
+    assert executor.send_control.await_args.args[3] == ControlActionType.TURN_OFF
+
+
+@pytest.mark.asyncio
+async def test_when_snapshot_already_handled_transition_then_scheduler_does_not_duplicate(frozen_clock):
+    # Arrange
+    handler, executor = _build_handler(frozen_clock, end_in_sec=0.2)
+    await handler.handle_snapshot(_snapshot())
+    await asyncio.sleep(0.3)
+    await handler.handle_snapshot(_snapshot())  # Snapshot path detects TURN_OFF first
+    executor.send_control.reset_mock()
+
+    # Act
+    task = asyncio.create_task(handler.run_transition_scheduler())
+    await asyncio.sleep(0.2)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    # Assert
+    executor.send_control.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_when_device_is_offline_at_transition_then_scheduler_defers_control(frozen_clock):
+    # Arrange
+    handler, executor = _build_handler(frozen_clock, end_in_sec=0.3)
+    await handler.handle_snapshot({**_snapshot(), "is_online": False})
+
+    # Act
+    task = asyncio.create_task(handler.run_transition_scheduler())
+    await asyncio.sleep(0.8)
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+    # Assert
+    assert executor.defer_control.await_args.args[3] == ControlActionType.TURN_OFF
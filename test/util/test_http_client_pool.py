@@ -0,0 +1,112 @@
+from datetime import datetime
+
+import httpx
+import pytest
+
+from core.model.enum.alert_enum import AlertSeverity
+from core.schema.alert_schema import AlertMessageModel
+from core.util.factory.notifier_factory import close_notifiers
+from core.util.notifier import http_client_pool
+from core.util.notifier.http_client_pool import HttpClientPool
+from core.util.notifier.telegram_notifier import TelegramNotifier
+
+
+def _alert() -> AlertMessageModel:
+    return AlertMessageModel(
+        model="TECO_VFD",
+        slave_id=1,
+        level=AlertSeverity.WARNING,
+        message="HZ too high",
+        alert_code="HZ_HIGH",
+        timestamp=datetime(2025, 1, 1, 12, 0, 0),
+        name="hz_high",
+        device_name="VFD 1",
+        condition="gt",
+        threshold=50.0,
+        current_value=55.0,
+    )
+
+
+@pytest.fixture
+def recorded_requests():
+    return []
+
+
+@pytest.fixture
+def pool(recorded_requests):
+    def handler(request: httpx.Request) -> httpx.Response:
+        recorded_requests.append(request)
+        return httpx.Response(200, json={"ok": True})
+
+    return HttpClientPool(transport=httpx.MockTransport(handler))
+
+
+class TestHttpClientPool:
+    """Test per-origin client reuse and lifecycle"""
+
+    def test_when_same_origin_then_same_client_is_returned(self, pool):
+        # Act
+        first = pool.get("https://api.telegram.org/botA/sendMessage")
+        second = pool.get("https://API.telegram.org:443/botB/sendMessage")
+        other = pool.get("https://hooks.example.com/alert")
+
+        # Assert
+        assert first is second
+        assert other is not first
+        assert len(pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_when_closed_then_clients_released_and_recreated_on_demand(self, pool):
+        # Arrange
+        client = pool.get("https://api.telegram.org/sendMessage")
+
+        # Act
+        await pool.aclose()
+        reopened = pool.get("https://api.telegram.org/sendMessage")
+
+        # Assert
+        assert client.is_closed
+        assert reopened is not client and not reopened.is_closed
+        await pool.aclose()
+
+    def test_when_h2_missing_then_http2_is_disabled(self, monkeypatch):
+        # Arrange
+        monkeypatch.setattr(http_client_pool, "HTTP2_AVAILABLE", False)
+
+        # Act
+        pool = HttpClientPool(http2=True)
+
+        # Assert
+        assert pool.http2 is False
+
+
+class TestTelegramNotifierPooling:
+    """Test that notifiers reuse the shared pool instead of per-alert clients"""
+
+    @pytest.mark.asyncio
+    async def test_when_sending_many_alerts_then_single_pooled_client_is_used(self, pool, recorded_requests):
+        # Arrange
+        first = TelegramNotifier(bot_token="t1", chat_id="1", client_pool=pool)
+        second = TelegramNotifier(bot_token="t2", chat_id="2", client_pool=pool)
+
+        # Act
+        results = [await n.send(_alert()) for n in (first, second, first)]
+
+        # Assert
+        assert results == [True, True, True]
+        assert len(recorded_requests) == 3
+        assert len(pool) == 1
+        await close_notifiers([first, second])
+        assert len(pool) == 0
+
+    @pytest.mark.asyncio
+    async def test_when_no_pool_injected_then_notifier_owns_and_closes_private_pool(self):
+        # Arrange
+        notifier = TelegramNotifier(bot_token="t", chat_id="1")
+        client = notifier.client_pool.get(notifier.url)
+
+        # Act
+        await notifier.aclose()
+
+        # Assert
+        assert client.is_closed
@@ -0,0 +1,220 @@
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from core.device.generic.modbus_bus import ModbusBus
+from core.model.device_constant import DEFAULT_MISSING_VALUE
+from core.util.device_health_manager import DeviceHealthManager
+from core.util.latency_histogram import DeviceLatencyTracker, LatencyHistogram
+
+
+class _SlowClient:
+    """Fake client: answers after `delay` seconds (None = dead slave, never answers)."""
+
+    def __init__(self):
+        self.connected = True
+        self.delay: float | None = 0.0
+
+    async def read_holding_registers(self, address: int, *, count: int = 1, slave: int = 1):
+        if self.delay is None:
+            await asyncio.Event().wait()
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(registers=[7] * count, isError=lambda: False)
+
+
+class TestLatencyHistogram:
+    """Rolling bucketed latency histogram"""
+
+    def test_when_samples_added_then_quantile_is_bucket_upper_bound(self):
+        # Arrange
+        histogram = LatencyHistogram(window=100)
+
+        # Act
+        for _ in range(99):
+            histogram.add(0.010)
+        histogram.add(0.500)
+
+        # Assert
+        assert 0.010 <= histogram.quantile(0.5) < 0.0125
+        assert 0.010 <= histogram.quantile(0.99) < 0.0125
+        assert 0.500 <= histogram.quantile(1.0) < 0.625
+
+    def test_when_window_is_full_then_oldest_samples_are_forgotten(self):
+        # Arrange
+        histogram = LatencyHistogram(window=10)
+
+        # Act
+        for _ in range(10):
+            histogram.add(1.0)
+        for _ in range(10):
+            histogram.add(0.002)
+
+        # Assert
+        assert histogram.count == 10
+        assert histogram.quantile(1.0) < 0.003
+
+    def test_when_empty_then_quantile_is_none(self):
+        assert LatencyHistogram().quantile(0.99) is None
+
+
+class TestDeviceLatencyTracker:
+    """Adaptive deadlines derived from per-size latency histograms"""
+
+    def test_when_not_enough_samples_then_no_deadline(self):
+        # Arrange
+        tracker = DeviceLatencyTracker(min_samples=5)
+
+        # Act
+        for _ in range(4):
+            tracker.record("read:8", 0.02)
+
+        # Assert
+        assert tracker.deadline("read:8", ceiling=1.0) is None
+
+    def test_when_warmed_up_then_deadline_is_p99_times_margin_clamped(self):
+        # Arrange
+        tracker = DeviceLatencyTracker(margin=3.0, min_deadline_sec=0.05, min_samples=5)
+
+        # Act
+        for _ in range(5):
+            tracker.record("read:8", 0.02)
+            tracker.record("read:1", 0.001)
+            tracker.record("read:128", 0.8)
+
+        # Assert
+        assert 0.06 <= tracker.deadline("read:8", ceiling=1.0) < 0.08
+        assert tracker.deadline("read:1", ceiling=1.0) == 0.05  # floor
+        assert tracker.deadline("read:128", ceiling=1.0) == 1.0  # configured timeout caps it
+
+    def test_when_sizes_differ_then_keys_are_power_of_two_buckets(self):
+        assert DeviceLatencyTracker.size_key("read", 1) == "read:1"
+        assert DeviceLatencyTracker.size_key("read", 3) == "read:4"
+        assert DeviceLatencyTracker.size_key("read_bits", 120) == "read_bits:128"
+
+
+class TestAdaptiveRequestDeadline:
+    """ModbusBus requests under the device's adaptive deadline"""
+
+    @pytest.mark.asyncio
+    async def test_when_slave_goes_dead_then_request_fails_after_adaptive_deadline(self):
+        # Arrange
+        client = _SlowClient()
+        tracker = DeviceLatencyTracker(margin=3.0, min_deadline_sec=0.02, min_samples=5)
+        bus = ModbusBus(
+            client, slave_id=1, register_type="holding", transport="tcp", latency=tracker, request_timeout_sec=2.0
+        )
+        for _ in range(5):
+            assert await bus.read_regs(0, 4) == [7] * 4
+
+        # Act
+        client.delay = None
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await bus.read_regs(0, 4)
+        elapsed = loop.time() - start
+
+        # Assert
+        assert result == [DEFAULT_MISSING_VALUE] * 4
+        assert elapsed < 0.2
+
+    @pytest.mark.asyncio
+    async def test_when_no_tracker_then_request_is_not_wrapped(self):
+        # Arrange
+        client = _SlowClient()
+        client.delay = 0.05
+        bus = ModbusBus(client, slave_id=1, register_type="holding", transport="tcp")
+
+        # Act
+        result = await bus.read_regs(0, 2)
+
+        # Assert
+        assert result == [7, 7]
+
+
+class TestHealthManagerAdaptiveTimeout:
+    """DeviceHealthManager keeps one latency tracker per device"""
+
+    def test_when_history_is_recorded_then_read_all_timeout_shrinks(self):
+        # Arrange
+        health = DeviceHealthManager(adaptive_timeout_min_samples=3, adaptive_timeout_margin=2.0)
+
+        # Act
+        before = health.adaptive_timeout("METER_1", "read_all", 3.0)
+        for _ in range(3):
+            health.record_latency("METER_1", "read_all", 0.1)
+        after = health.adaptive_timeout("METER_1", "read_all", 3.0)
+
+        # Assert
+        assert before == 3.0
+        assert 0.2 <= after < 0.25
+        assert health.adaptive_timeout("METER_2", "read_all", 3.0) == 3.0
+        assert health.latency_tracker("METER_1") is health.latency_tracker("METER_1")
+
+
+class TestDeadlineRecovery:
+    """A device that got slower re-learns its deadline instead of staying offline"""
+
+    def test_when_samples_age_out_then_window_forgets_them(self):
+        # Arrange
+        histogram = LatencyHistogram(window=100, max_age_sec=10.0)
+        now = time.monotonic()
+        for _ in range(50):
+            histogram.add(0.010, now=now - 20.0)
+
+        # Act
+        histogram.add(0.500, now=now)
+
+        # Assert
+        assert histogram.count == 1
+        assert histogram.quantile(0.5) >= 0.5
+
+    def test_when_timeout_recorded_then_deadline_falls_back_until_next_success(self):
+        # Arrange
+        tracker = DeviceLatencyTracker(margin=3.0, min_samples=3)
+        for _ in range(3):
+            tracker.record("read:4", 0.010)
+        adaptive = tracker.deadline("read:4", 2.0)
+
+        # Act
+        tracker.record_timeout("read:4")
+        after_timeout = tracker.deadline("read:4", 2.0)
+        tracker.record("read:4", 0.010)
+
+        # Assert
+        assert adaptive is not None and adaptive < 0.1
+        assert after_timeout is None
+        assert tracker.deadline("read:4", 2.0) == adaptive
+
+    @pytest.mark.asyncio
+    async def test_when_slave_gets_slower_then_next_request_uses_configured_timeout(self):
+        # Arrange
+        client = _SlowClient()
+        tracker = DeviceLatencyTracker(margin=3.0, min_deadline_sec=0.02, min_samples=5)
+        bus = ModbusBus(
+            client, slave_id=1, register_type="holding", transport="tcp", latency=tracker, request_timeout_sec=2.0
+        )
+        for _ in range(5):
+            await bus.read_regs(0, 4)
+
+        # Act
+        client.delay = 0.1
+        first = await bus.read_regs(0, 4)
+        second = await bus.read_regs(0, 4)
+
+        # Assert
+        assert first == [DEFAULT_MISSING_VALUE] * 4
+        assert second == [7] * 4
+
+    def test_when_read_all_times_out_then_health_manager_uses_configured_timeout(self):
+        # Arrange
+        health = DeviceHealthManager(adaptive_timeout_min_samples=3, adaptive_timeout_margin=2.0)
+        for _ in range(3):
+            health.record_latency("METER_1", "read_all", 0.1)
+
+        # Act
+        health.record_timeout("METER_1", "read_all")
+
+        # Assert
+        assert health.adaptive_timeout("METER_1", "read_all", 3.0) == 3.0
@@ -0,0 +1,227 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+from collections import Counter
+
+import pytest
+import pytest_asyncio
+
+from core.schema.system_config_schema import SubscribersConfig
+from core.util.loop_profiler import (
+    UNATTRIBUTED,
+    LoopProfiler,
+    LoopProfilerConfig,
+    collapse_stack,
+    format_collapsed,
+    sample_thread,
+)
+from core.util.sub_registry import SubscriberRegistry
+from core.util.watchdog_heartbeat import WatchdogHeartbeat, WatchdogHeartbeatConfig
+
+
+def _blocking_call(seconds: float) -> None:
+    time.sleep(seconds)
+
+
+@pytest_asyncio.fixture
+async def profiler():
+    profiler = LoopProfiler(LoopProfilerConfig(slow_callback_sec=0.05, max_stalls=3))
+    profiler.install()
+    try:
+        yield profiler
+    finally:
+        profiler.uninstall()
+
+
+class TestSlowCallbackDetector:
+    """Stalls are recorded with the stack captured while the callback was still running"""
+
+    @pytest.mark.asyncio
+    async def test_when_callback_blocks_then_stall_has_blocking_frame(self, profiler):
+        # Arrange
+        async def stalls():
+            await asyncio.sleep(0)
+            _blocking_call(0.2)
+
+        # Act
+        await asyncio.create_task(stalls(), name="stalling")
+
+        # Assert
+        stall = profiler.last_stall()
+        assert profiler.stall_count == 1
+        assert stall["owner"] == "stalling" and stall["callback"] == "task stalling"
+        assert stall["duration_ms"] >= 200
+        assert stall["stack"][-1].endswith("in _blocking_call")
+        assert not any("util/loop_profiler.py" in line for line in stall["stack"])
+
+    @pytest.mark.asyncio
+    async def test_when_callbacks_are_fast_then_no_stall(self, profiler):
+        # Act
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # Assert
+        assert profiler.stall_count == 0
+        assert profiler.summary()["callbacks"] > 0
+
+    @pytest.mark.asyncio
+    async def test_when_more_stalls_than_capacity_then_oldest_dropped(self, profiler):
+        # Arrange
+        loop = asyncio.get_running_loop()
+
+        # Act
+        for _ in range(5):
+            loop.call_soon(_blocking_call, 0.06)
+            await asyncio.sleep(0.01)
+
+        # Assert
+        assert profiler.stall_count == 5
+        assert len(profiler.summary()["stalls"]) == 3
+
+    @pytest.mark.asyncio
+    async def test_when_uninstalled_then_callbacks_are_not_timed(self, profiler):
+        # Arrange
+        profiler.uninstall()
+        callbacks = profiler.summary()["callbacks"]
+
+        # Act
+        await asyncio.create_task(asyncio.sleep(0))
+
+        # Assert
+        assert profiler.installed is False
+        assert profiler.summary()["callbacks"] == callbacks
+
+
+class TestOwnerAccounting:
+    """CPU and wall time are charged to the owning subscriber"""
+
+    @pytest.mark.asyncio
+    async def test_when_subscriber_spawns_tasks_then_they_are_charged_to_it(self, profiler):
+        # Arrange
+        async def child():
+            _blocking_call(0.01)
+
+        async def runner():
+            await asyncio.gather(*(asyncio.create_task(child()) for _ in range(3)))
+
+        registry = SubscriberRegistry(SubscribersConfig())
+        registry.register("MONITOR", runner)
+
+        # Act
+        await registry.start_enabled_sub()
+        await registry.tasks["MONITOR"]
+
+        # Assert
+        owners = profiler.owner_stats()
+        assert owners["sub:MONITOR"]["wall_sec"] >= 0.03
+        assert owners["sub:MONITOR"]["runs"] >= 4
+
+    @pytest.mark.asyncio
+    async def test_when_unnamed_task_runs_then_it_is_unattributed(self, profiler):
+        # Act
+        await asyncio.create_task(asyncio.sleep(0))
+
+        # Assert
+        assert UNATTRIBUTED in profiler.owner_stats()
+
+    @pytest.mark.asyncio
+    async def test_when_reset_then_counters_cleared(self, profiler):
+        # Arrange
+        asyncio.get_running_loop().call_soon(_blocking_call, 0.06)
+        await asyncio.sleep(0.01)
+
+        # Act
+        profiler.reset()
+
+        # Assert
+        summary = profiler.summary()
+        assert summary["stall_count"] == 0 and summary["stalls"] == []
+
+
+class TestSamplingProfiler:
+    """On-demand sampling of the loop thread"""
+
+    @pytest.mark.asyncio
+    async def test_when_loop_busy_then_collapsed_stacks_show_busy_frame(self, profiler):
+        # Arrange
+        async def busy():
+            await asyncio.sleep(0.02)
+            _blocking_call(0.15)
+
+        # Act
+        task = asyncio.create_task(busy())
+        collapsed = await profiler.profile(0.3, interval_sec=0.005)
+        await task
+
+        # Assert
+        lines = collapsed.splitlines()
+        assert lines and all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+        assert any("_blocking_call" in line.split(";")[-1] for line in lines)
+
+    @pytest.mark.asyncio
+    async def test_when_profile_running_then_second_request_rejected(self, profiler):
+        # Arrange
+        first = asyncio.create_task(profiler.profile(0.2))
+        await asyncio.sleep(0.01)
+
+        # Act / Assert
+        assert profiler.profiling is True
+        with pytest.raises(RuntimeError):
+            await profiler.profile(0.1)
+        await first
+
+    @pytest.mark.asyncio
+    async def test_when_seconds_above_limit_then_value_error(self, profiler):
+        with pytest.raises(ValueError):
+            await profiler.profile(profiler.cfg.max_profile_sec + 1)
+
+    def test_when_samples_formatted_then_most_common_first(self):
+        # Arrange
+        stack = collapse_stack(sys._getframe())
+        samples = sample_thread(threading.get_ident() + 1, 0.01, 0.001)
+
+        # Act
+        text = format_collapsed(Counter({"a;b": 2, "a;c": 5}))
+
+        # Assert
+        assert stack.split(";")[-1].startswith(
+            "TestSamplingProfiler.test_when_samples_formatted_then_most_common_first (util/test_loop_profiler.py:"
+        )
+        assert not samples
+        assert text == "a;c 5\na;b 2\n"
+
+
+class TestWatchdogIntegration:
+    """Heartbeat carries the stall count and lag logs name the culprit"""
+
+    @pytest.mark.asyncio
+    async def test_when_profiler_attached_then_heartbeat_has_slow_callbacks(self, profiler, tmp_path):
+        # Arrange
+        path = tmp_path / "heartbeat.txt"
+        watchdog = WatchdogHeartbeat(WatchdogHeartbeatConfig(heartbeat_path=str(path), interval_sec=0.05), profiler)
+        task = asyncio.create_task(watchdog.run())
+
+        # Act
+        asyncio.get_running_loop().call_soon(_blocking_call, 0.06)
+        await asyncio.sleep(0.2)
+        watchdog.stop()
+        await task
+
+        # Assert
+        assert json.loads(path.read_text())["slow_callbacks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_when_lag_follows_stall_then_culprit_is_named(self, profiler):
+        # Arrange
+        watchdog = WatchdogHeartbeat(WatchdogHeartbeatConfig(), profiler)
+        asyncio.get_running_loop().call_soon(_blocking_call, 0.06)
+        await asyncio.sleep(0.01)
+
+        # Act
+        culprit = watchdog._culprit(window_sec=1.0)
+
+        # Assert
+        assert "slow_callback=" in culprit and "_blocking_call" in culprit
+        assert WatchdogHeartbeat(WatchdogHeartbeatConfig())._culprit(1.0) == ""
@@ -0,0 +1,121 @@
+import asyncio
+from email.message import EmailMessage
+
+import aiosmtplib
+import pytest
+
+from core.util.notifier.smtp_session import SmtpSessionWorker
+
+
+class _FakeSmtp:
+    """Stand-in for aiosmtplib.SMTP that records the session lifecycle"""
+
+    def __init__(self, log: dict, drop_after: int | None = None):
+        self.log = log
+        self.drop_after = drop_after
+        self.is_connected = False
+        self.sent = 0
+
+    async def connect(self):
+        self.log["connects"] += 1
+        self.is_connected = True
+
+    async def send_message(self, message):
+        if self.drop_after is not None and self.sent >= self.drop_after:
+            self.is_connected = False
+            raise aiosmtplib.SMTPServerDisconnected("connection lost")
+        self.sent += 1
+        self.log["subjects"].append(message["Subject"])
+
+    async def noop(self):
+        self.log["noops"] += 1
+
+    async def quit(self):
+        self.is_connected = False
+
+    def close(self):
+        self.is_connected = False
+
+
+def _message(n: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["Subject"] = f"alert {n}"
+    msg.set_content("body")
+    return msg
+
+
+@pytest.fixture
+def session_log():
+    return {"connects": 0, "noops": 0, "subjects": []}
+
+
+class TestSmtpSessionWorker:
+    """Test session reuse, keep-alive and reconnect of the SMTP worker"""
+
+    @pytest.mark.asyncio
+    async def test_when_burst_of_messages_then_single_session_is_used(self, session_log):
+        # Arrange
+        worker = SmtpSessionWorker("smtp.local", 587, smtp_factory=lambda: _FakeSmtp(session_log))
+
+        # Act
+        results = await asyncio.gather(*(worker.submit(_message(n)) for n in range(10)))
+
+        # Assert
+        assert results == [True] * 10
+        assert session_log["connects"] == 1
+        assert sorted(session_log["subjects"]) == sorted(f"alert {n}" for n in range(10))
+        await worker.aclose()
+
+    @pytest.mark.asyncio
+    async def test_when_server_drops_session_then_reconnects_and_delivers(self, session_log):
+        # Arrange: first session dies after two messages
+        sessions = iter([_FakeSmtp(session_log, drop_after=2), _FakeSmtp(session_log)])
+        worker = SmtpSessionWorker("smtp.local", 587, smtp_factory=lambda: next(sessions))
+
+        # Act
+        results = await asyncio.gather(*(worker.submit(_message(n)) for n in range(4)))
+
+        # Assert
+        assert results == [True] * 4
+        assert session_log["connects"] == 2
+        assert len(session_log["subjects"]) == 4
+        await worker.aclose()
+
+    @pytest.mark.asyncio
+    async def test_when_idle_then_noop_keeps_session_alive(self, session_log):
+        # Arrange
+        worker = SmtpSessionWorker("smtp.local", 587, keepalive_sec=1, smtp_factory=lambda: _FakeSmtp(session_log))
+        worker.keepalive_sec = 0.02  # below the config floor to keep the test fast
+
+        # Act
+        await worker.submit(_message(1))
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert session_log["noops"] >= 1
+        assert worker.is_connected
+        await worker.aclose()
+        assert not worker.is_connected
+
+    @pytest.mark.asyncio
+    async def test_when_closed_mid_batch_then_pending_submitters_get_false(self, session_log):
+        # Arrange: the server stalls on the first message of the batch
+        stalled = asyncio.Event()
+        smtp = _FakeSmtp(session_log)
+
+        async def stall(message):
+            stalled.set()
+            await asyncio.Event().wait()
+
+        smtp.send_message = stall
+        worker = SmtpSessionWorker("smtp.local", 587, smtp_factory=lambda: smtp)
+        submits = [asyncio.create_task(worker.submit(_message(n))) for n in range(3)]
+        await stalled.wait()
+
+        # Act
+        await worker.aclose()
+        results = await asyncio.wait_for(asyncio.gather(*submits), timeout=1.0)
+
+        # Assert
+        assert results == [False] * 3
+        assert not worker.is_connected
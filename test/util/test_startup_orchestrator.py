@@ -0,0 +1,159 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.device.generic.generic_device import AsyncGenericModbusDevice
+from core.device.generic.modbus_bus import ModbusBus
+from core.model.enum.modbus_transport_enum import ModbusTransport
+from core.util.device_health_manager import DeviceHealthManager, HealthCheckResult
+from core.util.health_check_util import StartupOrchestrator
+from device_monitor import AsyncDeviceMonitor
+
+
+def _device(model: str, slave_id: int, port: str, transport: str = ModbusTransport.SERIAL):
+    return SimpleNamespace(model=model, slave_id=slave_id, port=port, transport=ModbusTransport(transport))
+
+
+class _ProbeLog:
+    """Fake quick_health_check: each device answers (or times out) after a fixed delay."""
+
+    def __init__(self, health: DeviceHealthManager, delays: dict[str, tuple[float, bool]]):
+        self.health = health
+        self.delays = delays
+        self.active = 0
+        self.max_active_per_port: dict[str, int] = {}
+        self._active_per_port: dict[str, int] = {}
+
+    async def __call__(self, device, device_id: str):
+        delay, online = self.delays[device_id]
+        self._active_per_port[device.port] = self._active_per_port.get(device.port, 0) + 1
+        self.max_active_per_port[device.port] = max(
+            self.max_active_per_port.get(device.port, 0), self._active_per_port[device.port]
+        )
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._active_per_port[device.port] -= 1
+
+        if online:
+            await self.health.mark_success(device_id)
+        else:
+            await self.health.mark_failure(device_id)
+        return online, HealthCheckResult(device_id, online, delay * 1000, "single_register")
+
+
+class TestStartupOrchestrator:
+    """Parallel per-port startup probing"""
+
+    @pytest.mark.asyncio
+    async def test_when_ports_probe_then_lanes_run_in_parallel_and_serial_lanes_stay_sequential(self):
+        # Arrange
+        devices = [
+            _device("A", 1, "/dev/ttyUSB0"),
+            _device("A", 2, "/dev/ttyUSB0"),
+            _device("B", 1, "/dev/ttyUSB1"),
+            _device("B", 2, "/dev/ttyUSB1"),
+            _device("M", 1, "tcp://10.0.0.5:502", ModbusTransport.TCP),
+            _device("M", 2, "tcp://10.0.0.5:502", ModbusTransport.TCP),
+        ]
+        health = DeviceHealthManager()
+        probe = _ProbeLog(health, {f"{d.model}_{d.slave_id}": (0.1, True) for d in devices})
+        health.quick_health_check = probe
+        startup = StartupOrchestrator(SimpleNamespace(device_list=devices), health)
+
+        # Act
+        start = asyncio.get_running_loop().time()
+        stats = await startup.start()
+        elapsed = asyncio.get_running_loop().time() - start
+
+        # Assert
+        assert stats == {"online": 6, "offline": 0, "failed": 0}
+        assert elapsed < 0.35  # 3 lanes in parallel, 2 x 0.1s on each serial lane
+        assert probe.max_active_per_port == {"/dev/ttyUSB0": 1, "/dev/ttyUSB1": 1, "tcp://10.0.0.5:502": 2}
+        assert health.probing_count == 0
+
+    @pytest.mark.asyncio
+    async def test_when_slow_device_still_probing_then_verified_devices_are_released(self):
+        # Arrange
+        devices = [_device("FAST", 1, "/dev/ttyUSB0"), _device("DEAD", 1, "/dev/ttyUSB1")]
+        health = DeviceHealthManager()
+        health.quick_health_check = _ProbeLog(health, {"FAST_1": (0.01, True), "DEAD_1": (0.3, False)})
+        startup = StartupOrchestrator(SimpleNamespace(device_list=devices), health)
+
+        # Act
+        task = startup.start()
+        await asyncio.sleep(0.1)
+
+        # Assert
+        assert not health.is_probing("FAST_1")
+        assert health.is_probing("DEAD_1")
+        assert startup.summary()["probing"] == 1
+
+        await task
+        assert not health.is_probing("DEAD_1")
+        assert startup.health_stats == {"online": 1, "offline": 1, "failed": 0}
+
+    def test_when_first_snapshot_recorded_then_only_first_counts(self):
+        # Arrange
+        startup = StartupOrchestrator(SimpleNamespace(device_list=[]), DeviceHealthManager(), started_at=0.0)
+
+        # Act
+        startup.record_first_snapshot()
+        first = startup.time_to_first_snapshot_sec
+        startup.record_first_snapshot()
+
+        # Assert
+        assert first is not None and first > 0
+        assert startup.time_to_first_snapshot_sec == first
+
+
+class TestMonitorDuringStartupProbe:
+    """The monitor polls released devices only and reports its first publish"""
+
+    @pytest.mark.asyncio
+    async def test_when_device_is_probing_then_monitor_skips_it(self, monkeypatch):
+        # Arrange
+        def make(slave_id: int) -> AsyncGenericModbusDevice:
+            return AsyncGenericModbusDevice(
+                model="TST",
+                client=SimpleNamespace(connected=True),
+                slave_id=slave_id,
+                register_type="holding",
+                register_map={"V": {"offset": 0, "format": "u16", "readable": True}},
+                device_type="power_meter",
+                port="/dev/ttyFAKE",
+                port_lock=asyncio.Lock(),
+            )
+
+        monkeypatch.setattr(ModbusBus, "ensure_connected", AsyncMock(return_value=True))
+        monkeypatch.setattr(ModbusBus, "read_regs", AsyncMock(return_value=[230]))
+        health = DeviceHealthManager()
+        health.begin_startup_probe(["TST_2"])
+        published: list[dict] = []
+        first_snapshot = []
+
+        async def publish(topic, snapshot):
+            published.append(snapshot)
+
+        monitor = AsyncDeviceMonitor(
+            async_device_manager=SimpleNamespace(device_list=[make(1), make(2)]),
+            pubsub=SimpleNamespace(publish=publish),
+            health_manager=health,
+            on_first_snapshot=lambda: first_snapshot.append(True),
+        )
+        worker = asyncio.create_task(monitor._reader_worker(0))
+
+        # Act
+        try:
+            snapshots = await monitor._run_one_cycle()
+            await monitor._publish_snapshots(snapshots)
+            await monitor._publish_snapshots(snapshots)
+        finally:
+            worker.cancel()
+
+        # Assert
+        assert [s["device_id"] for s in snapshots] == ["TST_1"]
+        assert len(published) == 2
+        assert first_snapshot == [True]